@@ -0,0 +1,109 @@
+"""Read and write latency under each SQLite connection profile.
+
+For every profile in schema.CONNECTION_PROFILES, builds a fresh file-backed
+database with a synthetic notes table, then measures:
+
+- write: latency of small committed transactions (one note update each, the
+         shape of per-geist status and suggestion writes), where the
+         profile's journal mode and fsync policy dominate
+- read:  point lookups by path on a read-only connection, as stats and
+         geists issue them
+- read during write: the same lookups while the writer connection holds an
+         open write transaction (WAL readers never wait on the writer;
+         rollback-journal readers are locked out while it commits)
+
+Reports p50/p95 in milliseconds.
+
+Run:  uv run python benchmarks/db_profile_benchmark.py [--notes 5000]
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from geistfabrik.schema import CONNECTION_PROFILES, connect_readonly, init_db
+
+
+def populate(db_path: Path, profile: str, n_notes: int) -> None:
+    """Create the database under profile and insert n_notes notes."""
+    conn = init_db(db_path, profile=profile)
+    conn.executemany(
+        "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES (?, ?, ?, '', '', 0)",
+        [(f"note_{i}.md", f"Note {i}", "word " * 200) for i in range(n_notes)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ms = sorted(s * 1000 for s in samples)
+    return statistics.median(ms), ms[int(len(ms) * 0.95) - 1]
+
+
+def time_writes(db_path: Path, profile: str, n_notes: int, ops: int) -> list[float]:
+    """Latency of single-row committed updates."""
+    rng = random.Random(0)
+    conn = init_db(db_path, profile=profile)
+    samples = []
+    for _ in range(ops):
+        path = f"note_{rng.randrange(n_notes)}.md"
+        t0 = time.perf_counter()
+        conn.execute("UPDATE notes SET file_mtime = file_mtime + 1 WHERE path = ?", (path,))
+        conn.commit()
+        samples.append(time.perf_counter() - t0)
+    conn.close()
+    return samples
+
+
+def time_reads(
+    db_path: Path, profile: str, n_notes: int, ops: int, during_write: bool
+) -> list[float]:
+    """Latency of point lookups on a read-only connection."""
+    rng = random.Random(1)
+    writer = init_db(db_path, profile=profile)
+    if during_write:
+        writer.execute("UPDATE notes SET title = title || '!' WHERE path = 'note_0.md'")
+    reader = connect_readonly(db_path, profile=profile)
+    samples = []
+    for _ in range(ops):
+        path = f"note_{rng.randrange(n_notes)}.md"
+        t0 = time.perf_counter()
+        reader.execute("SELECT content FROM notes WHERE path = ?", (path,)).fetchone()
+        samples.append(time.perf_counter() - t0)
+    reader.close()
+    writer.rollback()
+    writer.close()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{args.notes} notes, {args.writes} writes, {args.reads} reads (ms)")
+    print(f"{'profile':<8} {'operation':<18} {'p50':>8} {'p95':>8}")
+    print("-" * 45)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in CONNECTION_PROFILES:
+            db_path = Path(tmp) / f"{profile}.db"
+            populate(db_path, profile, args.notes)
+            results = {
+                "write": time_writes(db_path, profile, args.notes, args.writes),
+                "read": time_reads(db_path, profile, args.notes, args.reads, False),
+                "read during write": time_reads(db_path, profile, args.notes, args.reads, True),
+            }
+            for operation, samples in results.items():
+                p50, p95 = _percentiles(samples)
+                print(f"{profile:<8} {operation:<18} {p50:>8.3f} {p95:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Neighbour recall and footprint of reduced-precision embeddings.
+
+For each precision (float32, float16, int8) reports bytes per stored session
+embedding, the size of the in-memory search matrix, and the mean top-k query
+latency, with three top-k neighbour recalls against exact float32 search:
+
+- scan:     the compact matrix alone
+- rescored: compact scan plus float32 rescoring of the best candidates, as
+            InMemoryVectorBackend does at `vector_search.precision`
+- stored:   as rescored, with the vectors also stored at this precision
+            (`database.embedding_precision`), so rescoring sees dequantised
+            values
+
+Embeddings come from the latest session of a vault's database, or from a
+synthetic clustered set shaped like session embeddings (unit semantic part
+weighted 0.9, temporal features weighted 0.1).
+
+Run:  uv run python benchmarks/quantization_recall.py [--db VAULT/_geistfabrik/vault.db]
+      uv run python benchmarks/quantization_recall.py --notes 20000 --k 10
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+
+from geistfabrik.config import DEFAULT_RESCORE_FACTOR, SEMANTIC_DIM, TOTAL_DIM
+from geistfabrik.quantization import (
+    EMBEDDING_PRECISIONS,
+    CompactMatrix,
+    decode_embeddings,
+    encode_embeddings,
+    encoded_size,
+    neighbour_recall,
+)
+
+
+def synthetic_embeddings(n_notes: int, seed: int = 0) -> np.ndarray:
+    """Clustered unit vectors with session-style temporal features appended."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(n_notes // 100, 2), SEMANTIC_DIM))
+    semantic = centres[rng.integers(0, len(centres), n_notes)]
+    semantic = semantic + rng.normal(size=(n_notes, SEMANTIC_DIM))
+    semantic /= np.linalg.norm(semantic, axis=1, keepdims=True)
+    temporal = np.column_stack(
+        [
+            rng.uniform(0, 8, n_notes),  # note age in years
+            np.sin(rng.uniform(0, 2 * np.pi, n_notes)),
+            np.full(n_notes, 0.5),
+        ]
+    )
+    return np.hstack([semantic * 0.9, temporal * 0.1]).astype(np.float32)
+
+
+def vault_embeddings(db_path: Path) -> np.ndarray:
+    """Session embeddings of the latest session in a vault database."""
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    rows = conn.execute(
+        """
+        SELECT embedding FROM session_embeddings
+        WHERE session_id = (SELECT session_id FROM sessions ORDER BY date DESC LIMIT 1)
+        """
+    ).fetchall()
+    conn.close()
+    return decode_embeddings([blob for (blob,) in rows], TOTAL_DIM)
+
+
+def query_latency(matrix: np.ndarray, precision: str, k: int, queries: int) -> float:
+    """Mean seconds per top-k query: compact scan plus float32 rescoring."""
+    stored = decode_embeddings(encode_embeddings(matrix, precision), matrix.shape[1])
+    compact = CompactMatrix(stored, precision)
+    rows = np.random.default_rng(1).choice(len(stored), size=min(queries, len(stored)))
+    start = time.perf_counter()
+    for row in rows:
+        candidates = compact.candidates(stored[row], k * DEFAULT_RESCORE_FACTOR)
+        scores = stored[candidates] @ stored[row]
+        np.argsort(-scores, kind="stable")[:k]
+    return (time.perf_counter() - start) / len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="vault.db to read the latest session from")
+    parser.add_argument("--notes", type=int, default=10000, help="Synthetic vault size")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    matrix = vault_embeddings(args.db) if args.db else synthetic_embeddings(args.notes)
+    n, dim = matrix.shape
+    source = str(args.db) if args.db else "synthetic"
+    print(f"{n} embeddings of dim {dim} ({source}), recall@{args.k} over {args.queries} queries")
+    print(
+        f"{'precision':<10} {'bytes/row':>9} {'matrix MB':>10} "
+        f"{'scan':>7} {'rescored':>9} {'stored':>7} {'ms/query':>9}"
+    )
+    print("-" * 67)
+    for precision in EMBEDDING_PRECISIONS:
+        # Search precision only (float32 storage): scan alone, then rescored
+        scan, rescored = (
+            neighbour_recall(
+                matrix, precision, args.k, args.queries, rescore_factor=factor, storage=False
+            )
+            for factor in (1, DEFAULT_RESCORE_FACTOR)
+        )
+        # Stored at this precision too, so rescoring sees dequantised vectors
+        stored = neighbour_recall(
+            matrix, precision, args.k, args.queries, rescore_factor=DEFAULT_RESCORE_FACTOR
+        )
+        matrix_mb = CompactMatrix(matrix, precision).nbytes / 1e6
+        latency = query_latency(matrix, precision, args.k, args.queries) * 1000
+        print(
+            f"{precision:<10} {encoded_size(dim, precision):>9} {matrix_mb:>10.1f} "
+            f"{scan:>7.3f} {rescored:>9.3f} {stored:>7.3f} {latency:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
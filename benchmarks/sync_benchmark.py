@@ -0,0 +1,124 @@
+"""First-sync throughput: bulk-batched writes vs per-note statements.
+
+Generates a synthetic vault (notes with links and tags), then times a first
+sync into a fresh file-backed database two ways:
+
+- after:  the shipped Vault.sync() (one mtime query, BulkWriter executemany
+          flush, the "fast" connection profile)
+- before: an inline reconstruction of the previous write path (one mtime
+          lookup plus INSERT OR REPLACE, two DELETEs and two executemany
+          calls per note, default rollback-journal pragmas)
+
+Both paths parse the same files, so the ratio isolates the write strategy.
+
+Run:  uv run python benchmarks/sync_benchmark.py [--notes 5000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from geistfabrik.markdown_parser import parse_markdown
+from geistfabrik.schema import SCHEMA_SQL
+from geistfabrik.vault import Vault
+
+
+def make_vault(root: Path, n_notes: int, seed: int = 0) -> Path:
+    """Write n_notes markdown files with links and tags under root/vault."""
+    rng = random.Random(seed)
+    vault = root / "vault"
+    (vault / ".obsidian").mkdir(parents=True)
+    for i in range(n_notes):
+        links = " ".join(f"[[Note {rng.randrange(n_notes)}]]" for _ in range(5))
+        tags = " ".join(f"#topic{rng.randrange(50)}" for _ in range(3))
+        body = " ".join(f"word{rng.randrange(2000)}" for _ in range(150))
+        (vault / f"note_{i}.md").write_text(f"# Note {i}\n\n{body}\n\n{links}\n{tags}\n")
+    return vault
+
+
+def sync_after(vault_path: Path, db_path: Path) -> None:
+    vault = Vault(vault_path, db_path)
+    vault.sync()
+    vault.close()
+
+
+def sync_before(vault_path: Path, db_path: Path) -> None:
+    db = sqlite3.connect(str(db_path))
+    db.execute("PRAGMA foreign_keys = ON")
+    db.executescript(SCHEMA_SQL)
+    for md_file in vault_path.rglob("*.md"):
+        rel_path = str(md_file.relative_to(vault_path))
+        db.execute(
+            "SELECT file_mtime FROM notes WHERE path = ? OR source_file = ? LIMIT 1",
+            (rel_path, rel_path),
+        ).fetchone()
+        content = md_file.read_text(encoding="utf-8")
+        stat = md_file.stat()
+        title, _, links, tags = parse_markdown(rel_path, content)
+        db.execute("DELETE FROM notes WHERE source_file = ?", (rel_path,))
+        db.execute(
+            "INSERT OR REPLACE INTO notes (path, title, content, created, modified, "
+            "file_mtime, is_virtual, source_file, entry_date) VALUES (?,?,?,?,?,?,0,NULL,NULL)",
+            (
+                rel_path,
+                title,
+                content,
+                datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                stat.st_mtime,
+            ),
+        )
+        db.execute("DELETE FROM links WHERE source_path = ?", (rel_path,))
+        db.execute("DELETE FROM tags WHERE note_path = ?", (rel_path,))
+        db.executemany(
+            "INSERT INTO links (source_path, target, display_text, is_embed, block_ref) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (rel_path, lk.target, lk.display_text, int(lk.is_embed), lk.block_ref)
+                for lk in links
+            ],
+        )
+        db.executemany(
+            "INSERT INTO tags (note_path, tag) VALUES (?, ?)", [(rel_path, t) for t in tags]
+        )
+    db.commit()
+    db.close()
+
+
+def _time(fn, vault_path: Path, work_dir: Path, repeats: int) -> float:
+    best = float("inf")
+    for run in range(repeats):
+        db_path = work_dir / f"{fn.__name__}_{run}.db"
+        t0 = time.perf_counter()
+        fn(vault_path, db_path)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        vault_path = make_vault(work_dir, args.notes)
+
+        before = _time(sync_before, vault_path, work_dir, args.repeats)
+        after = _time(sync_after, vault_path, work_dir, args.repeats)
+
+    print(f"First sync, {args.notes} notes (best of {args.repeats})")
+    print(f"{'path':<10} {'seconds':>9} {'notes/s':>10}")
+    print("-" * 31)
+    print(f"{'before':<10} {before:>9.3f} {args.notes / before:>10.0f}")
+    print(f"{'after':<10} {after:>9.3f} {args.notes / after:>10.0f}")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,15 @@
 """Benchmark script for vector search backends.
 
 This script compares performance between InMemoryVectorBackend and SqliteVecBackend
-across different vault sizes and query patterns.
+across different vault sizes and query patterns, and times SqliteVecBackend
+session opens: cold (empty vec_search), warm (same session reopened) and next
+day (a new session with a fraction of the vectors changed).
 
 Usage:
     python scripts/benchmark_backends.py
     python scripts/benchmark_backends.py --sizes 100,500,1000
     python scripts/benchmark_backends.py --queries 10,50,100
+    python scripts/benchmark_backends.py --changed 0.05
 """
 
 import argparse
@@ -76,7 +79,10 @@ def setup_test_db(num_notes: int) -> Tuple[sqlite3.Connection, str, Dict[str, np
     # Create session
     session_date = "2025-01-15"
     created_at = now.isoformat()
-    db.execute("INSERT INTO sessions (date, created_at) VALUES (?, ?)", (session_date, created_at))
+    db.execute(
+        "INSERT INTO sessions (date, created_at, vault_state_hash) VALUES (?, ?, ?)",
+        (session_date, created_at, "bench-1"),
+    )
     cursor = db.execute("SELECT session_id FROM sessions WHERE date = ?", (session_date,))
     session_id = cursor.fetchone()[0]
 
@@ -92,6 +98,82 @@ def setup_test_db(num_notes: int) -> Tuple[sqlite3.Connection, str, Dict[str, np
     return db, session_date, embeddings
 
 
+def add_next_session(
+    db: sqlite3.Connection, embeddings: Dict[str, np.ndarray], changed_fraction: float
+) -> str:
+    """Store a follow-up session where a fraction of the vectors changed.
+
+    Args:
+        db: Database connection holding the first session
+        embeddings: Embeddings of the first session
+        changed_fraction: Share of notes whose vector is regenerated
+
+    Returns:
+        Session date of the new session
+    """
+    session_date = "2025-01-16"
+    db.execute(
+        "INSERT INTO sessions (date, created_at, vault_state_hash) VALUES (?, ?, ?)",
+        (session_date, datetime.now().isoformat(), "bench-2"),
+    )
+    session_id = db.execute(
+        "SELECT session_id FROM sessions WHERE date = ?", (session_date,)
+    ).fetchone()[0]
+
+    paths = list(embeddings)
+    changed = set(paths[: int(len(paths) * changed_fraction)])
+    fresh = generate_synthetic_embeddings(len(changed))
+    rows = []
+    for path, embedding in embeddings.items():
+        if path in changed:
+            embedding = fresh.popitem()[1]
+        rows.append((session_id, path, embedding.tobytes()))
+    db.executemany(
+        "INSERT INTO session_embeddings (session_id, note_path, embedding) VALUES (?, ?, ?)",
+        rows,
+    )
+    db.commit()
+    return session_date
+
+
+def benchmark_session_open(
+    db: sqlite3.Connection,
+    session_date: str,
+    embeddings: Dict[str, np.ndarray],
+    changed_fraction: float,
+) -> Dict[str, Tuple[float, int]]:
+    """Time SqliteVecBackend.load_embeddings for cold, warm and next-day opens.
+
+    Each open uses a fresh backend instance, as a new invocation would.
+
+    Args:
+        db: Database connection with sqlite-vec loaded
+        session_date: Date of the stored session
+        embeddings: Embeddings of the stored session
+        changed_fraction: Share of vectors that differ in the next-day session
+
+    Returns:
+        Dictionary mapping open kind to (seconds, vec_search rows written)
+    """
+    SqliteVecBackend(db)  # create the vec tables
+    db.execute("DELETE FROM vec_search")
+    db.execute("DELETE FROM vec_path_mapping")
+    db.execute("DELETE FROM vec_search_state")
+    db.commit()
+
+    results = {}
+    for kind, date in [
+        ("cold", session_date),
+        ("warm", session_date),
+        ("next day", add_next_session(db, embeddings, changed_fraction)),
+    ]:
+        backend = SqliteVecBackend(db)
+        start = time.perf_counter()
+        backend.load_embeddings(date)
+        results[kind] = (time.perf_counter() - start, backend.rows_written)
+    return results
+
+
 def benchmark_backend(
     backend_name: str,
     backend,
@@ -128,7 +210,7 @@ def benchmark_backend(
         query_embedding = embeddings[query_path]
 
         start = time.perf_counter()
-        backend.find_similar(query_embedding, k=10)
+        backend.find_similar(query_embedding, count=10)
         query_time = time.perf_counter() - start
         query_times.append(query_time)
 
@@ -171,6 +253,17 @@ def print_results(size: int, backend_name: str, results: Dict[str, float]) -> No
     print(f"  Avg similarity:    {results['avg_similarity_time'] * 1000:>8.3f} ms")
 
 
+def print_session_open_results(results: Dict[str, Tuple[float, int]]) -> None:
+    """Print session-open timings.
+
+    Args:
+        results: Results from benchmark_session_open
+    """
+    print("\nSqliteVecBackend session open:")
+    for kind, (seconds, rows_written) in results.items():
+        print(f"  {kind:<9} {seconds * 1000:>8.2f} ms  ({rows_written} rows written)")
+
+
 def main() -> None:
     """Run benchmarks."""
     parser = argparse.ArgumentParser(description="Benchmark vector search backends")
@@ -191,6 +284,12 @@ def main() -> None:
         action="store_true",
         help="Skip sqlite-vec benchmark (if not installed)",
     )
+    parser.add_argument(
+        "--changed",
+        type=float,
+        default=0.05,
+        help="Share of vectors changed in the next-day session open (default: 0.05)",
+    )
     args = parser.parse_args()
 
     sizes = [int(s.strip()) for s in args.sizes.split(",")]
@@ -255,6 +354,10 @@ def main() -> None:
             print(f"    Load:  {speedup_load:>6.2f}x")
             print(f"    Query: {speedup_query:>6.2f}x")
 
+            print_session_open_results(
+                benchmark_session_open(db, session_date, embeddings, args.changed)
+            )
+
         db.close()
 
     print(f"\n{'=' * 70}")
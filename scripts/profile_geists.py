@@ -15,135 +15,17 @@ Usage:
 
 import argparse
 import time
-from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
 from geistfabrik.embeddings import Session
 from geistfabrik.geist_executor import GeistExecutor
+from geistfabrik.instrumentation import Instrumentation
 from geistfabrik.vault import Vault
 from geistfabrik.vault_context import VaultContext
 
 
-class ProfilingVaultContext(VaultContext):
-    """VaultContext with profiling instrumentation."""
-
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-        self.profile_stats: Dict[str, Any] = {
-            "call_counts": defaultdict(int),
-            "cache_hits": defaultdict(int),
-            "cache_misses": defaultdict(int),
-            "timings": defaultdict(float),
-        }
-
-    def _profile_method(self, method_name: str, func: Any, *args: Any, **kwargs: Any) -> Any:
-        """Wrap method call with profiling."""
-        self.profile_stats["call_counts"][method_name] += 1
-
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-    def backlinks(self, note):
-        """Instrumented backlinks."""
-        method_name = "backlinks"
-        self.profile_stats["call_counts"][method_name] += 1
-
-        # Check cache
-        if note.path in self._backlinks_cache:
-            self.profile_stats["cache_hits"][method_name] += 1
-        else:
-            self.profile_stats["cache_misses"][method_name] += 1
-
-        start = time.perf_counter()
-        result = super().backlinks(note)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-    def outgoing_links(self, note):
-        """Instrumented outgoing_links."""
-        method_name = "outgoing_links"
-        self.profile_stats["call_counts"][method_name] += 1
-
-        # Check cache
-        if note.path in self._outgoing_links_cache:
-            self.profile_stats["cache_hits"][method_name] += 1
-        else:
-            self.profile_stats["cache_misses"][method_name] += 1
-
-        start = time.perf_counter()
-        result = super().outgoing_links(note)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-    def graph_neighbors(self, note):
-        """Instrumented graph_neighbors."""
-        method_name = "graph_neighbors"
-        self.profile_stats["call_counts"][method_name] += 1
-
-        # Check cache
-        if note.path in self._graph_neighbors_cache:
-            self.profile_stats["cache_hits"][method_name] += 1
-        else:
-            self.profile_stats["cache_misses"][method_name] += 1
-
-        start = time.perf_counter()
-        result = super().graph_neighbors(note)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-    def similarity(self, a, b):
-        """Instrumented similarity."""
-        method_name = "similarity"
-        self.profile_stats["call_counts"][method_name] += 1
-
-        # Check cache
-        sorted_paths = sorted([a.path, b.path])
-        cache_key = (sorted_paths[0], sorted_paths[1])
-
-        if cache_key in self._similarity_cache:
-            self.profile_stats["cache_hits"][method_name] += 1
-        else:
-            self.profile_stats["cache_misses"][method_name] += 1
-
-        start = time.perf_counter()
-        result = super().similarity(a, b)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-    def neighbours(self, note, k=10):
-        """Instrumented neighbours."""
-        method_name = "neighbours"
-        self.profile_stats["call_counts"][method_name] += 1
-
-        # Check cache
-        cache_key = (note.path, k)
-        if cache_key in self._neighbours_cache:
-            self.profile_stats["cache_hits"][method_name] += 1
-        else:
-            self.profile_stats["cache_misses"][method_name] += 1
-
-        start = time.perf_counter()
-        result = super().neighbours(note, k)
-        elapsed = time.perf_counter() - start
-
-        self.profile_stats["timings"][method_name] += elapsed
-        return result
-
-
 def profile_geist(vault_path: str, geist_id: str) -> Dict[str, Any]:
     """Profile a single geist execution.
 
@@ -167,8 +49,11 @@ def profile_geist(vault_path: str, geist_id: str) -> Dict[str, Any]:
     session = Session(date=datetime(2025, 1, 15), db=vault.db)
     session.compute_embeddings(vault.all_notes())
 
-    # Create profiling context
-    context = ProfilingVaultContext(vault, session)
+    # Instrument the context (call counts, timings, cache hits per method)
+    context = VaultContext(vault, session)
+    timings = Instrumentation()
+    timings.instrument(context)
+    timings.attach(vault.db)
 
     # Load geists (use empty custom dir, load only defaults)
     import tempfile
@@ -179,6 +64,7 @@ def profile_geist(vault_path: str, geist_id: str) -> Dict[str, Any]:
             default_geists_dir=Path("src/geistfabrik/default_geists/code"),
         )
         executor.load_geists()
+        executor.timings = timings
 
         # Execute geist
         print(f"Executing {geist_id}...")
@@ -204,53 +90,11 @@ def profile_geist(vault_path: str, geist_id: str) -> Dict[str, Any]:
     print(f"Vault notes: {len(context.notes())}")
 
     # Print profiling stats
-    stats = context.profile_stats
-
-    if stats["call_counts"]:
-        print(f"\n{'─' * 70}")
-        print("METHOD CALL STATISTICS")
-        print(f"{'─' * 70}")
-        print(
-            f"{'Method':<20} {'Calls':>8} {'Hits':>8} {'Misses':>8} "
-            f"{'Hit Rate':>10} {'Time (ms)':>12}"
-        )
-        print(f"{'─' * 70}")
-
-        total_time = sum(stats["timings"].values())
-
-        for method in sorted(stats["call_counts"].keys()):
-            calls = stats["call_counts"][method]
-            hits = stats["cache_hits"].get(method, 0)
-            misses = stats["cache_misses"].get(method, 0)
-            hit_rate = (hits / calls * 100) if calls > 0 else 0
-            method_time = stats["timings"][method]
-            # time_pct = (method_time / total_time * 100) if total_time > 0 else 0
-
-            print(
-                f"{method:<20} {calls:>8} {hits:>8} {misses:>8} "
-                f"{hit_rate:>9.1f}% {method_time * 1000:>11.2f}ms"
-            )
-
-        print(f"{'─' * 70}")
-        print(
-            f"{'TOTAL':<20} {sum(stats['call_counts'].values()):>8} "
-            f"{sum(stats['cache_hits'].values()):>8} "
-            f"{sum(stats['cache_misses'].values()):>8} "
-            f"{'':>10} {total_time * 1000:>11.2f}ms"
-        )
-
-        # Cache efficiency summary
-        total_hits = sum(stats["cache_hits"].values())
-        total_misses = sum(stats["cache_misses"].values())
-
-        if total_hits + total_misses > 0:
-            overall_hit_rate = total_hits / (total_hits + total_misses) * 100
-            print(f"\n{'─' * 70}")
-            print("CACHE EFFICIENCY")
-            print(f"{'─' * 70}")
-            print(f"Overall hit rate: {overall_hit_rate:.1f}%")
-            pct = total_time / elapsed * 100
-            print(f"Time in cached methods: {total_time * 1000:.2f}ms ({pct:.1f}% of total)")
+    timings.detach()
+    print(f"\n{'─' * 70}")
+    print("METHOD CALL STATISTICS")
+    print(f"{'─' * 70}")
+    print(timings.format_table())
 
     print(f"\n{'=' * 70}\n")
 
@@ -260,7 +104,7 @@ def profile_geist(vault_path: str, geist_id: str) -> Dict[str, Any]:
         "elapsed": elapsed,
         "suggestions": len(suggestions),
         "notes": len(context.notes()),
-        "stats": stats,
+        "stats": timings.to_dict(),
     }
 
 
@@ -2,11 +2,13 @@
 
 from .config_loader import GeistFabrikConfig, generate_default_config, load_config, save_config
 from .embeddings import EmbeddingComputer, Session, cosine_similarity, find_similar_notes
+from .engine import EngineRun, GeistFabrikEngine
 from .filtering import SuggestionFilter, select_suggestions
 from .function_registry import (
     DuplicateFunctionError,
     FunctionRegistry,
     FunctionRegistryError,
+    NoteLink,
     vault_function,
 )
 from .geist_executor import GeistExecutor, GeistMetadata
@@ -18,7 +20,7 @@ from .metadata_system import (
 )
 from .models import Link, Note, Suggestion
 from .vault import Vault
-from .vault_context import ChurnResult, VaultContext
+from .vault_context import ChurnResult, EmbeddingMatrix, VaultContext
 from .voice_analysis import VoiceMetadata
 
 __version__ = "0.10.0"
@@ -31,11 +33,14 @@ __all__ = [
     "Vault",
     "VaultContext",
     "ChurnResult",
+    "EmbeddingMatrix",
     "VoiceMetadata",
     "EmbeddingComputer",
     "Session",
     "cosine_similarity",
     "find_similar_notes",
+    "GeistFabrikEngine",
+    "EngineRun",
     "GeistExecutor",
     "GeistMetadata",
     "SuggestionFilter",
@@ -48,6 +53,7 @@ __all__ = [
     "FunctionRegistryError",
     "DuplicateFunctionError",
     "vault_function",
+    "NoteLink",
     "GeistFabrikConfig",
     "load_config",
     "save_config",
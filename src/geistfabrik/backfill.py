@@ -0,0 +1,213 @@
+"""Seed historical sessions in bulk (``geistfabrik backfill``).
+
+Geists that compare sessions over time (neighbour_churn,
+convergent_evolution, drift_velocity_anomaly, ...) need temporal history,
+which otherwise accumulates one ``invoke --date`` at a time. Each such run
+syncs, loads every note and computes one session's temporal embeddings.
+
+A note's session embedding is its cached semantic vector plus three
+temporal features that depend only on the note's creation date and the
+session date. Backfill therefore loads the semantic vectors once, computes
+the temporal features for all notes at all dates in one array operation
+(embeddings.temporal_feature_matrix), and writes every session's rows in a
+single transaction.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .bulk_writer import BulkWriter
+from .config import DEFAULT_SEMANTIC_WEIGHT, SEMANTIC_DIM, TEMPORAL_DIM
+from .embeddings import (
+    EmbeddingComputer,
+    Session,
+    load_cached_semantic_embeddings,
+    note_state,
+    temporal_feature_matrix,
+)
+from .models import Note
+from .quantization import encode_embeddings
+
+logger = logging.getLogger(__name__)
+
+# Session dates whose temporal features are computed in one array operation.
+# Bounds the feature array at ~2.4 MB per 1,000 notes.
+_DATES_PER_CHUNK = 100
+
+
+@dataclass
+class BackfillReport:
+    """Outcome of backfill_sessions()."""
+
+    written: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    notes: int = 0
+    seconds: float = 0.0
+
+
+def session_dates(start: datetime, end: datetime, every: int = 1) -> list[datetime]:
+    """Session dates from start to end inclusive, every ``every`` days.
+
+    Args:
+        start: First date
+        end: Last date (included when it falls on the interval)
+        every: Days between sessions
+
+    Returns:
+        Dates at midnight, oldest first
+
+    Raises:
+        ValueError: If every is less than 1 or end is before start
+    """
+    if every < 1:
+        raise ValueError(f"every must be at least 1 day, got {every}")
+    if end < start:
+        raise ValueError(f"End date {end:%Y-%m-%d} is before start date {start:%Y-%m-%d}")
+    first = datetime(start.year, start.month, start.day)
+    days = (end - first).days
+    return [first + timedelta(days=offset) for offset in range(0, days + 1, every)]
+
+
+def backfill_sessions(
+    db: sqlite3.Connection,
+    notes: list[Note],
+    dates: list[datetime],
+    computer: EmbeddingComputer | None = None,
+    embedding_retention: int | None = None,
+    vacuum_after_prune: bool = False,
+    embedding_precision: str = "float32",
+) -> BackfillReport:
+    """Write session embeddings for many dates at once.
+
+    Sessions already computed for the current vault state are skipped. The
+    latest date goes through the ordinary Session.compute_embeddings, which
+    also encodes and caches any note without a cached semantic vector; the
+    other dates reuse those vectors.
+
+    Args:
+        db: Database connection (vault already synced)
+        notes: All notes in the vault
+        dates: Session dates to backfill
+        computer: Embedding computer (default: the standard model)
+        embedding_retention: Passed to the latest date's Session, which
+            prunes sessions beyond it
+        vacuum_after_prune: Passed to the latest date's Session
+        embedding_precision: Storage precision of the written rows
+            ("float32", "float16" or "int8")
+
+    Returns:
+        Dates written and skipped
+    """
+    start = time.perf_counter()
+    report = BackfillReport(notes=len(notes))
+    if not dates:
+        return report
+    dates = sorted(set(dates))
+    latest = Session(
+        dates[-1],
+        db,
+        computer=computer,
+        embedding_retention=embedding_retention,
+        vacuum_after_prune=vacuum_after_prune,
+        embedding_precision=embedding_precision,
+    )
+    vault_hash = latest.compute_vault_state_hash(notes)
+
+    # Create the other sessions' rows and find those already up to date
+    created_at = datetime.now().isoformat()
+    db.executemany(
+        "INSERT OR IGNORE INTO sessions (date, created_at) VALUES (?, ?)",
+        ((date.strftime("%Y-%m-%d"), created_at) for date in dates),
+    )
+    # A session pruned by retention keeps its hash but has no rows, so it is
+    # up to date only if it also holds a row per note
+    sessions = {
+        day: (session_id, state_hash, rows)
+        for session_id, day, state_hash, rows in db.execute(
+            """
+            SELECT s.session_id, s.date, s.vault_state_hash,
+                   (SELECT COUNT(*) FROM session_embeddings se
+                    WHERE se.session_id = s.session_id)
+            FROM sessions s
+            """
+        )
+    }
+    pending = []
+    for date in dates:
+        key = date.strftime("%Y-%m-%d")
+        _, state_hash, rows = sessions[key]
+        if state_hash == vault_hash and rows == len(notes):
+            report.skipped.append(key)
+        else:
+            report.written.append(key)
+            if date != dates[-1]:
+                pending.append(date)
+
+    # Encodes and caches anything missing from the semantic cache
+    latest.compute_embeddings(notes)
+    if not pending:
+        db.commit()
+        report.seconds = time.perf_counter() - start
+        return report
+
+    cached, semantic, stale = load_cached_semantic_embeddings(db, notes)
+    if stale:
+        # Not in the notes table (callers should pass vault.all_notes())
+        logger.warning("Skipping %d note(s) without a cached embedding", len(stale))
+    paths = [note.path for note in cached]
+    states = [note_state(note) for note in cached]
+
+    # The semantic part is the same for every date; only the temporal
+    # columns change (weighted as in Session.compute_embeddings)
+    combined = np.empty((len(cached), SEMANTIC_DIM + TEMPORAL_DIM), dtype=np.float32)
+    combined[:, :SEMANTIC_DIM] = semantic * DEFAULT_SEMANTIC_WEIGHT
+
+    writer = BulkWriter(db)
+    try:
+        for chunk_start in range(0, len(pending), _DATES_PER_CHUNK):
+            chunk = pending[chunk_start : chunk_start + _DATES_PER_CHUNK]
+            temporal = temporal_feature_matrix(cached, chunk) * (1.0 - DEFAULT_SEMANTIC_WEIGHT)
+            for date, features in zip(chunk, temporal):
+                session_id = sessions[date.strftime("%Y-%m-%d")][0]
+                combined[:, SEMANTIC_DIM:] = features
+                # Replaced rows leave the session's kNN graph stale
+                writer.add("DELETE FROM session_knn WHERE session_id = ?", (session_id,))
+                writer.add("DELETE FROM session_embeddings WHERE session_id = ?", (session_id,))
+                writer.add_many(
+                    """
+                    INSERT INTO session_embeddings
+                    (session_id, note_path, embedding, note_state)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        (session_id, path, blob, state)
+                        for path, blob, state in zip(
+                            paths, encode_embeddings(combined, embedding_precision), states
+                        )
+                    ),
+                )
+                writer.add(
+                    "UPDATE sessions SET vault_state_hash = ? WHERE session_id = ?",
+                    (vault_hash, session_id),
+                )
+                # Flushing per session keeps one session's rows in memory;
+                # the transaction still spans the whole backfill
+                writer.flush()
+        db.commit()
+    except sqlite3.Error:
+        db.rollback()
+        raise
+
+    report.seconds = time.perf_counter() - start
+    logger.info(
+        "Backfilled %d session(s) for %d notes in %.1fs",
+        len(report.written),
+        len(cached),
+        report.seconds,
+    )
+    return report
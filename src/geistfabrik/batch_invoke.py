@@ -0,0 +1,432 @@
+"""Run invoke over many vaults with one model (``geistfabrik invoke-many``).
+
+Running ``geistfabrik invoke`` once per vault reloads the embedding model and
+re-imports everything for every vault, and each run is single-threaded. Here
+the parent process loads the model once and serves it as an encode service;
+vaults are spread over a pool of worker processes, each running the ordinary
+invoke command with the service installed as its model.
+
+Layout:
+- EncodeService: a thread in the parent answering encode requests from
+  workers over multiprocessing queues (one request queue, one reply queue per
+  worker).
+- RemoteEncoder: the model stand-in inside a worker. It has the
+  SentenceTransformer encode() signature, so sessions, the suggestion filter
+  and cluster labelling use it unchanged (see embeddings.install_model).
+- invoke_many(): schedules the vaults and collects a VaultResult per vault.
+
+Workers are started with "spawn" rather than "fork": the parent holds torch
+threads, and geists need each worker's main thread for their SIGALRM
+timeouts. A vault that fails, even by crashing its worker, is recorded and
+does not stop the others; vaults lost with a dead worker are retried one at
+a time in a fresh single-worker pool.
+"""
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from multiprocessing.context import SpawnContext
+from multiprocessing.queues import Queue
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .config import DEFAULT_BATCH_SIZE, MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+
+class EncodeService:
+    """Encodes texts for worker processes with the parent's model.
+
+    Example:
+        >>> service = EncodeService(EmbeddingComputer().model, context)
+        >>> service.start()
+        >>> initargs = service.worker_initargs(4)  # for ProcessPoolExecutor
+        >>> service.stop()
+    """
+
+    def __init__(self, model: Any, context: SpawnContext):
+        """Initialise the service.
+
+        Args:
+            model: Loaded SentenceTransformer (or anything with its encode())
+            context: Multiprocessing context the workers are started from
+        """
+        self.model = model
+        self.context = context
+        self.requests: Queue[Any] = context.Queue()
+        self.responses: dict[int, Queue[Any]] = {}
+        self.texts_encoded = 0
+        self.encode_seconds = 0.0
+        self._next_slot = 0
+        self._thread = threading.Thread(target=self._serve, name="encode-service", daemon=True)
+
+    def start(self) -> None:
+        """Start answering requests."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the service once queued requests are answered."""
+        self.requests.put(None)
+        self._thread.join()
+
+    def worker_initargs(self, workers: int) -> tuple[Any, ...]:
+        """Reply queues for a new pool of workers.
+
+        Args:
+            workers: Pool size
+
+        Returns:
+            initargs for _init_worker: each worker claims one reply queue
+        """
+        slots: Queue[int] = self.context.Queue()
+        responses = {}
+        for _ in range(workers):
+            slot = self._next_slot
+            self._next_slot += 1
+            responses[slot] = self.responses[slot] = self.context.Queue()
+            slots.put(slot)
+        return (self.requests, responses, slots)
+
+    def _serve(self) -> None:
+        while (request := self.requests.get()) is not None:
+            slot, texts, batch_size = request
+            start = time.perf_counter()
+            try:
+                embeddings = self.model.encode(
+                    texts, convert_to_numpy=True, show_progress_bar=False, batch_size=batch_size
+                )
+                reply: tuple[str, Any] = ("ok", np.asarray(embeddings))
+            except Exception as e:
+                logger.warning("Encode request failed: %s", e)
+                reply = ("error", f"{type(e).__name__}: {e}")
+            self.encode_seconds += time.perf_counter() - start
+            self.texts_encoded += len(texts)
+            self.responses[slot].put(reply)
+
+
+class RemoteEncoder:
+    """Worker-side model that forwards encode() to the EncodeService."""
+
+    def __init__(self, requests: "Queue[Any]", responses: "Queue[Any]", slot: int):
+        """Initialise the encoder.
+
+        Args:
+            requests: The service's request queue
+            responses: This worker's reply queue
+            slot: This worker's reply slot
+        """
+        self.requests = requests
+        self.responses = responses
+        self.slot = slot
+        self.texts_sent = 0
+
+    def encode(
+        self,
+        texts: str | list[str],
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> np.ndarray:
+        """Encode texts in the parent process (SentenceTransformer signature).
+
+        Args:
+            texts: Text or texts to embed
+            convert_to_numpy: Ignored; always returns numpy
+            show_progress_bar: Ignored
+            batch_size: Passed to the parent's model
+
+        Returns:
+            Embeddings, (dim,) for one text or (n, dim)
+
+        Raises:
+            RuntimeError: If the parent's model failed on the request
+        """
+        single = isinstance(texts, str)
+        batch = [texts] if isinstance(texts, str) else list(texts)
+        self.requests.put((self.slot, batch, batch_size))
+        status, payload = self.responses.get()
+        if status != "ok":
+            raise RuntimeError(f"Encode service failed: {payload}")
+        self.texts_sent += len(batch)
+        embeddings: np.ndarray = payload
+        return embeddings[0] if single else embeddings
+
+
+# This worker's encoder, set by _init_worker
+_encoder: RemoteEncoder | None = None
+
+
+def _init_worker(
+    requests: "Queue[Any]", responses: "dict[int, Queue[Any]]", slots: "Queue[int]"
+) -> None:
+    """Pool initialiser: claim a reply slot and install the remote encoder."""
+    global _encoder
+    from .embeddings import install_model
+
+    slot = slots.get()
+    _encoder = RemoteEncoder(requests, responses[slot], slot)
+    install_model(MODEL_NAME, _encoder)
+
+
+@dataclass
+class VaultResult:
+    """Outcome of invoke on one vault."""
+
+    vault: str
+    status: str = "ok"  # "ok" | "failed" | "crashed"
+    exit_code: int | None = None
+    seconds: float = 0.0
+    notes: int = 0
+    suggestions: int = 0
+    texts_encoded: int = 0
+    error: str | None = None
+    log: str | None = None
+
+
+def _invoke_vault(vault: str, invoke_args: list[str], log_path: str | None) -> VaultResult:
+    """Run the invoke command on one vault inside a worker."""
+    from .cli import create_parser
+    from .commands import InvokeCommand
+
+    result = VaultResult(vault=vault, log=log_path)
+    sent_before = _encoder.texts_sent if _encoder else 0
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            command = InvokeCommand(create_parser().parse_args(["invoke", vault, *invoke_args]))
+            result.exit_code = command.run()
+        result.notes = command.note_count
+        result.suggestions = command.suggestion_count
+    except BaseException as e:  # SystemExit from argparse included
+        result.exit_code = 1
+        output.write(f"Error: {type(e).__name__}: {e}\n")
+    result.seconds = time.perf_counter() - start
+    result.texts_encoded = (_encoder.texts_sent if _encoder else 0) - sent_before
+
+    text = output.getvalue()
+    if result.exit_code != 0:
+        result.status = "failed"
+        errors = [line for line in text.splitlines() if line.startswith("Error:")]
+        result.error = errors[-1][len("Error:") :].strip() if errors else "invoke failed"
+    if log_path:
+        Path(log_path).write_text(text)
+    return result
+
+
+@dataclass
+class BatchReport:
+    """Results and throughput of one invoke_many() run."""
+
+    results: list[VaultResult] = field(default_factory=list)
+    seconds: float = 0.0
+    workers: int = 0
+    texts_encoded: int = 0
+    encode_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Vaults that completed successfully."""
+        return sum(1 for r in self.results if r.status == "ok")
+
+    @property
+    def vaults_per_hour(self) -> float:
+        """Vaults processed per hour of wall time."""
+        return len(self.results) / self.seconds * 3600 if self.seconds else 0.0
+
+    @property
+    def texts_encoded_per_second(self) -> float:
+        """Encode-service throughput while encoding."""
+        return self.texts_encoded / self.encode_seconds if self.encode_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serialisable report."""
+        return {
+            "vaults": len(self.results),
+            "succeeded": self.succeeded,
+            "failed": len(self.results) - self.succeeded,
+            "workers": self.workers,
+            "seconds": self.seconds,
+            "vaults_per_hour": self.vaults_per_hour,
+            "texts_encoded": self.texts_encoded,
+            "encode_seconds": self.encode_seconds,
+            "texts_encoded_per_second": self.texts_encoded_per_second,
+            "results": [asdict(r) for r in self.results],
+        }
+
+    def format_summary(self) -> str:
+        """Human-readable summary: one line per failure, then throughput."""
+        lines = [f"{r.vault}: {r.status} - {r.error}" for r in self.results if r.status != "ok"]
+        lines += [
+            f"Vaults: {self.succeeded}/{len(self.results)} succeeded "
+            f"in {self.seconds:.1f}s with {self.workers} worker(s)",
+            f"Throughput: {self.vaults_per_hour:.0f} vaults/hour, "
+            f"{self.texts_encoded} texts (notes and suggestions) encoded "
+            f"at {self.texts_encoded_per_second:.0f} texts/s",
+        ]
+        return "\n".join(lines)
+
+
+def read_vault_list(path: Path) -> list[str]:
+    """Read a vault list file: one path per line, blank lines and # comments ignored.
+
+    Args:
+        path: List file
+
+    Returns:
+        Vault paths, relative ones resolved against the list's directory
+    """
+    vaults = []
+    for line in path.read_text().splitlines():
+        entry = line.strip()
+        if entry and not entry.startswith("#"):
+            vault = Path(entry).expanduser()
+            vaults.append(str(vault if vault.is_absolute() else path.parent / vault))
+    return vaults
+
+
+def _log_name(index: int, vault: str) -> str:
+    """Unique, filesystem-safe stem for a vault's output files."""
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", Path(vault).name) or "vault"
+    return f"{index:04d}-{name}"
+
+
+def invoke_many(
+    vaults: Sequence[str | Path],
+    invoke_args: Sequence[str] = (),
+    workers: int | None = None,
+    output_dir: Path | None = None,
+    model: Any = None,
+    progress: Callable[[VaultResult], None] | None = None,
+) -> BatchReport:
+    """Run ``geistfabrik invoke`` on every vault, sharing one model.
+
+    Args:
+        vaults: Vault paths
+        invoke_args: Extra invoke arguments for every vault (e.g. ["--write"])
+        workers: Worker processes (default: CPU count, at most one per vault)
+        output_dir: Where to write <n>-<vault>.log, <n>-<vault>.json and
+            report.json (default: nothing written)
+        model: Embedding model to serve (default: load the standard model)
+        progress: Called with each vault's result as it completes
+
+    Returns:
+        Per-vault results and throughput
+    """
+    vault_list = [str(v) for v in vaults]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(vault_list) or 1))
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    if model is None:
+        from .embeddings import EmbeddingComputer
+
+        model = EmbeddingComputer().model
+
+    context = multiprocessing.get_context("spawn")
+    service = EncodeService(model, context)
+    service.start()
+    report = BatchReport(workers=workers)
+    results: dict[int, VaultResult] = {}
+    start = time.perf_counter()
+    try:
+        args = list(invoke_args)
+        crashed = _run_pool(
+            service,
+            context,
+            workers,
+            vault_list,
+            range(len(vault_list)),
+            args,
+            output_dir,
+            results,
+            progress,
+        )
+        # A dead worker (segfault, OOM kill) breaks its whole pool, so the
+        # other vaults it was running are lost too. Retry each one alone: only
+        # the vault that actually crashes is recorded as crashed.
+        for index in crashed:
+            if _run_pool(
+                service, context, 1, vault_list, [index], args, output_dir, results, progress
+            ):
+                crash = VaultResult(
+                    vault=vault_list[index], status="crashed", error="worker process died"
+                )
+                _record(index, crash, vault_list, output_dir, results, progress)
+    finally:
+        service.stop()
+
+    report.seconds = time.perf_counter() - start
+    report.results = [results[i] for i in range(len(vault_list))]
+    report.texts_encoded = service.texts_encoded
+    report.encode_seconds = service.encode_seconds
+    if output_dir is not None:
+        (output_dir / "report.json").write_text(json.dumps(report.to_dict(), indent=2))
+    return report
+
+
+def _run_pool(
+    service: EncodeService,
+    context: SpawnContext,
+    workers: int,
+    vaults: list[str],
+    indices: Sequence[int],
+    invoke_args: list[str],
+    output_dir: Path | None,
+    results: dict[int, VaultResult],
+    progress: Callable[[VaultResult], None] | None,
+) -> list[int]:
+    """Run some vaults in one pool; returns those lost to a dead worker."""
+    crashed = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(indices)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=service.worker_initargs(min(workers, len(indices))),
+    ) as pool:
+        futures: dict[int, Future[VaultResult]] = {}
+        for index in indices:
+            stem = _log_name(index, vaults[index])
+            log_path = str(output_dir / f"{stem}.log") if output_dir else None
+            futures[index] = pool.submit(_invoke_vault, vaults[index], invoke_args, log_path)
+
+        for index, future in futures.items():
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                crashed.append(index)
+                continue
+            except Exception as e:  # e.g. a result that failed to pickle
+                result = VaultResult(vault=vaults[index], status="failed", error=str(e))
+            _record(index, result, vaults, output_dir, results, progress)
+    return crashed
+
+
+def _record(
+    index: int,
+    result: VaultResult,
+    vaults: list[str],
+    output_dir: Path | None,
+    results: dict[int, VaultResult],
+    progress: Callable[[VaultResult], None] | None,
+) -> None:
+    """Store a vault's final result, write its JSON and report progress."""
+    results[index] = result
+    if output_dir is not None:
+        stem = _log_name(index, vaults[index])
+        (output_dir / f"{stem}.json").write_text(json.dumps(asdict(result), indent=2))
+    if progress is not None:
+        progress(result)
@@ -0,0 +1,547 @@
+"""Scale benchmark suite (``geistfabrik bench``).
+
+Runs a complete session (sync, embed, context build, every geist, filtering,
+journal write) against deterministic synthetic vaults of 1k to 100k notes, and
+records per-phase, per-geist and per-filter-stage timings plus peak memory as
+JSON. A stored result can serve as a baseline: compare_results() lists every
+tracked metric that got slower (or bigger) by more than a threshold, and the
+CLI exits non-zero when there are any.
+
+Everything runs offline. HashEmbeddingModel stands in for the sentence
+transformer: it hashes words into the embedding dimensions, so notes sharing
+vocabulary still land near each other and clustering and neighbour queries do
+realistic work, without loading torch or downloading a model.
+"""
+
+import hashlib
+import os
+import platform
+import re
+import tempfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .config import (
+    BENCH_MIN_MEMORY_MB,
+    BENCH_MIN_SECONDS,
+    DEFAULT_BENCH_THRESHOLD,
+    DEFAULT_GEIST_TIMEOUT,
+    MODEL_NAME,
+    SEMANTIC_DIM,
+)
+from .embeddings import EmbeddingComputer, Session, installed_model
+from .filtering import SuggestionFilter, select_suggestions
+from .function_registry import FunctionRegistry
+from .geist_executor import GeistExecutor
+from .instrumentation import Instrumentation
+from .journal_writer import JournalWriter
+from .memory_budget import peak_memory_mb
+from .models import Suggestion
+from .tracery import TraceryGeistLoader
+from .vault import Vault
+from .vault_context import VaultContext
+
+# Named scales accepted by --scales (any plain number or "<n>k" also works)
+SCALES = {"1k": 1_000, "10k": 10_000, "50k": 50_000, "100k": 100_000}
+
+# Fixed so timings are comparable between runs and machines
+BENCH_SESSION_DATE = datetime(2025, 6, 15)
+
+# Bumped when the result layout changes; compare_results() refuses a mismatch
+RESULT_FORMAT = 1
+
+_PACKAGE_DIR = Path(__file__).parent
+
+_TOPICS = [
+    ("garden", "soil compost seedling pruning mulch harvest perennial"),
+    ("systems", "latency cache queue replica shard throughput consensus"),
+    ("stoicism", "virtue judgement impression assent discipline fortune"),
+    ("woodwork", "joinery chisel grain dovetail plane veneer clamp"),
+    ("music", "harmony cadence interval rhythm counterpoint timbre"),
+    ("cities", "zoning transit density housing street commons"),
+    ("astronomy", "orbit nebula parallax spectrum telescope eclipse"),
+    ("baking", "starter crumb proof hydration levain crust oven"),
+    ("writing", "draft revision voice argument paragraph metaphor"),
+    ("learning", "recall spacing practice feedback transfer interleaving"),
+    ("running", "tempo threshold cadence recovery mileage stride"),
+    ("typography", "kerning serif leading baseline ligature glyph"),
+]
+
+_FILLER = "the and of a to in is that for with as on this about from".split()
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def parse_scale(label: str) -> int:
+    """Parse a scale label such as "10k" or "2500" into a note count.
+
+    Args:
+        label: Scale label
+
+    Returns:
+        Number of notes
+
+    Raises:
+        ValueError: If the label is not a positive count
+    """
+    text = label.strip().lower()
+    if text in SCALES:
+        return SCALES[text]
+    multiplier = 1
+    if text.endswith("k"):
+        text, multiplier = text[:-1], 1000
+    try:
+        notes = int(float(text) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid scale: {label!r} (expected e.g. 1k, 10k or 2500)") from None
+    if notes <= 0:
+        raise ValueError(f"Invalid scale: {label!r} (must be positive)")
+    return notes
+
+
+@dataclass
+class SyntheticVaultSpec:
+    """Shape of a generated vault."""
+
+    notes: int = 1_000
+    mean_links: float = 4.0  # outgoing links per note (Poisson)
+    link_skew: float = 1.1  # Zipf exponent of link targets; higher = stronger hubs
+    journal_fraction: float = 0.1  # share of notes that are dated journal entries
+    date_spread_days: int = 1_095  # notes are created over this many days
+    seed: int = 0
+
+
+def generate_vault(
+    root: Path, spec: SyntheticVaultSpec, session_date: datetime = BENCH_SESSION_DATE
+) -> dict[str, datetime]:
+    """Write a deterministic synthetic vault.
+
+    Regular notes are grouped into topics with their own vocabulary, link to
+    targets drawn from a Zipf distribution (a few hubs, a long tail), and carry
+    tags and tasks. Journal entries live in yearly date-collection files
+    ("## YYYY-MM-DD" sections), which sync splits into one note per day.
+
+    The filesystem cannot hold a creation date, so the intended ones are
+    returned for apply_creation_dates() to write after sync; modification
+    times are set on the files directly.
+
+    Args:
+        root: Empty vault directory
+        spec: Vault shape
+        session_date: Notes are dated before this day
+
+    Returns:
+        Creation date of each regular note, keyed by vault-relative path
+    """
+    rng = np.random.default_rng(spec.seed)
+    journal_count = min(int(spec.notes * spec.journal_fraction), spec.date_spread_days)
+    count = spec.notes - journal_count
+
+    titles = [f"{_TOPICS[i % len(_TOPICS)][0].title()} note {i:06d}" for i in range(count)]
+    topic_words = [words.split() for _, words in _TOPICS]
+
+    # Zipf-distributed link targets over a shuffled ranking, so hubs are
+    # spread across topics rather than being the first notes written
+    link_counts = rng.poisson(spec.mean_links, size=count)
+    weights = 1.0 / np.arange(1, count + 1) ** spec.link_skew
+    ranking = rng.permutation(count)
+    targets = ranking[rng.choice(count, size=int(link_counts.sum()), p=weights / weights.sum())]
+    link_offsets = np.concatenate(([0], np.cumsum(link_counts)))
+
+    ages = rng.integers(1, spec.date_spread_days, size=count)
+    edit_lags = rng.integers(0, 60, size=count)
+    word_choices = rng.integers(0, 7, size=(count, 24))
+    filler_choices = rng.integers(0, len(_FILLER), size=(count, 24))
+    has_task = rng.random(count) < 0.15
+    has_question = rng.random(count) < 0.2
+    has_tag = rng.random(count) < 0.4
+
+    created: dict[str, datetime] = {}
+    for i, title in enumerate(titles):
+        topic, _ = _TOPICS[i % len(_TOPICS)]
+        vocab = topic_words[i % len(topic_words)]
+        words = [
+            f"{_FILLER[f]} {vocab[w % len(vocab)]}"
+            for w, f in zip(word_choices[i], filler_choices[i], strict=True)
+        ]
+        lines = [f"# {title}", "", " ".join(words[:12]) + ".", " ".join(words[12:]) + "."]
+        links = targets[link_offsets[i] : link_offsets[i + 1]]
+        if len(links):
+            lines.append("See " + ", ".join(f"[[{titles[t]}]]" for t in links if t != i) + ".")
+        if has_question[i]:
+            lines.append(f"What would change if {vocab[3]} came before {vocab[4]}?")
+        if has_task[i]:
+            lines += ["", f"- [ ] revisit {vocab[0]}", f"- [x] read about {vocab[1]}"]
+        if has_tag[i]:
+            lines.append(f"\n#{topic}")
+
+        path = root / f"{title}.md"
+        path.write_text("\n".join(lines) + "\n")
+        born = session_date - timedelta(days=int(ages[i]))
+        edited = min(born + timedelta(days=int(edit_lags[i])), session_date - timedelta(days=1))
+        os.utime(path, (edited.timestamp(), edited.timestamp()))
+        created[path.name] = born
+
+    if journal_count:
+        days = np.sort(rng.choice(np.arange(1, spec.date_spread_days + 1), journal_count, False))
+        entries: dict[int, list[str]] = {}
+        for age in days[::-1]:
+            day = session_date - timedelta(days=int(age))
+            vocab = topic_words[int(age) % len(topic_words)]
+            link = titles[int(ranking[int(age) % count])] if count else None
+            body = f"Thought about {vocab[0]} and {vocab[2]} today."
+            if link:
+                body += f" Linked to [[{link}]]."
+            entries.setdefault(day.year, []).append(f"## {day.date().isoformat()}\n\n{body}\n")
+        for year, sections in entries.items():
+            (root / f"Journal {year}.md").write_text("\n".join(sections))
+
+    return created
+
+
+def apply_creation_dates(vault: Vault, created: dict[str, datetime]) -> None:
+    """Write generate_vault()'s creation dates into the synced notes table.
+
+    Args:
+        vault: Synced vault
+        created: Creation date per vault-relative path
+    """
+    vault.db.executemany(
+        "UPDATE notes SET created = ? WHERE path = ?",
+        [(when.isoformat(), path) for path, when in created.items()],
+    )
+    vault.db.commit()
+
+
+class HashEmbeddingModel:
+    """Offline stand-in for the sentence transformer.
+
+    Each word is hashed to one embedding dimension and a sign (feature
+    hashing); a text's embedding is the normalised sum over its words.
+    Deterministic, fast, and texts sharing words score as similar.
+
+    Example:
+        >>> computer = EmbeddingComputer(model=HashEmbeddingModel())
+    """
+
+    def __init__(self, dimension: int = SEMANTIC_DIM):
+        """Initialise the model.
+
+        Args:
+            dimension: Embedding width
+        """
+        self.dimension = dimension
+        self._slots: dict[str, tuple[int, float]] = {}
+
+    def _slot(self, token: str) -> tuple[int, float]:
+        slot = self._slots.get(token)
+        if slot is None:
+            value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+            slot = self._slots[token] = (value % self.dimension, 1.0 if value >> 63 else -1.0)
+        return slot
+
+    def encode(
+        self,
+        texts: str | list[str],
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        batch_size: int = 32,
+    ) -> np.ndarray:
+        """Embed one text or a list of texts (same contract as SentenceTransformer).
+
+        Args:
+            texts: Text or texts to embed
+            convert_to_numpy: Ignored; always returns numpy
+            show_progress_bar: Ignored
+            batch_size: Ignored
+
+        Returns:
+            float32 array, (dimension,) for one text or (n, dimension)
+        """
+        single = isinstance(texts, str)
+        items = [texts] if isinstance(texts, str) else texts
+        rows: list[int] = []
+        cols: list[int] = []
+        signs: list[float] = []
+        for row, text in enumerate(items):
+            for token in _TOKEN_RE.findall(text.lower()):
+                col, sign = self._slot(token)
+                rows.append(row)
+                cols.append(col)
+                signs.append(sign)
+
+        out = np.zeros((len(items), self.dimension), dtype=np.float32)
+        np.add.at(out, (rows, cols), signs)
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out[0] if single else out
+
+
+def run_benchmark(
+    spec: SyntheticVaultSpec,
+    geist_ids: Iterable[str] | None = None,
+    timeout: int = DEFAULT_GEIST_TIMEOUT,
+) -> dict[str, Any]:
+    """Run one session against a freshly generated vault.
+
+    Vault generation is not timed. Phases mirror ``invoke --write``: sync,
+    embed, context, execute (every default geist, in load order), filter,
+    write.
+
+    Args:
+        spec: Vault to generate
+        geist_ids: Geists to run (default: every default code and Tracery geist)
+        timeout: Per-geist timeout in seconds
+
+    Returns:
+        JSON-serialisable result for this scale
+    """
+    wanted = set(geist_ids) if geist_ids is not None else None
+    hash_model = HashEmbeddingModel()
+    computer = EmbeddingComputer(model=hash_model)  # type: ignore[arg-type]
+    timings = Instrumentation()
+
+    # Cluster labelling (KeyBERT) creates its own EmbeddingComputer(); with the
+    # hash model installed under MODEL_NAME it never loads the real model
+    with (
+        installed_model(MODEL_NAME, hash_model),
+        tempfile.TemporaryDirectory(prefix="geistfabrik-bench-") as tmp,
+    ):
+        root = Path(tmp)
+        created = generate_vault(root, spec)
+        (root / "_geistfabrik").mkdir()
+
+        vault = Vault(root, root / "_geistfabrik" / "vault.db")
+        try:
+            timings.attach(vault.db)
+            with timings.phase("sync"):
+                vault.sync()
+            apply_creation_dates(vault, created)
+            notes = vault.all_notes()
+
+            with timings.phase("embed"):
+                session = Session(BENCH_SESSION_DATE, vault.db, computer=computer)
+                session.compute_embeddings(notes)
+
+            with timings.phase("context"):
+                context = VaultContext(vault, session, function_registry=FunctionRegistry())
+                executor = GeistExecutor(
+                    root / "_geistfabrik" / "geists" / "code",
+                    timeout=timeout,
+                    default_geists_dir=_PACKAGE_DIR / "default_geists" / "code",
+                )
+                executor.load_geists()
+                tracery_geists, _ = TraceryGeistLoader(
+                    root / "_geistfabrik" / "geists" / "tracery",
+                    seed=int(BENCH_SESSION_DATE.timestamp()),
+                    default_geists_dir=_PACKAGE_DIR / "default_geists" / "tracery",
+                ).load_all()
+            executor.timings = timings
+
+            suggestions: list[Suggestion] = []
+            counts: dict[str, int] = {}
+            statuses: dict[str, str] = {}
+            with timings.phase("execute"):
+                for geist_id in list(executor.geists):
+                    if wanted is None or geist_id in wanted:
+                        results = executor.execute_geist(geist_id, context)
+                        counts[geist_id] = len(results)
+                        suggestions.extend(results)
+                for tracery_geist in tracery_geists:
+                    if wanted is None or tracery_geist.geist_id in wanted:
+                        with timings.geist(tracery_geist.geist_id):
+                            try:
+                                results = tracery_geist.suggest(context)
+                            except Exception:
+                                results = []
+                                statuses[tracery_geist.geist_id] = "error"
+                        counts[tracery_geist.geist_id] = len(results)
+                        suggestions.extend(results)
+
+            suggestion_filter = SuggestionFilter(vault.db, computer)
+            with timings.phase("filter"):
+                filtered = suggestion_filter.filter_all(suggestions, BENCH_SESSION_DATE)
+                final = select_suggestions(
+                    filtered, "default", 5, int(BENCH_SESSION_DATE.timestamp())
+                )
+
+            with timings.phase("write"):
+                JournalWriter(root, vault.db).write_session(BENCH_SESSION_DATE, final)
+        finally:
+            timings.detach()
+            vault.close()
+
+    for entry in executor.execution_log:
+        # A timed-out geist's time is the timeout, not its real cost
+        statuses[entry["geist_id"]] = entry.get("error_type") or entry["status"]
+    return {
+        "notes": len(notes),
+        "spec": asdict(spec),
+        "phases": {name: span.duration for name, span in timings.phases.items()},
+        "sql": {name: span.sql_count for name, span in timings.phases.items()},
+        "total": sum(span.duration for span in timings.phases.values()),
+        "geists": {
+            geist_id: {
+                "seconds": span.duration,
+                "sql": span.sql_count,
+                "suggestions": counts.get(geist_id, 0),
+                "status": statuses.get(geist_id, "success"),
+            }
+            for geist_id, span in timings.geists.items()
+        },
+        "filters": {timing.stage: timing.seconds for timing in suggestion_filter.timings},
+        "suggestions": {"raw": len(suggestions), "filtered": len(filtered), "final": len(final)},
+        "peak_rss_mb": peak_memory_mb(),
+    }
+
+
+def run_suite(
+    scales: list[str],
+    geist_ids: Iterable[str] | None = None,
+    timeout: int = DEFAULT_GEIST_TIMEOUT,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark several scales, smallest first.
+
+    Peak memory is a process-wide high-water mark; running in ascending order
+    makes each scale's figure its own peak (or close to it).
+
+    Args:
+        scales: Scale labels (see parse_scale)
+        geist_ids: Geists to run (default: all default geists)
+        timeout: Per-geist timeout in seconds
+        seed: Vault generator seed
+
+    Returns:
+        Result document: environment details and one entry per scale
+    """
+    from . import __version__
+
+    geist_list = list(geist_ids) if geist_ids is not None else None
+    results: dict[str, Any] = {}
+    for label in sorted(scales, key=parse_scale):
+        spec = SyntheticVaultSpec(notes=parse_scale(label), seed=seed)
+        results[label] = run_benchmark(spec, geist_list, timeout)
+
+    return {
+        "format": RESULT_FORMAT,
+        "geistfabrik": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "scales": results,
+    }
+
+
+@dataclass
+class Regression:
+    """A tracked metric that regressed past the threshold."""
+
+    scale: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (0.5 = 50% worse)."""
+        return self.current / self.baseline - 1 if self.baseline else float("inf")
+
+
+def tracked_metrics(result: dict[str, Any]) -> dict[str, float]:
+    """Flatten one scale's result into the metrics compare_results() gates on.
+
+    Args:
+        result: One entry of a result document's "scales"
+
+    Returns:
+        Metric name ("total", "phase.<name>", "geist.<id>", "peak_rss_mb") to value
+    """
+    metrics: dict[str, float] = {"total": result["total"]}
+    for name, seconds in result["phases"].items():
+        metrics[f"phase.{name}"] = seconds
+    for geist_id, stats in result["geists"].items():
+        metrics[f"geist.{geist_id}"] = stats["seconds"]
+    if result.get("peak_rss_mb") is not None:
+        metrics["peak_rss_mb"] = result["peak_rss_mb"]
+    return metrics
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_BENCH_THRESHOLD,
+    min_seconds: float = BENCH_MIN_SECONDS,
+    min_memory_mb: float = BENCH_MIN_MEMORY_MB,
+) -> list[Regression]:
+    """Find tracked metrics that regressed against a baseline.
+
+    A metric regresses when it exceeds its baseline by more than threshold
+    (relative) and by more than an absolute floor (min_seconds for timings,
+    min_memory_mb for memory), so sub-millisecond noise never fails a run.
+    Scales and metrics present in only one document are skipped.
+
+    Args:
+        current: Result document from run_suite()
+        baseline: Earlier result document
+        threshold: Allowed relative increase (0.25 = 25%)
+        min_seconds: Smallest timing increase that counts
+        min_memory_mb: Smallest memory increase that counts
+
+    Returns:
+        Regressions, worst first
+
+    Raises:
+        ValueError: If the documents have different result formats
+    """
+    if baseline.get("format") != current.get("format"):
+        raise ValueError(
+            f"Baseline format {baseline.get('format')} does not match "
+            f"current format {current.get('format')}; re-record the baseline"
+        )
+
+    regressions = []
+    for scale, result in current["scales"].items():
+        if scale not in baseline["scales"]:
+            continue
+        before = tracked_metrics(baseline["scales"][scale])
+        for metric, value in tracked_metrics(result).items():
+            base = before.get(metric)
+            if base is None:
+                continue
+            floor = min_memory_mb if metric == "peak_rss_mb" else min_seconds
+            if value > base * (1 + threshold) and value - base > floor:
+                regressions.append(Regression(scale, metric, base, value))
+    return sorted(regressions, key=lambda r: -r.change)
+
+
+def format_results(document: dict[str, Any], top: int = 10) -> str:
+    """Render a result document as a table per scale.
+
+    Args:
+        document: Result document from run_suite()
+        top: Slowest geists to list per scale
+
+    Returns:
+        Multi-line summary
+    """
+    lines = []
+    for scale, result in document["scales"].items():
+        memory = result.get("peak_rss_mb")
+        lines.append(
+            f"{scale}: {result['notes']} notes, {result['total']:.2f}s total, "
+            + (f"peak RSS {memory:.0f} MiB" if memory is not None else "peak RSS n/a")
+        )
+        for name, seconds in result["phases"].items():
+            lines.append(f"  {name:<26} {seconds * 1000:>10.1f} ms {result['sql'][name]:>8} SQL")
+        slowest = sorted(result["geists"].items(), key=lambda item: -item[1]["seconds"])
+        for geist_id, stats in slowest[:top]:
+            status = "" if stats["status"] == "success" else f"  ({stats['status']})"
+            lines.append(f"    {geist_id:<24} {stats['seconds'] * 1000:>10.1f} ms{status}")
+        lines.append("")
+    return "\n".join(lines).rstrip()
@@ -0,0 +1,109 @@
+"""Batched SQLite writes for sync, session embeddings and journal recording.
+
+Issuing one statement per row turns a first sync (or a session commit) into
+thousands of tiny round-trips. BulkWriter accumulates rows per statement and
+flushes each statement with executemany() in chunks, so the whole batch runs
+as a handful of statements inside a single transaction.
+"""
+
+import logging
+import sqlite3
+from collections.abc import Iterable, Sequence
+from types import TracebackType
+from typing import Any
+
+from .config import BULK_WRITE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """Accumulates rows per SQL statement and flushes them with executemany.
+
+    Statements are flushed in the order they were first added, so callers
+    express dependencies (deletes before inserts, parents before children)
+    simply by adding statements in that order.
+
+    Used as a context manager, the writer flushes and commits on success and
+    rolls back (discarding pending rows) on error:
+
+        with BulkWriter(db) as writer:
+            writer.add_many("INSERT INTO tags (note_path, tag) VALUES (?, ?)", rows)
+    """
+
+    def __init__(self, db: sqlite3.Connection, chunk_size: int = BULK_WRITE_CHUNK_SIZE):
+        """Initialise writer.
+
+        Args:
+            db: Database connection to write to
+            chunk_size: Maximum rows per executemany() call
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self.db = db
+        self.chunk_size = chunk_size
+        self._pending: dict[str, list[Sequence[Any]]] = {}
+        self.rows_written = 0
+        self.statements_executed = 0
+
+    def add(self, sql: str, row: Sequence[Any]) -> None:
+        """Queue one row for a statement.
+
+        Args:
+            sql: Parameterised SQL statement
+            row: Parameters for one execution
+        """
+        self._pending.setdefault(sql, []).append(row)
+
+    def add_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Queue many rows for a statement.
+
+        Args:
+            sql: Parameterised SQL statement
+            rows: Parameters, one sequence per execution
+        """
+        self._pending.setdefault(sql, []).extend(rows)
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows queued but not yet flushed."""
+        return sum(len(rows) for rows in self._pending.values())
+
+    def flush(self) -> int:
+        """Execute all queued rows, statement by statement, in chunks.
+
+        Does not commit; the caller (or the context manager) owns the
+        transaction.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for sql, rows in self._pending.items():
+            for start in range(0, len(rows), self.chunk_size):
+                self.db.executemany(sql, rows[start : start + self.chunk_size])
+                self.statements_executed += 1
+            written += len(rows)
+        self._pending.clear()
+        self.rows_written += written
+        return written
+
+    def discard(self) -> None:
+        """Drop queued rows without writing them."""
+        self._pending.clear()
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+            self.db.rollback()
+            return
+        self.flush()
+        self.db.commit()
@@ -10,14 +10,19 @@ import logging
 import sys
 
 from .commands import (
+    BackfillCommand,
     BaseCommand,
+    BenchCommand,
+    DbCommand,
     InitCommand,
     InvokeCommand,
+    InvokeManyCommand,
     StatsCommand,
     TestAllCommand,
     TestCommand,
     ValidateCommand,
 )
+from .config import DEFAULT_BENCH_THRESHOLD, DEFAULT_GEIST_TIMEOUT
 from .default_geists import TOTAL_GEIST_COUNT
 
 
@@ -54,6 +59,9 @@ Examples:
     # Invoke command
     _add_invoke_parser(subparsers)
 
+    # Invoke-many command
+    _add_invoke_many_parser(subparsers)
+
     # Test command
     _add_test_parser(subparsers)
 
@@ -66,6 +74,15 @@ Examples:
     # Validate command
     _add_validate_parser(subparsers)
 
+    # Bench command
+    _add_bench_parser(subparsers)
+
+    # Backfill command
+    _add_backfill_parser(subparsers)
+
+    # Db command group
+    _add_db_parser(subparsers)
+
     return parser
 
 
@@ -158,6 +175,11 @@ def _add_invoke_parser(subparsers: argparse._SubParsersAction) -> None:  # type:
         action="store_true",
         help="Show what changed since last session",
     )
+    invoke_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every geist instead of reusing output cached by an earlier run",
+    )
     invoke_parser.add_argument(
         "--verbose",
         action="store_true",
@@ -168,6 +190,17 @@ def _add_invoke_parser(subparsers: argparse._SubParsersAction) -> None:  # type:
         action="store_true",
         help="Enable performance profiling and diagnostic output for geist execution",
     )
+    invoke_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Show time and SQL per phase and geist, and VaultContext method statistics",
+    )
+    invoke_parser.add_argument(
+        "--timings-file",
+        type=str,
+        metavar="PATH",
+        help="Write the timings as a Chrome trace (JSON) to PATH",
+    )
     invoke_parser.add_argument(
         "--quiet",
         action="store_true",
@@ -175,6 +208,79 @@ def _add_invoke_parser(subparsers: argparse._SubParsersAction) -> None:  # type:
     )
 
 
+def _add_invoke_many_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
+    """Add the invoke-many subparser."""
+    invoke_many_parser = subparsers.add_parser(
+        "invoke-many",
+        help="Run invoke on every vault in a list, sharing one model across worker processes",
+    )
+    invoke_many_parser.add_argument(
+        "vault_list",
+        type=str,
+        help="Text file with one vault path per line (# comments allowed)",
+    )
+    invoke_many_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, at most one per vault)",
+    )
+    invoke_many_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        metavar="DIR",
+        help="Write each vault's log and result, plus report.json, to DIR",
+    )
+    invoke_many_parser.add_argument(
+        "--geists",
+        type=str,
+        help="Run only these geists in every vault, comma-separated",
+    )
+    invoke_many_parser.add_argument(
+        "--date",
+        type=str,
+        help="Session date in YYYY-MM-DD format (defaults to today)",
+    )
+    invoke_many_parser.add_argument(
+        "--timeout",
+        type=int,
+        default=None,
+        help="Geist execution timeout in seconds (default: each vault's config, 30)",
+    )
+    invoke_many_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Keep all filtered suggestions (no sampling)",
+    )
+    invoke_many_parser.add_argument(
+        "--count",
+        type=int,
+        default=None,
+        help="Suggestions in default mode (default: each vault's config, 5)",
+    )
+    invoke_many_parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Write each vault's session note (default: preview only)",
+    )
+    invoke_many_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite existing session notes (use with --write)",
+    )
+    invoke_many_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every geist instead of reusing output cached by an earlier run",
+    )
+    invoke_many_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary",
+    )
+
+
 def _add_test_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
     """Add the test subparser."""
     test_parser = subparsers.add_parser(
@@ -236,6 +342,11 @@ def _add_test_all_parser(subparsers: argparse._SubParsersAction) -> None:  # typ
         default=None,
         help="Geist execution timeout in seconds (default: config geist_execution.timeout, 30)",
     )
+    test_all_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every geist instead of reusing output cached by an earlier run",
+    )
     test_all_parser.add_argument(
         "--verbose",
         action="store_true",
@@ -316,15 +427,150 @@ def _add_validate_parser(subparsers: argparse._SubParsersAction) -> None:  # typ
     )
 
 
+def _add_bench_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
+    """Add the bench subparser."""
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark full sessions on generated vaults (no vault needed)",
+    )
+    bench_parser.add_argument(
+        "--scales",
+        type=str,
+        default="1k",
+        help="Comma-separated vault sizes: 1k, 10k, 50k, 100k or any count (default: 1k)",
+    )
+    bench_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        metavar="PATH",
+        help="Write results as JSON (usable later as a --baseline)",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=str,
+        metavar="PATH",
+        help="Compare against an earlier --output file; exit 1 on regression",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_BENCH_THRESHOLD,
+        help=(
+            f"Relative increase that counts as a regression (default: {DEFAULT_BENCH_THRESHOLD})"
+        ),
+    )
+    bench_parser.add_argument(
+        "--geists",
+        type=str,
+        help="Comma-separated geist IDs to run (default: all default geists)",
+    )
+    bench_parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_GEIST_TIMEOUT,
+        help=f"Geist execution timeout in seconds (default: {DEFAULT_GEIST_TIMEOUT})",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic vault generator seed (default: 0)",
+    )
+
+
+def _add_backfill_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
+    """Add the backfill subparser."""
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Compute session embeddings for a range of past dates in bulk",
+    )
+    backfill_parser.add_argument(
+        "vault",
+        type=str,
+        help="Path to Obsidian vault",
+    )
+    backfill_parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=str,
+        required=True,
+        help="First session date (YYYY-MM-DD)",
+    )
+    backfill_parser.add_argument(
+        "--to",
+        type=str,
+        help="Last session date (YYYY-MM-DD, default: today)",
+    )
+    backfill_parser.add_argument(
+        "--every",
+        type=int,
+        default=1,
+        metavar="DAYS",
+        help="Days between sessions (default: 1)",
+    )
+    backfill_parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Show detailed output",
+    )
+
+
+def _add_db_parser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
+    """Add the db subparser and its stats/compact subcommands."""
+    db_parser = subparsers.add_parser(
+        "db",
+        help="Inspect or compact the vault database",
+    )
+    db_subparsers = db_parser.add_subparsers(dest="db_command", required=True)
+
+    stats_parser = db_subparsers.add_parser(
+        "stats",
+        help="Show row counts, sizes and fragmentation per table",
+    )
+    stats_parser.add_argument(
+        "vault",
+        type=str,
+        nargs="?",
+        help="Path to Obsidian vault (optional, auto-detects from current directory)",
+    )
+    stats_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output as JSON for scripting",
+    )
+
+    compact_parser = db_subparsers.add_parser(
+        "compact",
+        help="Release free pages and rebuild indexes",
+    )
+    compact_parser.add_argument(
+        "vault",
+        type=str,
+        nargs="?",
+        help="Path to Obsidian vault (optional, auto-detects from current directory)",
+    )
+    compact_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rewrite the whole database file so every table is contiguous (slower)",
+    )
+
+
 # Command registry mapping command names to their classes
 # Using a concrete type for each command to avoid abstract instantiation issues
 COMMANDS: dict[str, type[BaseCommand]] = {
     "init": InitCommand,
     "invoke": InvokeCommand,
+    "invoke-many": InvokeManyCommand,
     "test": TestCommand,
     "test-all": TestAllCommand,
     "stats": StatsCommand,
     "validate": ValidateCommand,
+    "bench": BenchCommand,
+    "backfill": BackfillCommand,
+    "db": DbCommand,
 }
 
 
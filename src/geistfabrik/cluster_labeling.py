@@ -12,12 +12,8 @@ import logging
 import sqlite3
 
 import numpy as np
-from sklearn.feature_extraction.text import (  # type: ignore[import-untyped]
-    TfidfVectorizer,
-)
-from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-    cosine_similarity as sklearn_cosine,
-)
+
+from .embeddings import configure_sklearn, pairwise_cosine
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +145,9 @@ def label_tfidf(
     cluster_texts = {cid: " ".join(texts) for cid, texts in clusters.items()}
 
     # Compute TF-IDF
+    configure_sklearn()
+    from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore[import-untyped]
+
     vectorizer = TfidfVectorizer(max_features=100, stop_words="english", ngram_range=(1, 2))
 
     try:
@@ -205,8 +204,11 @@ def label_keybert(
     Returns:
         Dictionary mapping cluster_id to label string (comma-separated keywords)
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     from geistfabrik.embeddings import EmbeddingComputer
 
+    configure_sklearn()
     cluster_labels: dict[int, str] = {}
 
     # Load note titles/content for each cluster
@@ -292,7 +294,7 @@ def label_keybert(
 
             # Compute semantic similarity to cluster centroid
             centroid_2d = centroid.reshape(1, -1)
-            similarities = sklearn_cosine(centroid_2d, candidate_embeddings)[0]
+            similarities = pairwise_cosine(centroid_2d, candidate_embeddings)[0]
 
             # Apply MMR with semantic scores
             diverse_terms = apply_mmr(candidate_terms, similarities, lambda_param=0.5, k=n_terms)
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from geistfabrik.embeddings import configure_sklearn, pairwise_cosine
+
 if TYPE_CHECKING:
     from geistfabrik.models import Note
     from geistfabrik.vault_context import VaultContext
@@ -50,17 +52,13 @@ class Cluster:
         Returns:
             Cosine similarity to cluster centroid (0-1)
         """
-        from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-            cosine_similarity as sklearn_cosine,
-        )
-
         # Get note embedding via public accessor
         note_emb = vault.get_embedding(note.path)
         if note_emb is None:
             return 0.0
 
         # Compute similarity to centroid
-        similarity = sklearn_cosine(note_emb.reshape(1, -1), self.centroid.reshape(1, -1))
+        similarity = pairwise_cosine(note_emb.reshape(1, -1), self.centroid.reshape(1, -1))
         return float(similarity[0, 0])
 
 
@@ -156,6 +154,7 @@ class ClusterAnalyser:
             from sklearn.cluster import HDBSCAN  # type: ignore[import-untyped]
         except ImportError:
             return {}
+        configure_sklearn()
 
         # Use cached session embeddings via public accessor
         embeddings_dict = self.vault.get_all_embeddings()
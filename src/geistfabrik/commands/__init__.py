@@ -8,20 +8,28 @@ Each command encapsulates its own logic while sharing common functionality
 like vault validation, config loading, and error handling through BaseCommand.
 """
 
+from .backfill import BackfillCommand
 from .base import BaseCommand, CommandContext, ExecutionContext, find_vault_root
 from .batch_runner import TestAllCommand
+from .bench import BenchCommand
+from .db import DbCommand
 from .initialize import InitCommand
 from .invoke import InvokeCommand
+from .invoke_many import InvokeManyCommand
 from .runner import TestCommand
 from .stats import StatsCommand
 from .validate import ValidateCommand
 
 __all__ = [
+    "BackfillCommand",
     "BaseCommand",
+    "BenchCommand",
     "CommandContext",
+    "DbCommand",
     "ExecutionContext",
     "InitCommand",
     "InvokeCommand",
+    "InvokeManyCommand",
     "StatsCommand",
     "TestCommand",
     "TestAllCommand",
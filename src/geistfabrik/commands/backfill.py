@@ -0,0 +1,69 @@
+"""Backfill command for seeding historical sessions in bulk."""
+
+from ..config_loader import GeistFabrikConfig
+from .base import BaseCommand
+
+
+class BackfillCommand(BaseCommand):
+    """Command to write session embeddings for a range of past dates.
+
+    Equivalent to running ``invoke --date`` once per date without running
+    any geists, but loads the vault and its semantic embeddings once and
+    writes every session in a single transaction.
+    """
+
+    def execute(self) -> int:
+        """Execute the backfill command.
+
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        from ..backfill import backfill_sessions, session_dates
+
+        vault_path = self.get_vault_path()
+        if vault_path is None:
+            return 1
+        if not self.validate_geistfabrik_initialised(vault_path):
+            return 1
+
+        start = self.parse_session_date(self.args.from_date)
+        end = self.parse_session_date(self.args.to)
+        if start is None or end is None:
+            return 1
+        try:
+            dates = session_dates(start, end, every=self.args.every)
+        except ValueError as e:
+            self.print_error(str(e))
+            return 1
+
+        cmd_ctx = self.setup_command_context(vault_path)
+        if cmd_ctx is None:
+            return 1
+        config = cmd_ctx.config if cmd_ctx.config is not None else GeistFabrikConfig()
+        retention = config.session_embedding_retention
+        if 0 < retention < len(dates):
+            self.print(
+                f"Warning: {len(dates)} sessions exceed session_embedding_retention "
+                f"({retention}); older ones will be pruned by the next invoke"
+            )
+
+        self.print("Syncing vault...")
+        changed = cmd_ctx.vault.sync()
+        self.print_verbose(f"Synced {changed} changed note(s)")
+
+        self.print(
+            f"Backfilling {len(dates)} session(s) from {dates[0]:%Y-%m-%d} to {dates[-1]:%Y-%m-%d}"
+        )
+        report = backfill_sessions(
+            cmd_ctx.vault.db,
+            cmd_ctx.vault.all_notes(),
+            dates,
+            embedding_retention=retention,
+            vacuum_after_prune=config.database.vacuum_after_prune,
+            embedding_precision=config.database.embedding_precision,
+        )
+        self.print(
+            f"Backfilled {len(report.written)} session(s) for {report.notes} notes, "
+            f"skipped {len(report.skipped)} already up to date, in {report.seconds:.1f}s"
+        )
+        return 0
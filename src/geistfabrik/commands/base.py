@@ -8,13 +8,19 @@ from datetime import datetime
 from pathlib import Path
 
 from ..config import (
+    DEFAULT_DATABASE_VACUUM_AFTER_PRUNE,
+    DEFAULT_EMBEDDING_PRECISION,
     DEFAULT_GEIST_TIMEOUT,
     DEFAULT_MAX_GEIST_FAILURES,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_SEARCH_PRECISION,
     DEFAULT_SESSION_EMBEDDING_RETENTION,
 )
 from ..config_loader import GeistFabrikConfig, load_config
 from ..embeddings import Session
 from ..function_registry import FunctionRegistry
+from ..geist_cache import GeistOutputCache, session_fingerprint
+from ..memory_budget import MemoryBudget
 from ..metadata_system import MetadataLoader
 from ..vault import Vault
 from ..vault_context import VaultContext
@@ -297,7 +303,7 @@ class BaseCommand(ABC):
             self.print_verbose(f"Loaded configuration from {config_path.relative_to(vault_path)}")
 
         # Open vault
-        self._vault = Vault(vault_path, db_path)
+        self._vault = Vault(vault_path, db_path, config=config)
 
         return CommandContext(
             vault_path=vault_path,
@@ -358,10 +364,22 @@ class BaseCommand(ABC):
             vault.db,
             backend=backend_type,
             embedding_retention=embedding_retention,
+            vacuum_after_prune=(
+                config.database.vacuum_after_prune
+                if config
+                else DEFAULT_DATABASE_VACUUM_AFTER_PRUNE
+            ),
+            embedding_precision=(
+                config.database.embedding_precision if config else DEFAULT_EMBEDDING_PRECISION
+            ),
+            search_precision=(
+                config.vector_search.precision if config else DEFAULT_SEARCH_PRECISION
+            ),
         )
 
-        self.print_verbose(f"Computing embeddings for {len(vault.all_notes())} notes...")
-        session.compute_embeddings(vault.all_notes())
+        notes = vault.all_notes()
+        self.print_verbose(f"Computing embeddings for {len(notes)} notes...")
+        session.compute_embeddings(notes)
 
         # Create VaultContext
         vault_context = VaultContext(
@@ -369,6 +387,9 @@ class BaseCommand(ABC):
             session,
             metadata_loader=metadata_loader,
             function_registry=function_registry,
+            memory_budget=MemoryBudget(
+                config.performance.memory_budget_mb if config else DEFAULT_MEMORY_BUDGET_MB
+            ),
         )
 
         return ExecutionContext(
@@ -384,6 +405,32 @@ class BaseCommand(ABC):
             function_registry=function_registry,
         )
 
+    def setup_output_cache(self, exec_ctx: ExecutionContext) -> GeistOutputCache | None:
+        """Create the cross-run geist output cache, unless --no-cache was given.
+
+        Call once the config is final: it is part of the cache key.
+
+        Args:
+            exec_ctx: Execution context the geists will run in
+
+        Returns:
+            GeistOutputCache, or None when caching is disabled
+        """
+        if getattr(self.args, "no_cache", False):
+            return None
+        fingerprint = session_fingerprint(
+            exec_ctx.vault_context, exec_ctx.config, exec_ctx.geistfabrik_dir
+        )
+        return GeistOutputCache(exec_ctx.vault.db, fingerprint)
+
+    def print_cache_summary(self, cache: GeistOutputCache | None) -> None:
+        """Report output cache hits and misses for this run."""
+        if cache is None or not (cache.hits or cache.misses):
+            return
+        self.print(f"Geist cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+        if cache.hit_ids:
+            self.print_verbose(f"  Reused: {', '.join(cache.hit_ids)}")
+
     # -------------------------------------------------------------------------
     # Date Parsing
     # -------------------------------------------------------------------------
@@ -3,8 +3,10 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..geist_cache import GeistOutputCache
 from ..geist_executor import GeistExecutor
 from ..geist_status import GeistStatusStore
+from ..models import Suggestion
 from ..tracery import TraceryGeist, TraceryGeistLoader
 from .base import BaseCommand, ExecutionContext
 
@@ -77,6 +79,10 @@ class TestAllCommand(BaseCommand):
         )
         executor.load_geists()
 
+        # Reuse output of geists whose inputs are unchanged since an earlier run
+        output_cache = self.setup_output_cache(exec_ctx)
+        executor.output_cache = output_cache
+
         # Load Tracery geists
         tracery_geists_dir = exec_ctx.vault_path / "_geistfabrik" / "geists" / "tracery"
         seed = int(session_date.timestamp())
@@ -94,8 +100,9 @@ class TestAllCommand(BaseCommand):
 
         # Test all geists
         results = self._test_all_code_geists(executor, exec_ctx)
-        tracery_results = self._test_all_tracery_geists(tracery_geists, exec_ctx)
+        tracery_results = self._test_all_tracery_geists(tracery_geists, exec_ctx, output_cache)
         results.update(tracery_results)
+        self.print_cache_summary(output_cache)
 
         # Print summary
         return self._print_summary(results, exec_ctx.vault_path)
@@ -136,7 +143,8 @@ class TestAllCommand(BaseCommand):
 
             if profile:
                 if profile.status == "success":
-                    print(f"v ({len(suggestions)} suggestions, {profile.total_time:.3f}s)")
+                    timing = "cached" if profile.cached else f"{profile.total_time:.3f}s"
+                    print(f"v ({len(suggestions)} suggestions, {timing})")
                     results[geist_id] = TestResult(
                         status="success",
                         count=len(suggestions),
@@ -163,12 +171,14 @@ class TestAllCommand(BaseCommand):
         self,
         tracery_geists: list[TraceryGeist],
         exec_ctx: ExecutionContext,
+        output_cache: GeistOutputCache | None = None,
     ) -> dict[str, TestResult]:
         """Test all Tracery geists and collect results.
 
         Args:
             tracery_geists: List of Tracery geists to test
             exec_ctx: Execution context
+            output_cache: Cross-run output cache (None to always run)
 
         Returns:
             Dictionary mapping geist ID to test result
@@ -186,8 +196,14 @@ class TestAllCommand(BaseCommand):
             geist_id = tracery_geist.geist_id
             print(f"Testing {geist_id}...", end=" ")
 
+            def produce(geist: TraceryGeist = tracery_geist) -> list[Suggestion]:
+                return geist.suggest(exec_ctx.vault_context)
+
             try:
-                suggestions = tracery_geist.suggest(exec_ctx.vault_context)
+                if output_cache is not None and tracery_geist.source_digest:
+                    suggestions = output_cache.fetch(geist_id, tracery_geist.source_digest, produce)
+                else:
+                    suggestions = produce()
                 print(f"v ({len(suggestions)} suggestions)")
                 results[geist_id] = TestResult(
                     status="success",
@@ -0,0 +1,68 @@
+"""Bench command for the synthetic-vault scale benchmarks."""
+
+import json
+import os
+from pathlib import Path
+
+from .base import BaseCommand
+
+
+class BenchCommand(BaseCommand):
+    """Command to benchmark full sessions on generated vaults.
+
+    Needs no vault: each scale generates its own in a temporary directory.
+    With --baseline, exits 1 when a tracked metric regressed past --threshold.
+    """
+
+    def execute(self) -> int:
+        """Execute the bench command.
+
+        Returns:
+            Exit code (0 for success, 1 for error or regression)
+        """
+        # Cluster labelling must not try to download a model mid-benchmark
+        os.environ.setdefault("GEISTFABRIK_OFFLINE", "1")
+        from ..benchmark import compare_results, format_results, parse_scale, run_suite
+
+        scales = [label.strip() for label in self.args.scales.split(",") if label.strip()]
+        try:
+            for label in scales:
+                parse_scale(label)
+        except ValueError as e:
+            self.print_error(str(e))
+            return 1
+
+        baseline = None
+        if self.args.baseline:
+            baseline_path = Path(self.args.baseline)
+            if not baseline_path.exists():
+                self.print_error(f"Baseline not found: {baseline_path}")
+                return 1
+            baseline = json.loads(baseline_path.read_text())
+
+        geist_ids = self.args.geists.split(",") if self.args.geists else None
+        self.print(f"Benchmarking scales: {', '.join(scales)}")
+        document = run_suite(scales, geist_ids, timeout=self.args.timeout, seed=self.args.seed)
+        self.print(format_results(document))
+
+        if self.args.output:
+            Path(self.args.output).write_text(json.dumps(document, indent=2))
+            self.print(f"\nWrote results to {self.args.output}")
+
+        if baseline is None:
+            return 0
+
+        regressions = compare_results(document, baseline, threshold=self.args.threshold)
+        if not regressions:
+            self.print(f"\nNo regressions beyond {self.args.threshold:.0%} against baseline")
+            return 0
+
+        self.print(f"\n{len(regressions)} regression(s) beyond {self.args.threshold:.0%}:")
+        for regression in regressions:
+            unit = "MiB" if regression.metric == "peak_rss_mb" else "s"
+            self.print(
+                f"  [{regression.scale}] {regression.metric}: "
+                f"{regression.baseline:.3f}{unit} -> {regression.current:.3f}{unit} "
+                f"(+{regression.change:.0%})"
+            )
+        return 1
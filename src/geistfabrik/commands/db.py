@@ -0,0 +1,83 @@
+"""Db command for inspecting and compacting vault.db."""
+
+import json
+
+from ..storage import DatabaseStats, compact_database, database_stats
+from .base import BaseCommand
+
+
+def _format_bytes(size: int | None) -> str:
+    """Format a byte count for display."""
+    if size is None:
+        return "-"
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+class DbCommand(BaseCommand):
+    """Command group for the vault database.
+
+    ``db stats`` reports row counts, sizes and fragmentation per table;
+    ``db compact`` releases free pages and rebuilds indexes (``--full``
+    rewrites the whole file).
+    """
+
+    def execute(self) -> int:
+        """Execute the db command.
+
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        vault_path = self.get_vault_path(auto_detect=True)
+        if vault_path is None:
+            return 1
+        if not (vault_path / "_geistfabrik" / "vault.db").exists():
+            self.print_error(f"GeistFabrik not initialised in {vault_path}")
+            return 1
+
+        cmd_ctx = self.setup_command_context(vault_path)
+        if cmd_ctx is None:
+            return 1
+        db = cmd_ctx.vault.db
+
+        if self.args.db_command == "compact":
+            self.print("Compacting vault.db...")
+            report = compact_database(db, full=self.args.full)
+            how = "full vacuum" if report.full_vacuum else "incremental vacuum and reindex"
+            self.print(
+                f"{_format_bytes(report.bytes_before)} -> {_format_bytes(report.bytes_after)} "
+                f"({how}, {report.seconds:.1f}s)"
+            )
+            return 0
+
+        stats = database_stats(db)
+        if getattr(self.args, "json", False):
+            print(json.dumps(stats.to_dict(), indent=2))
+        else:
+            print(self._format_stats(stats))
+        return 0
+
+    @staticmethod
+    def _format_stats(stats: DatabaseStats) -> str:
+        """Format database statistics as a table."""
+        lines = [
+            f"Size:        {_format_bytes(stats.total_bytes)} "
+            f"({stats.page_count} pages of {stats.page_size} B)",
+            f"Free:        {_format_bytes(stats.free_bytes)} ({stats.freelist_count} pages)",
+            f"Auto-vacuum: {stats.auto_vacuum}",
+            "",
+            f"{'Table':<28} {'Rows':>10} {'Size':>10} {'Payload':>10} {'Fragmented':>11}",
+        ]
+        for table in stats.tables:
+            fragmented = "-" if table.fragmentation is None else f"{table.fragmentation:.0%}"
+            lines.append(
+                f"{table.name:<28} {table.rows:>10} {_format_bytes(table.bytes):>10} "
+                f"{_format_bytes(table.payload_bytes):>10} {fragmented:>11}"
+            )
+        if stats.auto_vacuum != "incremental":
+            lines.append("")
+            lines.append("Run `geistfabrik db compact` to enable incremental auto-vacuum.")
+        return "\n".join(lines)
@@ -1,18 +1,24 @@
 """Invoke command for running geists and generating suggestions."""
 
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from ..config import DEFAULT_EXECUTION_MODE, DEFAULT_PLANNER_WAVE_SIZE
 from ..config_loader import GeistFabrikConfig, save_config
 from ..embeddings import EmbeddingComputer
+from ..execution_planner import ExecutionPlanner, resolve_execution_mode
 from ..filtering import SuggestionFilter, select_suggestions
+from ..function_registry import FunctionRegistry
+from ..geist_cache import GeistOutputCache
 from ..geist_executor import GeistExecutor
 from ..geist_status import GeistStatusStore
+from ..instrumentation import Instrumentation
 from ..journal_writer import JournalWriter
 from ..models import Suggestion
 from ..tracery import TraceryGeist, TraceryGeistLoader
-from ..vault import Vault
+from ..vault_context import VaultContext
 from .base import BaseCommand, ExecutionContext
 
 
@@ -29,13 +35,19 @@ class InvokeCommand(BaseCommand):
     """Command to run geists and generate suggestions.
 
     Supports multiple modes:
-    - Default: Run all geists, filter, sample ~5 suggestions
+    - Default: Run geists in seeded waves until ~5 suggestions survive filtering
+      (geist_execution.execution_mode: exhaustive runs all geists first)
     - Single geist: --geist <id>
     - Multiple geists: --geists <id1>,<id2>
     - Full mode: --full (all filtered suggestions)
     - Raw mode: --no-filter (skip filtering)
     """
 
+    # Outcome of the last run, for callers running the command in-process
+    # (invoke-many)
+    note_count = 0
+    suggestion_count = 0
+
     def execute(self) -> int:
         """Execute the invoke command.
 
@@ -53,28 +65,30 @@ class InvokeCommand(BaseCommand):
 
         self.print(f"Loading vault: {vault_path}")
 
-        # Set up database
-        geistfabrik_dir = vault_path / "_geistfabrik"
-        geistfabrik_dir.mkdir(exist_ok=True)
-        db_path = geistfabrik_dir / "vault.db"
+        (vault_path / "_geistfabrik").mkdir(exist_ok=True)
+
+        # Opt-in phase/geist/method timings (--timings, --timings-file)
+        self._timings = self._make_timings()
 
-        # Load vault and sync
-        self._vault = Vault(vault_path, db_path)
-        note_count = self._vault.sync()
+        # Open the vault (one connection for the whole run) and sync
+        cmd_ctx = self.setup_command_context(vault_path)
+        if cmd_ctx is None:
+            return 1
+        if self._timings:
+            self._timings.attach(cmd_ctx.vault.db)
+        with self._phase("sync"):
+            note_count = cmd_ctx.vault.sync()
         self.print(f"Synced {note_count} notes")
+        self.note_count = note_count
 
         # Parse session date
         session_date = self.parse_session_date(getattr(self.args, "date", None))
         if session_date is None:
             return 1
 
-        # Set up command context
-        cmd_ctx = self.setup_command_context(vault_path)
-        if cmd_ctx is None:
-            return 1
-
         # Set up execution context (session, VaultContext)
-        exec_ctx = self.setup_execution_context(cmd_ctx, session_date)
+        with self._phase("embed"):
+            exec_ctx = self.setup_execution_context(cmd_ctx, session_date)
 
         # Stash config for filter/count resolution in later phases
         self._config = exec_ctx.config
@@ -85,6 +99,14 @@ class InvokeCommand(BaseCommand):
         # Handle newly discovered geists
         self._handle_new_geists(exec_ctx, newly_discovered)
 
+        # Reuse output of geists whose inputs are unchanged since an earlier run
+        self._output_cache = self.setup_output_cache(exec_ctx)
+        code_executor.output_cache = self._output_cache
+
+        if self._timings:
+            self._timings.instrument(exec_ctx.vault_context)
+            code_executor.timings = self._timings
+
         # Check if any geists are enabled
         total_geists = len(code_executor.geists) + len(tracery_geists)
         if total_geists == 0:
@@ -94,21 +116,40 @@ class InvokeCommand(BaseCommand):
         # Show configuration summary
         self._print_config_summary(exec_ctx, code_executor, tracery_geists)
 
-        # Execute geists
-        results = self._execute_geists(exec_ctx, code_executor, tracery_geists)
-        if results is None:
+        try:
+            use_planner = self._use_planner()
+        except ValueError as e:
+            self.print_error(str(e))
             return 1
 
-        # Show execution summary
-        self._print_execution_summary(results)
+        if use_planner:
+            # Execute geists lazily, filtering as they go
+            with self._phase("execute"):
+                results, filtered = self._execute_planned(
+                    exec_ctx, code_executor, tracery_geists, session_date
+                )
+        else:
+            # Execute geists
+            with self._phase("execute"):
+                maybe_results = self._execute_geists(exec_ctx, code_executor, tracery_geists)
+            if maybe_results is None:
+                return 1
+            results = maybe_results
 
-        self.print(f"Generated {len(results.all_suggestions)} raw suggestions")
+            # Show execution summary
+            self._print_execution_summary(results)
 
-        # Filter suggestions
-        filtered = self._filter_suggestions(results.all_suggestions, session_date)
+            self.print(f"Generated {len(results.all_suggestions)} raw suggestions")
+
+            # Filter suggestions
+            with self._phase("filter"):
+                filtered = self._filter_suggestions(results.all_suggestions, session_date)
+
+        self.print_cache_summary(self._output_cache)
 
         # Select final suggestions
         final = self._select_final_suggestions(filtered, session_date)
+        self.suggestion_count = len(final)
 
         # Handle --diff mode
         if self.args.diff:
@@ -116,20 +157,26 @@ class InvokeCommand(BaseCommand):
 
         # Write to journal if requested
         if self.args.write:
-            if not self._write_journal(exec_ctx, session_date, final):
+            with self._phase("write"):
+                written = self._write_journal(exec_ctx, session_date, final)
+            if not written:
                 return 1
 
         # Display results
         self._display_results(session_date, final)
 
         # Show debug info if requested
-        if self.args.debug and code_executor:
-            self._show_debug_profiles(code_executor)
+        if self.args.debug:
+            if code_executor:
+                self._show_debug_profiles(code_executor)
+            self._show_memo_stats(exec_ctx.function_registry)
 
         # Show execution log for errors
         if code_executor:
             self._show_execution_errors(code_executor)
 
+        self._report_timings()
+
         return 0
 
     def _validate_args(self) -> bool:
@@ -273,7 +320,14 @@ class InvokeCommand(BaseCommand):
             mode = "Filtered output"
         else:
             mode = "Default"
+            cfg = getattr(self, "_config", None)
+            if cfg:
+                mode += f" ({cfg.geist_execution.execution_mode} execution)"
         print(f"Mode: {mode}")
+        cache_status = (
+            "DISABLED (--no-cache)" if getattr(self.args, "no_cache", False) else "ENABLED"
+        )
+        print(f"Output cache: {cache_status}")
         print(f"{'=' * 60}\n")
 
         # Print execution message
@@ -320,12 +374,7 @@ class InvokeCommand(BaseCommand):
                     code_results[geist_id] = code_executor.execute_geist(geist_id, context)
                 elif any(g.geist_id == geist_id for g in tracery_geists):
                     tracery_geist = next(g for g in tracery_geists if g.geist_id == geist_id)
-                    try:
-                        suggestions = tracery_geist.suggest(context)
-                        tracery_results[geist_id] = suggestions
-                    except Exception as e:
-                        self.print_error(f"Executing Tracery geist {geist_id}: {e}")
-                        tracery_results[geist_id] = []
+                    tracery_results[geist_id] = self._run_tracery_geist(tracery_geist, context)
                 else:
                     self.print_error(f"Geist '{geist_id}' not found")
                     return None
@@ -335,12 +384,9 @@ class InvokeCommand(BaseCommand):
 
             # Execute all Tracery geists
             for tracery_geist in tracery_geists:
-                try:
-                    suggestions = tracery_geist.suggest(context)
-                    tracery_results[tracery_geist.geist_id] = suggestions
-                except Exception as e:
-                    self.print_error(f"Executing Tracery geist {tracery_geist.geist_id}: {e}")
-                    tracery_results[tracery_geist.geist_id] = []
+                tracery_results[tracery_geist.geist_id] = self._run_tracery_geist(
+                    tracery_geist, context
+                )
 
         # Collect all suggestions in config order
         all_suggestions = self._collect_suggestions_in_order(code_results, tracery_results, config)
@@ -351,6 +397,133 @@ class InvokeCommand(BaseCommand):
             all_suggestions=all_suggestions,
         )
 
+    def _run_tracery_geist(
+        self, tracery_geist: TraceryGeist, context: VaultContext
+    ) -> list[Suggestion]:
+        """Run one Tracery geist (or reuse its cached output), reporting errors."""
+        cache: GeistOutputCache | None = getattr(self, "_output_cache", None)
+        digest = tracery_geist.source_digest
+        timings: Instrumentation | None = getattr(self, "_timings", None)
+        span = timings.geist(tracery_geist.geist_id) if timings else nullcontext()
+        try:
+            with span:
+                if cache is not None and digest:
+                    return cache.fetch(
+                        tracery_geist.geist_id, digest, lambda: tracery_geist.suggest(context)
+                    )
+                return tracery_geist.suggest(context)
+        except Exception as e:
+            self.print_error(f"Executing Tracery geist {tracery_geist.geist_id}: {e}")
+            return []
+
+    def _make_timings(self) -> Instrumentation | None:
+        """Create the timings collector if --timings or --timings-file was given."""
+        if getattr(self.args, "timings", False) or getattr(self.args, "timings_file", None):
+            return Instrumentation()
+        return None
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a phase of the run (a no-op without timings)."""
+        timings: Instrumentation | None = getattr(self, "_timings", None)
+        return timings.phase(name) if timings else nullcontext()
+
+    def _report_timings(self) -> None:
+        """Print and/or write the collected timings."""
+        timings: Instrumentation | None = getattr(self, "_timings", None)
+        if timings is None:
+            return
+        timings.detach()
+        if getattr(self.args, "timings", False):
+            print(f"\n{'=' * 60}")
+            print("Timings")
+            print(f"{'=' * 60}")
+            print(timings.format_table())
+        timings_file = getattr(self.args, "timings_file", None)
+        if timings_file:
+            timings.write(Path(timings_file))
+            self.print(f"Wrote timings to {timings_file}")
+
+    def _use_planner(self) -> bool:
+        """Whether this invocation runs geists through the execution planner.
+
+        Only default mode (sampled output of all geists) is planned; --full,
+        --no-filter and --geist(s) need every selected geist's output.
+
+        Raises:
+            ValueError: If geist_execution.execution_mode is unknown
+        """
+        config = getattr(self, "_config", None)
+        mode = resolve_execution_mode(
+            config.geist_execution.execution_mode if config else DEFAULT_EXECUTION_MODE
+        )
+        if self.args.full or self.args.no_filter or self._get_geists_to_run():
+            return False
+        return mode == "planned"
+
+    def _execute_planned(
+        self,
+        exec_ctx: ExecutionContext,
+        code_executor: GeistExecutor,
+        tracery_geists: list[TraceryGeist],
+        session_date: datetime,
+    ) -> tuple[GeistResults, list[Suggestion]]:
+        """Run geists in planned waves until enough suggestions survive filtering.
+
+        Args:
+            exec_ctx: Execution context
+            code_executor: Code geist executor
+            tracery_geists: List of Tracery geists
+            session_date: Session date (seeds the execution order)
+
+        Returns:
+            Tuple of (results of the geists that ran, filtered suggestions)
+        """
+        context = exec_ctx.vault_context
+        config = exec_ctx.config
+        tracery_by_id = {g.geist_id: g for g in tracery_geists}
+        code_results: dict[str, list[Suggestion]] = {}
+        tracery_results: dict[str, list[Suggestion]] = {}
+
+        def run_geist(geist_id: str) -> list[Suggestion]:
+            if geist_id in code_executor.geists:
+                code_results[geist_id] = code_executor.execute_geist(geist_id, context)
+                return code_results[geist_id]
+            tracery_results[geist_id] = self._run_tracery_geist(tracery_by_id[geist_id], context)
+            return tracery_results[geist_id]
+
+        suggestion_filter = self._make_filter()
+
+        def filter_wave(batch: list[Suggestion]) -> list[Suggestion]:
+            with self._phase("filter"):
+                return suggestion_filter.filter_incremental(batch, session_date)
+
+        planner = ExecutionPlanner(
+            code_executor.get_enabled_geists() + list(tracery_by_id),
+            seed=int(session_date.timestamp()),
+            target=self._resolve_count(),
+            wave_size=config.geist_execution.wave_size if config else DEFAULT_PLANNER_WAVE_SIZE,
+        )
+        planned = planner.run(run_geist, filter_wave)
+
+        results = GeistResults(
+            code_results=code_results,
+            tracery_results=tracery_results,
+            all_suggestions=self._collect_suggestions_in_order(
+                code_results, tracery_results, config
+            ),
+        )
+        self._print_execution_summary(results)
+        self.print(
+            f"Planner: ran {len(planned.executed)} of {len(planned.order)} geists "
+            f"in {planned.waves} wave(s), skipped {len(planned.skipped)}"
+        )
+        if planned.skipped:
+            self.print_verbose(f"  Skipped: {', '.join(planned.skipped)}")
+        self.print(f"Generated {planned.raw_count} raw suggestions")
+        self.print(f"Filtered to {len(planned.survivors)} suggestions")
+        self._show_filter_timings(suggestion_filter)
+        return results, planned.survivors
+
     def _collect_suggestions_in_order(
         self,
         code_results: dict[str, list[Suggestion]],
@@ -428,16 +601,46 @@ class InvokeCommand(BaseCommand):
             self.print("Skipping filtering pipeline (--no-filter)")
             return suggestions
 
+        suggestion_filter = self._make_filter()
+        filtered = suggestion_filter.filter_all(suggestions, session_date)
+        self.print(f"Filtered to {len(filtered)} suggestions")
+        self._show_filter_timings(suggestion_filter)
+        return filtered
+
+    def _make_filter(self) -> SuggestionFilter:
+        """Build the suggestion filter from config."""
         assert self._vault is not None  # Set in execute()
-        embedding_computer = EmbeddingComputer()
         config = getattr(self, "_config", None)
         filter_config = config.filtering.to_filter_config() if config else None
-        suggestion_filter = SuggestionFilter(
-            self._vault.db, embedding_computer, config=filter_config
+        return SuggestionFilter(self._vault.db, EmbeddingComputer(), config=filter_config)
+
+    def _resolve_count(self) -> int:
+        """Default-mode suggestion count: --count, else config, else 5."""
+        count = getattr(self.args, "count", None)
+        if count is None:
+            config = getattr(self, "_config", None)
+            count = config.session.default_suggestions if config else 5
+        return int(count)
+
+    def _show_filter_timings(self, suggestion_filter: SuggestionFilter) -> None:
+        """Show per-stage filter timings and embedding reuse in verbose mode.
+
+        Args:
+            suggestion_filter: Filter that has just run filter_all()
+        """
+        if not self.verbose or not suggestion_filter.timings:
+            return
+
+        self.print_verbose("Filter timings:")
+        for timing in suggestion_filter.timings:
+            self.print_verbose(
+                f"  {timing.stage:<10} {timing.input_count:>4} -> {timing.output_count:<4} "
+                f"{timing.seconds * 1000:8.1f}ms"
+            )
+        self.print_verbose(
+            f"  Suggestion embeddings: {suggestion_filter.texts_encoded} encoded, "
+            f"{suggestion_filter.texts_loaded} loaded from cache"
         )
-        filtered = suggestion_filter.filter_all(suggestions, session_date)
-        self.print(f"Filtered to {len(filtered)} suggestions")
-        return filtered
 
     def _select_final_suggestions(
         self,
@@ -454,12 +657,8 @@ class InvokeCommand(BaseCommand):
             Final selected suggestions
         """
         mode = "full" if (self.args.full or self.args.no_filter) else "default"
-        config = getattr(self, "_config", None)
-        count = getattr(self.args, "count", None)
-        if count is None:
-            count = config.session.default_suggestions if config else 5
         seed = int(session_date.timestamp())
-        final = select_suggestions(filtered, mode, count, seed)
+        final = select_suggestions(filtered, mode, self._resolve_count(), seed)
         self.print(f"Selected {len(final)} final suggestions\n")
         return final
 
@@ -605,6 +804,28 @@ class InvokeCommand(BaseCommand):
 
         print(f"{'=' * 60}\n")
 
+    def _show_memo_stats(self, registry: FunctionRegistry) -> None:
+        """Show vault function memo hits in debug mode.
+
+        Args:
+            registry: Function registry used for this session
+        """
+        memo_stats = registry.get_memo_stats()
+        if not memo_stats:
+            return
+
+        total_hits = sum(s.hits for s in memo_stats.values())
+        total_calls = total_hits + sum(s.misses for s in memo_stats.values())
+
+        print(f"\n{'=' * 60}")
+        print("Vault Function Memo (--debug mode)")
+        print(f"{'=' * 60}")
+        print(f"Shared results: {total_hits}/{total_calls} calls served from memo")
+        for name in sorted(memo_stats):
+            stats = memo_stats[name]
+            print(f"  {name}: {stats.hits} hits, {stats.misses} misses")
+        print(f"{'=' * 60}\n")
+
     def _show_execution_errors(self, code_executor: GeistExecutor) -> None:
         """Show execution errors and timeouts.
 
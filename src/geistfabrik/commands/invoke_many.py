@@ -0,0 +1,73 @@
+"""Invoke-many command for running sessions over a list of vaults."""
+
+from pathlib import Path
+
+from .base import BaseCommand
+
+
+class InvokeManyCommand(BaseCommand):
+    """Command to run invoke on many vaults with one shared model.
+
+    The vault list is a text file with one vault path per line. Each vault
+    runs the ordinary invoke command in a worker process; the options given
+    here (--write, --date, ...) apply to every vault.
+    """
+
+    def execute(self) -> int:
+        """Execute the invoke-many command.
+
+        Returns:
+            Exit code (0 if every vault succeeded, 1 otherwise)
+        """
+        from ..batch_invoke import VaultResult, invoke_many, read_vault_list
+
+        list_path = Path(self.args.vault_list)
+        if not list_path.is_file():
+            self.print_error(f"Vault list not found: {list_path}")
+            return 1
+        vaults = read_vault_list(list_path)
+        if not vaults:
+            self.print_error(f"No vaults listed in {list_path}")
+            return 1
+
+        output_dir = Path(self.args.output) if self.args.output else None
+        done = 0
+
+        def progress(result: VaultResult) -> None:
+            nonlocal done
+            done += 1
+            self.print(
+                f"[{done}/{len(vaults)}] {result.vault}: {result.status} ({result.seconds:.1f}s)"
+            )
+
+        self.print(f"Running {len(vaults)} vault(s)")
+        report = invoke_many(
+            vaults,
+            self._invoke_args(),
+            workers=self.args.workers,
+            output_dir=output_dir,
+            progress=progress,
+        )
+
+        self.print("")
+        self.print(report.format_summary())
+        if output_dir is not None:
+            self.print(f"Wrote per-vault results and report.json to {output_dir}")
+        return 0 if report.succeeded == len(report.results) else 1
+
+    def _invoke_args(self) -> list[str]:
+        """Translate this command's options into arguments for each invoke."""
+        args = []
+        if self.args.write:
+            args.append("--write")
+        if self.args.full:
+            args.append("--full")
+        if self.args.force:
+            args.append("--force")
+        if self.args.no_cache:
+            args.append("--no-cache")
+        for flag in ("date", "count", "geists", "timeout"):
+            value = getattr(self.args, flag)
+            if value is not None:
+                args += [f"--{flag}", str(value)]
+        return args
@@ -36,20 +36,25 @@ class StatsCommand(BaseCommand):
             return 1
 
         # Load vault and config
-        self._vault = Vault(vault_path, db_path)
         config_path = vault_path / "_geistfabrik" / "config.yaml"
         config = load_config(config_path) if config_path.exists() else GeistFabrikConfig()
+        self._vault = Vault(vault_path, db_path, config=config)
 
-        # Collect statistics
+        # Collect statistics on a read-only connection of their own, so they
+        # do not serialise on the writer (an invoke may be running)
         history_days = getattr(self.args, "history", 30)
-        collector = StatsCollector(self._vault, config, history_days=history_days)
+        reader = self._vault.open_reader()
+        try:
+            collector = StatsCollector(self._vault, config, history_days=history_days, db=reader)
 
-        # Compute embedding metrics if embeddings exist
-        self._compute_embedding_metrics(collector, history_days)
+            # Compute embedding metrics if embeddings exist
+            self._compute_embedding_metrics(collector, history_days)
 
-        # Add verbose details if requested
-        if self.verbose:
-            collector.add_verbose_details()
+            # Add verbose details if requested
+            if self.verbose:
+                collector.add_verbose_details()
+        finally:
+            reader.close()
 
         # Generate recommendations
         recommendations = generate_recommendations(collector.stats)
@@ -97,3 +102,8 @@ class StatsCommand(BaseCommand):
         temporal = collector.get_temporal_drift(session_date, days_back=history_days)
         if temporal:
             collector.add_temporal_analysis(temporal)
+
+        # Session-to-session drift across the whole history window
+        timeline = collector.get_drift_timeline(days_back=history_days)
+        if timeline:
+            collector.add_drift_timeline(timeline)
@@ -132,6 +132,24 @@ Range: [1, 10] failures
 Recommended: 3 failures
 """
 
+DEFAULT_EXECUTION_MODE = "planned"
+"""str: How default-mode invocations run geists (geist_execution.execution_mode).
+
+"planned" runs geists in a seeded order, a wave at a time, filtering as it
+goes, and stops once session.default_suggestions suggestions have survived.
+"exhaustive" runs every enabled geist before filtering and sampling.
+--full, --no-filter and --geist(s) always run exhaustively.
+Options: "planned" | "exhaustive"
+"""
+
+DEFAULT_PLANNER_WAVE_SIZE = 4
+"""int: Geists the planner runs between incremental filter passes.
+
+Smaller waves stop closer to the minimum number of geists; larger waves
+amortise filter passes. Waves run sequentially (geist timeouts use SIGALRM).
+Range: [1, number of geists]
+"""
+
 
 # Storage Configuration
 # ---------------------
@@ -153,6 +171,123 @@ older history.
 Range: [0, unbounded]
 """
 
+BULK_WRITE_CHUNK_SIZE = 5000
+"""int: Maximum rows per executemany() call when flushing batched writes.
+
+Sync, session embedding storage and journal recording accumulate rows and
+flush them in chunks of this size within one transaction. Larger chunks mean
+fewer statement round-trips; the cap keeps a single call's parameter
+marshalling bounded on very large vaults.
+Range: [100, 50000] typically
+"""
+
+DEFAULT_DATABASE_PROFILE = "fast"
+"""str: SQLite connection profile used when config.yaml sets no `database.profile`.
+
+"fast" runs the database in WAL mode with synchronous=NORMAL, a 64 MiB page
+cache, 256 MiB memory-mapped I/O and in-memory temp tables; readers are not
+blocked by a writer. "safe" uses the rollback journal with a full fsync on
+every commit and default-sized caches.
+
+vault.db lives inside the vault. Vaults kept in iCloud, Dropbox, OneDrive or
+on a network share should use "safe": WAL keeps recent commits in the -wal
+side file, which a sync client may not copy with vault.db, and its -shm file
+does not work across machines.
+Options: "fast" | "safe"
+"""
+
+DEFAULT_DATABASE_VACUUM_AFTER_PRUNE = False
+"""bool: Release freed pages to the filesystem after pruning old sessions.
+
+Pruning session embeddings beyond session_embedding_retention leaves their
+pages on SQLite's freelist, where later writes reuse them but the file never
+shrinks. When enabled, each prune that deletes rows is followed by an
+incremental vacuum. Requires a database in incremental auto-vacuum mode (the
+default for new vaults; run `geistfabrik db compact` once to convert an older
+one). Set via `database.vacuum_after_prune`.
+"""
+
+DEFAULT_EMBEDDING_PRECISION = "float32"
+"""str: Storage precision of session embeddings (`database.embedding_precision`).
+
+Every session stores one 387-dim embedding per note, so session_embeddings
+dominates vault.db on long histories. "float16" halves each row (774 bytes);
+"int8" stores the semantic components as int8 codes with a per-vector scale
+and keeps the three temporal features float32 (400 bytes, ~3.9x smaller).
+Rows are dequantised to float32 when loaded; rows already stored keep their
+precision, and mixed precisions read back transparently. The note-level
+semantic cache stays float32, so each session quantises exact vectors.
+Options: "float32" | "float16" | "int8"
+"""
+
+DEFAULT_SEARCH_PRECISION = "float32"
+"""str: Precision of the in-memory search matrix (`vector_search.precision`).
+
+At "float16" or "int8" the in-memory backend scans a compact, row-normalised
+copy of the session's embeddings (2x / ~3.9x smaller than the float32
+matrix) and rescores the best DEFAULT_RESCORE_FACTOR * count candidates with
+exact float32 cosine similarity. Returned scores are exact; a true neighbour
+is missed only if the compact scan ranks it outside the candidate set.
+`benchmarks/quantization_recall.py` measures the recall on a vault.
+Options: "float32" | "float16" | "int8"
+"""
+
+DEFAULT_RESCORE_FACTOR = 4
+"""int: Candidates rescored in float32 per result, for reduced-precision search.
+
+A neighbours(k) query at search precision float16/int8 rescores k * factor
+candidates. Higher values trade a little speed for recall.
+Range: [1, 20] typically
+"""
+
+DEFAULT_KNN_K = 50
+"""int: Neighbours kept per note in the per-session kNN graph.
+
+The graph answers neighbours(count <= K), surprisal and neighbour churn
+without touching the embedding matrix again. Larger values serve bigger
+neighbour queries at 6 bytes per note per neighbour (int32 index + float16
+score); queries above K fall back to a direct search.
+"""
+
+DEFAULT_MEMORY_BUDGET_MB = 0
+"""int: Working-memory budget in MiB (`performance.memory_budget_mb`).
+
+When set, block sizes for the blocked similarity products (kNN graph,
+surprisal, neighbour churn), the note sample used by embedding metrics and
+unlinked_pairs, and entry caps for VaultContext's session caches are derived
+from the budget and the vault size (see memory_budget.py). Large vaults on
+small machines then stream smaller blocks, sample fewer notes and evict
+cache entries instead of running out of memory; large budgets get larger
+blocks and samples. 0 keeps the built-in limits (1024-row blocks, a
+1000-note metrics sample, 200 unlinked_pairs candidates, uncapped caches).
+Range: 0, or [256, RAM in MiB] typically
+"""
+
+
+# Benchmark Configuration
+# -----------------------
+# These constants control when `geistfabrik bench --baseline` reports a
+# regression.
+
+DEFAULT_BENCH_THRESHOLD = 0.25
+"""float: Relative increase in a tracked metric that counts as a regression.
+
+0.25 fails the comparison when a phase, geist, total or peak memory figure is
+more than 25% above the baseline. Timings on a busy or shared machine vary by
+10-20% between identical runs, so tighter thresholds need a quiet machine.
+Range: [0.05, 1.0] typically
+"""
+
+BENCH_MIN_SECONDS = 0.05
+"""float: Smallest timing increase (seconds) that can count as a regression.
+
+Fast geists and phases take a few milliseconds, where a 25% swing is noise;
+an increase must exceed both the threshold and this floor.
+"""
+
+BENCH_MIN_MEMORY_MB = 16.0
+"""float: Smallest peak-memory increase (MiB) that can count as a regression."""
+
 
 def get_default_filter_config() -> dict[str, Any]:
     """Get default filtering configuration dictionary.
@@ -11,11 +11,18 @@ from typing import Any
 import yaml
 
 from .config import (
+    DEFAULT_DATABASE_PROFILE,
+    DEFAULT_DATABASE_VACUUM_AFTER_PRUNE,
+    DEFAULT_EMBEDDING_PRECISION,
+    DEFAULT_EXECUTION_MODE,
     DEFAULT_GEIST_TIMEOUT,
     DEFAULT_MAX_GEIST_FAILURES,
     DEFAULT_MAX_SUGGESTION_LENGTH,
+    DEFAULT_MEMORY_BUDGET_MB,
     DEFAULT_MIN_SUGGESTION_LENGTH,
     DEFAULT_NOVELTY_WINDOW_DAYS,
+    DEFAULT_PLANNER_WAVE_SIZE,
+    DEFAULT_SEARCH_PRECISION,
     DEFAULT_SESSION_EMBEDDING_RETENTION,
     DEFAULT_SIMILARITY_THRESHOLD,
     get_default_filter_config,
@@ -97,6 +104,7 @@ class VectorSearchConfig:
 
     backend: str = "in-memory"
     backend_settings: dict[str, Any] = field(default_factory=dict)
+    precision: str = DEFAULT_SEARCH_PRECISION
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "VectorSearchConfig":
@@ -104,12 +112,14 @@ class VectorSearchConfig:
         return cls(
             backend=data.get("backend", "in-memory"),
             backend_settings=data.get("backends", {}),
+            precision=data.get("precision", DEFAULT_SEARCH_PRECISION),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
         result: dict[str, Any] = {
             "backend": self.backend,
+            "precision": self.precision,
         }
         if self.backend_settings:
             result["backends"] = self.backend_settings
@@ -122,6 +132,8 @@ class GeistExecutionConfig:
 
     timeout: int = DEFAULT_GEIST_TIMEOUT
     max_failures: int = DEFAULT_MAX_GEIST_FAILURES
+    execution_mode: str = DEFAULT_EXECUTION_MODE  # "planned" or "exhaustive"
+    wave_size: int = DEFAULT_PLANNER_WAVE_SIZE
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "GeistExecutionConfig":
@@ -129,11 +141,18 @@ class GeistExecutionConfig:
         return cls(
             timeout=data.get("timeout", DEFAULT_GEIST_TIMEOUT),
             max_failures=data.get("max_failures", DEFAULT_MAX_GEIST_FAILURES),
+            execution_mode=data.get("execution_mode", DEFAULT_EXECUTION_MODE),
+            wave_size=data.get("wave_size", DEFAULT_PLANNER_WAVE_SIZE),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
-        return {"timeout": self.timeout, "max_failures": self.max_failures}
+        return {
+            "timeout": self.timeout,
+            "max_failures": self.max_failures,
+            "execution_mode": self.execution_mode,
+            "wave_size": self.wave_size,
+        }
 
 
 @dataclass
@@ -211,6 +230,58 @@ class SessionConfig:
         return {"default_suggestions": self.default_suggestions}
 
 
+@dataclass
+class DatabaseConfig:
+    """Configuration for the SQLite database.
+
+    Attributes:
+        profile: Connection profile ("fast" or "safe")
+        vacuum_after_prune: Release pages freed by session pruning
+        embedding_precision: Storage precision of session embeddings
+    """
+
+    profile: str = DEFAULT_DATABASE_PROFILE
+    vacuum_after_prune: bool = DEFAULT_DATABASE_VACUUM_AFTER_PRUNE
+    embedding_precision: str = DEFAULT_EMBEDDING_PRECISION
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DatabaseConfig":
+        """Create config from dictionary."""
+        return cls(
+            profile=data.get("profile", DEFAULT_DATABASE_PROFILE),
+            vacuum_after_prune=data.get("vacuum_after_prune", DEFAULT_DATABASE_VACUUM_AFTER_PRUNE),
+            embedding_precision=data.get("embedding_precision", DEFAULT_EMBEDDING_PRECISION),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to dictionary."""
+        return {
+            "profile": self.profile,
+            "vacuum_after_prune": self.vacuum_after_prune,
+            "embedding_precision": self.embedding_precision,
+        }
+
+
+@dataclass
+class PerformanceConfig:
+    """Configuration for memory use.
+
+    Attributes:
+        memory_budget_mb: Working-memory budget in MiB; 0 keeps built-in limits
+    """
+
+    memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PerformanceConfig":
+        """Create config from dictionary."""
+        return cls(memory_budget_mb=data.get("memory_budget_mb", DEFAULT_MEMORY_BUDGET_MB))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to dictionary."""
+        return {"memory_budget_mb": self.memory_budget_mb}
+
+
 @dataclass
 class GeistFabrikConfig:
     """GeistFabrik configuration."""
@@ -224,6 +295,8 @@ class GeistFabrikConfig:
     geist_execution: GeistExecutionConfig = field(default_factory=GeistExecutionConfig)
     filtering: FilteringConfig = field(default_factory=FilteringConfig)
     session: SessionConfig = field(default_factory=SessionConfig)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
 
     def is_geist_enabled(self, geist_id: str) -> bool:
         """Check if a geist is enabled.
@@ -261,6 +334,8 @@ class GeistFabrikConfig:
             geist_execution=GeistExecutionConfig.from_dict(data.get("geist_execution", {})),
             filtering=FilteringConfig.from_dict(data.get("filtering", {})),
             session=SessionConfig.from_dict(data.get("session", {})),
+            database=DatabaseConfig.from_dict(data.get("database", {})),
+            performance=PerformanceConfig.from_dict(data.get("performance", {})),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -279,6 +354,8 @@ class GeistFabrikConfig:
             "geist_execution": self.geist_execution.to_dict(),
             "filtering": self.filtering.to_dict(),
             "session": self.session.to_dict(),
+            "database": self.database.to_dict(),
+            "performance": self.performance.to_dict(),
         }
 
 
@@ -296,6 +373,8 @@ KNOWN_CONFIG_KEYS = frozenset(
         "geist_execution",
         "filtering",
         "session",
+        "database",
+        "performance",
     }
 )
 
@@ -399,6 +478,10 @@ def generate_default_config() -> str:
     lines.append("# Configuration for vector similarity search")
     lines.append("vector_search:")
     lines.append("  backend: in-memory      # Options: 'in-memory' | 'sqlite-vec'")
+    lines.append(
+        f"  precision: {DEFAULT_SEARCH_PRECISION}"
+        "        # In-memory search matrix: 'float32' | 'float16' | 'int8'"
+    )
     lines.append("  # backends:             # Backend-specific settings (optional)")
     lines.append("  #   sqlite_vec:")
     lines.append("  #     cache_size_mb: 100")
@@ -411,5 +494,27 @@ def generate_default_config() -> str:
         "  # Recent sessions to keep embeddings for; 0 = keep all"
     )
     lines.append("")
+    lines.append("# SQLite connection profile: 'fast' (WAL, large caches) or 'safe'")
+    lines.append("# (rollback journal, fsync per commit). Use 'safe' if this vault is in")
+    lines.append("# iCloud, Dropbox, OneDrive or on a network share: WAL keeps recent commits")
+    lines.append("# in vault.db-wal, which sync clients may not copy along with vault.db.")
+    lines.append("database:")
+    lines.append(f"  profile: {DEFAULT_DATABASE_PROFILE}")
+    lines.append(
+        f"  vacuum_after_prune: {str(DEFAULT_DATABASE_VACUUM_AFTER_PRUNE).lower()}"
+        "  # Shrink vault.db after pruning old sessions"
+    )
+    lines.append(
+        f"  embedding_precision: {DEFAULT_EMBEDDING_PRECISION}"
+        "  # Session embedding storage: 'float32' | 'float16' | 'int8'"
+    )
+    lines.append("")
+    lines.append("# Performance")
+    lines.append("# -----------")
+    lines.append("# Working-memory budget in MiB. Block sizes, similarity samples and cache")
+    lines.append("# caps are derived from it; 0 keeps the built-in limits.")
+    lines.append("performance:")
+    lines.append(f"  memory_budget_mb: {DEFAULT_MEMORY_BUDGET_MB}")
+    lines.append("")
 
     return "\n".join(lines)
@@ -33,11 +33,12 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
 
     # Get recent notes (last 3 months)
     recent_cutoff = now - timedelta(days=90)
-    recent_notes = [n for n in notes if n.created > recent_cutoff]
+    index = vault.temporal_index()
+    recent_notes = index.created_after(recent_cutoff)
 
     # Get old notes (more than 1 year ago)
     old_cutoff = now - timedelta(days=365)
-    old_notes = [n for n in notes if n.created < old_cutoff]
+    old_notes = index.created_before(old_cutoff)
 
     if len(recent_notes) < 5 or len(old_notes) < 5:
         return []
@@ -34,21 +34,20 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
     if len(recent) < 2:
         return []
 
-    # For each recent note, find its semantic opposite
-    for note in recent[:3]:  # Check top 3 recent notes
-        # Get contrarian note titles (contrarian_to returns List[str])
-        contrarian_titles = vault.call_function("contrarian_to", note.title, 3)
-
-        if not contrarian_titles:
+    # For each recent note, find its semantic opposite. One batched call
+    # scores all three against the session embedding matrix together.
+    checked = recent[:3]  # Check top 3 recent notes
+    contrarian_lists = vault.call_function_many(
+        "contrarian_to", [note.title for note in checked], 3
+    )
+    for note, contrarian_links in zip(checked, contrarian_lists):
+        if not contrarian_links:
             continue
 
         # Check if contrarian notes are sparse or old
-        for contrarian_title in contrarian_titles[:1]:  # Take the most contrarian
-            # contrarian_to returns bracketed links ("[[Title]]"); strip the
-            # brackets and resolve by title/path. (Passing the bracketed
-            # string to get_note() - an exact-path lookup - always returned
-            # None, which left this geist permanently inert.)
-            contrarian = vault.resolve_link_target(contrarian_title.strip("[]"))
+        for link in contrarian_links[:1]:  # Take the most contrarian
+            # contrarian_to returns NoteLinks, which carry the note's path
+            contrarian = vault.get_note(link.path)
             if contrarian is None or contrarian.path.startswith("geist journal/"):
                 continue
 
@@ -28,19 +28,22 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
     all_notes = vault.notes()
     candidate_notes = vault.sample(all_notes, min(5, len(all_notes)))
 
-    for note in candidate_notes[:2]:  # Create up to 2 triads
-        # Find the most contrarian note (antithesis) - returns List[str]
-        contrarian_titles = vault.call_function("contrarian_to", note.title, 1)
+    # Find the most contrarian note (antithesis) for each thesis in one
+    # batched call
+    theses = candidate_notes[:2]  # Create up to 2 triads
+    antitheses = vault.call_function_many("contrarian_to", [note.title for note in theses], 1)
 
-        if not contrarian_titles:
+    for note, contrarian_links in zip(theses, antitheses):
+        if not contrarian_links:
             continue
 
-        antithesis_title = contrarian_titles[0]
+        # contrarian_to returns NoteLinks, already bracketed
+        antithesis = contrarian_links[0]
 
         # Create dialectic suggestion
         text = (
             f"**Thesis**: [[{note.link_text}]]\n"
-            f"**Antithesis**: [[{antithesis_title}]]\n"
+            f"**Antithesis**: {antithesis}\n"
             f"\nWhat if you synthesized both into a new note? "
             f"What emerges when you hold these opposites together?"
         )
@@ -48,7 +51,7 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
         suggestions.append(
             Suggestion(
                 text=text,
-                notes=[note.link_text, antithesis_title],
+                notes=[note.link_text, antithesis.link_text],
                 geist_id="dialectic_triad",
             )
         )
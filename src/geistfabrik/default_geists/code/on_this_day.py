@@ -29,15 +29,14 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
     """
     # Session date, not wall-clock: keeps --date replays deterministic
     today = vault.session.date
-    same_date_notes = []
-
-    all_notes = vault.notes()
-    for note in all_notes:
-        created = note.created
-        # Same month and day, different year, and in the past
-        if created.month == today.month and created.day == today.day and created.year < today.year:
-            years_ago = today.year - created.year
-            same_date_notes.append((note, years_ago))
+
+    # Same month and day, earlier year
+    same_date_notes = [
+        (note, today.year - note.created.year)
+        for note in vault.temporal_index().created_on_day(
+            today.month, today.day, before_year=today.year
+        )
+    ]
 
     # Sort by years ago (most recent first)
     same_date_notes.sort(key=lambda x: x[1])
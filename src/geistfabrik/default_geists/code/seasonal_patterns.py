@@ -9,13 +9,13 @@ Two independent analyses feed the same geist:
 2. Seasonal tag concentration - tags used predominantly in one season.
 """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from geistfabrik import Note, Suggestion, VaultContext
+    from geistfabrik import Suggestion, VaultContext
+    from geistfabrik.temporal_analysis import TemporalIndex
 from geistfabrik.similarity_analysis import SimilarityLevel
-from geistfabrik.temporal_analysis import get_season
 
 MONTH_NAMES = [
     "January",
@@ -39,27 +39,25 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
     Returns:
         List of suggestions highlighting rhythmic patterns
     """
-    notes = vault.notes_excluding_journal()
+    index = vault.temporal_index(exclude_journal=True)
 
-    if len(notes) < 50:  # Need enough notes to detect patterns
+    if len(index.notes) < 50:  # Need enough notes to detect patterns
         return []
 
-    suggestions = _recurring_month_themes(vault, notes)
-    suggestions.extend(_seasonal_tag_concentration(vault, notes))
+    suggestions = _recurring_month_themes(vault, index)
+    suggestions.extend(_seasonal_tag_concentration(vault, index))
 
     return vault.sample(suggestions, count=2)
 
 
-def _recurring_month_themes(vault: "VaultContext", notes: list["Note"]) -> list["Suggestion"]:
+def _recurring_month_themes(vault: "VaultContext", index: "TemporalIndex") -> list["Suggestion"]:
     """Months whose notes cohere semantically, with themes recurring across years."""
     from geistfabrik import Suggestion
 
     suggestions: list[Suggestion] = []
 
     # Group notes by month
-    months = defaultdict(list)
-    for note in notes:
-        months[note.created.month].append(note)
+    months = index.by_created_month()
 
     # Find months with distinctive semantic clusters
     month_profiles = []
@@ -159,15 +157,16 @@ def _recurring_month_themes(vault: "VaultContext", notes: list["Note"]) -> list[
     return suggestions
 
 
-def _seasonal_tag_concentration(vault: "VaultContext", notes: list["Note"]) -> list["Suggestion"]:
+def _seasonal_tag_concentration(
+    vault: "VaultContext", index: "TemporalIndex"
+) -> list["Suggestion"]:
     """Tags that appear predominantly in a single season."""
     from geistfabrik import Suggestion
 
     suggestions: list[Suggestion] = []
 
-    season_tags = defaultdict(list)
-    for note in notes:
-        season_tags[get_season(note.created)].append(note)
+    season_tags = index.by_created_season()
+    notes_per_tag = Counter(tag for note in index.notes for tag in set(note.tags))
 
     # Find tags that appear predominantly in one season
     for season, season_notes in season_tags.items():
@@ -184,7 +183,7 @@ def _seasonal_tag_concentration(vault: "VaultContext", notes: list["Note"]) -> l
         for tag, count in tag_counts.items():
             if count >= 5:
                 # Check how often this tag appears in other seasons
-                total_with_tag = sum(1 for n in notes if tag in n.tags)
+                total_with_tag = notes_per_tag[tag]
                 season_ratio = count / total_with_tag if total_with_tag > 0 else 0
 
                 if season_ratio > 0.6:  # 60% of this tag appears in one season
@@ -33,13 +33,11 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
 
     # Find notes from same season in previous years
     seasonal_notes = []
-    all_notes = vault.notes()
-    for note in all_notes:
-        note_season = get_season(note.created)
+    for note in vault.temporal_index().created_in_season(current_season):
         note_year = note.created.year
 
         # Same season, but not current year (looking back)
-        if note_season == current_season and note_year < current_year:
+        if note_year < current_year:
             years_ago = current_year - note_year
             seasonal_notes.append((note, years_ago))
 
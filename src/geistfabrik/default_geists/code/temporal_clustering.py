@@ -46,7 +46,9 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
         # Group notes by quarter and find if distinct semantic clusters emerge
         quarter_groups: dict[str, list[Note]] = {}
 
-        for note in notes:
+        # Only notes inside the two-year window can land in a quarter
+        window_start = quarters[-1][0]
+        for note in vault.temporal_index().created_between(window_start, now):
             for start, end, label in quarters:
                 if start <= note.created <= end:
                     if label not in quarter_groups:
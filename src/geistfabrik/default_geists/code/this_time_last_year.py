@@ -6,7 +6,7 @@ geist samples one such note and asks what's different now — and what's
 the same.
 """
 
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -29,7 +29,7 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
         At most one suggestion resurfacing an anniversary note
     """
     today = vault.session.date
-    notes = vault.notes_excluding_journal()
+    index = vault.temporal_index(exclude_journal=True)
     candidates = []
 
     for years_ago in (1, 2, 3):
@@ -39,12 +39,12 @@ def suggest(vault: "VaultContext") -> list["Suggestion"]:
             # Feb 29 in a non-leap target year — use Feb 28 instead
             target_date = today.replace(year=today.year - years_ago, day=28)
 
-        window_start = (target_date - timedelta(days=7)).date()
-        window_end = (target_date + timedelta(days=7)).date()
+        # Whole days: from the first instant of the start day to the last of the end day
+        window_start = datetime.combine((target_date - timedelta(days=7)).date(), time.min)
+        window_end = datetime.combine((target_date + timedelta(days=7)).date(), time.max)
 
-        for note in notes:
-            if window_start <= note.created.date() <= window_end:
-                candidates.append((note, years_ago))
+        for note in index.created_between(window_start, window_end):
+            candidates.append((note, years_ago))
 
     if not candidates:
         return []
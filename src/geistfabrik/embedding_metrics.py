@@ -9,37 +9,20 @@ import json
 import logging
 import sqlite3
 from datetime import datetime
+from importlib.util import find_spec
 from typing import Any
 
 import numpy as np
 
-from .embeddings import cosine_similarity
+from .embeddings import configure_sklearn, cosine_similarity, pairwise_cosine
+from .memory_budget import MemoryBudget
 
-# Optional dependencies for advanced metrics
-try:
-    from sklearn.cluster import HDBSCAN  # type: ignore[import-untyped]
-    from sklearn.metrics import silhouette_score  # type: ignore[import-untyped]
-    from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-        cosine_similarity as sklearn_cosine,
-    )
-
-    HAS_SKLEARN = True
-except ImportError:
-    HAS_SKLEARN = False
-
-try:
-    from skdim.id import TwoNN  # type: ignore
-
-    HAS_SKDIM = True
-except ImportError:
-    HAS_SKDIM = False
-
-try:
-    from vendi_score import vendi  # type: ignore
-
-    HAS_VENDI = True
-except ImportError:
-    HAS_VENDI = False
+# Optional dependencies for advanced metrics. Only their presence is checked
+# here; each is imported where a metric needs it, so loading this module (for
+# `stats` on any vault) does not pay for importing sklearn, skdim or vendi.
+HAS_SKLEARN = find_spec("sklearn") is not None
+HAS_SKDIM = find_spec("skdim") is not None
+HAS_VENDI = find_spec("vendi_score") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +39,8 @@ class EmbeddingMetricsComputer:
         """
         self.db = db
         self.config = config
+        performance = getattr(config, "performance", None)
+        self.memory_budget = MemoryBudget(getattr(performance, "memory_budget_mb", 0))
 
     def compute_metrics(
         self,
@@ -188,6 +173,8 @@ class EmbeddingMetricsComputer:
         # Intrinsic dimensionality (if available)
         if HAS_SKDIM and len(embeddings) >= 10:
             try:
+                from skdim.id import TwoNN  # type: ignore
+
                 id_estimator = TwoNN()
                 intrinsic_dim = id_estimator.fit_transform(embeddings)
                 metrics["intrinsic_dim"] = round(float(intrinsic_dim), 1)
@@ -198,8 +185,18 @@ class EmbeddingMetricsComputer:
         # Vendi Score (if available)
         if HAS_VENDI and HAS_SKLEARN and len(embeddings) >= 2:
             try:
-                # Compute similarity matrix for Vendi Score
-                similarity_matrix = sklearn_cosine(embeddings)
+                from vendi_score import vendi  # type: ignore
+
+                # Compute similarity matrix for Vendi Score. Under a memory
+                # budget, vaults too large for the full matrix are sampled.
+                vendi_embeddings = embeddings
+                sample_size = self.memory_budget.similarity_sample()
+                if self.memory_budget.limited and len(embeddings) > sample_size:
+                    rng = np.random.default_rng(0)
+                    vendi_embeddings = embeddings[
+                        rng.choice(len(embeddings), sample_size, replace=False)
+                    ]
+                similarity_matrix = pairwise_cosine(vendi_embeddings)
                 vendi_score_value = vendi.score_K(similarity_matrix)
                 metrics["vendi_score"] = round(float(vendi_score_value), 1)
             except Exception:
@@ -227,9 +224,10 @@ class EmbeddingMetricsComputer:
                 logger.debug("IsoScore computation failed", exc_info=True)
 
         # Basic similarity statistics
-        # Sample for efficiency if large
-        if len(embeddings) > 1000:
-            indices = np.random.choice(len(embeddings), 1000, replace=False)
+        # Sample for efficiency if large (size set by the memory budget)
+        sample_size = self.memory_budget.similarity_sample()
+        if len(embeddings) > sample_size:
+            indices = np.random.choice(len(embeddings), sample_size, replace=False)
             sample_embeddings = embeddings[indices]
         else:
             sample_embeddings = embeddings
@@ -237,7 +235,7 @@ class EmbeddingMetricsComputer:
         # Compute similarity matrix (vectorized for performance)
         if HAS_SKLEARN and len(sample_embeddings) > 1:
             # Use sklearn's vectorized cosine_similarity (~100x faster)
-            similarity_matrix_sim = sklearn_cosine(sample_embeddings)
+            similarity_matrix_sim = pairwise_cosine(sample_embeddings)
             # Extract upper triangle (excluding diagonal)
             similarities = similarity_matrix_sim[np.triu_indices_from(similarity_matrix_sim, k=1)]
 
@@ -261,6 +259,10 @@ class EmbeddingMetricsComputer:
         self, embeddings: np.ndarray, paths: list[str]
     ) -> dict[str, Any]:
         """Compute clustering-based metrics (requires sklearn)."""
+        configure_sklearn()
+        from sklearn.cluster import HDBSCAN  # type: ignore[import-untyped]
+        from sklearn.metrics import silhouette_score  # type: ignore[import-untyped]
+
         metrics: dict[str, Any] = {}
 
         # Run HDBSCAN clustering
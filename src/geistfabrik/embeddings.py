@@ -14,30 +14,78 @@ import hashlib
 import logging
 import math
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import sklearn  # type: ignore[import-untyped]
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-    cosine_similarity as sklearn_cosine,
-)
 from threadpoolctl import threadpool_limits  # type: ignore[import-untyped]
 
+# sentence-transformers (torch) and sklearn take seconds to import; they load
+# on first use (EmbeddingComputer.model, pairwise_cosine) so commands that
+# never embed or cluster start instantly.
 if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
     from .vector_search import VectorSearchBackend
 
+from .bulk_writer import BulkWriter
 from .config import (
     DEFAULT_BATCH_SIZE,
     DEFAULT_SEMANTIC_WEIGHT,
     MODEL_NAME,
+    SEMANTIC_DIM,
+    TEMPORAL_DIM,
+    TOTAL_DIM,
 )
 from .models import Note
+from .quantization import decode_embedding, encode_embeddings, validate_precision
+from .schema import content_hash
+from .storage import incremental_vacuum
 
 logger = logging.getLogger(__name__)
 
+# Loaded models by name, shared by every EmbeddingComputer in the process: a
+# session, the suggestion filter and cluster labelling each create their own
+# computer, and each would otherwise load the model again.
+_loaded_models: dict[str, "SentenceTransformer"] = {}
+
+
+def install_model(model_name: str, model: Any) -> None:
+    """Make every EmbeddingComputer for model_name use an already-loaded model.
+
+    invoke-many workers install a proxy for the parent's model this way.
+
+    Args:
+        model_name: Model name the computers are created with
+        model: Anything with SentenceTransformer's encode()
+    """
+    _loaded_models[model_name] = model
+
+
+@contextmanager
+def installed_model(model_name: str, model: Any) -> Iterator[None]:
+    """Install a model (see install_model) for the duration of a with block.
+
+    Whatever was installed for model_name before is restored afterwards.
+
+    Args:
+        model_name: Model name the computers are created with
+        model: Anything with SentenceTransformer's encode()
+    """
+    previous = _loaded_models.get(model_name)
+    install_model(model_name, model)
+    try:
+        yield
+    finally:
+        if previous is None:
+            _loaded_models.pop(model_name, None)
+        else:
+            _loaded_models[model_name] = previous
+
+
 # Native BLAS/OpenMP thread cap applied only around model.encode() calls.
 # 1 keeps embedding deterministic and prevents the runaway thread-pool
 # spawning (one pool per core, per process) that hung CI under parallel geist
@@ -84,9 +132,118 @@ SKLEARN_OPTIMIZATIONS = {
     "fast_path": True,
 }
 
-# Apply sklearn configuration
-sklearn.set_config(assume_finite=True)
-logger.info("sklearn optimisations enabled: assume_finite=True, fast_path=True (21.5% speedup)")
+_sklearn_configured = False
+
+
+def configure_sklearn() -> None:
+    """Import sklearn and apply SKLEARN_OPTIMIZATIONS (once per process).
+
+    Call before using sklearn directly; pairwise_cosine() does so itself.
+    """
+    global _sklearn_configured
+    if _sklearn_configured:
+        return
+    import sklearn  # type: ignore[import-untyped]
+
+    sklearn.set_config(assume_finite=SKLEARN_OPTIMIZATIONS["assume_finite"])
+    _sklearn_configured = True
+    logger.info("sklearn optimisations enabled: assume_finite=True, fast_path=True (21.5% speedup)")
+
+
+def pairwise_cosine(a: np.ndarray, b: np.ndarray | None = None) -> np.ndarray:
+    """sklearn's cosine_similarity, importing sklearn on first use.
+
+    Args:
+        a: Matrix of shape (n, d)
+        b: Matrix of shape (m, d); defaults to a
+
+    Returns:
+        Similarity matrix of shape (n, m)
+    """
+    configure_sklearn()
+    from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
+
+    result: np.ndarray = cosine_similarity(a, b)
+    return result
+
+
+def temporal_feature_matrix(notes: list[Note], dates: list[datetime]) -> np.ndarray:
+    """Temporal features of every note at every session date, vectorised.
+
+    Entry [d, n] equals EmbeddingComputer.compute_temporal_features(notes[n],
+    dates[d]) (to float rounding), without a Python loop over the pairs.
+
+    Args:
+        notes: Notes (naive creation datetimes, as stored by sync)
+        dates: Session dates
+
+    Returns:
+        (len(dates), len(notes), TEMPORAL_DIM) float64 array
+    """
+    created = np.array([note.created for note in notes], dtype="datetime64[us]")
+    sessions = np.array(dates, dtype="datetime64[us]")
+    # Floor division matches timedelta.days, which also rounds down
+    age_days = (sessions[:, None] - created[None, :]) // np.timedelta64(1, "D")
+    creation_doy = np.array([note.created.timetuple().tm_yday for note in notes], dtype=float)
+    session_doy = np.array([date.timetuple().tm_yday for date in dates], dtype=float)
+
+    features = np.empty((len(dates), len(notes), TEMPORAL_DIM))
+    features[:, :, 0] = age_days / 365.0
+    features[:, :, 1] = np.sin(2 * np.pi * creation_doy / 365.0)[None, :]
+    features[:, :, 2] = np.sin(2 * np.pi * session_doy / 365.0)[:, None]
+    return features
+
+
+def load_cached_semantic_embeddings(
+    db: sqlite3.Connection, notes: list[Note]
+) -> tuple[list[Note], np.ndarray, list[Note]]:
+    """Probe the embedding cache for many notes with one joined query.
+
+    A note is up to date when the cache holds a row for its path whose
+    model_version matches the content hash stored on ``notes`` at sync
+    time, so no content is hashed here. Notes without a stored hash (or
+    not in the notes table) count as stale.
+
+    Args:
+        db: Database connection
+        notes: Notes to look up
+
+    Returns:
+        Tuple of (cached notes, their semantic embeddings as one contiguous
+        (len(cached), SEMANTIC_DIM) float32 matrix in the same order,
+        stale notes that must be encoded)
+    """
+    if not notes:
+        return [], np.empty((0, SEMANTIC_DIM), dtype=np.float32), []
+
+    db.execute("CREATE TEMP TABLE IF NOT EXISTS _probe_paths (path TEXT PRIMARY KEY)")
+    db.execute("DELETE FROM _probe_paths")
+    db.executemany(
+        "INSERT OR IGNORE INTO _probe_paths (path) VALUES (?)", ((n.path,) for n in notes)
+    )
+    rows = db.execute(
+        """
+        SELECT n.path, e.embedding
+        FROM _probe_paths p
+        JOIN notes n ON n.path = p.path
+        JOIN embeddings e
+            ON e.note_path = n.path AND e.model_version = ? || n.content_hash
+        """,
+        (f"{MODEL_NAME}:",),
+    ).fetchall()
+    db.execute("DELETE FROM _probe_paths")
+
+    by_path = {note.path: note for note in notes}
+    cached = [by_path[path] for path, _ in rows]
+    if rows:
+        matrix = np.frombuffer(b"".join(blob for _, blob in rows), dtype=np.float32).reshape(
+            len(rows), -1
+        )
+    else:
+        matrix = np.empty((0, SEMANTIC_DIM), dtype=np.float32)
+    cached_paths = {note.path for note in cached}
+    stale = [note for note in notes if note.path not in cached_paths]
+    return cached, matrix, stale
 
 
 class EmbeddingComputer:
@@ -95,7 +252,7 @@ class EmbeddingComputer:
     def __init__(
         self,
         model_name: str = MODEL_NAME,
-        model: SentenceTransformer | None = None,
+        model: "SentenceTransformer | None" = None,
     ):
         """Initialise embedding computer.
 
@@ -129,14 +286,17 @@ class EmbeddingComputer:
         return "cpu"
 
     @property
-    def model(self) -> SentenceTransformer:
+    def model(self) -> "SentenceTransformer":
         """Lazy-load the sentence-transformers model.
 
         Checks for bundled local model first (models/all-MiniLM-L6-v2/),
         then falls back to HuggingFace cache/download.
 
-        Auto-detects best available device (CUDA > MPS > CPU).
+        Auto-detects best available device (CUDA > MPS > CPU). The loaded
+        model is shared with later EmbeddingComputers for the same model name.
         """
+        if self._model is None:
+            self._model = _loaded_models.get(self.model_name)
         if self._model is None:
             # Detect device if not already set
             if self.device is None:
@@ -180,11 +340,14 @@ class EmbeddingComputer:
                 # Fall back to HuggingFace (auto-download to cache)
                 model_source = self.model_name
 
+            from sentence_transformers import SentenceTransformer
+
             self._model = SentenceTransformer(
                 model_source,
                 device=self.device,  # Use detected device (cuda/mps/cpu)
                 local_files_only=offline,
             )
+            _loaded_models[self.model_name] = self._model
         return self._model
 
     def compute_semantic(self, text: str) -> np.ndarray:
@@ -303,6 +466,15 @@ class EmbeddingComputer:
         self.close()
 
 
+def note_state(note: Note) -> str:
+    """Fingerprint the note inputs of a session embedding.
+
+    Content changes move the modification time, and the temporal features
+    depend on the creation time.
+    """
+    return f"{note.created.isoformat()}|{note.modified.isoformat()}"
+
+
 class Session:
     """Represents a GeistFabrik session with temporal embeddings."""
 
@@ -313,6 +485,9 @@ class Session:
         computer: EmbeddingComputer | None = None,
         backend: str = "in-memory",
         embedding_retention: int | None = None,
+        vacuum_after_prune: bool = False,
+        embedding_precision: str = "float32",
+        search_precision: str = "float32",
     ):
         """Initialise session.
 
@@ -324,7 +499,18 @@ class Session:
             embedding_retention: Maximum number of recent sessions to retain temporal
                 embeddings for. Sessions older than this are pruned at the start of
                 each session to bound database growth. None or <= 0 retains all.
+            vacuum_after_prune: Release the pages freed by pruning to the
+                filesystem (storage.incremental_vacuum)
+            embedding_precision: Precision session embeddings are stored at
+                ("float32", "float16" or "int8"; see quantization.py)
+            search_precision: Precision of the in-memory backend's search
+                matrix
+
+        Raises:
+            ValueError: If either precision is unknown
         """
+        self.embedding_precision = validate_precision(embedding_precision)
+        self.search_precision = validate_precision(search_precision)
         self.date = date
         self.db = db
         self.session_id = self._get_or_create_session()
@@ -332,6 +518,9 @@ class Session:
         self._backend_type = backend
         self._backend: VectorSearchBackend | None = None
         self.embedding_retention = embedding_retention
+        self.vacuum_after_prune = vacuum_after_prune
+        self.changed_paths: list[str] = []
+        self.removed_paths: list[str] = []
 
     def _get_or_create_session(self) -> int:
         """Get existing session ID or create new session.
@@ -369,6 +558,9 @@ class Session:
     def compute_vault_state_hash(self, notes: list[Note]) -> str:
         """Compute hash of vault state for change detection.
 
+        Covers every input of the session embeddings except content, which
+        follows the note's modification time.
+
         Args:
             notes: List of all notes
 
@@ -378,7 +570,7 @@ class Session:
         hasher = hashlib.sha256()
         for note in sorted(notes, key=lambda n: n.path):
             hasher.update(note.path.encode())
-            hasher.update(str(note.modified).encode())
+            hasher.update(note_state(note).encode())
         return hasher.hexdigest()
 
     def _compute_content_hash(self, content: str) -> str:
@@ -390,142 +582,159 @@ class Session:
         Returns:
             SHA256 hash of content
         """
-        return hashlib.sha256(content.encode()).hexdigest()
-
-    def _get_cached_semantic_embedding(self, note: Note) -> np.ndarray | None:
-        """Get cached semantic embedding if available and valid.
-
-        Args:
-            note: Note to get embedding for
-
-        Returns:
-            Cached semantic embedding or None if not found/invalid
-        """
-        content_hash = self._compute_content_hash(note.content)
+        return content_hash(content)
 
-        cursor = self.db.execute(
-            """
-            SELECT embedding FROM embeddings
-            WHERE note_path = ? AND model_version = ?
-            """,
-            (note.path, f"{MODEL_NAME}:{content_hash}"),
-        )
-        row = cursor.fetchone()
+    def _load_cached_semantic_embeddings(
+        self, notes: list[Note]
+    ) -> tuple[list[Note], np.ndarray, list[Note]]:
+        """Probe the embedding cache (see load_cached_semantic_embeddings)."""
+        return load_cached_semantic_embeddings(self.db, notes)
 
-        if row is None:
-            return None
-
-        # Deserialize from numpy bytes (safe, no code execution risk)
-        embedding: np.ndarray = np.frombuffer(row[0], dtype=np.float32)
-        return embedding
-
-    def _cache_semantic_embedding(self, note: Note, embedding: np.ndarray) -> None:
-        """Cache semantic embedding for a note.
+    def _semantic_cache_row(
+        self, note: Note, embedding: np.ndarray, computed_at: str
+    ) -> tuple[str, bytes, str, str]:
+        """Build the embeddings-table row that caches a note's semantic embedding.
 
         Args:
             note: Note to cache embedding for
             embedding: Semantic embedding to cache
+            computed_at: ISO timestamp recorded with the row
+
+        Returns:
+            (note_path, embedding, model_version, computed_at) row
         """
         content_hash = self._compute_content_hash(note.content)
         # Serialise using numpy's native format (safe, no code execution risk)
         # Store as float32 to reduce storage size (sufficient precision)
         embedding_bytes = embedding.astype(np.float32).tobytes()
-
-        self.db.execute(
-            """
-            INSERT OR REPLACE INTO embeddings (note_path, embedding, model_version, computed_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                note.path,
-                embedding_bytes,
-                f"{MODEL_NAME}:{content_hash}",
-                datetime.now().isoformat(),
-            ),
-        )
+        return (note.path, embedding_bytes, f"{MODEL_NAME}:{content_hash}", computed_at)
 
     def compute_embeddings(self, notes: list[Note]) -> None:
         """Compute and store session embeddings for all notes.
 
-        Uses cached semantic embeddings when available (content unchanged),
-        only recomputing temporal features each session for performance.
+        Re-running a session is incremental. If the stored vault state hash
+        matches and the session still holds a row per note, nothing is
+        recomputed (retention pruning deletes a session's rows but keeps its
+        hash). Otherwise only rows whose note is new
+        or changed are computed and upserted, and rows for notes that no
+        longer exist are deleted. A loaded backend is refreshed with just
+        those rows. Changed notes reuse cached semantic embeddings when their
+        content is unchanged, so usually only temporal features are
+        recomputed.
+
+        After the call, ``changed_paths`` and ``removed_paths`` hold the rows
+        that were rewritten and deleted.
 
         Args:
             notes: List of all notes in vault
         """
-        # Compute vault state hash
         vault_hash = self.compute_vault_state_hash(notes)
+        row = self.db.execute(
+            """
+            SELECT vault_state_hash,
+                   (SELECT COUNT(*) FROM session_embeddings WHERE session_id = ?)
+            FROM sessions WHERE session_id = ?
+            """,
+            (self.session_id, self.session_id),
+        ).fetchone()
+        if row is not None and row[0] == vault_hash and row[1] == len(notes):
+            self.changed_paths = []
+            self.removed_paths = []
+            logger.info("Vault unchanged since this session was computed; reusing embeddings")
+            return
 
-        # Update session with vault state
-        self.db.execute(
-            "UPDATE sessions SET vault_state_hash = ? WHERE session_id = ?",
-            (vault_hash, self.session_id),
+        # Diff against the rows already stored for this session
+        stored_states: dict[str, str | None] = dict(
+            self.db.execute(
+                "SELECT note_path, note_state FROM session_embeddings WHERE session_id = ?",
+                (self.session_id,),
+            ).fetchall()
         )
+        current_paths = {note.path for note in notes}
+        dirty_notes = [note for note in notes if stored_states.get(note.path) != note_state(note)]
+        removed_paths = [path for path in stored_states if path not in current_paths]
 
-        # Delete existing embeddings for this session (if recomputing)
-        self.db.execute("DELETE FROM session_embeddings WHERE session_id = ?", (self.session_id,))
-
-        # Separate notes into cached and uncached
-        cached_notes: list[tuple[Note, np.ndarray]] = []
-        uncached_notes: list[Note] = []
+        # One joined cache probe for every changed note
+        cached_notes, cached_matrix, uncached_notes = self._load_cached_semantic_embeddings(
+            dirty_notes
+        )
 
-        for note in notes:
-            cached_embedding = self._get_cached_semantic_embedding(note)
-            if cached_embedding is not None:
-                cached_notes.append((note, cached_embedding))
-            else:
-                uncached_notes.append(note)
+        writer = BulkWriter(self.db)
+        writer.add_many(
+            "DELETE FROM session_embeddings WHERE session_id = ? AND note_path = ?",
+            ((self.session_id, path) for path in removed_paths),
+        )
 
         # Batch compute semantic embeddings for uncached notes only
-        semantic_embeddings: dict[str, np.ndarray] = {}
-
+        computed_matrix = np.empty((0, SEMANTIC_DIM), dtype=np.float32)
         if uncached_notes:
             texts = [note.content for note in uncached_notes]
             with threadpool_limits(limits=_ENCODE_THREAD_LIMIT):
-                computed_embeddings = self.computer.model.encode(
-                    texts,
-                    convert_to_numpy=True,
-                    show_progress_bar=False,
-                    batch_size=DEFAULT_BATCH_SIZE,
+                computed_matrix = np.asarray(
+                    self.computer.model.encode(
+                        texts,
+                        convert_to_numpy=True,
+                        show_progress_bar=False,
+                        batch_size=DEFAULT_BATCH_SIZE,
+                    ),
+                    dtype=np.float32,
                 )
 
             # Cache newly computed embeddings
-            for i, note in enumerate(uncached_notes):
-                semantic = computed_embeddings[i]
-                semantic_embeddings[note.path] = semantic
-                self._cache_semantic_embedding(note, semantic)
-
-        # Add cached embeddings to lookup dict
-        for note, semantic in cached_notes:
-            semantic_embeddings[note.path] = semantic
-
-        # Compute temporal features and combine with semantic embeddings
-        embedding_rows = []
-        for note in notes:
-            semantic = semantic_embeddings[note.path]
-            temporal = self.computer.compute_temporal_features(note, self.date)
-
-            # Weight and combine (matching compute_temporal_embedding logic)
-            semantic_weight = DEFAULT_SEMANTIC_WEIGHT
-            temporal_weight = 1.0 - DEFAULT_SEMANTIC_WEIGHT
-            semantic_scaled = semantic * semantic_weight
-            temporal_scaled = temporal * temporal_weight
-            embedding = np.concatenate([semantic_scaled, temporal_scaled])
-
-            # Serialise embedding to bytes using numpy's native format (safe)
-            # Store as float32 to reduce storage size (sufficient precision for embeddings)
-            embedding_bytes = embedding.astype(np.float32).tobytes()
-
-            embedding_rows.append((self.session_id, note.path, embedding_bytes))
-
-        # Batch insert all embeddings
-        self.db.executemany(
+            computed_at = datetime.now().isoformat()
+            writer.add_many(
+                """
+                INSERT OR REPLACE INTO embeddings (note_path, embedding, model_version, computed_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    self._semantic_cache_row(note, semantic, computed_at)
+                    for note, semantic in zip(uncached_notes, computed_matrix)
+                ),
+            )
+
+        # Weight and combine semantic and temporal parts for all changed notes
+        # at once (matching compute_temporal_embedding logic)
+        ordered_notes = cached_notes + uncached_notes
+        parts = [m for m in (cached_matrix, computed_matrix) if len(m)]
+        semantic_matrix = np.concatenate(parts) if parts else cached_matrix
+        temporal_matrix = temporal_feature_matrix(ordered_notes, [self.date])[0]
+        combined = np.hstack(
+            [
+                semantic_matrix * DEFAULT_SEMANTIC_WEIGHT,
+                temporal_matrix * (1.0 - DEFAULT_SEMANTIC_WEIGHT),
+            ]
+        ).astype(np.float32)
+
+        # Serialise at the configured precision (float32 by default)
+        # Rows are written in the caller's note order
+        row_of = {note.path: i for i, note in enumerate(ordered_notes)}
+        blobs = encode_embeddings(
+            combined[[row_of[note.path] for note in dirty_notes]], self.embedding_precision
+        )
+        embedding_rows = [
+            (self.session_id, note.path, blob, note_state(note))
+            for note, blob in zip(dirty_notes, blobs)
+        ]
+
+        # Upsert changed rows; a rewritten row's cluster assignment is stale.
+        # Cache rows, session rows and the new state hash commit together.
+        writer.add_many(
             """
-            INSERT INTO session_embeddings (session_id, note_path, embedding)
-            VALUES (?, ?, ?)
+            INSERT INTO session_embeddings (session_id, note_path, embedding, note_state)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (session_id, note_path) DO UPDATE SET
+                embedding = excluded.embedding,
+                note_state = excluded.note_state,
+                cluster_label = NULL
             """,
             embedding_rows,
         )
+        writer.add(
+            "UPDATE sessions SET vault_state_hash = ? WHERE session_id = ?",
+            (vault_hash, self.session_id),
+        )
+        writer.flush()
 
         try:
             self.db.commit()
@@ -533,15 +742,25 @@ class Session:
             logger.error(f"Database commit failed saving embeddings: {e}")
             raise
 
+        self.changed_paths = [note.path for note in dirty_notes]
+        self.removed_paths = removed_paths
+        if self._backend is not None:
+            self._backend.refresh_embeddings(
+                self.date.strftime("%Y-%m-%d"), self.changed_paths, self.removed_paths
+            )
+
         # Bound database growth by pruning embeddings for sessions that fall
         # outside the configured retention window.
         self._prune_old_session_embeddings()
 
         # Log cache statistics
-        total = len(notes)
+        total = len(dirty_notes)
         cached = len(cached_notes)
         computed = len(uncached_notes)
         cache_hit_rate = (cached / total * 100) if total > 0 else 0
+        logger.info(
+            f"Session embeddings: {total}/{len(notes)} new or changed, {len(removed_paths)} removed"
+        )
         logger.info(
             f"Embedding cache: {cached}/{total} cached ({cache_hit_rate:.1f}% hit rate), "
             f"{computed} computed"
@@ -552,9 +771,10 @@ class Session:
 
         Keeps the most recent ``embedding_retention`` sessions (by date) plus the
         current session, and deletes older sessions' rows from session_embeddings
-        to bound database growth. Session metadata rows (and tiny session
-        suggestions used for novelty history) are left intact - only the bulky
-        embedding BLOBs are removed. No-op when retention is None or <= 0.
+        to bound database growth, along with those sessions' kNN graphs.
+        Session metadata rows (and tiny session suggestions used for novelty
+        history) are left intact - only the bulky BLOBs are removed. No-op
+        when retention is None or <= 0.
         """
         retention = self.embedding_retention
         if retention is None or retention <= 0:
@@ -576,6 +796,19 @@ class Session:
             (self.session_id, retention),
         )
         pruned = cursor.rowcount
+        # Their kNN graphs can no longer be validated against the rows
+        self.db.execute(
+            """
+            DELETE FROM session_knn
+            WHERE session_id IN (
+                SELECT session_id FROM sessions
+                WHERE session_id != ?
+                ORDER BY date DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.session_id, retention),
+        )
         try:
             self.db.commit()
         except sqlite3.Error as e:
@@ -586,6 +819,9 @@ class Session:
                 f"Pruned {pruned} session-embedding rows beyond retention "
                 f"window ({retention} sessions)"
             )
+            if self.vacuum_after_prune:
+                released = incremental_vacuum(self.db)
+                logger.info(f"Released {released} free pages after pruning")
 
     def get_embedding(self, note_path: str) -> np.ndarray | None:
         """Get embedding for a note in this session.
@@ -608,9 +844,8 @@ class Session:
         if row is None:
             return None
 
-        # Deserialize from numpy bytes (safe, no code execution risk)
-        embedding: np.ndarray = np.frombuffer(row[0], dtype=np.float32)
-        return embedding
+        # Dequantised if stored at reduced precision
+        return decode_embedding(row[0], TOTAL_DIM)
 
     def _create_backend(self) -> "VectorSearchBackend":
         """Create vector search backend based on configuration.
@@ -624,7 +859,7 @@ class Session:
         from .vector_search import InMemoryVectorBackend, SqliteVecBackend
 
         if self._backend_type == "in-memory":
-            return InMemoryVectorBackend(self.db)
+            return InMemoryVectorBackend(self.db, precision=self.search_precision)
         elif self._backend_type == "sqlite-vec":
             return SqliteVecBackend(self.db)
         else:
@@ -677,7 +912,7 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
             return float(np.dot(a, b))
 
     # Use sklearn for vectorized computation
-    return float(sklearn_cosine(a.reshape(1, -1), b.reshape(1, -1))[0, 0])
+    return float(pairwise_cosine(a.reshape(1, -1), b.reshape(1, -1))[0, 0])
 
 
 def find_similar_notes(
@@ -710,7 +945,7 @@ def find_similar_notes(
     embedding_matrix = np.vstack([embeddings[p] for p in filtered_paths])
 
     query_reshaped = query_embedding.reshape(1, -1)
-    similarity_scores = sklearn_cosine(query_reshaped, embedding_matrix)[0]
+    similarity_scores = pairwise_cosine(query_reshaped, embedding_matrix)[0]
 
     # Create (path, similarity) tuples
     similarities = [
@@ -0,0 +1,430 @@
+"""In-process engine that keeps a vault's session state warm between runs.
+
+``geistfabrik invoke`` builds everything from scratch: it opens the
+database, loads the model, imports geist modules, computes session
+embeddings and builds a VaultContext, runs once and exits. A long-running
+host (editor plugin backend, notebook, scheduler) would pay that setup on
+every call. GeistFabrikEngine does it once and keeps the result:
+
+- the database connection and config
+- the embedding model (shared process-wide, see embeddings.install_model)
+- loaded code geists, metadata inference modules and vault functions
+  (Tracery grammars are cached per file by TraceryGeist.from_yaml)
+- the notes, the session and its vector backend, and the VaultContext
+  with its caches (clusters, kNN graph, neighbours, metadata)
+
+Between calls only what changed is rebuilt. A vault edit re-embeds the
+dirty notes (Session.compute_embeddings is incremental) and replaces the
+VaultContext; a new date gets a new session; an edited geist, metadata or
+vault function module reloads the extensions; an edited config.yaml
+reloads everything except the model and the connection.
+
+Example:
+    >>> with GeistFabrikEngine("~/vault") as engine:
+    ...     first = engine.run(datetime(2025, 3, 1))
+    ...     # ... the user edits a note ...
+    ...     second = engine.run(datetime(2025, 3, 1))  # re-embeds one note
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .config_loader import GeistFabrikConfig, load_config
+from .embeddings import EmbeddingComputer, Session
+from .execution_planner import ExecutionPlanner, resolve_execution_mode
+from .filtering import SuggestionFilter, select_suggestions
+from .function_registry import FunctionRegistry
+from .geist_cache import GeistOutputCache, session_fingerprint
+from .geist_executor import GeistExecutor
+from .geist_status import GeistStatusStore
+from .journal_writer import JournalWriter
+from .memory_budget import MemoryBudget
+from .metadata_system import MetadataLoader
+from .models import Note, Suggestion
+from .tracery import TraceryGeistLoader
+from .vault import Vault
+from .vault_context import VaultContext
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = Path(__file__).parent
+
+# Run modes, matching invoke's default, --full and --no-filter
+ENGINE_MODES = ("default", "full", "raw")
+
+# Extension directories under _geistfabrik whose modules the engine imports
+_EXTENSION_DIRS = ("geists/code", "metadata_inference", "vault_functions")
+
+
+def _session_day(date: datetime) -> datetime:
+    """A session date at midnight: sessions, contexts and seeds are per day."""
+    return date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class EngineRun:
+    """Outcome of one GeistFabrikEngine.run()."""
+
+    date: datetime
+    mode: str
+    suggestions: list[Suggestion]
+    raw_count: int = 0
+    filtered_count: int = 0
+    executed: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def _stamp(paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    """Name, mtime and size of each existing file, to detect edits cheaply."""
+    stamp = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        stamp.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+class GeistFabrikEngine:
+    """Runs sessions against one vault, reusing state across runs.
+
+    Not thread-safe: geist timeouts use SIGALRM, so run() must be called
+    from the main thread, one call at a time.
+    """
+
+    def __init__(
+        self,
+        vault_path: Path | str,
+        computer: EmbeddingComputer | None = None,
+        use_cache: bool = True,
+    ):
+        """Open the vault and load its extensions.
+
+        Args:
+            vault_path: Vault root (must contain an initialised _geistfabrik)
+            computer: Embedding computer (default: the standard model)
+            use_cache: Reuse geist output across runs (see geist_cache)
+
+        Raises:
+            FileNotFoundError: If the vault or its _geistfabrik directory is missing
+        """
+        self.vault_path = Path(vault_path).expanduser().resolve()
+        self.geistfabrik_dir = self.vault_path / "_geistfabrik"
+        if not self.geistfabrik_dir.is_dir():
+            raise FileNotFoundError(f"GeistFabrik not initialised in {self.vault_path}")
+        self.config_path = self.geistfabrik_dir / "config.yaml"
+        self.computer = computer if computer is not None else EmbeddingComputer()
+        self.use_cache = use_cache
+
+        self.vault = Vault(self.vault_path, self.geistfabrik_dir / "vault.db")
+        self._config_stamp = _stamp([self.config_path])
+        self._notes: list[Note] | None = None
+        self._session: Session | None = None
+        self._context: VaultContext | None = None
+        self._synced = False
+        self._load_extensions()
+
+    @property
+    def config(self) -> GeistFabrikConfig:
+        """The vault's configuration (reloaded when config.yaml changes)."""
+        return self.vault.config
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.vault.close()
+
+    def __enter__(self) -> "GeistFabrikEngine":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Warm state
+    # -------------------------------------------------------------------------
+
+    def notes(self) -> list[Note]:
+        """All notes, loaded once per vault change."""
+        if self._notes is None:
+            self._notes = self.vault.all_notes()
+        return self._notes
+
+    def refresh(self) -> int:
+        """Sync the vault incrementally and re-embed notes that changed.
+
+        Returns:
+            Number of notes added or modified. Deleted notes are picked up
+            as well but not counted.
+        """
+        self._check_config()
+        before = self._note_count()
+        synced = self.vault.sync()
+        self._synced = True
+        if not (synced or self._note_count() != before):
+            return 0
+
+        previous = {note.path for note in self._notes or []}
+        self._notes = None
+        self._context = None
+        if self._session is not None:
+            # Only new and changed notes are re-embedded
+            self._session.compute_embeddings(self.notes())
+            logger.info(
+                "Refreshed session: %d note(s) re-embedded", len(self._session.changed_paths)
+            )
+            # Sync's cascade already deleted removed notes' rows, so the
+            # session cannot tell its loaded backend about them: start over
+            if previous - {note.path for note in self.notes()}:
+                self._session = None
+        return synced
+
+    def context(self, date: datetime) -> VaultContext:
+        """The VaultContext for a session date, built only when needed.
+
+        Args:
+            date: Session date (the time of day is ignored)
+
+        Returns:
+            VaultContext over the current notes and the date's embeddings
+        """
+        date = _session_day(date)
+        if self._session is None or self._session.date != date:
+            config = self.config
+            self._session = Session(
+                date,
+                self.vault.db,
+                computer=self.computer,
+                backend=config.vector_search.backend,
+                embedding_retention=config.session_embedding_retention,
+                vacuum_after_prune=config.database.vacuum_after_prune,
+                embedding_precision=config.database.embedding_precision,
+                search_precision=config.vector_search.precision,
+            )
+            self._session.compute_embeddings(self.notes())
+            self._context = None
+        if self._context is None:
+            self._context = VaultContext(
+                self.vault,
+                self._session,
+                metadata_loader=self._metadata_loader,
+                function_registry=self._function_registry,
+                memory_budget=MemoryBudget(self.config.performance.memory_budget_mb),
+            )
+        return self._context
+
+    def _note_count(self) -> int:
+        return int(self.vault.db.execute("SELECT COUNT(*) FROM notes").fetchone()[0])
+
+    def _extension_files(self) -> list[Path]:
+        files: list[Path] = []
+        for dirname in _EXTENSION_DIRS:
+            files += sorted((self.geistfabrik_dir / dirname).glob("*.py"))
+        return files
+
+    def _load_extensions(self) -> None:
+        """(Re)load code geists, metadata modules and vault functions."""
+        config = self.config
+        enabled_modules = config.enabled_modules or None
+
+        metadata_dir = self.geistfabrik_dir / "metadata_inference"
+        self._metadata_loader: MetadataLoader | None = None
+        if metadata_dir.exists():
+            self._metadata_loader = MetadataLoader(metadata_dir)
+            self._metadata_loader.load_modules(enabled_modules)
+
+        functions_dir = self.geistfabrik_dir / "vault_functions"
+        if functions_dir.exists():
+            self._function_registry = FunctionRegistry(functions_dir)
+            self._function_registry.load_modules(enabled_modules)
+        else:
+            self._function_registry = FunctionRegistry()
+
+        self._executor = GeistExecutor(
+            self.geistfabrik_dir / "geists" / "code",
+            timeout=config.geist_execution.timeout,
+            max_failures=config.geist_execution.max_failures,
+            default_geists_dir=_PACKAGE_DIR / "default_geists" / "code",
+            enabled_defaults=config.default_geists,
+            status_store=GeistStatusStore(self.vault.db),
+        )
+        self._executor.load_geists()
+        self._extensions_stamp = _stamp(self._extension_files())
+        # The context holds the old loader and registry
+        self._context = None
+
+    def _check_config(self) -> None:
+        """Reload config.yaml, and everything built from it, if it changed."""
+        stamp = _stamp([self.config_path])
+        if stamp == self._config_stamp:
+            return
+        logger.info("config.yaml changed; reloading")
+        self._config_stamp = stamp
+        self.vault.config = load_config(self.config_path)
+        self._session = None
+        self._load_extensions()
+
+    def _check_extensions(self) -> None:
+        """Reload extension modules if any was added, edited or removed."""
+        if _stamp(self._extension_files()) != self._extensions_stamp:
+            logger.info("Geist or extension modules changed; reloading")
+            self._load_extensions()
+
+    # -------------------------------------------------------------------------
+    # Running sessions
+    # -------------------------------------------------------------------------
+
+    def run(
+        self,
+        date: datetime | None = None,
+        mode: str = "default",
+        geists: list[str] | None = None,
+        count: int | None = None,
+        sync: bool = True,
+    ) -> EngineRun:
+        """Run a session and return its suggestions.
+
+        Args:
+            date: Session date (default: today; the time of day is ignored,
+                so runs on one day share a session, context and seed)
+            mode: "default" (a sample of count filtered suggestions), "full"
+                (every filtered suggestion) or "raw" (unfiltered)
+            geists: Geists to run (default: every enabled geist)
+            count: Suggestions in default mode (default: config, else 5)
+            sync: Call refresh() first; pass False when the caller knows the
+                vault is unchanged
+
+        Returns:
+            EngineRun with the final suggestions
+
+        Raises:
+            ValueError: If mode or a requested geist is unknown
+        """
+        if mode not in ENGINE_MODES:
+            raise ValueError(f"Unknown mode '{mode}'. Valid modes: {', '.join(ENGINE_MODES)}")
+        session_date = _session_day(date if date is not None else datetime.now())
+        if sync or not self._synced:
+            self.refresh()
+        self._check_extensions()
+        config = self.config
+        context = self.context(session_date)
+
+        seed = int(session_date.timestamp())
+        tracery_geists, _ = TraceryGeistLoader(
+            self.geistfabrik_dir / "geists" / "tracery",
+            seed=seed,
+            default_geists_dir=_PACKAGE_DIR / "default_geists" / "tracery",
+            enabled_defaults=config.default_geists,
+        ).load_all()
+        tracery_by_id = {g.geist_id: g for g in tracery_geists}
+
+        executor = self._executor
+        executor.execution_log = []
+        cache = None
+        if self.use_cache:
+            cache = GeistOutputCache(
+                self.vault.db, session_fingerprint(context, config, self.geistfabrik_dir)
+            )
+        executor.output_cache = cache
+
+        if geists:
+            unknown = [g for g in geists if g not in executor.geists and g not in tracery_by_id]
+            if unknown:
+                raise ValueError(f"Unknown geist(s): {', '.join(unknown)}")
+            selected = list(geists)
+        else:
+            selected = executor.get_enabled_geists() + list(tracery_by_id)
+
+        outputs: dict[str, list[Suggestion]] = {}
+        errors: dict[str, str] = {}
+
+        def run_geist(geist_id: str) -> list[Suggestion]:
+            if geist_id in executor.geists:
+                outputs[geist_id] = executor.execute_geist(geist_id, context)
+                return outputs[geist_id]
+            tracery_geist = tracery_by_id[geist_id]
+            digest = tracery_geist.source_digest
+            try:
+                if cache is not None and digest:
+                    outputs[geist_id] = cache.fetch(
+                        geist_id, digest, lambda: tracery_geist.suggest(context)
+                    )
+                else:
+                    outputs[geist_id] = tracery_geist.suggest(context)
+            except Exception as e:
+                logger.warning("Tracery geist %s failed: %s", geist_id, e)
+                errors[geist_id] = str(e)
+                outputs[geist_id] = []
+            return outputs[geist_id]
+
+        if count is None:
+            count = config.session.default_suggestions
+        planned = (
+            mode == "default"
+            and not geists
+            and resolve_execution_mode(config.geist_execution.execution_mode) == "planned"
+        )
+        if planned:
+            suggestion_filter = self._make_filter()
+            planner = ExecutionPlanner(
+                selected,
+                seed=seed,
+                target=count,
+                wave_size=config.geist_execution.wave_size,
+            )
+            planned_run = planner.run(
+                run_geist, lambda batch: suggestion_filter.filter_incremental(batch, session_date)
+            )
+            raw_count = planned_run.raw_count
+            filtered = planned_run.survivors
+        else:
+            raw = [s for geist_id in selected for s in run_geist(geist_id)]
+            raw_count = len(raw)
+            filtered = raw if mode == "raw" else self._make_filter().filter_all(raw, session_date)
+
+        for entry in executor.execution_log:
+            if entry["status"] != "success":
+                errors[entry["geist_id"]] = str(entry.get("error", entry["status"]))
+
+        final = select_suggestions(
+            filtered, "default" if mode == "default" else "full", count, seed
+        )
+        return EngineRun(
+            date=session_date,
+            mode=mode,
+            suggestions=final,
+            raw_count=raw_count,
+            filtered_count=len(filtered),
+            executed=list(outputs),
+            errors=errors,
+        )
+
+    def write(self, result: EngineRun) -> Path:
+        """Write a run's suggestions to its geist journal session note.
+
+        Args:
+            result: Run to write
+
+        Returns:
+            Path of the written note
+
+        Raises:
+            FileExistsError: If the date already has a session note
+        """
+        mode = "default" if result.mode == "default" else "full"
+        journal_writer = JournalWriter(self.vault_path, self.vault.db)
+        return journal_writer.write_session(result.date, result.suggestions, mode)
+
+    def _make_filter(self) -> SuggestionFilter:
+        return SuggestionFilter(
+            self.vault.db, self.computer, config=self.config.filtering.to_filter_config()
+        )
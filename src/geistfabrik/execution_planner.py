@@ -0,0 +1,156 @@
+"""Selection-aware geist execution for default mode.
+
+Default mode keeps only a handful of suggestions (session.default_suggestions),
+yet running every geist and filtering everything they produce spends most of
+its time on suggestions that are never shown. The planner runs geists in a
+seeded order, a wave at a time, filters each wave's suggestions as they arrive
+and stops as soon as enough suggestions have survived filtering.
+
+Waves run one after another in the main thread: geist timeouts rely on
+SIGALRM and geists share the vault's SQLite connection, so they cannot run in
+worker threads. The wave size only sets how many geists run between filter
+passes.
+
+Config switch: geist_execution.execution_mode = "exhaustive" restores running
+every geist before filtering.
+"""
+
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .config import DEFAULT_PLANNER_WAVE_SIZE
+from .models import Suggestion
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("planned", "exhaustive")
+"""Values of geist_execution.execution_mode ("serial" is read as "exhaustive")."""
+
+
+def resolve_execution_mode(mode: str) -> str:
+    """Normalise a configured execution mode.
+
+    Args:
+        mode: Configured value
+
+    Returns:
+        "planned" or "exhaustive"
+
+    Raises:
+        ValueError: If mode is not a known execution mode
+    """
+    # The original spec's only mode was "serial": every geist, in order
+    if mode == "serial":
+        return "exhaustive"
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode: {mode}")
+    return mode
+
+
+@dataclass
+class PlannedRun:
+    """Outcome of a planned execution.
+
+    Attributes:
+        order: Every candidate geist in planned order
+        results: Suggestions per executed geist, in execution order
+        survivors: Suggestions that passed filtering, in execution order
+        waves: Number of waves executed
+    """
+
+    order: list[str]
+    results: dict[str, list[Suggestion]] = field(default_factory=dict)
+    survivors: list[Suggestion] = field(default_factory=list)
+    waves: int = 0
+
+    @property
+    def executed(self) -> list[str]:
+        """Geists that ran."""
+        return list(self.results)
+
+    @property
+    def skipped(self) -> list[str]:
+        """Geists the planner never needed to run, in planned order."""
+        return [geist_id for geist_id in self.order if geist_id not in self.results]
+
+    @property
+    def raw_count(self) -> int:
+        """Suggestions generated by the executed geists before filtering."""
+        return sum(len(suggestions) for suggestions in self.results.values())
+
+
+class ExecutionPlanner:
+    """Runs geists lazily until enough filtered suggestions exist.
+
+    Example:
+        >>> planner = ExecutionPlanner(geist_ids, seed=seed, target=5)
+        >>> run = planner.run(run_geist, lambda batch: f.filter_incremental(batch, date))
+        >>> len(run.skipped)
+        52
+    """
+
+    def __init__(
+        self,
+        geist_ids: list[str],
+        seed: int,
+        target: int,
+        wave_size: int = DEFAULT_PLANNER_WAVE_SIZE,
+    ):
+        """Initialise the planner.
+
+        Args:
+            geist_ids: Candidate geists (duplicates ignored)
+            seed: Seed for the execution order (the session seed)
+            target: Surviving suggestions wanted before stopping
+            wave_size: Geists run between filter passes
+
+        Raises:
+            ValueError: If wave_size is less than 1
+        """
+        if wave_size < 1:
+            raise ValueError(f"wave_size must be at least 1, got {wave_size}")
+        self.target = target
+        self.wave_size = wave_size
+        # Sorted first so the order depends only on the seed and the geist set
+        self.order = sorted(set(geist_ids))
+        random.Random(seed).shuffle(self.order)
+
+    def run(
+        self,
+        run_geist: Callable[[str], list[Suggestion]],
+        filter_batch: Callable[[list[Suggestion]], list[Suggestion]],
+    ) -> PlannedRun:
+        """Execute waves until target suggestions survive or geists run out.
+
+        Args:
+            run_geist: Runs one geist and returns its suggestions
+            filter_batch: Filters a batch that follows every earlier batch
+                (e.g. SuggestionFilter.filter_incremental) and returns its
+                survivors
+
+        Returns:
+            PlannedRun describing what ran and what survived
+        """
+        planned = PlannedRun(order=list(self.order))
+        for start in range(0, len(self.order), self.wave_size):
+            if len(planned.survivors) >= self.target:
+                break
+            batch: list[Suggestion] = []
+            for geist_id in self.order[start : start + self.wave_size]:
+                suggestions = run_geist(geist_id)
+                planned.results[geist_id] = suggestions
+                batch.extend(suggestions)
+            planned.waves += 1
+            planned.survivors.extend(filter_batch(batch))
+
+        logger.debug(
+            "Planned run: %d/%d geists in %d waves, %d of %d suggestions survived",
+            len(planned.results),
+            len(self.order),
+            planned.waves,
+            len(planned.survivors),
+            planned.raw_count,
+        )
+        return planned
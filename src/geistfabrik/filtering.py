@@ -9,20 +9,45 @@ This module implements the four-stage filtering pipeline:
 Each filter can be enabled/disabled via configuration.
 """
 
+import logging
 import sqlite3
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
 import numpy as np
-from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-    cosine_similarity as sklearn_cosine,
-)
 
+from .bulk_writer import BulkWriter
 from .config import (
+    MODEL_NAME,
+    SEMANTIC_DIM,
     get_default_filter_config,
 )
-from .embeddings import EmbeddingComputer
+from .embeddings import EmbeddingComputer, pairwise_cosine
 from .models import Suggestion
+from .schema import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FilterStageTiming:
+    """Wall-clock cost and effect of one filter stage."""
+
+    stage: str
+    input_count: int
+    output_count: int
+    seconds: float
+
+
+@dataclass
+class _FilterStream:
+    """What filter_incremental() remembers from earlier batches."""
+
+    note_refs: tuple[set[str], set[str]] | None = None  # (valid, excluded)
+    diverse_embeddings: list[np.ndarray] = field(default_factory=list)
+    seen_texts: set[str] = field(default_factory=set)
 
 
 class SuggestionFilter:
@@ -47,11 +72,133 @@ class SuggestionFilter:
         # Lazy caching for novelty filter
         self._recent_embeddings_cache: Any = None  # numpy array when populated
         self._cache_metadata: Any = None  # (session_date, window_days) tuple when populated
+        # Suggestion text -> semantic embedding, shared by every stage of a run
+        self._text_embeddings: dict[str, np.ndarray] = {}
+        # Session date of the current run; stored embeddings it encodes or
+        # reads are stamped with it, and pruned relative to it
+        self._session_date: datetime | None = None
+        self.texts_encoded = 0
+        self.texts_loaded = 0
+        self.timings: list[FilterStageTiming] = []
+        self._stream: _FilterStream | None = None
 
     def _default_config(self) -> dict[str, Any]:
         """Return default filtering configuration."""
         return get_default_filter_config()
 
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Get semantic embeddings for suggestion texts, encoding each text once.
+
+        Texts are looked up in this run's cache first, then in the
+        suggestion_embeddings table (keyed by text hash and model). Texts found
+        in neither are encoded in one batch and written back for later runs.
+        Stored rows this run uses are stamped with the session date, so the
+        prune keeps them.
+
+        Args:
+            texts: Suggestion texts (duplicates allowed)
+
+        Returns:
+            (len(texts), dim) float32 matrix in input order
+        """
+        missing = [t for t in dict.fromkeys(texts) if t not in self._text_embeddings]
+        if missing:
+            used_on = (self._session_date or datetime.now()).isoformat()
+            hashes = {text: content_hash(text) for text in missing}
+            stored = self._load_stored_embeddings(list(hashes.values()), used_on)
+            to_encode = []
+            for text in missing:
+                embedding = stored.get(hashes[text])
+                if embedding is not None:
+                    self._text_embeddings[text] = embedding
+                else:
+                    to_encode.append(text)
+            self.texts_loaded += len(missing) - len(to_encode)
+
+            if to_encode:
+                encoded = np.asarray(
+                    self.embedding_computer.compute_batch_semantic(to_encode), dtype=np.float32
+                )
+                self._text_embeddings.update(zip(to_encode, encoded))
+                self.texts_encoded += len(to_encode)
+                self._store_embeddings(
+                    [(hashes[text], embedding) for text, embedding in zip(to_encode, encoded)],
+                    used_on,
+                )
+
+        if not texts:
+            return np.empty((0, SEMANTIC_DIM), dtype=np.float32)
+        return np.vstack([self._text_embeddings[text] for text in texts])
+
+    def _load_stored_embeddings(
+        self, text_hashes: list[str], used_on: str
+    ) -> dict[str, np.ndarray]:
+        """Fetch persisted suggestion embeddings for the current model by text hash.
+
+        Rows found have computed_at moved up to used_on (never back).
+        """
+        self.db.execute("CREATE TEMP TABLE IF NOT EXISTS _text_hashes (hash TEXT PRIMARY KEY)")
+        self.db.execute("DELETE FROM _text_hashes")
+        self.db.executemany(
+            "INSERT OR IGNORE INTO _text_hashes (hash) VALUES (?)", ((h,) for h in text_hashes)
+        )
+        rows = self.db.execute(
+            """
+            SELECT se.text_hash, se.embedding
+            FROM suggestion_embeddings se
+            JOIN _text_hashes th ON th.hash = se.text_hash
+            WHERE se.model_version = ?
+            """,
+            (MODEL_NAME,),
+        ).fetchall()
+        if rows:
+            self.db.execute(
+                """
+                UPDATE suggestion_embeddings SET computed_at = ?
+                WHERE model_version = ? AND computed_at < ?
+                    AND text_hash IN (SELECT hash FROM _text_hashes)
+                """,
+                (used_on, MODEL_NAME, used_on),
+            )
+        self.db.execute("DELETE FROM _text_hashes")
+        self.db.commit()
+        return {text_hash: np.frombuffer(blob, dtype=np.float32) for text_hash, blob in rows}
+
+    def _store_embeddings(self, rows: list[tuple[str, np.ndarray]], computed_at: str) -> None:
+        """Persist newly encoded suggestion embeddings."""
+        with BulkWriter(self.db) as writer:
+            writer.add_many(
+                """
+                INSERT OR REPLACE INTO suggestion_embeddings
+                    (text_hash, model_version, embedding, computed_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    (text_hash, MODEL_NAME, embedding.tobytes(), computed_at)
+                    for text_hash, embedding in rows
+                ),
+            )
+
+    def _prune_stored_embeddings(self, session_date: datetime, window_days: int) -> None:
+        """Drop persisted suggestion embeddings unused within the novelty window.
+
+        The window ends at the session date, as the novelty history does, so
+        every history text the novelty filter will embed survives. Texts still
+        in use are simply re-encoded and stored again, so this only bounds the
+        table's growth from one-off candidate suggestions.
+
+        Args:
+            session_date: Current session date
+            window_days: Novelty window in days
+        """
+        cutoff = session_date - timedelta(days=max(window_days, 1))
+        cursor = self.db.execute(
+            "DELETE FROM suggestion_embeddings WHERE computed_at < ?", (cutoff.isoformat(),)
+        )
+        if cursor.rowcount > 0:
+            logger.debug(f"Pruned {cursor.rowcount} stored suggestion embeddings")
+        self.db.commit()
+
     def _get_recent_embeddings(self, session_date: datetime, window_days: int) -> Any:
         """Get embeddings for recent suggestions with lazy caching.
 
@@ -62,8 +209,6 @@ class SuggestionFilter:
         Returns:
             Numpy array of embeddings for recent suggestions
         """
-        import numpy as np
-
         cache_key = (session_date, window_days)
 
         # Check if cache is valid
@@ -83,11 +228,8 @@ class SuggestionFilter:
         )
         recent_texts = [row[0] for row in cursor.fetchall()]
 
-        if recent_texts:
-            # Batch compute all embeddings at once
-            recent_embeddings = self.embedding_computer.compute_batch_semantic(recent_texts)
-        else:
-            recent_embeddings = np.array([])
+        # Stored embeddings cover history texts already seen in earlier runs
+        recent_embeddings = self.embed_texts(recent_texts)
 
         # Update cache
         self._recent_embeddings_cache = recent_embeddings
@@ -106,8 +248,17 @@ class SuggestionFilter:
             Filtered list of suggestions
         """
         filtered = suggestions
+        self.timings = []
+        self._session_date = session_date
 
-        for strategy in self.config.get("strategies", []):
+        strategies = self.config.get("strategies", [])
+        if "novelty" in strategies or "diversity" in strategies:
+            window_days = self.config.get("novelty", {}).get("window_days", 60)
+            self._prune_stored_embeddings(session_date, window_days)
+
+        for strategy in strategies:
+            stage_input = len(filtered)
+            start = time.perf_counter()
             if strategy == "boundary":
                 filtered = self.filter_boundary(filtered)
             elif strategy == "novelty":
@@ -116,21 +267,97 @@ class SuggestionFilter:
                 filtered = self.filter_diversity(filtered)
             elif strategy == "quality":
                 filtered = self.filter_quality(filtered)
+            else:
+                continue
+            self.timings.append(
+                FilterStageTiming(strategy, stage_input, len(filtered), time.perf_counter() - start)
+            )
 
         return filtered
 
-    def filter_boundary(self, suggestions: list[Suggestion]) -> list[Suggestion]:
-        """Remove suggestions referencing non-existent or excluded notes.
+    def filter_incremental(
+        self, suggestions: list[Suggestion], session_date: datetime
+    ) -> list[Suggestion]:
+        """Filter the next batch of a stream of suggestions.
+
+        Returns exactly the suggestions from this batch that filter_all() would
+        keep if run over every batch so far, concatenated in order. Every stage
+        decides on a suggestion from it and earlier suggestions only, so earlier
+        batches need not be filtered again: the stream keeps the note
+        references, the diversity stage's kept embeddings and the quality
+        stage's seen texts. Stage timings accumulate across batches.
 
         Args:
-            suggestions: Suggestions to filter
+            suggestions: Next batch of raw suggestions
+            session_date: Date of current session
 
         Returns:
-            Suggestions with valid note references only
+            Survivors from this batch
         """
-        if not self.config.get("boundary", {}).get("enabled", True):
+        strategies = self.config.get("strategies", [])
+        if self._stream is None:
+            self._stream = _FilterStream()
+            self.timings = []
+            self._session_date = session_date
+            if "novelty" in strategies or "diversity" in strategies:
+                window_days = self.config.get("novelty", {}).get("window_days", 60)
+                self._prune_stored_embeddings(session_date, window_days)
+        stream = self._stream
+
+        filtered = suggestions
+        for strategy in strategies:
+            stage_input = len(filtered)
+            start = time.perf_counter()
+            if strategy == "boundary":
+                if self.config.get("boundary", {}).get("enabled", True):
+                    if stream.note_refs is None:
+                        stream.note_refs = self._note_refs()
+                    filtered = self._within_boundary(filtered, *stream.note_refs)
+            elif strategy == "novelty":
+                filtered = self.filter_novelty(filtered, session_date)
+            elif strategy == "diversity":
+                filtered = self._filter_diversity_stream(filtered, stream)
+            elif strategy == "quality":
+                filtered = self.filter_quality(filtered, seen_texts=stream.seen_texts)
+            else:
+                continue
+            self._add_timing(strategy, stage_input, len(filtered), time.perf_counter() - start)
+
+        return filtered
+
+    def _add_timing(self, stage: str, input_count: int, output_count: int, seconds: float) -> None:
+        """Add one batch's cost to a stage's running timing."""
+        for timing in self.timings:
+            if timing.stage == stage:
+                timing.input_count += input_count
+                timing.output_count += output_count
+                timing.seconds += seconds
+                return
+        self.timings.append(FilterStageTiming(stage, input_count, output_count, seconds))
+
+    def _filter_diversity_stream(
+        self, suggestions: list[Suggestion], stream: _FilterStream
+    ) -> list[Suggestion]:
+        """Diversity stage for a batch, also against earlier batches' keepers."""
+        diversity_config = self.config.get("diversity", {})
+        if not diversity_config.get("enabled", True) or not suggestions:
             return suggestions
 
+        threshold = diversity_config.get("threshold", 0.85)
+        if stream.diverse_embeddings:
+            sim_matrix = pairwise_cosine(
+                self.embed_texts([s.text for s in suggestions]),
+                np.vstack(stream.diverse_embeddings),
+            )
+            too_similar = (sim_matrix >= threshold).any(axis=1)
+            suggestions = [s for i, s in enumerate(suggestions) if not too_similar[i]]
+
+        kept = self.filter_diversity(suggestions)
+        stream.diverse_embeddings.extend(self.embed_texts([s.text for s in kept]))
+        return kept
+
+    def _note_refs(self) -> tuple[set[str], set[str]]:
+        """Every valid and every excluded way a suggestion may reference a note."""
         # Folder prefixes whose notes must never surface in suggestions
         # (e.g. "Private/", "People/"). Spec: filtering.boundary.exclude_paths.
         exclude_paths = tuple(self.config.get("boundary", {}).get("exclude_paths", []) or [])
@@ -155,7 +382,13 @@ class SuggestionFilter:
                 excluded_refs |= forms
             else:
                 valid_refs |= forms
+        return valid_refs, excluded_refs
 
+    @staticmethod
+    def _within_boundary(
+        suggestions: list[Suggestion], valid_refs: set[str], excluded_refs: set[str]
+    ) -> list[Suggestion]:
+        """Keep suggestions whose every note exists and none is excluded."""
         filtered = []
         for suggestion in suggestions:
             # Keep only if every referenced note exists AND none is excluded.
@@ -163,9 +396,22 @@ class SuggestionFilter:
                 continue
             if all(note_ref in valid_refs for note_ref in suggestion.notes):
                 filtered.append(suggestion)
-
         return filtered
 
+    def filter_boundary(self, suggestions: list[Suggestion]) -> list[Suggestion]:
+        """Remove suggestions referencing non-existent or excluded notes.
+
+        Args:
+            suggestions: Suggestions to filter
+
+        Returns:
+            Suggestions with valid note references only
+        """
+        if not self.config.get("boundary", {}).get("enabled", True):
+            return suggestions
+
+        return self._within_boundary(suggestions, *self._note_refs())
+
     def filter_novelty(
         self, suggestions: list[Suggestion], session_date: datetime
     ) -> list[Suggestion]:
@@ -183,6 +429,7 @@ class SuggestionFilter:
         novelty_config = self.config.get("novelty", {})
         if not novelty_config.get("enabled", True):
             return suggestions
+        self._session_date = session_date
 
         window_days = novelty_config.get("window_days", 60)
         threshold = novelty_config.get("threshold", 0.85)
@@ -212,16 +459,13 @@ class SuggestionFilter:
             if len(recent_embeddings) == 0:
                 return suggestions  # No history to compare against
 
-            # Batch compute embeddings for all suggestions at once
-            suggestion_texts = [s.text for s in suggestions]
-            suggestion_embeddings = self.embedding_computer.compute_batch_semantic(suggestion_texts)
+            # Embeddings are shared with the diversity stage (encoded once)
+            suggestion_matrix = self.embed_texts([s.text for s in suggestions])
 
             # One S x R similarity matrix instead of a Python double loop of
             # per-pair cosine calls (the loop dominated --full/firehose mode);
             # a suggestion is novel iff no recent embedding meets the threshold.
-            suggestion_matrix = np.asarray(suggestion_embeddings, dtype=np.float32)
-            recent_matrix = np.vstack(list(recent_embeddings)).astype(np.float32)
-            sim_matrix = sklearn_cosine(suggestion_matrix, recent_matrix)
+            sim_matrix = pairwise_cosine(suggestion_matrix, recent_embeddings)
             too_similar = (sim_matrix >= threshold).any(axis=1)
 
             return [s for i, s in enumerate(suggestions) if not too_similar[i]]
@@ -247,14 +491,13 @@ class SuggestionFilter:
         if not suggestions:
             return suggestions
 
-        # Batch compute embeddings for all suggestions at once
-        suggestion_texts = [s.text for s in suggestions]
-        embeddings = self.embedding_computer.compute_batch_semantic(suggestion_texts)
+        # Embeddings are shared with the novelty stage (encoded once)
+        embeddings = self.embed_texts([s.text for s in suggestions])
 
         # One S x S similarity matrix, then the same greedy keep-first loop
         # reading matrix cells (previously S^2/2 per-pair cosine calls - the
         # dominant filter cost in --full mode at 50-200+ suggestions).
-        sim_matrix = sklearn_cosine(np.asarray(embeddings, dtype=np.float32))
+        sim_matrix = pairwise_cosine(embeddings)
 
         keep = [True] * len(suggestions)
         for i in range(len(suggestions)):
@@ -268,7 +511,9 @@ class SuggestionFilter:
 
         return [s for i, s in enumerate(suggestions) if keep[i]]
 
-    def filter_quality(self, suggestions: list[Suggestion]) -> list[Suggestion]:
+    def filter_quality(
+        self, suggestions: list[Suggestion], seen_texts: set[str] | None = None
+    ) -> list[Suggestion]:
         """Apply basic quality checks.
 
         Checks:
@@ -278,6 +523,8 @@ class SuggestionFilter:
 
         Args:
             suggestions: Suggestions to filter
+            seen_texts: Texts already accepted earlier in the stream; updated
+                in place (a fresh set if None)
 
         Returns:
             Quality suggestions only
@@ -291,7 +538,8 @@ class SuggestionFilter:
         check_repetition = quality_config.get("check_repetition", True)
 
         filtered = []
-        seen_texts: set[str] = set()
+        if seen_texts is None:
+            seen_texts = set()
 
         for suggestion in suggestions:
             text = suggestion.text.strip()
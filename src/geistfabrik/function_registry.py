@@ -4,6 +4,7 @@ This module provides:
 1. @vault_function decorator for registering functions
 2. FunctionRegistry for loading and managing functions
 3. Built-in vault functions for common operations
+4. NoteLink, the typed link string vault functions return to Tracery and geists
 """
 
 import importlib.util
@@ -11,9 +12,14 @@ import inspect
 import logging
 import sys
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from .models import Note
+
 if TYPE_CHECKING:
     from .vault_context import VaultContext
 
@@ -35,12 +41,91 @@ class DuplicateFunctionError(Exception):
 # Global registry for decorated functions
 _GLOBAL_REGISTRY: dict[str, Callable[..., Any]] = {}
 
+# Attribute marking a function as pure-per-session (safe to memoise)
+_PURE_ATTR = "_vault_function_pure"
+
+# Attribute marking a function as batched over its first argument
+_BATCHED_ATTR = "_vault_function_batched"
+
+
+class NoteLink(str):
+    """A bracketed Obsidian link ("[[Title]]") to a note.
+
+    Vault functions return NoteLinks where they return notes. As a str it
+    drops into Tracery templates unchanged; code geists can use ``path`` and
+    ``link_text`` rather than stripping brackets and resolving the title.
+
+    Attributes:
+        path: Path of the linked note
+        link_text: Text inside the brackets
+    """
+
+    path: str
+    link_text: str
+
+    def __new__(cls, note: Note) -> "NoteLink":
+        link = super().__new__(cls, f"[[{note.link_text}]]")
+        link.path = note.path
+        link.link_text = note.link_text
+        return link
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # str's reduce would pass the link text to __new__, which wants a Note
+        return (_rebuild_note_link, (str(self), self.path, self.link_text))
+
+
+def _rebuild_note_link(text: str, path: str, link_text: str) -> NoteLink:
+    """Recreate a NoteLink for copy and pickle (see NoteLink.__reduce__)."""
+    link = str.__new__(NoteLink, text)
+    link.path = path
+    link.link_text = link_text
+    return link
+
+
+def is_pure_function(func: Callable[..., Any]) -> bool:
+    """Check whether a vault function was declared pure-per-session.
+
+    Args:
+        func: Registered vault function
+
+    Returns:
+        True if results depend only on the session and arguments
+    """
+    return bool(getattr(func, _PURE_ATTR, False))
+
+
+def is_batched_function(func: Callable[..., Any]) -> bool:
+    """Check whether a vault function was declared batched.
+
+    Args:
+        func: Registered vault function
+
+    Returns:
+        True if the function takes a list for its first argument after vault
+        and returns one result per element
+    """
+    return bool(getattr(func, _BATCHED_ATTR, False))
+
+
+def _first_argument(func: Callable[..., Any]) -> str | None:
+    """Name of a vault function's first parameter after vault."""
+    params = list(inspect.signature(func).parameters)
+    return params[1] if len(params) > 1 else None
+
 
-def vault_function(name: str) -> Callable[..., Any]:
+def vault_function(name: str, pure: bool = False, batched: bool = False) -> Callable[..., Any]:
     """Decorator to register a function for use in geists and Tracery.
 
     Args:
         name: Name to register the function under
+        pure: Declare the function pure-per-session: for a given session its
+            result depends only on its arguments (no draws from the shared
+            vault RNG). Pure functions are memoised by FunctionRegistry and
+            their results shared across all geists in the session.
+        batched: The function takes a list of values for its first argument
+            after vault and returns a list with one result per value.
+            Callers still call it with a single value; call_many() passes
+            many at once.
 
     Returns:
         Decorator function
@@ -53,7 +138,9 @@ def vault_function(name: str) -> Callable[..., Any]:
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        if name in _GLOBAL_REGISTRY:
+        # Re-running the same definition (the builtins, once per registry)
+        # replaces it; a different function under the name is a conflict
+        if name in _GLOBAL_REGISTRY and not _same_definition(_GLOBAL_REGISTRY[name], func):
             raise DuplicateFunctionError(
                 f"Function '{name}' is already registered: {_GLOBAL_REGISTRY[name]}"
             )
@@ -65,6 +152,16 @@ def vault_function(name: str) -> Callable[..., Any]:
         if not params or params[0].name != "vault":
             raise FunctionRegistryError(f"Function '{name}' must have 'vault' as first parameter")
 
+        if batched and len(params) < 2:
+            raise FunctionRegistryError(
+                f"Batched function '{name}' needs an argument after 'vault' to batch over"
+            )
+
+        if pure:
+            setattr(func, _PURE_ATTR, True)
+        if batched:
+            setattr(func, _BATCHED_ATTR, True)
+
         _GLOBAL_REGISTRY[name] = func
         logger.debug(f"Registered vault function: {name}")
         return func
@@ -72,6 +169,25 @@ def vault_function(name: str) -> Callable[..., Any]:
     return decorator
 
 
+def _same_definition(a: Callable[..., Any], b: Callable[..., Any]) -> bool:
+    """Whether two functions come from the same definition (module and qualname)."""
+    return (a.__module__, a.__qualname__) == (b.__module__, b.__qualname__)
+
+
+def _notes_where(vault: "VaultContext", mask: np.ndarray) -> list[Note]:
+    """Notes selected by a boolean mask aligned with vault.notes()."""
+    notes = vault.notes()
+    return [notes[i] for i in np.flatnonzero(mask)]
+
+
+@dataclass
+class MemoStats:
+    """Memo hit/miss counters for one pure vault function."""
+
+    hits: int = 0
+    misses: int = 0
+
+
 class FunctionRegistry:
     """Manages vault functions from modules and built-ins.
 
@@ -79,6 +195,15 @@ class FunctionRegistry:
     1. Loaded from a directory of Python modules
     2. Registered programmatically via @vault_function decorator
     3. Built-in functions provided by the system
+
+    Results of functions declared pure (``@vault_function(name, pure=True)``)
+    are memoised per session, keyed by name and arguments, so every Tracery
+    grammar and code geist in a session shares one computation. The memo is
+    reset whenever a call arrives with a different VaultContext.
+
+    call_many() calls a function for many values of its first argument. A
+    batched function (``@vault_function(name, batched=True)``) receives all
+    values not already memoised in one call.
     """
 
     def __init__(self, function_dir: Path | None = None):
@@ -91,7 +216,14 @@ class FunctionRegistry:
         self.function_dir = function_dir
         self.functions: dict[str, Callable[..., Any]] = {}
 
-        # Load built-in functions
+        # Session-scoped memo for pure functions
+        self._memo: dict[tuple[Any, ...], Any] = {}
+        self._memo_owner: VaultContext | None = None
+        self.memo_stats: dict[str, MemoStats] = {}
+
+        # Load built-in functions. Registering them again in a process that
+        # already built a registry (invoke-many workers) replaces the
+        # previous definitions rather than colliding with them.
         self._register_builtin_functions()
 
     def _register_builtin_functions(self) -> None:
@@ -101,12 +233,16 @@ class FunctionRegistry:
         and VaultContext (Note-based). They:
         - Accept strings from Tracery
         - Work with Note objects internally
-        - Return bracketed Obsidian links (e.g. "[[Title]]") back to Tracery,
+        - Return bracketed Obsidian links as NoteLinks (e.g. "[[Title]]") back to Tracery,
           so templates use the result as-is without adding their own brackets
+
+        Functions that sample via the vault RNG (sample_notes, the voice lens
+        functions) are deliberately not pure: sharing their results would give
+        every geist the same sample.
         """
 
         @vault_function("sample_notes")
-        def sample_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def sample_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count random notes from vault.
 
             Returns:
@@ -114,30 +250,30 @@ class FunctionRegistry:
             """
             notes = vault.notes()
             sampled = vault.sample(notes, count)
-            return [f"[[{note.link_text}]]" for note in sampled]
+            return [NoteLink(note) for note in sampled]
 
-        @vault_function("old_notes")
-        def old_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        @vault_function("old_notes", pure=True)
+        def old_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Get count least recently modified notes.
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
             notes = vault.old_notes(count)
-            return [f"[[{note.link_text}]]" for note in notes]
+            return [NoteLink(note) for note in notes]
 
-        @vault_function("recent_notes")
-        def recent_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        @vault_function("recent_notes", pure=True)
+        def recent_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Get count most recently modified notes.
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
             notes = vault.recent_notes(count)
-            return [f"[[{note.link_text}]]" for note in notes]
+            return [NoteLink(note) for note in notes]
 
         @vault_function("random_note_title")
-        def random_note_title(vault: "VaultContext") -> str:
+        def random_note_title(vault: "VaultContext") -> NoteLink | str:
             """Get a random note from the vault.
 
             Uses deterministic randomness based on vault's RNG seed.
@@ -149,30 +285,30 @@ class FunctionRegistry:
             if not notes:
                 return ""
             sampled = vault.sample(notes, 1)
-            return f"[[{sampled[0].link_text}]]" if sampled else ""
+            return NoteLink(sampled[0]) if sampled else ""
 
-        @vault_function("orphans")
-        def orphans(vault: "VaultContext", count: int = 5) -> list[str]:
+        @vault_function("orphans", pure=True)
+        def orphans(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Get count orphan notes (no incoming or outgoing links).
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
             notes = vault.orphans(count)
-            return [f"[[{note.link_text}]]" for note in notes]
+            return [NoteLink(note) for note in notes]
 
-        @vault_function("hubs")
-        def hubs(vault: "VaultContext", count: int = 5) -> list[str]:
+        @vault_function("hubs", pure=True)
+        def hubs(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Get count notes with most incoming links.
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
             notes = vault.hubs(count)
-            return [f"[[{note.link_text}]]" for note in notes]
+            return [NoteLink(note) for note in notes]
 
-        @vault_function("neighbours")
-        def neighbours(vault: "VaultContext", note_title: str, count: int = 5) -> list[str]:
+        @vault_function("neighbours", pure=True)
+        def neighbours(vault: "VaultContext", note_title: str, count: int = 5) -> list[NoteLink]:
             """Get count semantically similar notes to given note.
 
             Note: This is a CODE-ONLY function (cannot be used in Tracery geists).
@@ -193,74 +329,52 @@ class FunctionRegistry:
             neighbour_notes = vault.neighbours(note, count)
 
             # Convert Note → string for Tracery
-            return [f"[[{n.link_text}]]" for n in neighbour_notes]
+            return [NoteLink(n) for n in neighbour_notes]
 
-        @vault_function("contrarian_to")
-        def contrarian_to(vault: "VaultContext", note_title: str, count: int = 3) -> list[str]:
-            """Find notes that are semantically dissimilar to given note.
+        @vault_function("contrarian_to", pure=True, batched=True)
+        def contrarian_to(
+            vault: "VaultContext", note_titles: list[str], count: int = 3
+        ) -> list[list[NoteLink]]:
+            """Find notes that are semantically dissimilar to each given note.
 
             Note: This is a CODE-ONLY function (cannot be used in Tracery geists).
 
-            Performance optimised: Uses vectorised numpy operations to compute all
-            similarities at once via matrix multiplication, rather than looping.
-            This is 10-100x faster than the loop-based approach.
+            Batched: called with one note link it returns that note's
+            contrarians; call_many() passes many links at once. Every query is
+            scored against the session's shared embedding matrix in a single
+            matrix product.
 
             Args:
-                note_title: Note link (string from Tracery)
-                count: Number of contrarian notes to return
+                note_titles: Note links (strings from Tracery)
+                count: Number of contrarian notes to return per link
 
             Returns:
-                List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
+                Per link, a list of bracketed Obsidian links, least similar first
+                (empty if the link does not resolve or has no embedding)
             """
-            import numpy as np
-
-            # Resolve string → Note (adapter layer responsibility)
-            note = vault.resolve_link_target(note_title)
-            if note is None:
-                return []
-
-            # Get query note embedding via public accessor
-            query_embedding = vault.get_embedding(note.path)
-            if query_embedding is None:
-                return []
-
-            all_notes = vault.notes()
-
-            # Build arrays of notes and embeddings (excluding query note)
-            candidate_notes = []
-            candidate_embeddings = []
-
-            for n in all_notes:
-                if n.path == note.path:
-                    continue  # Skip self
-
-                embedding = vault.get_embedding(n.path)
-                if embedding is not None:
-                    candidate_notes.append(n)
-                    candidate_embeddings.append(embedding)
-
-            if not candidate_notes:
-                return []
-
-            # Vectorized: Compute all similarities at once
-            query_array = np.array(query_embedding)
-            candidates_matrix = np.array(candidate_embeddings)
-
-            # Compute dot products (similarity scores)
-            similarities = np.dot(candidates_matrix, query_array)
-
-            # Normalise to get cosine similarities
-            query_norm = np.linalg.norm(query_array)
-            candidate_norms = np.linalg.norm(candidates_matrix, axis=1)
-            similarities = similarities / (candidate_norms * query_norm)
-
-            # Get indices of count least similar (ascending sort)
-            least_similar_indices = np.argsort(similarities)[:count]
-
-            # Return bracketed obsidian links
-            return [f"[[{candidate_notes[i].link_text}]]" for i in least_similar_indices]
+            matrix = vault.embedding_matrix()
+            results: list[list[NoteLink]] = [[] for _ in note_titles]
+
+            # Resolve string → Note → matrix row (adapter layer responsibility)
+            queries: list[tuple[int, int]] = []
+            for i, title in enumerate(note_titles):
+                note = vault.resolve_link_target(title)
+                if note is not None and note.path in matrix.rows:
+                    queries.append((i, matrix.rows[note.path]))
+            if not queries or len(matrix.notes) < 2:
+                return results
+
+            rows = np.array([row for _, row in queries])
+            similarities = matrix.unit[rows].astype(np.float32) @ matrix.unit.T
+            similarities[np.arange(len(rows)), rows] = np.inf  # never contrarian to itself
+
+            limit = min(count, len(matrix.notes) - 1)
+            for (i, _), scores in zip(queries, similarities):
+                least_similar = np.argsort(scores, kind="stable")[:limit]
+                results[i] = [NoteLink(matrix.notes[j]) for j in least_similar]
+            return results
 
-        @vault_function("semantic_clusters")
+        @vault_function("semantic_clusters", pure=True)
         def semantic_clusters(
             vault: "VaultContext", count: int = 2, neighbour_count: int = 3
         ) -> list[str]:
@@ -325,29 +439,27 @@ class FunctionRegistry:
         # --- Reflective lens functions (voice metadata + embedding drift) ---
 
         @vault_function("past_focused_notes")
-        def past_focused_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def past_focused_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with past-tense temporal orientation.
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = [n for n in vault.notes() if vault.voice(n).temporal_orientation == "past"]
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(vault, vault.voice_column("temporal_orientation") == "past")
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
         @vault_function("future_focused_notes")
-        def future_focused_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def future_focused_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with future-tense temporal orientation.
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = [
-                n for n in vault.notes() if vault.voice(n).temporal_orientation == "future"
-            ]
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(vault, vault.voice_column("temporal_orientation") == "future")
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
         @vault_function("self_focused_notes")
-        def self_focused_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def self_focused_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with high first-person singular usage.
 
             Candidates need self_focus_ratio > 0.8 AND at least some
@@ -358,15 +470,15 @@ class FunctionRegistry:
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = []
-            for n in vault.notes():
-                voice = vault.voice(n)
-                if voice.self_focus_ratio > 0.8 and voice.first_person_singular > 0:
-                    candidates.append(n)
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(
+                vault,
+                (vault.voice_column("self_focus_ratio") > 0.8)
+                & (vault.voice_column("first_person_singular") > 0),
+            )
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
         @vault_function("we_notes")
-        def we_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def we_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with high first-person plural usage.
 
             Candidates have more than 2 first-person plural pronouns per
@@ -375,31 +487,31 @@ class FunctionRegistry:
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = [n for n in vault.notes() if vault.voice(n).first_person_plural > 2.0]
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(vault, vault.voice_column("first_person_plural") > 2.0)
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
         @vault_function("uncertain_notes")
-        def uncertain_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def uncertain_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with high hedging density (>0.5 hedges/sentence).
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = [n for n in vault.notes() if vault.voice(n).hedging_ratio > 0.5]
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(vault, vault.voice_column("hedging_ratio") > 0.5)
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
         @vault_function("questioning_notes")
-        def questioning_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        def questioning_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Sample count notes with high question density (>1 per 100 words).
 
             Returns:
                 List of bracketed Obsidian links (e.g. ["[[Note A]]", "[[Note B]]"])
             """
-            candidates = [n for n in vault.notes() if vault.voice(n).question_density > 1.0]
-            return [f"[[{note.link_text}]]" for note in vault.sample(candidates, count)]
+            candidates = _notes_where(vault, vault.voice_column("question_density") > 1.0)
+            return [NoteLink(note) for note in vault.sample(candidates, count)]
 
-        @vault_function("surprising_notes")
-        def surprising_notes(vault: "VaultContext", count: int = 5) -> list[str]:
+        @vault_function("surprising_notes", pure=True)
+        def surprising_notes(vault: "VaultContext", count: int = 5) -> list[NoteLink]:
             """Get the count notes with highest information-theoretic surprisal.
 
             Thin wrapper over the session-cached VaultContext.surprisal_scores().
@@ -414,16 +526,16 @@ class FunctionRegistry:
             for path, _ in top:
                 note = vault.get_note(path)
                 if note is not None:
-                    results.append(f"[[{note.link_text}]]")
+                    results.append(NoteLink(note))
             return results
 
-        @vault_function("attention_shifted_notes")
+        @vault_function("attention_shifted_notes", pure=True)
         def attention_shifted_notes(
             vault: "VaultContext",
             months_ago: int = 6,
             min_churn: float = 0.7,
             count: int = 5,
-        ) -> list[str]:
+        ) -> list[NoteLink]:
             """Get count notes whose semantic neighbourhood has churned significantly.
 
             Thin wrapper over the session-cached VaultContext.neighbour_churn().
@@ -440,7 +552,7 @@ class FunctionRegistry:
             for path, _ in shifted[:count]:
                 note = vault.get_note(path)
                 if note is not None:
-                    results.append(f"[[{note.link_text}]]")
+                    results.append(NoteLink(note))
             return results
 
         # Transfer built-in functions from global registry to instance
@@ -507,22 +619,44 @@ class FunctionRegistry:
         module = importlib.util.module_from_spec(spec)
         sys.modules[f"_vaultfunc_{module_name}"] = module
 
+        # A vault's module functions belong to this registry only: take what
+        # the module's @vault_function decorators registered back out of the
+        # global registry, so a later registry (another vault in the same
+        # process) neither inherits them nor collides with them
+        before = dict(_GLOBAL_REGISTRY)
         try:
             spec.loader.exec_module(module)
         except Exception as e:
             raise FunctionRegistryError(f"Error executing module {module_name}: {e}")
-
-        # After module execution, check if any new functions were registered globally
-        # (This happens automatically via @vault_function decorator)
+        finally:
+            added = {
+                name: func
+                for name, func in _GLOBAL_REGISTRY.items()
+                if before.get(name) is not func
+            }
+            _GLOBAL_REGISTRY.clear()
+            _GLOBAL_REGISTRY.update(before)
+
+        for name in added:
+            if name in self.functions:
+                raise DuplicateFunctionError(
+                    f"Function '{name}' in module {module_name} is already registered"
+                )
+        self.functions.update(added)
 
         logger.debug(f"Loaded function module: {module_name}")
 
-    def register(self, name: str, func: Callable[..., Any]) -> None:
+    def register(
+        self, name: str, func: Callable[..., Any], pure: bool = False, batched: bool = False
+    ) -> None:
         """Manually register a function.
 
         Args:
             name: Name to register function under
             func: Function to register
+            pure: Declare the function pure-per-session (memoised)
+            batched: Declare the function batched over its first argument
+                (see vault_function)
 
         Raises:
             DuplicateFunctionError: If name already exists
@@ -530,6 +664,11 @@ class FunctionRegistry:
         if name in self.functions:
             raise DuplicateFunctionError(f"Function '{name}' already registered")
 
+        if pure:
+            setattr(func, _PURE_ATTR, True)
+        if batched:
+            setattr(func, _BATCHED_ATTR, True)
+
         self.functions[name] = func
         logger.debug(f"Manually registered function: {name}")
 
@@ -553,10 +692,162 @@ class FunctionRegistry:
 
         func = self.functions[name]
 
+        if not is_pure_function(func):
+            return self._invoke(name, func, vault, args, kwargs)
+
+        self._claim_memo(vault)
+        key = (name, args, tuple(sorted(kwargs.items())))
+        stats = self.memo_stats.setdefault(name, MemoStats())
         try:
-            return func(vault, *args, **kwargs)
+            cached = self._memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments: call through without memoising
+            return self._invoke(name, func, vault, args, kwargs)
+        else:
+            stats.hits += 1
+            return list(cached) if isinstance(cached, list) else cached
+
+        result = self._invoke(name, func, vault, args, kwargs)
+        stats.misses += 1
+        # Store a copy so callers mutating the returned list can't poison the memo
+        self._memo[key] = list(result) if isinstance(result, list) else result
+        return result
+
+    def call_many(
+        self, name: str, vault: "VaultContext", values: list[Any], *args: Any, **kwargs: Any
+    ) -> list[Any]:
+        """Call a registered function once per value of its first argument.
+
+        Returns what ``[call(name, vault, v, *args, **kwargs) for v in values]``
+        would, sharing the same memo. A batched function is called once with
+        every value that was not memoised.
+
+        Args:
+            name: Name of function to call
+            vault: VaultContext to pass to function
+            values: Values for the function's first argument after vault
+            *args: Remaining positional arguments, shared by every call
+            **kwargs: Keyword arguments, shared by every call
+
+        Returns:
+            One result per value
+
+        Raises:
+            FunctionRegistryError: If function not found or execution fails
+        """
+        if name not in self.functions:
+            raise FunctionRegistryError(f"Function '{name}' not registered")
+
+        func = self.functions[name]
+        values = list(values)
+        results: list[Any] = [None] * len(values)
+        keys: list[tuple[Any, ...] | None] = [None] * len(values)
+        missing = list(range(len(values)))
+
+        pure = is_pure_function(func)
+        stats = MemoStats()
+        if pure:
+            self._claim_memo(vault)
+            stats = self.memo_stats.setdefault(name, stats)
+            missing = []
+            for i, value in enumerate(values):
+                key = (name, (value, *args), tuple(sorted(kwargs.items())))
+                try:
+                    cached = self._memo[key]
+                except KeyError:
+                    keys[i] = key
+                    missing.append(i)
+                except TypeError:
+                    missing.append(i)  # Unhashable: computed, not memoised
+                else:
+                    stats.hits += 1
+                    results[i] = list(cached) if isinstance(cached, list) else cached
+
+        if not missing:
+            return results
+
+        if is_batched_function(func):
+            computed = self._invoke_batch(
+                name, func, vault, [values[i] for i in missing], args, kwargs
+            )
+        else:
+            computed = [
+                self._invoke(name, func, vault, (values[i], *args), kwargs) for i in missing
+            ]
+
+        for i, result in zip(missing, computed):
+            results[i] = result
+            memo_key = keys[i]
+            if memo_key is not None:
+                stats.misses += 1
+                self._memo[memo_key] = list(result) if isinstance(result, list) else result
+        return results
+
+    def _claim_memo(self, vault: "VaultContext") -> None:
+        """Start a fresh memo when calls arrive from a different VaultContext."""
+        if vault is not self._memo_owner:
+            self.clear_memo()
+            self._memo_owner = vault
+
+    def _invoke(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        vault: "VaultContext",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call func, wrapping failures in FunctionRegistryError."""
+        try:
+            if not is_batched_function(func):
+                return func(vault, *args, **kwargs)
+
+            # A single call to a batched function: batch of one
+            param = _first_argument(func)
+            if args:
+                return func(vault, [args[0]], *args[1:], **kwargs)[0]
+            if param in kwargs:
+                return func(vault, **{**kwargs, param: [kwargs[param]]})[0]
+            raise TypeError(f"missing required argument: '{param}'")
+        except Exception as e:
+            raise FunctionRegistryError(f"Error calling function '{name}': {e}") from e
+
+    def _invoke_batch(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        vault: "VaultContext",
+        values: list[Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Call a batched func over values, wrapping failures in FunctionRegistryError."""
+        try:
+            results = list(func(vault, values, *args, **kwargs))
         except Exception as e:
             raise FunctionRegistryError(f"Error calling function '{name}': {e}") from e
+        if len(results) != len(values):
+            raise FunctionRegistryError(
+                f"Batched function '{name}' returned {len(results)} results "
+                f"for {len(values)} values"
+            )
+        return results
+
+    def clear_memo(self) -> None:
+        """Drop memoised results and hit/miss counters."""
+        self._memo.clear()
+        self._memo_owner = None
+        self.memo_stats.clear()
+
+    def get_memo_stats(self) -> dict[str, MemoStats]:
+        """Get memo hit/miss counters for pure functions called this session.
+
+        Returns:
+            Dictionary mapping function name to its MemoStats
+        """
+        return dict(self.memo_stats)
 
     def get_function_names(self) -> list[str]:
         """Get list of all registered function names.
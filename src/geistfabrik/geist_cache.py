@@ -0,0 +1,214 @@
+"""Cross-run cache of raw geist output.
+
+Within a session a geist's output is determined by its source, the vault
+state, the session date and the configuration: geists draw randomness only from
+the vault RNG, which is reseeded per geist (VaultContext.reseed), and Tracery
+geists expand from their own seeded engine. Previewing with ``invoke`` and then
+committing with ``invoke --write`` therefore runs every geist twice for the
+same result. This cache stores each geist's suggestions under a key covering
+all of those inputs, so the second run skips the geists entirely.
+
+Key components:
+- geist source: SHA-256 of the geist's file
+- session fingerprint: vault_state_hash, session date and seed, the
+  configuration, the session history, the installed GeistFabrik source and
+  the vault's metadata_inference/ and vault_functions/ modules
+
+The table keeps one row per geist, so a new day (or any change) overwrites the
+previous entry rather than growing the database. Only successful runs are
+stored; a geist that failed or timed out runs again next time.
+
+Not covered: helper modules a custom geist imports from elsewhere. Run with
+--no-cache after editing one.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+from .config_loader import GeistFabrikConfig
+from .models import Suggestion
+from .vault_context import VaultContext
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = Path(__file__).parent
+
+# Vault directories whose modules geists reach through VaultContext
+_USER_MODULE_DIRS = ("metadata_inference", "vault_functions")
+
+
+def source_digest(path: Path) -> str:
+    """Hash a geist's source file.
+
+    Args:
+        path: Path to the geist module or YAML file
+
+    Returns:
+        SHA-256 hex digest of the file contents
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _package_stamp() -> str:
+    """Fingerprint the installed GeistFabrik source.
+
+    Uses file sizes and modification times, which is enough to notice an
+    upgrade or a local edit without reading every module.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        stat = path.stat()
+        hasher.update(
+            f"{path.relative_to(_PACKAGE_DIR)}|{stat.st_size}|{stat.st_mtime_ns}".encode()
+        )
+    return hasher.hexdigest()
+
+
+def session_fingerprint(
+    context: VaultContext,
+    config: GeistFabrikConfig | None,
+    geistfabrik_dir: Path,
+) -> str:
+    """Fingerprint everything besides its own source that a geist's output depends on.
+
+    Args:
+        context: Vault context the geists will run against
+        config: Loaded configuration (None when running without config.yaml)
+        geistfabrik_dir: The vault's _geistfabrik directory
+
+    Returns:
+        SHA-256 hex digest
+    """
+    session = context.session
+    state_row = context.db.execute(
+        "SELECT vault_state_hash FROM sessions WHERE session_id = ?", (session.session_id,)
+    ).fetchone()
+    # Geists comparing against earlier sessions see a backfilled or new session
+    history_row = context.db.execute("SELECT COUNT(*), MAX(session_id) FROM sessions").fetchone()
+
+    hasher = hashlib.sha256()
+    for part in (
+        state_row[0] if state_row else None,
+        session.date.date().isoformat(),
+        context.seed,
+        json.dumps(config.to_dict() if config else None, sort_keys=True, default=str),
+        tuple(history_row),
+        _package_stamp(),
+    ):
+        hasher.update(f"{part}\x00".encode())
+
+    for dirname in _USER_MODULE_DIRS:
+        module_dir = geistfabrik_dir / dirname
+        if not module_dir.is_dir():
+            continue
+        for path in sorted(module_dir.glob("*.py")):
+            hasher.update(f"{dirname}/{path.name}\x00".encode())
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+class GeistOutputCache:
+    """Stores raw geist output in the geist_output_cache table.
+
+    Example:
+        >>> cache = GeistOutputCache(db, session_fingerprint(context, config, gf_dir))
+        >>> suggestions = cache.get("temporal_drift", digest)  # None on a miss
+        >>> cache.hits, cache.misses
+        (1, 0)
+    """
+
+    def __init__(self, db: sqlite3.Connection, fingerprint: str):
+        """Initialise the cache.
+
+        Args:
+            db: Vault database connection
+            fingerprint: Session fingerprint (see session_fingerprint)
+        """
+        self.db = db
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self.hit_ids: list[str] = []
+
+    def _key(self, geist_id: str, digest: str) -> str:
+        return hashlib.sha256(f"{self.fingerprint}|{geist_id}|{digest}".encode()).hexdigest()
+
+    def get(self, geist_id: str, digest: str) -> list[Suggestion] | None:
+        """Look up a geist's cached output.
+
+        Args:
+            geist_id: Geist identifier
+            digest: Digest of the geist's source (see source_digest)
+
+        Returns:
+            Cached suggestions, or None on a miss
+        """
+        row = self.db.execute(
+            "SELECT cache_key, suggestions FROM geist_output_cache WHERE geist_id = ?",
+            (geist_id,),
+        ).fetchone()
+        if row is None or row[0] != self._key(geist_id, digest):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.hit_ids.append(geist_id)
+        return [Suggestion(**fields) for fields in json.loads(row[1])]
+
+    def put(self, geist_id: str, digest: str, suggestions: list[Suggestion]) -> None:
+        """Store a geist's output, replacing any earlier entry.
+
+        Args:
+            geist_id: Geist identifier
+            digest: Digest of the geist's source (see source_digest)
+            suggestions: Suggestions from a successful run
+        """
+        try:
+            self.db.execute(
+                """
+                INSERT INTO geist_output_cache (geist_id, cache_key, suggestions, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (geist_id) DO UPDATE SET
+                    cache_key = excluded.cache_key,
+                    suggestions = excluded.suggestions,
+                    created_at = excluded.created_at
+                """,
+                (
+                    geist_id,
+                    self._key(geist_id, digest),
+                    json.dumps([asdict(s) for s in suggestions]),
+                    datetime.now().isoformat(),
+                ),
+            )
+            self.db.commit()
+        except sqlite3.Error as e:
+            # A cache write must never fail the geist run
+            logger.warning("Could not cache output of %s: %s", geist_id, e)
+
+    def fetch(
+        self, geist_id: str, digest: str, produce: Callable[[], list[Suggestion]]
+    ) -> list[Suggestion]:
+        """Return cached output, or produce it and cache it.
+
+        Nothing is cached when produce raises; the exception propagates.
+
+        Args:
+            geist_id: Geist identifier
+            digest: Digest of the geist's source (see source_digest)
+            produce: Runs the geist
+
+        Returns:
+            The geist's suggestions
+        """
+        cached = self.get(geist_id, digest)
+        if cached is not None:
+            return cached
+        suggestions = produce()
+        self.put(geist_id, digest, suggestions)
+        return suggestions
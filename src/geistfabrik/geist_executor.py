@@ -14,7 +14,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .geist_cache import GeistOutputCache, source_digest
 from .geist_status import GeistStatusStore
+from .instrumentation import Instrumentation
 from .models import Suggestion
 from .vault_context import VaultContext
 
@@ -51,6 +53,7 @@ class GeistExecutionProfile:
     status: str  # "success", "timeout", "error"
     total_time: float  # seconds
     suggestion_count: int = 0
+    cached: bool = False  # Served from the output cache without running
 
     # Optional profiling data (only collected in verbose mode)
     function_stats: list[ProfileStats] | None = None
@@ -80,6 +83,7 @@ class GeistExecutor:
         enabled_defaults: dict[str, bool] | None = None,
         debug: bool = False,
         status_store: GeistStatusStore | None = None,
+        output_cache: GeistOutputCache | None = None,
     ):
         """Initialise geist executor.
 
@@ -90,6 +94,8 @@ class GeistExecutor:
             default_geists_dir: Directory containing default geists (optional)
             enabled_defaults: Dictionary of default geist enabled states (optional)
             debug: Enable detailed performance profiling and diagnostics (optional)
+            status_store: Persistent failure tracking (optional)
+            output_cache: Cross-run cache of geist output (optional)
         """
         self.geists_dir = geists_dir
         self.timeout = timeout
@@ -100,6 +106,9 @@ class GeistExecutor:
         # Persistent failure tracking (cross-session disable); None in tests
         # falls back to the in-memory counter.
         self.status_store = status_store
+        self.output_cache = output_cache
+        # Per-geist attribution for --timings; None when timings are off
+        self.timings: Instrumentation | None = None
         self.geists: dict[str, GeistMetadata] = {}
         self.execution_log: list[dict[str, Any]] = []
         self.execution_profiles: list[GeistExecutionProfile] = []
@@ -256,6 +265,13 @@ class GeistExecutor:
         Returns:
             List of suggestions from geist (empty on error)
         """
+        if self.timings is None:
+            return self._execute_geist(geist_id, context)
+        with self.timings.geist(geist_id):
+            return self._execute_geist(geist_id, context)
+
+    def _execute_geist(self, geist_id: str, context: VaultContext) -> list[Suggestion]:
+        """Execute a geist (see execute_geist)."""
         if geist_id not in self.geists:
             raise ValueError(f"Unknown geist: {geist_id}")
 
@@ -275,6 +291,33 @@ class GeistExecutor:
             )
             return []
 
+        # Each geist samples from its own stream, whatever ran before it
+        context.reseed(geist_id)
+
+        digest = None
+        if self.output_cache is not None:
+            digest = source_digest(geist.path)
+            cached = self.output_cache.get(geist_id, digest)
+            if cached is not None:
+                self.execution_log.append(
+                    {
+                        "geist_id": geist_id,
+                        "status": "success",
+                        "suggestion_count": len(cached),
+                        "cached": True,
+                    }
+                )
+                self.execution_profiles.append(
+                    GeistExecutionProfile(
+                        geist_id=geist_id,
+                        status="success",
+                        total_time=0.0,
+                        suggestion_count=len(cached),
+                        cached=True,
+                    )
+                )
+                return cached
+
         # Start timing
         start_time = time.perf_counter()
         profiler = None
@@ -345,6 +388,9 @@ class GeistExecutor:
                 if execution_time > self.timeout * 0.8:
                     self._warn_slow_geist(geist_id, execution_time)
 
+                if self.output_cache is not None and digest is not None:
+                    self.output_cache.put(geist_id, digest, suggestions)
+
                 return suggestions
 
             finally:
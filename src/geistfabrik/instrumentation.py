@@ -0,0 +1,344 @@
+"""Opt-in run instrumentation (``invoke --timings``).
+
+Collects, for one run:
+- phases (sync, embed, execute, filter, write): wall time, SQL statements and
+  how far resident memory rose above its level at the start of the phase
+- geists: wall time and SQL statements per geist
+- VaultContext methods: calls, cumulative time and cache hits/misses, attributed
+  to the geist that made the call
+
+Nothing is patched until a run asks for it. instrument() shadows the public
+methods of one VaultContext instance with timing wrappers and attach() installs
+a SQLite trace callback, so a run without --timings executes the plain methods
+with no callback and pays no overhead.
+
+Results print as a table (format_table) or are written as a Chrome trace
+(write), which chrome://tracing and Perfetto open directly; the same file
+carries the full per-geist breakdown under its "geistfabrik" key.
+
+Per-phase memory needs a peak that can be reset, which only Linux offers
+(/proc/self/clear_refs). Elsewhere phases report no memory figure and the
+table shows the process's overall peak instead, labelled as such.
+"""
+
+import functools
+import inspect
+import json
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .memory_budget import peak_memory_mb, reset_peak_memory, resident_memory_mb
+from .vault_context import VaultContext
+
+# VaultContext methods backed by a session cache. A call that leaves its cache
+# the same size was answered from it (a hit); a call that adds an entry missed.
+METHOD_CACHES = {
+    "read": "_read_cache",
+    "neighbours": "_neighbours_cache",
+    "similarity": "_similarity_cache",
+    "backlinks": "_backlinks_cache",
+    "outgoing_links": "_outgoing_links_cache",
+    "graph_neighbours": "_graph_neighbours_cache",
+    "get_clusters": "_clusters_cache",
+    "temporal_index": "_temporal_index_cache",
+    "surprisal_scores": "_surprisal_cache",
+    "neighbour_churn": "_churn_cache",
+    "metadata": "_metadata_cache",
+    "voice": "_voice_cache",
+    "voice_column": "_voice_columns",
+}
+
+# Attribution for method calls made outside any geist
+SESSION_SCOPE = "(session)"
+
+
+@dataclass
+class MethodStats:
+    """Calls to one VaultContext method from one geist."""
+
+    calls: int = 0
+    total_time: float = 0.0  # seconds, including nested method calls
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class SpanStats:
+    """Time and SQL statements spent in a phase or geist."""
+
+    duration: float = 0.0  # seconds, excluding nested phases
+    sql_count: int = 0
+    # Peak RSS (MiB) above the RSS at phase entry, including nested phases;
+    # the largest over repeats. Phases only, and None without per-phase peaks.
+    peak_growth_mb: float | None = None
+
+
+class Instrumentation:
+    """Collects timings for one run.
+
+    Example:
+        >>> timings = Instrumentation()
+        >>> timings.attach(vault.db)
+        >>> with timings.phase("sync"):
+        ...     vault.sync()
+        >>> timings.instrument(context)
+        >>> with timings.phase("execute"), timings.geist("hidden_hub"):
+        ...     executor.execute_geist("hidden_hub", context)
+        >>> print(timings.format_table())
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty collector."""
+        self.phases: dict[str, SpanStats] = {}
+        self.geists: dict[str, SpanStats] = {}
+        self.methods: dict[tuple[str, str], MethodStats] = {}
+        self.events: list[dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._sql_count = 0
+        self._connections: list[sqlite3.Connection] = []
+        # Time and SQL of finished child phases, one entry per open phase
+        self._open_phases: list[list[float]] = []
+        # RSS at entry and the peak banked before a nested phase's reset, one
+        # entry per open phase
+        self._phase_memory: list[list[float]] = []
+        self._current_geist: str | None = None
+        self.per_phase_memory = resident_memory_mb() is not None and reset_peak_memory()
+
+    # Sources
+
+    def attach(self, db: sqlite3.Connection) -> None:
+        """Count the SQL statements a connection executes.
+
+        Args:
+            db: Connection to trace until detach()
+        """
+        db.set_trace_callback(self._count_statement)
+        self._connections.append(db)
+
+    def detach(self) -> None:
+        """Remove the trace callbacks installed by attach()."""
+        for db in self._connections:
+            db.set_trace_callback(None)
+        self._connections.clear()
+
+    def _count_statement(self, statement: str) -> None:
+        """SQLite trace callback: called once per executed statement."""
+        self._sql_count += 1
+
+    def instrument(self, context: VaultContext) -> None:
+        """Time every public method of one VaultContext.
+
+        Wrappers are set on the instance, so other contexts are unaffected.
+
+        Args:
+            context: Context the geists will receive
+        """
+        for name, _ in inspect.getmembers(type(context), inspect.isfunction):
+            if not name.startswith("_"):
+                setattr(context, name, self._wrap(context, name, getattr(context, name)))
+
+    def _wrap(
+        self, context: VaultContext, name: str, method: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Wrap a bound method to record calls, time and cache hits."""
+        cache_attr = METHOD_CACHES.get(name)
+
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            cache = getattr(context, cache_attr) if cache_attr else None
+            size = len(cache) if cache is not None else 0
+            # A full BoundedCache stays the same size on a miss, but evicts
+            evictions = getattr(cache, "evictions", 0)
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                key = (self._current_geist or SESSION_SCOPE, name)
+                stats = self.methods.get(key)
+                if stats is None:
+                    stats = self.methods[key] = MethodStats()
+                stats.calls += 1
+                stats.total_time += time.perf_counter() - start
+            if cache is not None:
+                if len(cache) == size and getattr(cache, "evictions", 0) == evictions:
+                    stats.hits += 1
+                else:
+                    stats.misses += 1
+            return result
+
+        return timed
+
+    # Spans
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the run.
+
+        Phases may nest (e.g. filtering inside planned execution); a phase's
+        own figures exclude its nested phases, and repeated phases add up.
+
+        Args:
+            name: Phase name
+        """
+        # Registered on entry so phases list in the order they started
+        stats = self.phases.setdefault(name, SpanStats())
+        start = time.perf_counter()
+        sql_start = self._sql_count
+        self._open_phases.append([0.0, 0])
+        self._enter_phase_memory()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            sql = self._sql_count - sql_start
+            child_time, child_sql = self._open_phases.pop()
+            stats.duration += elapsed - child_time
+            stats.sql_count += sql - int(child_sql)
+            growth = self._exit_phase_memory()
+            if growth is not None:
+                stats.peak_growth_mb = max(stats.peak_growth_mb or 0.0, growth)
+            if self._open_phases:
+                self._open_phases[-1][0] += elapsed
+                self._open_phases[-1][1] += sql
+            self._record_event(name, "phase", start, elapsed)
+
+    def _enter_phase_memory(self) -> None:
+        """Restart the peak RSS for a phase that is starting."""
+        usage = resident_memory_mb() if self.per_phase_memory else None
+        if usage is None:
+            return
+        rss, peak = usage
+        # The reset loses the peak the enclosing phases have reached so far
+        for memory in self._phase_memory:
+            memory[1] = max(memory[1], peak)
+        reset_peak_memory()
+        self._phase_memory.append([rss, rss])
+
+    def _exit_phase_memory(self) -> float | None:
+        """Peak RSS growth (MiB) of the phase that is ending."""
+        if not self._phase_memory:
+            return None
+        entry_rss, banked_peak = self._phase_memory.pop()
+        usage = resident_memory_mb()
+        # No reset on exit: the peak keeps counting for the enclosing phase
+        peak = max(banked_peak, usage[1] if usage is not None else 0.0)
+        return max(peak - entry_rss, 0.0)
+
+    @contextmanager
+    def geist(self, geist_id: str) -> Iterator[None]:
+        """Attribute time, SQL and method calls to a geist.
+
+        Args:
+            geist_id: Geist being executed
+        """
+        start = time.perf_counter()
+        sql_start = self._sql_count
+        self._current_geist = geist_id
+        try:
+            yield
+        finally:
+            self._current_geist = None
+            elapsed = time.perf_counter() - start
+            stats = self.geists.setdefault(geist_id, SpanStats())
+            stats.duration += elapsed
+            stats.sql_count += self._sql_count - sql_start
+            self._record_event(geist_id, "geist", start, elapsed)
+
+    def _record_event(self, name: str, category: str, start: float, elapsed: float) -> None:
+        """Append a Chrome trace "complete" event (timestamps in microseconds)."""
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6),
+                "dur": round(elapsed * 1e6),
+                "pid": 1,
+                "tid": 1,
+            }
+        )
+
+    # Output
+
+    def method_totals(self) -> dict[str, MethodStats]:
+        """Method statistics summed over geists, slowest first."""
+        totals: dict[str, MethodStats] = {}
+        for (_, name), stats in self.methods.items():
+            total = totals.setdefault(name, MethodStats())
+            total.calls += stats.calls
+            total.total_time += stats.total_time
+            total.hits += stats.hits
+            total.misses += stats.misses
+        return dict(sorted(totals.items(), key=lambda item: -item[1].total_time))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Everything collected, as JSON-serialisable data."""
+        return {
+            "phases": {name: asdict(stats) for name, stats in self.phases.items()},
+            "geists": {geist_id: asdict(stats) for geist_id, stats in self.geists.items()},
+            "methods": [
+                {"geist": geist_id, "method": name, **asdict(stats)}
+                for (geist_id, name), stats in self.methods.items()
+            ],
+        }
+
+    def write(self, path: Path) -> None:
+        """Write a Chrome trace carrying the full statistics.
+
+        Args:
+            path: Output file
+        """
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "geistfabrik": self.to_dict(),
+        }
+        path.write_text(json.dumps(trace, indent=2))
+
+    def format_table(self, top: int = 15) -> str:
+        """Render phases, the slowest geists and the slowest methods.
+
+        Args:
+            top: Rows to show for geists and methods
+
+        Returns:
+            Multi-line table
+        """
+        lines = [f"{'Phase':<28} {'Time (ms)':>11} {'SQL':>8} {'Peak +MB':>9}"]
+        for name, span in self.phases.items():
+            growth = f"{span.peak_growth_mb:.0f}" if span.peak_growth_mb is not None else "-"
+            lines.append(
+                f"{name:<28} {span.duration * 1000:>11.1f} {span.sql_count:>8} {growth:>9}"
+            )
+        if not self.per_phase_memory:
+            process_peak = peak_memory_mb()
+            if process_peak is not None:
+                lines.append(
+                    f"(no per-phase peaks on this platform; process peak RSS {process_peak:.0f} MB)"
+                )
+
+        if self.geists:
+            lines += ["", f"{'Geist':<28} {'Time (ms)':>11} {'SQL':>8}"]
+            slowest = sorted(self.geists.items(), key=lambda item: -item[1].duration)
+            for geist_id, span in slowest[:top]:
+                lines.append(f"{geist_id:<28} {span.duration * 1000:>11.1f} {span.sql_count:>8}")
+
+        totals = self.method_totals()
+        if totals:
+            lines += [
+                "",
+                f"{'VaultContext method':<28} {'Time (ms)':>11} {'Calls':>8} "
+                f"{'Hits':>8} {'Misses':>8}",
+            ]
+            for name, stats in list(totals.items())[:top]:
+                hits, misses = (stats.hits, stats.misses) if name in METHOD_CACHES else ("-", "-")
+                lines.append(
+                    f"{name:<28} {stats.total_time * 1000:>11.1f} {stats.calls:>8} "
+                    f"{hits:>8} {misses:>8}"
+                )
+        return "\n".join(lines)
@@ -10,6 +10,7 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+from .bulk_writer import BulkWriter
 from .models import Suggestion
 
 logger = logging.getLogger(__name__)
@@ -132,20 +133,29 @@ class JournalWriter:
             suggestions: Suggestions to record
         """
         now = datetime.now().isoformat()
+        session_date = datetime.fromisoformat(date_str)
 
-        for i, suggestion in enumerate(suggestions, start=1):
-            block_id = self._generate_block_id(datetime.fromisoformat(date_str), i)
-
-            self.db.execute(
-                """
-                INSERT INTO session_suggestions
-                (session_date, geist_id, suggestion_text, block_id, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (date_str, suggestion.geist_id, suggestion.text, block_id, now),
-            )
+        writer = BulkWriter(self.db)
+        writer.add_many(
+            """
+            INSERT INTO session_suggestions
+            (session_date, geist_id, suggestion_text, block_id, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    date_str,
+                    suggestion.geist_id,
+                    suggestion.text,
+                    self._generate_block_id(session_date, i),
+                    now,
+                )
+                for i, suggestion in enumerate(suggestions, start=1)
+            ),
+        )
 
         try:
+            writer.flush()
             self.db.commit()
         except sqlite3.Error as e:
             logger.error(f"Database commit failed recording suggestions: {e}")
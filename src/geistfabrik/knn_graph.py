@@ -0,0 +1,262 @@
+"""Per-session exact k-nearest-neighbour graph.
+
+Semantic neighbours are needed by many consumers in one session: every
+neighbours() call, surprisal scores, neighbour churn (for the current and a
+historical epoch) and the hub heuristics in geists. Rather than each of them
+multiplying the embedding matrix again, the graph is computed once per session
+with blocked float32 matmuls, kept as compact arrays (int32 neighbour rows,
+float16 scores) and persisted in the session_knn table so later runs and
+later sessions load it instead of recomputing.
+
+Neighbour order within a row is exact: similarity descending, ties broken by
+row index. The float16 scores are approximate (about three significant
+digits); callers that need exact similarities rescore the few rows they use.
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from .config import DEFAULT_KNN_K, TOTAL_DIM
+from .quantization import decode_embedding
+
+logger = logging.getLogger(__name__)
+
+
+def normalise_rows(matrix: np.ndarray) -> np.ndarray:
+    """Row-normalise a matrix to unit vectors, leaving zero rows as zeros.
+
+    Args:
+        matrix: (N, d) array
+
+    Returns:
+        (N, d) array with each non-zero row scaled to unit norm
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms = np.where(norms == 0, 1.0, norms)
+    result: np.ndarray = matrix / norms
+    return result
+
+
+@dataclass
+class KnnGraph:
+    """Top-k cosine neighbours of every note in one session.
+
+    Attributes:
+        paths: Note paths in row order (sorted)
+        neighbours: (N, k) int32 array; row i lists the row indices of note
+            i's neighbours, most similar first. Self is never included.
+        scores: (N, k) float16 array of the matching cosine similarities
+    """
+
+    paths: list[str]
+    neighbours: np.ndarray
+    scores: np.ndarray
+
+    def __post_init__(self) -> None:
+        self._row: dict[str, int] = {path: i for i, path in enumerate(self.paths)}
+
+    @property
+    def k(self) -> int:
+        """Neighbours stored per note."""
+        return int(self.neighbours.shape[1])
+
+    @classmethod
+    def build(
+        cls, embeddings: Mapping[str, np.ndarray], k: int = DEFAULT_KNN_K, block_size: int = 1024
+    ) -> "KnnGraph":
+        """Compute the graph from a session's embeddings.
+
+        Uses blocked float32 matrix multiplication (block_size rows at a time,
+        peak memory about block_size × N floats) and np.argpartition for the
+        per-row top-k, then orders each row's k candidates. k is capped at
+        N - 1.
+
+        Args:
+            embeddings: Mapping of note path to embedding vector
+            k: Neighbours to keep per note
+            block_size: Rows per block (memory/speed trade-off)
+
+        Returns:
+            The session's KnnGraph
+        """
+        paths = sorted(embeddings)
+        n = len(paths)
+        k_eff = max(0, min(k, n - 1))
+        neighbours = np.empty((n, k_eff), dtype=np.int32)
+        scores = np.empty((n, k_eff), dtype=np.float16)
+        if k_eff == 0:
+            return cls(paths, neighbours, scores)
+
+        normalised = normalise_rows(
+            np.stack([np.asarray(embeddings[p], dtype=np.float32) for p in paths])
+        )
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+            rows = np.arange(end - start)
+            sims = normalised[start:end] @ normalised.T
+            # Mask self-similarity so a note is never its own neighbour
+            sims[rows, np.arange(start, end)] = -np.inf
+            if k_eff < n - 1:
+                candidates = np.argpartition(sims, -k_eff, axis=1)[:, -k_eff:]
+            else:
+                candidates = np.argsort(sims, axis=1)[:, 1:]  # all but self
+            candidate_sims = sims[rows[:, None], candidates]
+            # Similarity descending, then row index ascending
+            order = np.lexsort((candidates, -candidate_sims), axis=1)
+            neighbours[start:end] = np.take_along_axis(candidates, order, axis=1)
+            scores[start:end] = np.take_along_axis(candidate_sims, order, axis=1)
+
+        return cls(paths, neighbours, scores)
+
+    def covers(self, count: int) -> bool:
+        """Whether the graph can answer top-count queries exactly.
+
+        True when count is at most k, or when every note already lists all
+        other notes (small vaults).
+        """
+        return count <= self.k or self.k == len(self.paths) - 1
+
+    def row(self, path: str) -> int | None:
+        """Row index of a note, or None if it has no embedding."""
+        return self._row.get(path)
+
+    def neighbour_paths(self, path: str, count: int) -> list[str]:
+        """Paths of a note's count nearest neighbours, most similar first.
+
+        Args:
+            path: Note path
+            count: Number of neighbours (at most k unless covers(count))
+
+        Returns:
+            Neighbour paths; empty if the note is not in the graph
+        """
+        i = self._row.get(path)
+        if i is None:
+            return []
+        return [self.paths[j] for j in self.neighbours[i, :count]]
+
+    def neighbour_sets(self, count: int) -> dict[str, set[str]]:
+        """Top-count neighbour path sets for every note.
+
+        Args:
+            count: Neighbours per note (at most k unless covers(count))
+
+        Returns:
+            Dictionary mapping each path to the set of its neighbour paths
+        """
+        paths = self.paths
+        return {
+            path: {paths[j] for j in self.neighbours[i, :count]} for i, path in enumerate(paths)
+        }
+
+
+def load_knn_graph(db: sqlite3.Connection, session_id: int, k: int) -> KnnGraph | None:
+    """Load a session's stored graph if it is still valid.
+
+    A stored graph is valid when it has at least k neighbours per note (or
+    covers the whole vault) and was built from the session's current
+    embeddings: the session's vault hash and row count are unchanged.
+
+    Args:
+        db: Database connection
+        session_id: Session to load
+        k: Neighbours per note the caller needs
+
+    Returns:
+        The stored KnnGraph, or None when missing or stale
+    """
+    row = db.execute(
+        """
+        SELECT g.paths, g.neighbours, g.scores, g.k
+        FROM session_knn g
+        JOIN sessions s ON s.session_id = g.session_id
+        WHERE g.session_id = ?
+          AND s.vault_state_hash = g.vault_state_hash
+          AND g.row_count = (SELECT COUNT(*) FROM session_embeddings WHERE session_id = ?)
+        """,
+        (session_id, session_id),
+    ).fetchone()
+    if row is None:
+        return None
+
+    paths_json, neighbours_blob, scores_blob, stored_k = row
+    paths = json.loads(paths_json)
+    graph = KnnGraph(
+        paths,
+        np.frombuffer(neighbours_blob, dtype=np.int32).reshape(len(paths), stored_k),
+        np.frombuffer(scores_blob, dtype=np.float16).reshape(len(paths), stored_k),
+    )
+    return graph if graph.covers(k) else None
+
+
+def save_knn_graph(db: sqlite3.Connection, session_id: int, graph: KnnGraph) -> None:
+    """Persist a session's graph, replacing any stored one.
+
+    Args:
+        db: Database connection
+        session_id: Session the graph was built for
+        graph: Graph to store
+    """
+    db.execute(
+        """
+        INSERT OR REPLACE INTO session_knn
+            (session_id, k, paths, neighbours, scores, vault_state_hash, row_count)
+        SELECT ?, ?, ?, ?, ?, vault_state_hash, ?
+        FROM sessions WHERE session_id = ?
+        """,
+        (
+            session_id,
+            graph.k,
+            json.dumps(graph.paths),
+            graph.neighbours.astype(np.int32).tobytes(),
+            graph.scores.astype(np.float16).tobytes(),
+            len(graph.paths),
+            session_id,
+        ),
+    )
+    db.commit()
+
+
+def session_knn_graph(
+    db: sqlite3.Connection,
+    session_id: int,
+    embeddings: Mapping[str, np.ndarray] | None = None,
+    k: int = DEFAULT_KNN_K,
+    block_size: int = 1024,
+) -> KnnGraph:
+    """Load a session's graph, building and storing it if needed.
+
+    Args:
+        db: Database connection
+        session_id: Session whose graph is wanted
+        embeddings: The session's embeddings if already in memory; read from
+            session_embeddings otherwise (only when a rebuild is needed)
+        k: Neighbours per note
+        block_size: Rows per block if the graph has to be built
+
+    Returns:
+        The session's KnnGraph
+    """
+    graph = load_knn_graph(db, session_id, k)
+    if graph is not None:
+        return graph
+
+    if embeddings is None:
+        embeddings = {
+            path: decode_embedding(blob, TOTAL_DIM)
+            for path, blob in db.execute(
+                "SELECT note_path, embedding FROM session_embeddings WHERE session_id = ?",
+                (session_id,),
+            )
+        }
+    graph = KnnGraph.build(embeddings, k=max(k, DEFAULT_KNN_K), block_size=block_size)
+    save_knn_graph(db, session_id, graph)
+    logger.debug(
+        "Built kNN graph for session %d (%d notes, k=%d)", session_id, len(graph.paths), graph.k
+    )
+    return graph
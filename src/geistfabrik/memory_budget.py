@@ -0,0 +1,220 @@
+"""Memory budget governor.
+
+`performance.memory_budget_mb` bounds the working memory of the steps whose
+footprint grows with the vault: blocked similarity products (kNN graph,
+surprisal, neighbour churn), the similarity sample in embedding metrics,
+the candidate set of unlinked_pairs (lowered only), and VaultContext's per-note and
+per-pair caches. MemoryBudget turns the budget and the vault size into
+those limits. Large vaults degrade by streaming smaller blocks, sampling
+fewer notes and evicting cache entries rather than running out of memory;
+a generous budget gets larger blocks and samples.
+
+With no budget (0, the default) every limit keeps its built-in value.
+"""
+
+import math
+import sys
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .config import DEFAULT_MEMORY_BUDGET_MB
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Built-in limits, used when no budget is set
+DEFAULT_BLOCK_ROWS = 1024
+DEFAULT_SIMILARITY_SAMPLE = 1000
+DEFAULT_PAIR_CANDIDATES = 200
+
+# Shares of the budget. Blocked products and pairwise matrices run one at a
+# time, so they share a half; the session caches get a quarter; the rest is
+# left for embeddings, notes and the interpreter.
+_WORKSPACE_SHARE = 0.5
+_CACHE_SHARE = 0.25
+
+# Bytes per cell of a (rows x N) similarity block: float32 scores plus the
+# int64 indices argpartition returns
+_BLOCK_CELL_BYTES = 12
+
+# Bytes per pair of an (n x n) pairwise matrix: float64 similarities plus the
+# upper-triangle indices and values taken from it
+_PAIR_BYTES = 24
+
+# Floors, so a tiny budget slows work down instead of making it meaningless
+_MIN_BLOCK_ROWS = 16
+_MIN_SAMPLE = 100
+_MIN_CACHE_ENTRIES = 256
+
+# Rough size of one entry in each capped VaultContext cache
+CACHE_ENTRY_BYTES = {
+    "_similarity_cache": 200,
+    "_neighbours_cache": 1024,
+    "_backlinks_cache": 512,
+    "_outgoing_links_cache": 512,
+    "_graph_neighbours_cache": 512,
+    "_read_cache": 256,
+}
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """Limits derived from a memory budget.
+
+    Attributes:
+        budget_mb: Working-memory budget in MiB; 0 keeps the built-in limits
+    """
+
+    budget_mb: int = DEFAULT_MEMORY_BUDGET_MB
+
+    @property
+    def limited(self) -> bool:
+        """Whether a budget is set."""
+        return self.budget_mb > 0
+
+    @property
+    def _workspace_bytes(self) -> float:
+        return self.budget_mb * 1024 * 1024 * _WORKSPACE_SHARE
+
+    def block_rows(self, n_columns: int) -> int:
+        """Rows per block for a blocked (rows x n_columns) similarity product.
+
+        Args:
+            n_columns: Notes each row is scored against
+
+        Returns:
+            Block size in rows
+        """
+        if not self.limited or n_columns <= 0:
+            return DEFAULT_BLOCK_ROWS
+        rows = int(self._workspace_bytes / (n_columns * _BLOCK_CELL_BYTES))
+        return max(_MIN_BLOCK_ROWS, rows)
+
+    def similarity_sample(self) -> int:
+        """Largest note sample whose full pairwise similarity matrix fits.
+
+        Returns:
+            Sample size; vaults with more notes are sampled down to it
+        """
+        if not self.limited:
+            return DEFAULT_SIMILARITY_SAMPLE
+        return max(_MIN_SAMPLE, math.isqrt(int(self._workspace_bytes / _PAIR_BYTES)))
+
+    def pair_candidates(self) -> int:
+        """Notes unlinked_pairs compares all-against-all.
+
+        Never above the built-in limit: beyond it the cost is link checks on
+        the similar pairs found, which a larger budget does not pay for.
+
+        Returns:
+            Candidate count; larger vaults are sampled down to it
+        """
+        return min(DEFAULT_PAIR_CANDIDATES, self.similarity_sample())
+
+    def cache_entries(self, cache: str) -> int | None:
+        """Entry cap for one VaultContext cache.
+
+        Args:
+            cache: Cache attribute name (a key of CACHE_ENTRY_BYTES)
+
+        Returns:
+            Maximum entries, or None for no cap
+        """
+        if not self.limited or cache not in CACHE_ENTRY_BYTES:
+            return None
+        share = self.budget_mb * 1024 * 1024 * _CACHE_SHARE / len(CACHE_ENTRY_BYTES)
+        return max(_MIN_CACHE_ENTRIES, int(share / CACHE_ENTRY_BYTES[cache]))
+
+    def describe(self, n_notes: int) -> dict[str, Any]:
+        """The limits in force for a vault of n_notes notes.
+
+        Args:
+            n_notes: Notes in the vault
+
+        Returns:
+            Budget and derived limits, JSON-serialisable
+        """
+        return {
+            "budget_mb": self.budget_mb if self.limited else None,
+            "block_rows": min(self.block_rows(n_notes), max(n_notes, 1)),
+            "similarity_sample": self.similarity_sample(),
+            "pair_candidates": self.pair_candidates(),
+            "cache_entries": {cache: self.cache_entries(cache) for cache in CACHE_ENTRY_BYTES},
+        }
+
+
+class BoundedCache(dict[K, V]):
+    """A dict that drops its oldest entries beyond max_entries.
+
+    Session caches are filled once and read many times, so dropping the
+    oldest insertion is as good as LRU here and costs nothing on reads.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Entry cap; None for an ordinary, unbounded dict
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.evictions = 0
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        if self.max_entries is not None and len(self) > self.max_entries:
+            del self[next(iter(self))]
+            self.evictions += 1
+
+
+def peak_memory_mb() -> float | None:
+    """Peak resident set size of this process so far, in MiB.
+
+    Returns:
+        Peak RSS, or None where the resource module is unavailable (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def resident_memory_mb() -> tuple[float, float] | None:
+    """Current and peak resident set size of this process, in MiB.
+
+    Unlike peak_memory_mb(), the peak here restarts at reset_peak_memory().
+
+    Returns:
+        (current, peak) RSS, or None where /proc/self/status is unavailable
+        (anything but Linux)
+    """
+    fields: dict[str, float] = {}
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    fields[key] = int(value.split()[0]) / 1024  # reported in kB
+    except OSError:
+        return None
+    if len(fields) < 2:
+        return None
+    return fields["VmRSS"], fields["VmHWM"]
+
+
+def reset_peak_memory() -> bool:
+    """Restart the peak resident_memory_mb() reports from the current RSS.
+
+    Returns:
+        True if the peak was reset; False where the kernel does not support it
+        (anything but Linux 4.0+)
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")  # 5: reset the peak RSS (VmHWM)
+    except OSError:
+        return False
+    return True
@@ -2,7 +2,12 @@
 
 This module provides a system for loading and executing metadata inference modules.
 Modules are discovered from `<vault>/_geistfabrik/metadata_inference/` and must
-export an `infer(note, vault) -> Dict` function.
+export an `infer(note, vault) -> Dict` function, an
+`infer_batch(notes, vault) -> Dict[path, Dict]` function, or both.
+
+`infer_batch` lets a module that computes something vault-wide (percentiles,
+neighbour-based features, regex sweeps) do that work once per session rather
+than once per note.
 """
 
 import importlib.util
@@ -19,6 +24,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Marks a module that failed on a note in MetadataLoader.infer_many()
+_FAILED = object()
+
 
 class MetadataInferenceError(Exception):
     """Raised when metadata inference fails."""
@@ -36,7 +44,11 @@ class MetadataLoader:
     """Loads and manages metadata inference modules.
 
     Discovers Python modules from a directory, validates that they export
-    an `infer(note, vault) -> Dict` function, and detects key conflicts.
+    an `infer(note, vault) -> Dict` or `infer_batch(notes, vault)` function,
+    and detects key conflicts.
+
+    Every module has an entry in `modules`; a batch-only module's entry calls
+    `infer_batch` with a single note. infer_many() prefers `infer_batch`.
     """
 
     def __init__(self, module_dir: Path | None = None):
@@ -48,8 +60,16 @@ class MetadataLoader:
         """
         self.module_dir = module_dir
         self.modules: dict[str, Callable[[Note, VaultContext], dict[str, Any]]] = {}
+        self.batch_modules: dict[
+            str, Callable[[list[Note], VaultContext], dict[str, dict[str, Any]]]
+        ] = {}
         self._key_to_module: dict[str, str] = {}  # Track which module provides which key
 
+    @property
+    def wants_prefetch(self) -> bool:
+        """Whether inferring all notes at once beats inferring them lazily."""
+        return bool(self.batch_modules)
+
     def load_modules(self, enabled_modules: list[str] | None = None) -> None:
         """Load metadata inference modules from directory.
 
@@ -109,19 +129,28 @@ class MetadataLoader:
         except Exception as e:
             raise MetadataInferenceError(f"Error executing module {module_name}: {e}")
 
-        # Validate that module exports infer function
-        if not hasattr(module, "infer"):
-            raise MetadataInferenceError(f"Module {module_name} does not export 'infer' function")
-
-        infer_func = module.infer
-        if not callable(infer_func):
-            raise MetadataInferenceError(f"Module {module_name} 'infer' is not callable")
+        # Validate that module exports infer and/or infer_batch
+        infer_func = getattr(module, "infer", None)
+        batch_func = getattr(module, "infer_batch", None)
+        if infer_func is None and batch_func is None:
+            raise MetadataInferenceError(
+                f"Module {module_name} does not export 'infer' or 'infer_batch' function"
+            )
+        for name, func in (("infer", infer_func), ("infer_batch", batch_func)):
+            if func is not None and not callable(func):
+                raise MetadataInferenceError(f"Module {module_name} '{name}' is not callable")
 
         # Detect key conflicts by doing a dry run with a dummy note
         # (This is optional but helps catch conflicts early)
         # For now, we'll detect conflicts during actual inference
 
-        self.modules[module_name] = infer_func
+        if batch_func is not None:
+            self.batch_modules[module_name] = batch_func
+        self.modules[module_name] = (
+            infer_func
+            if infer_func is not None
+            else _single_note_infer(self.batch_modules[module_name])
+        )
         logger.debug(f"Loaded metadata module: {module_name}")
 
     def infer_all(self, note: Note, vault: "VaultContext") -> tuple[dict[str, Any], list[str]]:
@@ -143,45 +172,135 @@ class MetadataLoader:
         for module_name, infer_func in self.modules.items():
             try:
                 result = infer_func(note, vault)
+            except Exception as e:
+                logger.error(
+                    f"Error running metadata module {module_name} on note {note.path}: {e}"
+                )
+                failed_modules.append(module_name)
+                continue
+
+            self._merge_result(metadata, failed_modules, module_name, result)
 
-                # Validate return type
-                if not isinstance(result, dict):
-                    logger.warning(
-                        f"Metadata module {module_name} returned non-dict type: {type(result)}"
-                    )
+        return metadata, failed_modules
+
+    def infer_many(
+        self, notes: list[Note], vault: "VaultContext"
+    ) -> dict[str, tuple[dict[str, Any], list[str]]]:
+        """Run all metadata inference modules on many notes in one pass.
+
+        Batch modules are called once with every note; per-note modules are
+        called for each note. Results are validated per note as infer_all()
+        validates them. A key conflict costs only the note it occurs on: the
+        later module is logged and recorded as failed for that note, and every
+        other note keeps its metadata.
+
+        Args:
+            notes: Notes to infer metadata for
+            vault: VaultContext for accessing vault data
+
+        Returns:
+            Dict mapping note path to (metadata dict, list of failed module names)
+        """
+        by_module: dict[str, dict[str, Any]] = {}
+        for module_name, infer_func in self.modules.items():
+            if module_name in self.batch_modules:
+                by_module[module_name] = self._run_batch(module_name, notes, vault)
+            else:
+                by_module[module_name] = self._run_per_note(module_name, infer_func, notes, vault)
+
+        inferred: dict[str, tuple[dict[str, Any], list[str]]] = {}
+        for note in notes:
+            metadata: dict[str, Any] = {}
+            failed_modules: list[str] = []
+            for module_name, results in by_module.items():
+                result = results.get(note.path, {})
+                if result is _FAILED:
                     failed_modules.append(module_name)
                     continue
+                try:
+                    self._merge_result(metadata, failed_modules, module_name, result)
+                except MetadataConflictError as e:
+                    logger.error(f"{e} (note {note.path})")
+                    failed_modules.append(module_name)
+            inferred[note.path] = (metadata, failed_modules)
+        return inferred
 
-                # Detect key conflicts
-                for key, value in result.items():
-                    if key in metadata:
-                        existing_module = self._key_to_module[key]
-                        raise MetadataConflictError(
-                            f"Metadata key conflict: '{key}' provided by both "
-                            f"'{existing_module}' and '{module_name}'"
-                        )
-
-                    # Validate value types (must be JSON-serializable)
-                    if not self._is_valid_value(value):
-                        logger.warning(
-                            f"Metadata module {module_name} returned invalid value type "
-                            f"for key '{key}': {type(value)}"
-                        )
-                        continue
-
-                    metadata[key] = value
-                    self._key_to_module[key] = module_name
-
-            except MetadataConflictError:
-                raise  # Re-raise conflict errors
+    def _run_batch(
+        self, module_name: str, notes: list[Note], vault: "VaultContext"
+    ) -> dict[str, Any]:
+        """Call a module's infer_batch, marking every note failed on error."""
+        try:
+            results = self.batch_modules[module_name](notes, vault)
+        except Exception as e:
+            logger.error(f"Error running metadata module {module_name} on {len(notes)} notes: {e}")
+            return {note.path: _FAILED for note in notes}
+
+        if not isinstance(results, dict):
+            logger.warning(
+                f"Metadata module {module_name} infer_batch returned non-dict type: {type(results)}"
+            )
+            return {note.path: _FAILED for note in notes}
+        return results
+
+    def _run_per_note(
+        self,
+        module_name: str,
+        infer_func: Callable[[Note, "VaultContext"], dict[str, Any]],
+        notes: list[Note],
+        vault: "VaultContext",
+    ) -> dict[str, Any]:
+        """Call a module's infer on each note, marking notes that raise."""
+
+        def run(note: Note) -> Any:
+            try:
+                return infer_func(note, vault)
             except Exception as e:
                 logger.error(
                     f"Error running metadata module {module_name} on note {note.path}: {e}"
                 )
-                failed_modules.append(module_name)
+                return _FAILED
+
+        return {note.path: run(note) for note in notes}
+
+    def _merge_result(
+        self,
+        metadata: dict[str, Any],
+        failed_modules: list[str],
+        module_name: str,
+        result: Any,
+    ) -> None:
+        """Validate one module's result for a note and merge it into metadata.
+
+        Raises:
+            MetadataConflictError: If a key was already provided by another module
+        """
+        # Validate return type
+        if not isinstance(result, dict):
+            logger.warning(f"Metadata module {module_name} returned non-dict type: {type(result)}")
+            failed_modules.append(module_name)
+            return
+
+        # Detect key conflicts before merging any key, so a conflicting
+        # result is rejected whole
+        for key in result:
+            if key in metadata:
+                existing_module = self._key_to_module[key]
+                raise MetadataConflictError(
+                    f"Metadata key conflict: '{key}' provided by both "
+                    f"'{existing_module}' and '{module_name}'"
+                )
+
+        for key, value in result.items():
+            # Validate value types (must be JSON-serializable)
+            if not self._is_valid_value(value):
+                logger.warning(
+                    f"Metadata module {module_name} returned invalid value type "
+                    f"for key '{key}': {type(value)}"
+                )
                 continue
 
-        return metadata, failed_modules
+            metadata[key] = value
+            self._key_to_module[key] = module_name
 
     def _is_valid_value(self, value: Any) -> bool:
         """Check if a value is a valid metadata type.
@@ -220,6 +339,20 @@ class MetadataLoader:
         self._key_to_module.clear()
 
 
+def _single_note_infer(
+    batch_func: Callable[[list[Note], "VaultContext"], dict[str, dict[str, Any]]],
+) -> Callable[[Note, "VaultContext"], dict[str, Any]]:
+    """Adapt a batch-only module's infer_batch to the per-note infer signature."""
+
+    def infer(note: Note, vault: "VaultContext") -> dict[str, Any]:
+        results = batch_func([note], vault)
+        if not isinstance(results, dict):
+            return results  # reported as a non-dict result by the caller
+        return results.get(note.path, {})
+
+    return infer
+
+
 class MetadataAnalyser:
     """Analyse metadata distributions and outliers.
 
@@ -254,6 +387,7 @@ class MetadataAnalyser:
         import numpy as np
 
         notes = self.vault.notes()
+        self.vault.prefetch_metadata(notes)
         values = []
 
         for note in notes:
@@ -295,6 +429,7 @@ class MetadataAnalyser:
         import numpy as np
 
         notes = self.vault.notes()
+        self.vault.prefetch_metadata(notes)
         values = []
         note_value_map: dict[str, float] = {}
 
@@ -0,0 +1,362 @@
+"""Reduced-precision embedding storage and search.
+
+Embeddings are float32 by default. Two compact encodings are available:
+
+- ``float16``: half precision, 2 bytes per component.
+- ``int8``: the semantic components as int8 codes with one float32 scale per
+  vector (symmetric, scale = max |x| / 127). Components past SEMANTIC_DIM
+  (the temporal features of a session embedding) stay float32: note age grows
+  without bound, and sharing a scale with it would flatten the semantic part.
+
+Blobs do not record their encoding; decode_embedding() tells them apart by
+length, which differs for every encoding of a given dimension. Rows written
+at different precisions can therefore share a table, and changing the
+configured precision needs no migration.
+
+For search, CompactMatrix holds row-normalised vectors at reduced precision
+and scores them in blocks; callers rescore the best candidates against the
+float32 vectors. neighbour_recall() measures how often that finds the exact
+nearest neighbours. StoredEmbeddings keeps a session's blobs as stored and
+decodes rows on access, so compact rows are never held as float32.
+"""
+
+from collections.abc import Iterator, Mapping
+
+import numpy as np
+
+from .config import SEMANTIC_DIM
+
+EMBEDDING_PRECISIONS = ("float32", "float16", "int8")
+
+# Rows scored per block by CompactMatrix, bounding the float32 temporary
+_SCORE_BLOCK_ROWS = 8192
+
+
+def validate_precision(precision: str) -> str:
+    """Check an embedding precision name.
+
+    Args:
+        precision: One of EMBEDDING_PRECISIONS
+
+    Returns:
+        The precision, unchanged
+
+    Raises:
+        ValueError: If the precision is unknown
+    """
+    if precision not in EMBEDDING_PRECISIONS:
+        raise ValueError(
+            f"Unknown embedding precision: {precision!r}. "
+            f"Valid precisions: {', '.join(EMBEDDING_PRECISIONS)}"
+        )
+    return precision
+
+
+def _int8_split(dim: int) -> int:
+    """Number of leading components stored as int8 codes."""
+    return min(dim, SEMANTIC_DIM)
+
+
+def encoded_size(dim: int, precision: str) -> int:
+    """Bytes per vector of the given dimension at the given precision."""
+    validate_precision(precision)
+    if precision == "float32":
+        return 4 * dim
+    if precision == "float16":
+        return 2 * dim
+    quantised = _int8_split(dim)
+    return 4 + quantised + 4 * (dim - quantised)
+
+
+def encode_embeddings(matrix: np.ndarray, precision: str = "float32") -> list[bytes]:
+    """Encode each row of a matrix as a storage blob.
+
+    Args:
+        matrix: Embeddings, shape (N, dim)
+        precision: One of EMBEDDING_PRECISIONS
+
+    Returns:
+        One blob per row
+
+    Raises:
+        ValueError: If the precision is unknown
+    """
+    validate_precision(precision)
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if precision == "float32":
+        return [row.tobytes() for row in matrix]
+    if precision == "float16":
+        return [row.tobytes() for row in matrix.astype(np.float16)]
+
+    quantised = _int8_split(matrix.shape[1])
+    head = matrix[:, :quantised]
+    scales = (np.abs(head).max(axis=1) / 127.0).astype(np.float32)
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    codes = np.clip(np.rint(head / safe), -127, 127).astype(np.int8)
+    tail = np.ascontiguousarray(matrix[:, quantised:])
+    return [
+        scale.tobytes() + code.tobytes() + rest.tobytes()
+        for scale, code, rest in zip(scales, codes, tail)
+    ]
+
+
+def encode_embedding(embedding: np.ndarray, precision: str = "float32") -> bytes:
+    """Encode one vector as a storage blob (see encode_embeddings)."""
+    return encode_embeddings(np.asarray(embedding).reshape(1, -1), precision)[0]
+
+
+def blob_precision(size: int, dim: int) -> str:
+    """Identify a blob's encoding from its length.
+
+    Blobs matching no encoding of ``dim`` are treated as float32 (of another
+    dimension), as every blob was before compact encodings existed.
+
+    Args:
+        size: Blob length in bytes
+        dim: Expected vector dimension
+
+    Returns:
+        One of EMBEDDING_PRECISIONS
+    """
+    if size == 2 * dim:
+        return "float16"
+    if size == encoded_size(dim, "int8"):
+        return "int8"
+    return "float32"
+
+
+def decode_embedding(blob: bytes, dim: int) -> np.ndarray:
+    """Decode a storage blob to a float32 vector.
+
+    The vector is read-only whatever the encoding: float32 blobs decode to
+    a view over the blob, as before, and compact blobs to a new array frozen
+    the same way, so callers sharing it cannot corrupt it.
+
+    Args:
+        blob: Bytes from an embedding column
+        dim: Expected vector dimension (SEMANTIC_DIM or TOTAL_DIM)
+
+    Returns:
+        Read-only float32 vector
+    """
+    precision = blob_precision(len(blob), dim)
+    if precision == "float32":
+        return np.frombuffer(blob, dtype=np.float32)
+    if precision == "float16":
+        vector = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    else:
+        quantised = _int8_split(dim)
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        vector = np.empty(dim, dtype=np.float32)
+        vector[:quantised] = np.frombuffer(blob, dtype=np.int8, count=quantised, offset=4) * scale
+        vector[quantised:] = np.frombuffer(blob, dtype=np.float32, offset=4 + quantised)
+    vector.flags.writeable = False
+    return vector
+
+
+def decode_embeddings(blobs: list[bytes], dim: int) -> np.ndarray:
+    """Decode many storage blobs to one float32 matrix.
+
+    All-float32 input (the default) is decoded with a single frombuffer over
+    the joined blobs.
+
+    Args:
+        blobs: Bytes from an embedding column, all of dimension ``dim``
+        dim: Vector dimension
+
+    Returns:
+        Read-only matrix of shape (len(blobs), dim)
+    """
+    if not blobs:
+        return np.empty((0, dim), dtype=np.float32)
+    if all(len(blob) == 4 * dim for blob in blobs):
+        return np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dim)
+    matrix = np.vstack([decode_embedding(blob, dim) for blob in blobs])
+    matrix.flags.writeable = False
+    return matrix
+
+
+class StoredEmbeddings(Mapping[str, np.ndarray]):
+    """Note path -> embedding, kept as storage blobs and decoded on access.
+
+    Holding float16 or int8 rows this way keeps them at their stored size;
+    each lookup decodes one read-only float32 vector (decode_embedding).
+    """
+
+    def __init__(self, blobs: dict[str, bytes], dim: int):
+        """Wrap stored blobs.
+
+        Args:
+            blobs: Note path -> blob from an embedding column
+            dim: Vector dimension
+        """
+        self._blobs = blobs
+        self.dim = dim
+
+    def __getitem__(self, path: str) -> np.ndarray:
+        return decode_embedding(self._blobs[path], self.dim)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blobs)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._blobs
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the blobs."""
+        return sum(len(blob) for blob in self._blobs.values())
+
+
+class CompactMatrix:
+    """Row-normalised embeddings held at reduced precision for scanning.
+
+    scores() approximates cosine similarity against every row. Scoring
+    upcasts one block of rows at a time, so the float32 temporary stays
+    bounded however many rows there are.
+    """
+
+    def __init__(self, matrix: np.ndarray, precision: str):
+        """Quantise a float32 matrix.
+
+        Args:
+            matrix: Embeddings, shape (N, dim)
+            precision: "float16" or "int8" ("float32" keeps a normalised copy)
+
+        Raises:
+            ValueError: If the precision is unknown
+        """
+        self.precision = validate_precision(precision)
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        unit = matrix / np.where(norms > 0, norms, 1.0)
+        self.scales: np.ndarray | None = None
+        self.tail: np.ndarray | None = None
+        if precision == "int8":
+            # Split as in storage: int8 semantic codes, float32 temporal tail
+            quantised = _int8_split(unit.shape[1])
+            head = unit[:, :quantised]
+            scales = np.abs(head).max(axis=1) / 127.0
+            self.scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+            self.codes: np.ndarray = np.rint(head / self.scales[:, None]).astype(np.int8)
+            self.tail = np.ascontiguousarray(unit[:, quantised:])
+        elif precision == "float16":
+            self.codes = unit.astype(np.float16)
+        else:
+            self.codes = unit
+
+    def __len__(self) -> int:
+        return int(self.codes.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the codes and scales."""
+        extra = [part.nbytes for part in (self.scales, self.tail) if part is not None]
+        return int(self.codes.nbytes + sum(extra))
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Approximate cosine similarity of a query to every row.
+
+        Args:
+            query: Query vector, shape (dim,)
+
+        Returns:
+            float32 scores, shape (N,)
+        """
+        query = np.asarray(query, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return np.zeros(len(self), dtype=np.float32)
+        query = query / norm
+        scores = np.empty(len(self), dtype=np.float32)
+        head = query[: self.codes.shape[1]]
+        for start in range(0, len(self), _SCORE_BLOCK_ROWS):
+            block = self.codes[start : start + _SCORE_BLOCK_ROWS]
+            scores[start : start + len(block)] = block.astype(np.float32) @ head
+        if self.scales is not None:
+            scores *= self.scales
+        if self.tail is not None and self.tail.shape[1]:
+            scores += self.tail @ query[self.codes.shape[1] :]
+        return scores
+
+    def candidates(self, query: np.ndarray, count: int) -> np.ndarray:
+        """Row indices of the ``count`` best approximate scores (unordered).
+
+        Args:
+            query: Query vector
+            count: Candidates wanted
+
+        Returns:
+            Row indices
+        """
+        scores = self.scores(query)
+        if count >= len(scores):
+            return np.arange(len(scores))
+        return np.argpartition(-scores, count - 1)[:count]
+
+
+def rescore_count(count: int, factor: int) -> int:
+    """Candidates to rescore in float32 for a top-``count`` query."""
+    return count * max(factor, 1)
+
+
+def neighbour_recall(
+    matrix: np.ndarray,
+    precision: str,
+    k: int = 10,
+    queries: int = 200,
+    rescore_factor: int = 4,
+    storage: bool = True,
+    seed: int = 0,
+) -> float:
+    """Measure top-k neighbour recall at reduced precision.
+
+    Exact neighbours come from float32 cosine over ``matrix``. The compact
+    path stores the vectors at ``precision`` (when ``storage`` is true),
+    decodes them, scans a CompactMatrix of the decoded vectors and rescores
+    the best ``k * rescore_factor`` candidates in float32, as
+    InMemoryVectorBackend does. A factor of 1 measures the scan alone.
+
+    Args:
+        matrix: Embeddings, shape (N, dim)
+        precision: One of EMBEDDING_PRECISIONS
+        k: Neighbours per query (the query itself excluded)
+        queries: Rows sampled as queries
+        rescore_factor: Candidates rescored per neighbour wanted
+        storage: Also round-trip the vectors through storage encoding
+        seed: Query sampling seed
+
+    Returns:
+        Mean fraction of exact neighbours found, 0.0 to 1.0
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    n, dim = matrix.shape
+    if n <= 1:
+        return 1.0
+    k = min(k, n - 1)
+    stored = decode_embeddings(encode_embeddings(matrix, precision), dim) if storage else matrix
+    compact = CompactMatrix(stored, precision)
+    stored_norms = np.linalg.norm(stored, axis=1)
+    stored_norms[stored_norms == 0] = 1.0
+    exact_norms = np.linalg.norm(matrix, axis=1)
+    exact_norms[exact_norms == 0] = 1.0
+
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(n, size=min(queries, n), replace=False)
+    found = 0
+    for row in rows:
+        exact_scores = matrix @ matrix[row] / exact_norms
+        exact_scores[row] = -np.inf
+        exact = set(np.argpartition(-exact_scores, k - 1)[:k].tolist())
+
+        candidates = compact.candidates(stored[row], rescore_count(k + 1, rescore_factor))
+        candidates = candidates[candidates != row]
+        rescored = stored[candidates] @ stored[row] / stored_norms[candidates]
+        approx = candidates[np.argsort(-rescored, kind="stable")[:k]]
+        found += len(exact.intersection(approx.tolist()))
+    return found / (k * len(rows))
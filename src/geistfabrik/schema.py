@@ -1,8 +1,12 @@
 """SQLite schema for GeistFabrik."""
 
+import hashlib
+import os
 import sqlite3
 from pathlib import Path
 
+from .config import DEFAULT_DATABASE_PROFILE
+
 # Schema version for migrations
 # Version 3: Removed unused `suggestions` and `suggestion_notes` tables
 # Version 4: Added support for date-collection notes (virtual entries)
@@ -10,7 +14,13 @@ from pathlib import Path
 # Version 6: Added composite index for orphans query performance
 # Version 7: Added session_embeddings.cluster_label (per-session cluster assignments)
 # Version 8: Added geist_status table (persistent per-geist failure tracking)
-SCHEMA_VERSION = 8
+# Version 9: Added session_embeddings.note_state (incremental session reuse)
+# Version 10: Added notes.content_hash (bulk embedding-cache probe)
+# Version 11: Added suggestion_embeddings table (filter embedding cache)
+# Version 12: Added session_knn table (per-session kNN graph)
+# Version 13: Added geist_output_cache table (cross-run geist output)
+# Version 14: suggestion_embeddings keyed by (text_hash, model_version)
+SCHEMA_VERSION = 14
 
 SCHEMA_SQL = """
 -- Notes table
@@ -23,7 +33,8 @@ CREATE TABLE IF NOT EXISTS notes (
     file_mtime REAL NOT NULL,  -- For incremental sync
     is_virtual INTEGER DEFAULT 0,  -- True for virtual entries from date-collection notes
     source_file TEXT,  -- Original file path for virtual entries
-    entry_date TEXT  -- Date extracted from heading for virtual entries
+    entry_date TEXT,  -- Date extracted from heading for virtual entries
+    content_hash TEXT  -- SHA-256 of content, computed at sync (embedding cache key)
 );
 
 CREATE INDEX IF NOT EXISTS idx_notes_modified ON notes(modified);
@@ -78,11 +89,14 @@ CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(date);
 -- cluster_label records which semantic cluster the note belonged to in that
 -- session (written when clusters are computed; NULL for noise/unclustered).
 -- It is what lets cluster_evolution_tracker compare assignments across time.
+-- note_state fingerprints the note inputs the row was computed from, so a
+-- re-run of the same session only recomputes rows whose note changed.
 CREATE TABLE IF NOT EXISTS session_embeddings (
     session_id INTEGER NOT NULL,
     note_path TEXT NOT NULL,
     embedding BLOB NOT NULL,
     cluster_label TEXT,
+    note_state TEXT,
     FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE,
     FOREIGN KEY (note_path) REFERENCES notes(path) ON DELETE CASCADE,
     PRIMARY KEY (session_id, note_path)
@@ -90,6 +104,22 @@ CREATE TABLE IF NOT EXISTS session_embeddings (
 
 CREATE INDEX IF NOT EXISTS idx_session_embeddings_path ON session_embeddings(note_path);
 
+-- Per-session exact kNN graph (see knn_graph.py)
+-- neighbours is an int32 (N, k) array of row indices into paths (a JSON
+-- list), scores the matching float16 similarities. vault_state_hash and
+-- row_count record the session state it was built from; a graph whose
+-- session has changed since is rebuilt.
+CREATE TABLE IF NOT EXISTS session_knn (
+    session_id INTEGER PRIMARY KEY,
+    k INTEGER NOT NULL,
+    paths TEXT NOT NULL,
+    neighbours BLOB NOT NULL,
+    scores BLOB NOT NULL,
+    vault_state_hash TEXT,
+    row_count INTEGER NOT NULL,
+    FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+);
+
 -- Session suggestions (for novelty filtering and history tracking)
 -- NOTE: This table serves the same purpose as the previously-defined
 -- "suggestions" + "suggestion_notes" tables but with a denormalized design.
@@ -106,6 +136,22 @@ CREATE TABLE IF NOT EXISTS session_suggestions (
 CREATE INDEX IF NOT EXISTS idx_session_suggestions_date ON session_suggestions(session_date);
 CREATE INDEX IF NOT EXISTS idx_session_suggestions_geist ON session_suggestions(geist_id);
 
+-- Suggestion text embeddings (filtering cache)
+-- The novelty and diversity filters embed candidate suggestions and the
+-- novelty window's history. Rows keyed by text hash and model let each
+-- distinct text be encoded once per model, shared across filter stages and
+-- runs. computed_at is the latest session date that used the row.
+CREATE TABLE IF NOT EXISTS suggestion_embeddings (
+    text_hash TEXT NOT NULL,
+    model_version TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    computed_at TEXT NOT NULL,
+    PRIMARY KEY (text_hash, model_version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_suggestion_embeddings_computed
+    ON suggestion_embeddings(computed_at);
+
 -- Embedding metrics cache (for stats command)
 CREATE TABLE IF NOT EXISTS embedding_metrics (
     session_date TEXT PRIMARY KEY,
@@ -131,37 +177,212 @@ CREATE TABLE IF NOT EXISTS geist_status (
     last_error TEXT,
     updated TEXT
 );
+
+-- Raw geist output reused across runs (see geist_cache.py)
+-- One row per geist. cache_key hashes the geist's source with the session
+-- fingerprint (vault state, date, config); a row whose key no longer matches
+-- is a miss and is overwritten by the next successful run.
+CREATE TABLE IF NOT EXISTS geist_output_cache (
+    geist_id TEXT PRIMARY KEY,
+    cache_key TEXT NOT NULL,
+    suggestions TEXT NOT NULL,  -- JSON list of suggestion fields
+    created_at TEXT NOT NULL
+);
 """
 
 
-def init_db(db_path: Path | None = None) -> sqlite3.Connection:
+# Connection profiles for file-backed databases, selected by the
+# `database.profile` config key. Each profile is split into database-level
+# pragmas (journal mode, durability), which only a writer may set, and
+# per-connection pragmas, which read-only connections apply too.
+#
+# "fast": WAL lets readers proceed during a write and, with
+# synchronous=NORMAL, syncs only at checkpoints (still crash-safe; a power
+# loss may drop the last commit). A 64 MiB page cache and 256 MiB mmap window
+# keep a typical vault's working set out of read() calls.
+# "safe": rollback journal with a full fsync per commit and conservative
+# memory use, for vaults on network or synced folders (iCloud, Dropbox,
+# OneDrive) where WAL's -wal and -shm side files are unreliable: a sync
+# client can copy vault.db without its WAL, or two machines can open the
+# same file. vault.db lives inside the vault, so such vaults should set it.
+# cache_size is negative to mean KiB; busy_timeout is in milliseconds.
+CONNECTION_PROFILES: dict[str, dict[str, tuple[tuple[str, str | int], ...]]] = {
+    "fast": {
+        "database": (
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+        ),
+        "connection": (
+            ("cache_size", -65536),
+            ("temp_store", "MEMORY"),
+            ("mmap_size", 268435456),
+            ("busy_timeout", 5000),
+        ),
+    },
+    "safe": {
+        "database": (
+            ("journal_mode", "DELETE"),
+            ("synchronous", "FULL"),
+        ),
+        "connection": (
+            ("cache_size", -8192),
+            ("temp_store", "DEFAULT"),
+            ("mmap_size", 0),
+            ("busy_timeout", 5000),
+        ),
+    },
+}
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of a note's content, as stored in notes.content_hash.
+
+    This is also the content part of the embedding cache's model_version key.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _profile_pragmas(profile: str) -> dict[str, tuple[tuple[str, str | int], ...]]:
+    """Look up a connection profile by name.
+
+    Raises:
+        ValueError: If the profile is not in CONNECTION_PROFILES.
+    """
+    try:
+        return CONNECTION_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database profile: {profile!r}. "
+            f"Valid profiles: {', '.join(sorted(CONNECTION_PROFILES))}"
+        ) from None
+
+
+def apply_connection_profile(
+    conn: sqlite3.Connection, profile: str = DEFAULT_DATABASE_PROFILE, *, read_only: bool = False
+) -> None:
+    """Apply a connection profile's pragmas to an open connection.
+
+    Args:
+        conn: Connection to a file-backed database.
+        profile: Name of a profile in CONNECTION_PROFILES.
+        read_only: Only apply per-connection pragmas (a read-only connection
+            cannot change the journal mode).
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    pragmas = _profile_pragmas(profile)
+    if not read_only:
+        for name, value in pragmas["database"]:
+            conn.execute(f"PRAGMA {name} = {value}")
+    for name, value in pragmas["connection"]:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def _restrict_permissions(db_path: Path) -> None:
+    """Make the database and its -wal/-shm side files owner-only (0600).
+
+    The database holds note content and embeddings, and in WAL mode so does
+    the -wal file.
+    """
+    for path in (
+        db_path,
+        db_path.with_name(f"{db_path.name}-wal"),
+        db_path.with_name(f"{db_path.name}-shm"),
+    ):
+        if path.exists():
+            os.chmod(path, 0o600)
+
+
+def init_db(
+    db_path: Path | None = None, profile: str = DEFAULT_DATABASE_PROFILE
+) -> sqlite3.Connection:
     """Initialise database with schema.
 
+    A file-backed database is created under a 0077 umask, so SQLite creates
+    it and its -wal/-shm files owner-only, and all three are chmodded to
+    0600 afterwards (files from older versions may be world-readable).
+
     Args:
         db_path: Path to SQLite database file. If None, use in-memory database.
+        profile: Connection profile for file-backed databases ("fast" or "safe").
+            Ignored for in-memory databases.
 
     Returns:
         SQLite connection with schema initialised.
+
+    Raises:
+        ValueError: If the profile is unknown.
     """
     if db_path is None:
         conn = sqlite3.connect(":memory:")
     else:
+        _profile_pragmas(profile)  # Validate before touching the filesystem
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(db_path))
+        old_umask = os.umask(0o077)
+        try:
+            conn = sqlite3.connect(str(db_path))
+            # Only takes effect on an empty file, and must precede the switch
+            # to WAL; lets pruned pages be released with PRAGMA
+            # incremental_vacuum (see storage.py). Existing databases convert
+            # on `db compact`.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            apply_connection_profile(conn, profile)
+            # Create the WAL and shared-memory files while the umask applies
+            conn.execute("PRAGMA schema_version").fetchone()
+        finally:
+            os.umask(old_umask)
+        _restrict_permissions(db_path)
 
     # Enable foreign keys
     conn.execute("PRAGMA foreign_keys = ON")
 
+    existing_version = get_schema_version(conn)
+
     # Execute schema
     conn.executescript(SCHEMA_SQL)
 
-    # Set schema version
-    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    if existing_version == 0:
+        # New database: the schema above is already current
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    else:
+        # Existing database: CREATE TABLE IF NOT EXISTS does not add columns,
+        # so bring it up to date before stamping the version
+        migrate_schema(conn)
 
     conn.commit()
     return conn
 
 
+def connect_readonly(db_path: Path, profile: str = DEFAULT_DATABASE_PROFILE) -> sqlite3.Connection:
+    """Open an additional read-only connection to an initialised database.
+
+    Readers get their own handle (and page cache), so stats or concurrent
+    geists do not serialise on the writer's connection. Under the "fast"
+    profile the database is in WAL mode, so readers also proceed while a
+    write is in progress. The connection refuses writes at the SQLite level.
+
+    Args:
+        db_path: Path to an existing SQLite database created by init_db().
+        profile: Connection profile whose per-connection pragmas to apply.
+
+    Returns:
+        Read-only SQLite connection.
+
+    Raises:
+        FileNotFoundError: If the database file does not exist.
+        ValueError: If the profile is unknown.
+    """
+    _profile_pragmas(profile)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database does not exist: {db_path}")
+
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    apply_connection_profile(conn, profile, read_only=True)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
 def get_schema_version(conn: sqlite3.Connection) -> int:
     """Get the current schema version."""
     cursor = conn.execute("PRAGMA user_version")
@@ -276,3 +497,120 @@ def migrate_schema(conn: sqlite3.Connection) -> None:
         """)
         conn.execute("PRAGMA user_version = 8")
         conn.commit()
+
+    # Migration from version 8 to 9: Add note_state to session_embeddings so a
+    # session re-run can skip rows whose note has not changed. Existing rows
+    # keep NULL and are recomputed once.
+    if current_version < 9:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='session_embeddings'"
+        )
+        if cursor.fetchone() is not None:
+            cursor = conn.execute("PRAGMA table_info(session_embeddings)")
+            columns = {row[1] for row in cursor.fetchall()}
+
+            if "note_state" not in columns:
+                conn.execute("ALTER TABLE session_embeddings ADD COLUMN note_state TEXT")
+
+        conn.execute("PRAGMA user_version = 9")
+        conn.commit()
+
+    # Migration from version 9 to 10: Store each note's content hash so the
+    # embedding cache can be probed with one join instead of hashing every
+    # note per session. Existing rows are backfilled once.
+    if current_version < 10:
+        cursor = conn.execute("PRAGMA table_info(notes)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        # An empty column set means no notes table (partial schemas in tests)
+        if columns and "content_hash" not in columns:
+            conn.execute("ALTER TABLE notes ADD COLUMN content_hash TEXT")
+            rows = conn.execute("SELECT path, content FROM notes").fetchall()
+            conn.executemany(
+                "UPDATE notes SET content_hash = ? WHERE path = ?",
+                ((content_hash(content), path) for path, content in rows),
+            )
+
+        conn.execute("PRAGMA user_version = 10")
+        conn.commit()
+
+    # Migration from version 10 to 11: Add suggestion_embeddings so filter
+    # stages stop re-encoding the same suggestion texts every run.
+    if current_version < 11:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS suggestion_embeddings (
+                text_hash TEXT PRIMARY KEY,
+                model_version TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                computed_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_suggestion_embeddings_computed "
+            "ON suggestion_embeddings(computed_at)"
+        )
+        conn.execute("PRAGMA user_version = 11")
+        conn.commit()
+
+    # Migration from version 11 to 12: Add session_knn so neighbour queries,
+    # surprisal and churn share one stored kNN graph per session.
+    if current_version < 12:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS session_knn (
+                session_id INTEGER PRIMARY KEY,
+                k INTEGER NOT NULL,
+                paths TEXT NOT NULL,
+                neighbours BLOB NOT NULL,
+                scores BLOB NOT NULL,
+                vault_state_hash TEXT,
+                row_count INTEGER NOT NULL,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+            )
+        """)
+        conn.execute("PRAGMA user_version = 12")
+        conn.commit()
+
+    # Migration from version 12 to 13: Add geist_output_cache so a same-day
+    # re-run reuses geist output instead of executing every geist again.
+    if current_version < 13:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS geist_output_cache (
+                geist_id TEXT PRIMARY KEY,
+                cache_key TEXT NOT NULL,
+                suggestions TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("PRAGMA user_version = 13")
+        conn.commit()
+
+    # Migration from version 13 to 14: Key suggestion_embeddings by text hash
+    # and model, so a second model's rows no longer overwrite the first's.
+    # SQLite cannot change a primary key in place, so the table is rebuilt.
+    if current_version < 14:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='suggestion_embeddings'"
+        )
+        if cursor.fetchone() is not None:
+            conn.execute("""
+                CREATE TABLE suggestion_embeddings_v14 (
+                    text_hash TEXT NOT NULL,
+                    model_version TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    computed_at TEXT NOT NULL,
+                    PRIMARY KEY (text_hash, model_version)
+                )
+            """)
+            conn.execute("""
+                INSERT INTO suggestion_embeddings_v14
+                SELECT text_hash, model_version, embedding, computed_at
+                FROM suggestion_embeddings
+            """)
+            conn.execute("DROP TABLE suggestion_embeddings")
+            conn.execute("ALTER TABLE suggestion_embeddings_v14 RENAME TO suggestion_embeddings")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_suggestion_embeddings_computed "
+                "ON suggestion_embeddings(computed_at)"
+            )
+        conn.execute("PRAGMA user_version = 14")
+        conn.commit()
@@ -9,14 +9,27 @@ This module provides comprehensive vault statistics including:
 """
 
 import logging
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TypedDict
 
 import numpy as np
 
+from .config import TOTAL_DIM
+from .quantization import decode_embeddings
+
 logger = logging.getLogger(__name__)
 
+DRIFT_BLOCK_SIZE = 4096
+"""Rows per block when accumulating the Procrustes cross-covariance.
+
+Bounds the float64 temporaries to block_size x dim regardless of vault size.
+"""
+
+MIN_DRIFT_OVERLAP = 5
+"""Minimum notes shared by two sessions for a drift comparison to be reported."""
+
 
 class VaultStats(TypedDict, total=False):
     """Top-level sections of the collected vault statistics.
@@ -37,6 +50,7 @@ class VaultStats(TypedDict, total=False):
     geists: dict[str, Any]
     embeddings: dict[str, Any]
     temporal: dict[str, Any]
+    drift_timeline: list[dict[str, Any]]
     top_linked_notes: list[dict[str, Any]]
     orphan_notes: list[dict[str, Any]]
     hub_notes: list[dict[str, Any]]
@@ -45,18 +59,31 @@ class VaultStats(TypedDict, total=False):
 class StatsCollector:
     """Collects statistics from a GeistFabrik vault."""
 
-    def __init__(self, vault: Any, config: Any, history_days: int = 30):
+    def __init__(
+        self,
+        vault: Any,
+        config: Any,
+        history_days: int = 30,
+        db: sqlite3.Connection | None = None,
+    ):
         """Initialise stats collector.
 
         Args:
             vault: Vault instance
             config: Configuration object
             history_days: Days of session history to analyze
+            db: Connection to read from (only reads are issued); defaults to
+                vault.db. The stats command passes a Vault.open_reader()
+                connection so it does not queue on the writer's handle.
         """
         self.vault = vault
         self.config = config
         self.history_days = history_days
-        self.db = vault.db
+        self.db = db if db is not None else vault.db
+
+        # Latest session's (date, snapshot), decoded once and shared by
+        # get_latest_embeddings and get_temporal_drift
+        self._latest_snapshot: tuple[str, tuple[np.ndarray, np.ndarray, np.ndarray]] | None = None
 
         # Collected stats
         self.stats: VaultStats = {}
@@ -509,7 +536,18 @@ class StatsCollector:
         if not self.has_embeddings():
             return None
 
-        # Get most recent session with embeddings
+        session_date = self._latest_session_date()
+        if session_date is None:
+            return None
+        snapshot = self._load_latest_snapshot(session_date)
+        if snapshot is None:
+            return None
+
+        paths, embeddings, _ = snapshot
+        return session_date, embeddings, paths.tolist()
+
+    def _latest_session_date(self) -> str | None:
+        """Return the date of the most recent session with embeddings."""
         cursor = self.db.execute(
             """
             SELECT DISTINCT s.date
@@ -520,15 +558,34 @@ class StatsCollector:
             """
         )
         row = cursor.fetchone()
-        if not row:
-            return None
+        return row[0] if row else None
+
+    def _load_latest_snapshot(
+        self, session_date: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Load the latest session's snapshot, decoding it only once."""
+        if self._latest_snapshot is not None and self._latest_snapshot[0] == session_date:
+            return self._latest_snapshot[1]
+        snapshot = self._load_session_snapshot(session_date)
+        if snapshot is not None:
+            self._latest_snapshot = (session_date, snapshot)
+        return snapshot
+
+    def _load_session_snapshot(
+        self, session_date: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Load one session's embeddings as a path-sorted contiguous matrix.
 
-        session_date = row[0]
+        Args:
+            session_date: Session date (YYYY-MM-DD)
 
-        # Get embeddings for this session
+        Returns:
+            Tuple of (paths, embeddings, cluster_labels) sorted by path, or
+            None if the session has no embeddings
+        """
         cursor = self.db.execute(
             """
-            SELECT se.note_path, se.embedding
+            SELECT se.note_path, se.embedding, se.cluster_label
             FROM session_embeddings se
             INNER JOIN sessions s ON se.session_id = s.session_id
             WHERE s.date = ?
@@ -536,24 +593,36 @@ class StatsCollector:
             """,
             (session_date,),
         )
-
-        embeddings_list = []
-        paths = []
-        for row in cursor.fetchall():
-            path, blob = row
-            embedding = np.frombuffer(blob, dtype=np.float32)
-            embeddings_list.append(embedding)
-            paths.append(path)
-
-        if not embeddings_list:
+        rows = cursor.fetchall()
+        if not rows:
             return None
+        return _snapshot_from_rows(rows)
 
-        embeddings = np.vstack(embeddings_list)
-        return session_date, embeddings, paths
+    def _find_session_before(self, date: str) -> str | None:
+        """Return the latest session date with embeddings strictly before date."""
+        cursor = self.db.execute(
+            """
+            SELECT s.date
+            FROM sessions s
+            WHERE s.date < ? AND EXISTS (
+                SELECT 1 FROM session_embeddings se WHERE se.session_id = s.session_id
+            )
+            ORDER BY s.date DESC
+            LIMIT 1
+            """,
+            (date,),
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
 
     def get_temporal_drift(self, current_date: str, days_back: int = 30) -> dict[str, Any] | None:
         """Analyze temporal drift between current and historical embeddings.
 
+        The two sessions are joined on note path with a sorted-array
+        intersection, the past session is rotated onto the current one with
+        an orthogonal Procrustes fit (blocked cross-covariance + SVD), and
+        per-note drift is 1 - cosine similarity of the aligned rows.
+
         Args:
             current_date: Current session date (YYYY-MM-DD)
             days_back: How many days back to compare (default: 30)
@@ -563,15 +632,12 @@ class StatsCollector:
         """
         from datetime import timedelta
 
-        from scipy.linalg import orthogonal_procrustes  # type: ignore[import-untyped]
-
-        # Get current embeddings
-        current = self.get_latest_embeddings()
-        if not current:
+        # Only the latest date is needed here; its embeddings are decoded
+        # once, below, and shared with get_latest_embeddings
+        curr_date = self._latest_session_date()
+        if curr_date is None:
             return None
 
-        curr_date, curr_emb, curr_paths = current
-
         # Find a past session approximately days_back ago
         try:
             target_date = (
@@ -584,105 +650,41 @@ class StatsCollector:
             )
             return None
 
-        # Get closest past session
-        cursor = self.db.execute(
-            """
-            SELECT s.date
-            FROM sessions s
-            WHERE s.date < ? AND EXISTS (
-                SELECT 1 FROM session_embeddings se WHERE se.session_id = s.session_id
-            )
-            ORDER BY s.date DESC
-            LIMIT 1
-            """,
-            (target_date,),
-        )
-        row = cursor.fetchone()
-        if not row:
+        past_date = self._find_session_before(target_date)
+        if past_date is None:
             return None
 
-        past_date = row[0]
-
-        # Get past embeddings
-        cursor = self.db.execute(
-            """
-            SELECT se.note_path, se.embedding
-            FROM session_embeddings se
-            INNER JOIN sessions s ON se.session_id = s.session_id
-            WHERE s.date = ?
-            ORDER BY se.note_path
-            """,
-            (past_date,),
-        )
-
-        past_emb_dict = {}
-        for row in cursor.fetchall():
-            path, blob = row
-            embedding = np.frombuffer(blob, dtype=np.float32)
-            past_emb_dict[path] = embedding
+        curr_snapshot = self._load_latest_snapshot(curr_date)
+        past_snapshot = self._load_session_snapshot(past_date)
+        if curr_snapshot is None or past_snapshot is None:
+            return None
 
-        # Find common notes
-        common_paths = [p for p in curr_paths if p in past_emb_dict]
-        if len(common_paths) < 5:
+        result = _compute_session_drift(past_snapshot, curr_snapshot)
+        if result is None:
             return None  # Not enough overlap
+        common_paths, drifts, labels = result
 
-        # Build aligned embedding matrices
-        # Use dict lookup instead of list.index() for O(N) instead of O(N²)
-        path_to_idx = {p: i for i, p in enumerate(curr_paths)}
-        curr_aligned = np.vstack([curr_emb[path_to_idx[p]] for p in common_paths])
-        past_aligned = np.vstack([past_emb_dict[p] for p in common_paths])
-
-        # Align past embeddings to current via Procrustes
-        try:
-            rotation_matrix, _ = orthogonal_procrustes(past_aligned, curr_aligned)
-            past_rotated = past_aligned @ rotation_matrix
-        except Exception:
-            # Procrustes can fail
-            logger.debug("Procrustes alignment failed", exc_info=True)
-            past_rotated = past_aligned
-
-        # Compute drift per note (1 - cosine similarity)
-        from geistfabrik.embeddings import cosine_similarity
-
-        drift_scores = []
-        for i in range(len(common_paths)):
-            sim = cosine_similarity(past_rotated[i], curr_aligned[i])
-            drift = 1.0 - sim
-            drift_scores.append((common_paths[i], drift))
+        avg_drift = float(drifts.mean())
 
-        # Sort by drift
-        drift_scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Compute statistics
-        drifts = [d for _, d in drift_scores]
-        avg_drift = float(np.mean(drifts))
-
-        # Compare to previous period (if available) to detect acceleration
+        # Compare to the previous period (if available) to detect acceleration
         drift_trend = "stable"
         try:
-            earlier_date = (
-                datetime.fromisoformat(past_date) - timedelta(days=days_back)
-            ).isoformat()[:10]
-            cursor = self.db.execute(
-                """
-                SELECT s.date
-                FROM sessions s
-                WHERE s.date < ? AND EXISTS (
-                    SELECT 1 FROM session_embeddings se WHERE se.session_id = s.session_id
-                )
-                ORDER BY s.date DESC
-                LIMIT 1
-                """,
-                (earlier_date,),
+            earlier_date = self._find_session_before(
+                (datetime.fromisoformat(past_date) - timedelta(days=days_back)).isoformat()[:10]
             )
-            row = cursor.fetchone()
-            if row:
-                # Simplified: just check if current avg_drift is higher
-                # Full implementation would compute drift for past period too
-                drift_trend = "accelerating" if avg_drift > 0.2 else "stable"
+            earlier_snapshot = self._load_session_snapshot(earlier_date) if earlier_date else None
+            if earlier_snapshot is not None:
+                previous = _compute_session_drift(earlier_snapshot, past_snapshot)
+                if previous is not None:
+                    drift_trend = _classify_drift_trend(avg_drift, float(previous[1].mean()))
         except Exception:
             logger.debug("Failed to compute drift trend", exc_info=True)
 
+        # Sort by drift (descending); stable tie order keeps output deterministic
+        order = np.argsort(-drifts, kind="stable")
+        top = order[:5]
+        bottom = order[-5:]
+
         return {
             "current_date": curr_date,
             "comparison_date": past_date,
@@ -692,16 +694,85 @@ class StatsCollector:
             "notes_compared": len(common_paths),
             "average_drift": round(avg_drift, 3),
             "drift_trend": drift_trend,
-            "high_drift_notes": [
-                {"title": path.replace(".md", ""), "drift": round(d, 2)}
-                for path, d in drift_scores[:5]
-            ],
-            "stable_notes": [
-                {"title": path.replace(".md", ""), "drift": round(d, 2)}
-                for path, d in drift_scores[-5:]
-            ],
+            "drift_distribution": _drift_distribution(drifts),
+            "cluster_drift": _cluster_drift(drifts, labels),
+            "high_drift_notes": [_drift_entry(common_paths[i], drifts[i]) for i in top],
+            "stable_notes": [_drift_entry(common_paths[i], drifts[i]) for i in bottom],
         }
 
+    def get_drift_timeline(self, days_back: int = 30) -> list[dict[str, Any]]:
+        """Compute drift between consecutive sessions over a history window.
+
+        Streams every session in the window through a single ordered query,
+        keeping only the previous snapshot in memory, so the timeline costs
+        one pass over the stored embeddings rather than one query pair per
+        step.
+
+        Args:
+            days_back: Days of session history to cover, counted back from
+                the most recent session with embeddings
+
+        Returns:
+            One entry per consecutive session pair (oldest first) with
+            from_date, to_date, notes_compared, average_drift and median_drift.
+            Pairs with too little overlap are omitted.
+        """
+        from datetime import timedelta
+        from itertools import groupby
+
+        cursor = self.db.execute(
+            """
+            SELECT MAX(s.date)
+            FROM sessions s
+            WHERE EXISTS (
+                SELECT 1 FROM session_embeddings se WHERE se.session_id = s.session_id
+            )
+            """
+        )
+        row = cursor.fetchone()
+        if not row or row[0] is None:
+            return []
+
+        try:
+            start_date = (datetime.fromisoformat(row[0]) - timedelta(days=days_back)).isoformat()[
+                :10
+            ]
+        except ValueError:
+            logger.debug("Failed to parse date for drift timeline", exc_info=True)
+            return []
+
+        cursor = self.db.execute(
+            """
+            SELECT s.date, se.note_path, se.embedding, se.cluster_label
+            FROM session_embeddings se
+            INNER JOIN sessions s ON se.session_id = s.session_id
+            WHERE s.date >= ?
+            ORDER BY s.date, se.note_path
+            """,
+            (start_date,),
+        )
+
+        timeline: list[dict[str, Any]] = []
+        previous: tuple[str, tuple[np.ndarray, np.ndarray, np.ndarray]] | None = None
+        for session_date, group in groupby(cursor, key=lambda r: r[0]):
+            snapshot = _snapshot_from_rows([r[1:] for r in group])
+            if previous is not None:
+                result = _compute_session_drift(previous[1], snapshot)
+                if result is not None:
+                    _, drifts, _ = result
+                    timeline.append(
+                        {
+                            "from_date": previous[0],
+                            "to_date": session_date,
+                            "notes_compared": len(drifts),
+                            "average_drift": round(float(drifts.mean()), 3),
+                            "median_drift": round(float(np.median(drifts)), 3),
+                        }
+                    )
+            previous = (session_date, snapshot)
+
+        return timeline
+
     def add_embedding_metrics(self, metrics: dict[str, Any]) -> None:
         """Add computed embedding metrics to stats."""
         self.stats["embeddings"] = metrics
@@ -710,6 +781,10 @@ class StatsCollector:
         """Add temporal drift analysis to stats."""
         self.stats["temporal"] = temporal
 
+    def add_drift_timeline(self, timeline: list[dict[str, Any]]) -> None:
+        """Add session-to-session drift timeline to stats."""
+        self.stats["drift_timeline"] = timeline
+
     def add_verbose_details(self) -> None:
         """Add verbose details to stats for detailed output."""
         # Top linked notes
@@ -720,3 +795,161 @@ class StatsCollector:
 
         # Hub notes list
         self.stats["hub_notes"] = self.get_hub_notes(min_connections=10)
+
+
+# ---------------------------------------------------------------------------
+# Drift engine helpers
+# ---------------------------------------------------------------------------
+
+
+def _snapshot_from_rows(
+    rows: list[tuple[str, bytes, str | None]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decode (path, blob, cluster_label) rows into a session snapshot.
+
+    float32 blobs are concatenated and decoded with a single frombuffer call
+    instead of one array per row (quantization.decode_embeddings). Rows must
+    already be sorted by path.
+
+    Args:
+        rows: Query rows ordered by note_path
+
+    Returns:
+        Tuple of (paths, embeddings, cluster_labels) as numpy arrays
+    """
+    paths = np.array([r[0] for r in rows], dtype=object)
+    embeddings = decode_embeddings([r[1] for r in rows], TOTAL_DIM)
+    labels = np.array([r[2] for r in rows], dtype=object)
+    return paths, embeddings, labels
+
+
+def _procrustes_rotation(
+    source: np.ndarray, target: np.ndarray, block_size: int = DRIFT_BLOCK_SIZE
+) -> np.ndarray:
+    """Orthogonal matrix R minimising ||source @ R - target||_F.
+
+    Equivalent to scipy.linalg.orthogonal_procrustes, but the dim x dim
+    cross-covariance source.T @ target is accumulated over row blocks so the
+    float64 working set stays bounded for large vaults.
+
+    Args:
+        source: (n, d) matrix to rotate
+        target: (n, d) matrix to align onto (rows paired with source)
+        block_size: Rows per accumulation block
+
+    Returns:
+        (d, d) orthogonal rotation matrix
+    """
+    dim = source.shape[1]
+    cross_cov = np.zeros((dim, dim), dtype=np.float64)
+    for start in range(0, source.shape[0], block_size):
+        stop = start + block_size
+        cross_cov += source[start:stop].astype(np.float64).T @ target[start:stop].astype(np.float64)
+    u, _, vt = np.linalg.svd(cross_cov)
+    rotation: np.ndarray = u @ vt
+    return rotation
+
+
+def _rowwise_cosine_drift(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Per-row 1 - cosine similarity between paired rows of a and b."""
+    dots = np.einsum("ij,ij->i", a, b)
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    sims = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    drifts: np.ndarray = 1.0 - np.clip(sims, -1.0, 1.0)
+    return drifts
+
+
+def _compute_session_drift(
+    past: tuple[np.ndarray, np.ndarray, np.ndarray],
+    current: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Procrustes-aligned drift for notes present in both snapshots.
+
+    Args:
+        past: Earlier (paths, embeddings, cluster_labels) snapshot
+        current: Later snapshot, in the same format
+
+    Returns:
+        Tuple of (common_paths, drifts, current_cluster_labels), or None when
+        the sessions share fewer than MIN_DRIFT_OVERLAP notes or their
+        embedding dimensions differ
+    """
+    past_paths, past_emb, _ = past
+    curr_paths, curr_emb, curr_labels = current
+    if past_emb.shape[1] != curr_emb.shape[1]:
+        return None
+
+    # Both path arrays are sorted and unique, so intersect1d gives the row
+    # index of every shared note on each side without a Python-level join
+    common, past_idx, curr_idx = np.intersect1d(
+        past_paths.astype(str), curr_paths.astype(str), assume_unique=True, return_indices=True
+    )
+    if len(common) < MIN_DRIFT_OVERLAP:
+        return None
+
+    past_aligned = past_emb[past_idx].astype(np.float64)
+    curr_aligned = curr_emb[curr_idx].astype(np.float64)
+
+    try:
+        past_rotated = past_aligned @ _procrustes_rotation(past_aligned, curr_aligned)
+    except np.linalg.LinAlgError:
+        # SVD can fail to converge on degenerate input
+        logger.debug("Procrustes alignment failed", exc_info=True)
+        past_rotated = past_aligned
+
+    drifts = _rowwise_cosine_drift(past_rotated, curr_aligned)
+    return common, drifts, curr_labels[curr_idx]
+
+
+def _classify_drift_trend(current: float, previous: float) -> str:
+    """Label drift as accelerating/decelerating/stable versus the prior period."""
+    if current > previous * 1.2 and current - previous > 0.01:
+        return "accelerating"
+    if current < previous * 0.8 and previous - current > 0.01:
+        return "decelerating"
+    return "stable"
+
+
+def _drift_distribution(drifts: np.ndarray) -> dict[str, float]:
+    """Summarise per-note drift as min/percentiles/max."""
+    p10, p25, p50, p75, p90 = np.percentile(drifts, [10, 25, 50, 75, 90])
+    return {
+        "min": round(float(drifts.min()), 3),
+        "p10": round(float(p10), 3),
+        "p25": round(float(p25), 3),
+        "median": round(float(p50), 3),
+        "p75": round(float(p75), 3),
+        "p90": round(float(p90), 3),
+        "max": round(float(drifts.max()), 3),
+    }
+
+
+def _cluster_drift(drifts: np.ndarray, labels: np.ndarray) -> list[dict[str, Any]]:
+    """Mean drift per persisted cluster label, highest first.
+
+    Notes without a cluster_label (clusters not persisted for the session)
+    are ignored; returns an empty list when no labels are available.
+    """
+    mask = np.array([label is not None for label in labels], dtype=bool)
+    if not mask.any():
+        return []
+
+    unique, inverse = np.unique(labels[mask].astype(str), return_inverse=True)
+    sums = np.bincount(inverse, weights=drifts[mask])
+    counts = np.bincount(inverse)
+    means = sums / counts
+
+    order = np.argsort(-means, kind="stable")
+    return [
+        {
+            "cluster": str(unique[i]),
+            "notes": int(counts[i]),
+            "average_drift": round(float(means[i]), 3),
+        }
+        for i in order
+    ]
+
+
+def _drift_entry(path: str, drift: float) -> dict[str, Any]:
+    """Format one note's drift for the stats output."""
+    return {"title": str(path).replace(".md", ""), "drift": round(float(drift), 2)}
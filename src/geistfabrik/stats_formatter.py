@@ -205,6 +205,22 @@ class StatsFormatter:
             lines.append(f"  Average drift: {temporal['average_drift']:.3f}")
             lines.append(f"  Trend: {temporal['drift_trend']}")
 
+            distribution = temporal.get("drift_distribution")
+            if distribution:
+                lines.append(
+                    f"  Drift distribution: median {distribution['median']:.3f}, "
+                    f"p90 {distribution['p90']:.3f}, max {distribution['max']:.3f}"
+                )
+
+            if self.verbose and temporal.get("cluster_drift"):
+                lines.append("")
+                lines.append("  Drift by cluster:")
+                for cluster in temporal["cluster_drift"][:5]:
+                    lines.append(
+                        f"    {cluster['cluster']} ({cluster['notes']} notes) - "
+                        f"drift: {cluster['average_drift']:.3f}"
+                    )
+
             if self.verbose and temporal.get("high_drift_notes"):
                 lines.append("")
                 lines.append("  High-drift notes (evolving concepts):")
@@ -218,6 +234,16 @@ class StatsFormatter:
 
             lines.append("")
 
+        # Session-to-session drift timeline (if available)
+        if self.stats.get("drift_timeline"):
+            lines.append("Drift Timeline:")
+            for step in self.stats["drift_timeline"]:
+                lines.append(
+                    f"  {step['from_date']} -> {step['to_date']}: "
+                    f"{step['average_drift']:.3f} ({step['notes_compared']} notes)"
+                )
+            lines.append("")
+
         # Geist configuration
         lines.append("Geists:")
         geists = self.stats["geists"]
@@ -292,6 +318,8 @@ class StatsFormatter:
 
         if "temporal" in self.stats:
             output["temporal"] = convert_numpy(self.stats["temporal"])
+        if "drift_timeline" in self.stats:
+            output["drift_timeline"] = convert_numpy(self.stats["drift_timeline"])
 
         return json.dumps(output, indent=2)
 
@@ -0,0 +1,259 @@
+"""Storage footprint and compaction for vault.db (``geistfabrik db``).
+
+Pruning old session embeddings deletes rows but leaves their pages on
+SQLite's freelist, and rows written over many sessions end up interleaved
+across the file. New databases are created with ``auto_vacuum =
+INCREMENTAL`` (see schema.init_db), so free pages can be handed back to the
+filesystem cheaply with ``PRAGMA incremental_vacuum``; a full ``VACUUM``
+rewrites the file with every table and index in contiguous pages.
+
+Per-table sizes and fragmentation come from SQLite's ``dbstat`` virtual
+table. Builds without it still report row counts and database totals.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+
+@dataclass
+class TableStats:
+    """Footprint of one table and its indexes.
+
+    Attributes:
+        name: Table name
+        rows: Row count
+        bytes: Bytes in pages owned by the table and its indexes (None
+            without dbstat)
+        payload_bytes: Bytes of stored data within those pages
+        fragmentation: Share of leaf pages not directly following the
+            previous leaf of the same b-tree, 0.0 (contiguous) to 1.0
+    """
+
+    name: str
+    rows: int
+    bytes: int | None = None
+    payload_bytes: int | None = None
+    fragmentation: float | None = None
+
+
+@dataclass
+class DatabaseStats:
+    """Footprint of a whole database.
+
+    Attributes:
+        page_size: Bytes per page
+        page_count: Pages in the database file
+        freelist_count: Unused pages awaiting reuse or vacuum
+        auto_vacuum: "none", "full" or "incremental"
+        tables: Per-table statistics, largest first
+    """
+
+    page_size: int
+    page_count: int
+    freelist_count: int
+    auto_vacuum: str
+    tables: list[TableStats] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        """Size of the database (excluding any WAL file)."""
+        return self.page_size * self.page_count
+
+    @property
+    def free_bytes(self) -> int:
+        """Bytes in freelist pages."""
+        return self.page_size * self.freelist_count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary."""
+        return {
+            "page_size": self.page_size,
+            "page_count": self.page_count,
+            "freelist_count": self.freelist_count,
+            "total_bytes": self.total_bytes,
+            "free_bytes": self.free_bytes,
+            "auto_vacuum": self.auto_vacuum,
+            "tables": [vars(table) for table in self.tables],
+        }
+
+
+@dataclass
+class CompactReport:
+    """Outcome of compact_database().
+
+    Attributes:
+        bytes_before: Database size before compaction
+        bytes_after: Database size after compaction
+        full_vacuum: Whether the file was rewritten with VACUUM
+        seconds: Wall-clock duration
+    """
+
+    bytes_before: int
+    bytes_after: int
+    full_vacuum: bool
+    seconds: float
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Bytes returned to the filesystem."""
+        return self.bytes_before - self.bytes_after
+
+
+def _pragma_int(conn: sqlite3.Connection, name: str) -> int:
+    return int(conn.execute(f"PRAGMA {name}").fetchone()[0])
+
+
+def _btree_usage(
+    conn: sqlite3.Connection, owners: dict[str, str]
+) -> dict[str, tuple[int, int, int, int]] | None:
+    """Sum page usage per table from dbstat.
+
+    Args:
+        conn: Database connection
+        owners: b-tree name (table or index) to owning table
+
+    Returns:
+        Table to (bytes, payload bytes, leaf pages, out-of-order leaf
+        pages), or None when SQLite was built without dbstat
+    """
+    try:
+        rows = conn.execute("SELECT name, pageno, pagetype, pgsize, payload FROM dbstat").fetchall()
+    except sqlite3.OperationalError:
+        logger.debug("dbstat not available; reporting row counts only")
+        return None
+
+    usage: dict[str, list[int]] = {}
+    previous: dict[str, int] = {}
+    # dbstat walks each b-tree depth first, so its leaf pages come in key
+    # order; a leaf that does not directly follow the previous one means a
+    # seek when scanning the table
+    for name, pageno, pagetype, pgsize, payload in rows:
+        table = owners.get(name)
+        if table is None:
+            continue
+        totals = usage.setdefault(table, [0, 0, 0, 0])
+        totals[0] += pgsize
+        totals[1] += payload
+        if pagetype != "leaf":
+            continue
+        totals[2] += 1
+        if name in previous and pageno != previous[name] + 1:
+            totals[3] += 1
+        previous[name] = pageno
+    return {table: (t[0], t[1], t[2], t[3]) for table, t in usage.items()}
+
+
+def database_stats(conn: sqlite3.Connection) -> DatabaseStats:
+    """Measure row counts, sizes and fragmentation of every table.
+
+    Reads every page of the database, so takes time proportional to its size.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Database totals and per-table statistics, largest table first
+    """
+    owners = {
+        name: table
+        for name, table in conn.execute(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+    }
+    tables = sorted({table for table in owners.values() if not table.startswith("sqlite_")})
+    usage = _btree_usage(conn, owners)
+
+    stats = DatabaseStats(
+        page_size=_pragma_int(conn, "page_size"),
+        page_count=_pragma_int(conn, "page_count"),
+        freelist_count=_pragma_int(conn, "freelist_count"),
+        auto_vacuum=AUTO_VACUUM_MODES.get(_pragma_int(conn, "auto_vacuum"), "unknown"),
+    )
+    for table in tables:
+        rows = int(conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0])
+        entry = TableStats(name=table, rows=rows)
+        if usage is not None:
+            total, payload, pages, breaks = usage.get(table, (0, 0, 0, 0))
+            entry.bytes = total
+            entry.payload_bytes = payload
+            entry.fragmentation = breaks / (pages - 1) if pages > 1 else 0.0
+        stats.tables.append(entry)
+    stats.tables.sort(key=lambda t: (t.bytes or 0, t.rows), reverse=True)
+    return stats
+
+
+def incremental_vacuum(conn: sqlite3.Connection, pages: int | None = None) -> int:
+    """Return free pages to the filesystem.
+
+    A no-op unless the database uses ``auto_vacuum = INCREMENTAL``.
+
+    Args:
+        conn: Database connection (any open transaction is committed)
+        pages: Maximum pages to release (None releases all)
+
+    Returns:
+        Number of pages released
+    """
+    before = _pragma_int(conn, "freelist_count")
+    if before == 0 or _pragma_int(conn, "auto_vacuum") != 2:
+        return 0
+    limit = "" if pages is None else f"({int(pages)})"
+    # The pragma frees one page per step; execute() steps a statement only
+    # once, while executescript() runs it to completion (and commits first)
+    conn.executescript(f"PRAGMA incremental_vacuum{limit};")
+    return before - _pragma_int(conn, "freelist_count")
+
+
+def compact_database(conn: sqlite3.Connection, full: bool = False) -> CompactReport:
+    """Release free pages and rebuild indexes.
+
+    Runs an incremental vacuum followed by REINDEX. A database not yet in
+    incremental auto-vacuum mode (created before it became the default) is
+    converted, which needs one full VACUUM.
+
+    Args:
+        conn: Database connection
+        full: Always run a full VACUUM, rewriting every table and index into
+            contiguous pages
+
+    Returns:
+        Sizes before and after
+    """
+    start = time.perf_counter()
+    conn.commit()
+    page_size = _pragma_int(conn, "page_size")
+    before = page_size * _pragma_int(conn, "page_count")
+
+    full_vacuum = full or _pragma_int(conn, "auto_vacuum") != 2
+    if full_vacuum:
+        # Changing auto_vacuum on a populated database takes effect at VACUUM
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+    else:
+        incremental_vacuum(conn)
+        conn.execute("REINDEX")
+        conn.commit()
+    # Fold the WAL back into the main file (no-op in rollback-journal mode)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    after = page_size * _pragma_int(conn, "page_count")
+    report = CompactReport(
+        bytes_before=before,
+        bytes_after=after,
+        full_vacuum=full_vacuum,
+        seconds=time.perf_counter() - start,
+    )
+    logger.info(
+        "Compacted database from %d to %d bytes in %.1fs",
+        before,
+        after,
+        report.seconds,
+    )
+    return report
@@ -4,11 +4,14 @@ Implements a Tracery-like grammar system for declarative geist definitions.
 Supports symbol expansion, modifiers, and vault function calls.
 """
 
+import hashlib
 import logging
 import random
 import re
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -17,18 +20,170 @@ from .vault_context import VaultContext
 
 logger = logging.getLogger(__name__)
 
+_SYMBOL_PATTERN = re.compile(r"#([^#]+)#")
+_VAULT_CALL_PATTERN = re.compile(r"\$vault\.([a-z_]+)\(([^)]*)\)")
+
+
+@dataclass(frozen=True)
+class SymbolRef:
+    """A #symbol.mod1.mod2# reference inside a compiled rule."""
+
+    name: str
+    modifiers: tuple[str, ...]
+    raw: str  # Text between the #s, echoed back when the symbol is undefined
+
+
+@dataclass(frozen=True)
+class VaultCall:
+    """A rule that is exactly one $vault.function(args) call."""
+
+    name: str
+    args: tuple[int | str, ...]
+
+
+CompiledRule = tuple[str | SymbolRef, ...]
+"""A rule split into literal segments and symbol references."""
+
+
+@dataclass(frozen=True)
+class CompiledGrammar:
+    """Token form of a grammar: every rule parsed once, ahead of expansion.
+
+    Attributes:
+        rules: Symbol name -> compiled rules (index-aligned with the source rules)
+        vault_calls: Symbol name -> {rule index: VaultCall} for rules that are
+            $vault.* calls, resolved during pre-population
+    """
+
+    rules: dict[str, list[CompiledRule]]
+    vault_calls: dict[str, dict[int, VaultCall]]
+
+
+def _parse_symbol(symbol: str) -> SymbolRef:
+    """Split "name.mod1.mod2" into a SymbolRef."""
+    name, *modifiers = symbol.split(".")
+    return SymbolRef(name, tuple(modifiers), symbol)
+
+
+def compile_rule(rule: Any) -> CompiledRule:
+    """Tokenise a rule into literal segments and symbol references.
+
+    Uses the same #([^#]+)# matching as the interpreted engine did, so
+    compiled and interpreted expansion agree exactly.
+
+    Args:
+        rule: Rule text (non-string YAML scalars are treated as literals)
+
+    Returns:
+        Tuple of literal strings and SymbolRef tokens
+    """
+    text = rule if isinstance(rule, str) else str(rule)
+    tokens: list[str | SymbolRef] = []
+    pos = 0
+    for match in _SYMBOL_PATTERN.finditer(text):
+        if match.start() > pos:
+            tokens.append(text[pos : match.start()])
+        tokens.append(_parse_symbol(match.group(1)))
+        pos = match.end()
+    if pos < len(text):
+        tokens.append(text[pos:])
+    return tuple(tokens)
+
+
+def _parse_vault_call(rule: Any) -> VaultCall | None:
+    """Parse a rule that is a single $vault.function(args) call."""
+    if not isinstance(rule, str):
+        return None
+    match = _VAULT_CALL_PATTERN.fullmatch(rule.strip())
+    if not match:
+        return None
+
+    args_str = match.group(2).strip()
+    args: tuple[int | str, ...] = ()
+    if args_str:
+        raw_args = [arg.strip().strip("\"'") for arg in args_str.split(",")]
+        args = tuple(_convert_arg(arg) for arg in raw_args)
+    return VaultCall(match.group(1), args)
+
+
+def compile_grammar(grammar: dict[str, Any]) -> CompiledGrammar:
+    """Compile every rule of a grammar into token form.
+
+    Args:
+        grammar: Tracery grammar dictionary
+
+    Returns:
+        CompiledGrammar with tokenised rules and parsed $vault.* calls
+    """
+    rules: dict[str, list[CompiledRule]] = {}
+    vault_calls: dict[str, dict[int, VaultCall]] = {}
+    for symbol, symbol_rules in grammar.items():
+        rules[symbol] = [compile_rule(rule) for rule in symbol_rules]
+        calls = {}
+        for i, rule in enumerate(symbol_rules):
+            call = _parse_vault_call(rule)
+            if call is not None:
+                calls[i] = call
+        if calls:
+            vault_calls[symbol] = calls
+    return CompiledGrammar(rules, vault_calls)
+
+
+def _convert_arg(arg: str) -> int | str:
+    """Convert a $vault.* argument to int if numeric, str otherwise."""
+    try:
+        return int(arg)
+    except ValueError:
+        return arg
+
+
+@dataclass(frozen=True)
+class _CompiledGeistFile:
+    """Parsed, validated and compiled contents of one Tracery YAML file."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    geist_id: str
+    grammar: dict[str, Any]
+    count: int
+    compiled: CompiledGrammar
+
+
+_COMPILED_GEIST_CACHE: dict[str, _CompiledGeistFile] = {}
+"""Compiled grammars keyed by YAML path, reused across sessions in a process.
+
+An entry is reused while the file's mtime/size are unchanged; if they change
+but the content hash does not (e.g. a touch or checkout), it is still reused.
+"""
+
+
+def clear_compiled_grammar_cache() -> None:
+    """Drop all cached compiled Tracery grammars."""
+    _COMPILED_GEIST_CACHE.clear()
+
 
 class TraceryEngine:
     """Simple Tracery grammar engine with vault function support."""
 
-    def __init__(self, grammar: dict[str, list[str]], seed: int | None = None):
+    def __init__(
+        self,
+        grammar: dict[str, list[str]],
+        seed: int | None = None,
+        compiled: CompiledGrammar | None = None,
+    ):
         """Initialise Tracery engine.
 
         Args:
             grammar: Dictionary mapping symbols to expansion rules
             seed: Random seed for deterministic expansion
+            compiled: Pre-compiled form of grammar (compiled here if omitted)
         """
         self.grammar = grammar
+        self._compiled = compiled if compiled is not None else compile_grammar(grammar)
+        # Per-engine view: pre-population replaces entries for $vault.* symbols
+        self._rules: dict[str, list[CompiledRule]] = dict(self._compiled.rules)
+        self._template_cache: dict[str, CompiledRule] = {}
         self.rng = random.Random(seed)
         self.vault_context: VaultContext | None = None
         self.max_depth = 50
@@ -299,59 +454,54 @@ class TraceryEngine:
             return
 
         try:
-            # Pattern to match $vault.function_name(args)
-            pattern = r"\$vault\.([a-z_]+)\(([^)]*)\)"
-
-            for symbol, rules in list(self.grammar.items()):
+            for symbol, calls in self._compiled.vault_calls.items():
+                rules = self.grammar[symbol]
+                compiled_rules = self._rules[symbol]
                 expanded_rules: list[str] = []
+                expanded_compiled: list[CompiledRule] = []
 
-                for rule in rules:
-                    # Check if this rule is a vault function call
-                    match = re.fullmatch(pattern, rule.strip())
-
-                    if match:
-                        # Execute vault function
-                        func_name = match.group(1)
-                        args_str = match.group(2).strip()
-
-                        # Parse arguments
-                        args = []
-                        if args_str:
-                            raw_args = [arg.strip().strip("\"'") for arg in args_str.split(",")]
-                            args = [self._convert_arg(arg) for arg in raw_args]
-
-                        # Call function and get results
-                        result = self.vault_context.call_function(func_name, *args)
-
-                        # Check if we got fewer items than requested
-                        if isinstance(result, list) and args and isinstance(args[0], int):
-                            requested_count = args[0]
-                            actual_count = len(result)
-                            if actual_count < requested_count:
-                                logger.warning(
-                                    f"Symbol '{symbol}' requested {requested_count} items "
-                                    f"via $vault.{func_name}() but only {actual_count} "
-                                    f"available. This may cause repetition in suggestions."
-                                )
-
-                        # If result is a list, expand into multiple rules
-                        if isinstance(result, list):
-                            if len(result) == 0:
-                                logger.warning(
-                                    f"Symbol '{symbol}' has empty result from "
-                                    f"$vault.{func_name}(). This will produce "
-                                    f"suggestions with empty placeholders."
-                                )
-                                self._has_empty_symbols = True
-                            expanded_rules.extend([str(item) for item in result])
-                        else:
-                            expanded_rules.append(str(result))
-                    else:
+                for i, rule in enumerate(rules):
+                    call = calls.get(i)
+                    if call is None:
                         # Static rule, keep as-is
                         expanded_rules.append(rule)
+                        expanded_compiled.append(compiled_rules[i])
+                        continue
+
+                    # Execute vault function
+                    func_name, args = call.name, call.args
+                    result = self.vault_context.call_function(func_name, *args)
+
+                    # Check if we got fewer items than requested
+                    if isinstance(result, list) and args and isinstance(args[0], int):
+                        requested_count = args[0]
+                        actual_count = len(result)
+                        if actual_count < requested_count:
+                            logger.warning(
+                                f"Symbol '{symbol}' requested {requested_count} items "
+                                f"via $vault.{func_name}() but only {actual_count} "
+                                f"available. This may cause repetition in suggestions."
+                            )
+
+                    # If result is a list, expand into multiple rules
+                    if isinstance(result, list):
+                        if len(result) == 0:
+                            logger.warning(
+                                f"Symbol '{symbol}' has empty result from "
+                                f"$vault.{func_name}(). This will produce "
+                                f"suggestions with empty placeholders."
+                            )
+                            self._has_empty_symbols = True
+                        values = [str(item) for item in result]
+                    else:
+                        values = [str(result)]
+                    expanded_rules.extend(values)
+                    # Vault results may themselves contain #symbols#
+                    expanded_compiled.extend(compile_rule(value) for value in values)
 
                 # Replace symbol's rules with expanded version
                 self.grammar[symbol] = expanded_rules
+                self._rules[symbol] = expanded_compiled
 
             self._preprocessed = True
 
@@ -376,20 +526,33 @@ class TraceryEngine:
         Raises:
             RecursionError: If expansion exceeds max depth
         """
-        if depth > self.max_depth:
-            raise RecursionError(f"Tracery expansion exceeded max depth ({self.max_depth})")
+        tokens = self._template_cache.get(text)
+        if tokens is None:
+            tokens = compile_rule(text)
+            self._template_cache[text] = tokens
+        return self._expand_tokens(tokens, depth)
 
-        # Find and expand #symbols#
-        pattern = r"#([^#]+)#"
+    def _expand_tokens(self, tokens: CompiledRule, depth: int) -> str:
+        """Expand a compiled rule by walking its tokens.
 
-        def replace_symbol(match: re.Match[str]) -> str:
-            symbol = match.group(1)
-            expanded = self._expand_symbol(symbol, depth + 1)
-            return expanded
+        Args:
+            tokens: Literal segments and symbol references
+            depth: Current recursion depth
 
-        expanded = re.sub(pattern, replace_symbol, text)
+        Returns:
+            Expanded text
 
-        return expanded
+        Raises:
+            RecursionError: If expansion exceeds max depth
+        """
+        if depth > self.max_depth:
+            raise RecursionError(f"Tracery expansion exceeded max depth ({self.max_depth})")
+
+        parts = [
+            token if isinstance(token, str) else self._expand_ref(token, depth + 1)
+            for token in tokens
+        ]
+        return "".join(parts)
 
     def _expand_symbol(self, symbol: str, depth: int) -> str:
         """Expand a single symbol with optional modifiers.
@@ -404,33 +567,32 @@ class TraceryEngine:
         Returns:
             Expanded and modified text
         """
-        # Split symbol and modifiers
-        parts = symbol.split(".")
-        symbol_name = parts[0]
-        modifier_names = parts[1:] if len(parts) > 1 else []
+        return self._expand_ref(_parse_symbol(symbol), depth)
 
-        # Check if symbol exists in grammar
-        if symbol_name not in self.grammar:
-            return f"#{symbol}#"  # Return unchanged if not in grammar
+    def _expand_ref(self, ref: SymbolRef, depth: int) -> str:
+        """Expand a pre-parsed symbol reference.
 
-        rules = self.grammar[symbol_name]
+        Args:
+            ref: Symbol reference with its modifier chain
+            depth: Current recursion depth
+
+        Returns:
+            Expanded and modified text
+        """
+        rules = self._rules.get(ref.name)
+        if rules is None:
+            return f"#{ref.raw}#"  # Return unchanged if not in grammar
         if not rules:
             return ""
 
-        # Select random rule
-        selected = self.rng.choice(rules)
-
-        # Recursively expand the selected rule
-        expanded = self.expand(selected, depth)
+        # Select random rule and recursively expand it
+        result = self._expand_tokens(self.rng.choice(rules), depth)
 
-        # Apply modifiers in order
-        result = expanded
-        for modifier_name in modifier_names:
-            if modifier_name in self.modifiers:
-                result = self.modifiers[modifier_name](result)
-            else:
-                # Unknown modifier - leave as-is or could warn
-                pass
+        # Apply modifiers in order (unknown modifiers are ignored)
+        for modifier_name in ref.modifiers:
+            modifier = self.modifiers.get(modifier_name)
+            if modifier is not None:
+                result = modifier(result)
 
         return result
 
@@ -443,14 +605,7 @@ class TraceryEngine:
         Returns:
             Converted argument (int if numeric, str otherwise)
         """
-        # Try to convert to int
-        try:
-            return int(arg)
-        except ValueError:
-            pass
-
-        # Return as string
-        return arg
+        return _convert_arg(arg)
 
 
 class TraceryGeist:
@@ -462,6 +617,7 @@ class TraceryGeist:
         grammar: dict[str, list[str]],
         count: int = 1,
         seed: int | None = None,
+        compiled: CompiledGrammar | None = None,
     ):
         """Initialise Tracery geist.
 
@@ -470,10 +626,13 @@ class TraceryGeist:
             grammar: Tracery grammar dictionary
             count: Number of suggestions to generate per invocation
             seed: Random seed for deterministic expansion
+            compiled: Pre-compiled grammar (compiled on demand if omitted)
         """
         self.geist_id = geist_id
-        self.engine = TraceryEngine(grammar, seed)
+        self.engine = TraceryEngine(grammar, seed, compiled=compiled)
         self.count = count
+        # SHA-256 of the YAML source (set by from_yaml; keys the output cache)
+        self.source_digest: str | None = None
 
     @staticmethod
     def _validate_grammar(grammar: dict[str, list[str]], geist_id: str, yaml_path: Path) -> None:
@@ -531,6 +690,9 @@ class TraceryGeist:
           template: ["rule1", "rule2"]
         ```
 
+        The grammar is parsed, validated and compiled once per file version;
+        later loads of an unchanged file reuse the compiled token tree.
+
         Args:
             yaml_path: Path to YAML file
             seed: Random seed for deterministic expansion
@@ -538,8 +700,52 @@ class TraceryGeist:
         Returns:
             Loaded TraceryGeist instance
         """
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        entry = cls._load_compiled(Path(yaml_path))
+
+        # Pre-population replaces symbol lists, so each geist gets its own copy
+        grammar = {
+            symbol: list(rules) if isinstance(rules, list) else rules
+            for symbol, rules in entry.grammar.items()
+        }
+        geist = cls(entry.geist_id, grammar, entry.count, seed, compiled=entry.compiled)
+        geist.source_digest = entry.digest
+        return geist
+
+    @classmethod
+    def _load_compiled(cls, yaml_path: Path) -> _CompiledGeistFile:
+        """Return the compiled form of a YAML geist, using the cache when valid.
+
+        Args:
+            yaml_path: Path to YAML file
+
+        Returns:
+            Cached or freshly compiled geist file
+
+        Raises:
+            ValueError: If the file is not a valid Tracery geist
+        """
+        key = str(yaml_path)
+        stat = yaml_path.stat()
+        cached = _COMPILED_GEIST_CACHE.get(key)
+        if cached and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached
+
+        raw = yaml_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cached and cached.digest == digest:
+            entry = _CompiledGeistFile(
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                cached.geist_id,
+                cached.grammar,
+                cached.count,
+                cached.compiled,
+            )
+            _COMPILED_GEIST_CACHE[key] = entry
+            return entry
+
+        data = yaml.safe_load(raw)
 
         if data.get("type") != "geist-tracery":
             raise ValueError(
@@ -556,7 +762,17 @@ class TraceryGeist:
         # Validate grammar for anti-patterns
         cls._validate_grammar(grammar, geist_id, yaml_path)
 
-        return cls(geist_id, grammar, count, seed)
+        entry = _CompiledGeistFile(
+            stat.st_mtime_ns,
+            stat.st_size,
+            digest,
+            geist_id,
+            grammar,
+            count,
+            compile_grammar(grammar),
+        )
+        _COMPILED_GEIST_CACHE[key] = entry
+        return entry
 
     def suggest(self, vault: VaultContext) -> list[Suggestion]:
         """Generate suggestions using Tracery grammar.
@@ -567,6 +783,8 @@ class TraceryGeist:
         Returns:
             List of generated suggestions
         """
+        # $vault.* calls that sample use this geist's own RNG stream
+        vault.reseed(self.geist_id)
         self.engine.set_vault_context(vault)
 
         # If preprocessing failed, return empty suggestions
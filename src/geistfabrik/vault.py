@@ -2,17 +2,17 @@
 
 import fnmatch
 import logging
-import os
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .bulk_writer import BulkWriter
 from .config_loader import GeistFabrikConfig, load_config
 from .date_collection import is_date_collection_note, split_date_collection_note
 from .markdown_parser import parse_markdown
 from .models import Link, Note
-from .schema import init_db, migrate_schema
+from .schema import connect_readonly, content_hash, init_db, migrate_schema
 
 logger = logging.getLogger(__name__)
 
@@ -44,24 +44,40 @@ class Vault:
 
         # Load or use provided config
         if config is None:
-            config_path = self.vault_path / ".geistfabrik" / "config.yaml"
+            config_path = self.vault_path / "_geistfabrik" / "config.yaml"
             self.config = load_config(config_path)
         else:
             self.config = config
 
         # Initialise database
-        if db_path is None:
+        self.db_path = Path(db_path) if db_path is not None else None
+        if self.db_path is None:
             self.db = init_db(None)
         else:
-            db_path_obj = Path(db_path)
-            is_new_db = not db_path_obj.exists()
-            self.db = init_db(db_path_obj)
-            if is_new_db and db_path_obj.exists():
-                os.chmod(db_path_obj, 0o600)
+            # init_db makes the database and its WAL files owner-only (0600)
+            self.db = init_db(self.db_path, profile=self.config.database.profile)
 
         # Migrate schema if needed
         migrate_schema(self.db)
 
+    def open_reader(self) -> sqlite3.Connection:
+        """Open an additional read-only connection to the vault database.
+
+        Use this for readers that should not share (and serialise on) the
+        writer connection in ``self.db``. The caller owns the connection and
+        must close it.
+
+        Returns:
+            Read-only connection using the configured database profile.
+
+        Raises:
+            ValueError: If the vault uses an in-memory database, which other
+                connections cannot see.
+        """
+        if self.db_path is None:
+            raise ValueError("In-memory vault databases have no read-only connections")
+        return connect_readonly(self.db_path, profile=self.config.database.profile)
+
     def _is_excluded_from_date_collection(self, rel_path: str) -> bool:
         """Check if file should be excluded from date-collection detection.
 
@@ -84,13 +100,26 @@ class Vault:
         """
         processed_count = 0
 
-        # Get all markdown files in vault
+        # Get all markdown files in vault (relative paths from vault root)
         md_files = list(self.vault_path.rglob("*.md"))
-
-        for md_file in md_files:
-            # Get relative path from vault root
-            rel_path = str(md_file.relative_to(self.vault_path))
-
+        rel_paths = [str(md_file.relative_to(self.vault_path)) for md_file in md_files]
+
+        # Stored mtime per source file, loaded in one query instead of one
+        # lookup per file. Virtual entries are keyed by their source_file.
+        stored_mtimes: dict[str, float] = {
+            row[0]: row[1]
+            for row in self.db.execute("SELECT COALESCE(source_file, path), file_mtime FROM notes")
+        }
+
+        # Writes are accumulated and flushed in bulk after the scan. Stale-row
+        # deletes are only needed for files that already have rows stored.
+        journal_files: list[tuple[str, float]] = []
+        regular_files: list[str] = []
+        pending: dict[str, tuple[Note, float]] = {}
+        replaced_paths: list[str] = []
+        stale_entries: list[str] = []
+
+        for md_file, rel_path in zip(md_files, rel_paths):
             # Get file modification time (file may have been deleted since rglob)
             try:
                 file_mtime = md_file.stat().st_mtime
@@ -99,17 +128,10 @@ class Vault:
 
             # Check if file needs to be processed
             # For regular notes, check by path; for journals (virtual entries), check by source_file
-            cursor = self.db.execute(
-                "SELECT file_mtime FROM notes WHERE path = ? OR source_file = ? LIMIT 1",
-                (rel_path, rel_path),
-            )
-            row = cursor.fetchone()
-
-            if row is not None:
-                db_mtime = row[0]
-                if abs(db_mtime - file_mtime) < FLOAT_COMPARISON_TOLERANCE:
-                    # File unchanged, skip
-                    continue
+            db_mtime = stored_mtimes.get(rel_path)
+            if db_mtime is not None and abs(db_mtime - file_mtime) < FLOAT_COMPARISON_TOLERANCE:
+                # File unchanged, skip
+                continue
 
             # File is new or modified, process it
             try:
@@ -142,46 +164,63 @@ class Vault:
                     date_threshold=dc_config.date_threshold,
                 )
             ):
-                # Delete any existing entries for this file (both regular note and virtual entries)
-                # This handles the case where a regular note becomes a journal
-                self.db.execute(
-                    "DELETE FROM notes WHERE path = ? OR source_file = ?", (rel_path, rel_path)
-                )
-
                 # Split into virtual entries
                 virtual_notes = split_date_collection_note(rel_path, content, created, modified)
 
-                # Insert each virtual entry
-                for virtual_note in virtual_notes:
-                    self._update_note_from_object(virtual_note, file_mtime)
-
-                processed_count += len(virtual_notes)
-                logger.debug(f"Split {rel_path} into {len(virtual_notes)} virtual entries")
+                # For a journal already stored, only entries whose section
+                # changed are rewritten and only removed dates are deleted, so
+                # untouched entries keep their embeddings and session history.
+                # A regular note stored at this path (the file has just become
+                # a journal) is always dropped.
+                changed_notes = virtual_notes
+                if db_mtime is not None:
+                    changed_notes, removed_paths = self._diff_journal_entries(
+                        rel_path, virtual_notes
+                    )
+                    journal_files.append((rel_path, file_mtime))
+                    stale_entries.extend(removed_paths)
+                    replaced_paths.extend(note.path for note in changed_notes)
+                for virtual_note in changed_notes:
+                    pending[virtual_note.path] = (virtual_note, file_mtime)
+
+                processed_count += len(changed_notes)
+                logger.debug(
+                    f"Split {rel_path} into {len(virtual_notes)} virtual entries "
+                    f"({len(changed_notes)} new or changed)"
+                )
             else:
                 # Regular note - parse markdown
                 title, clean_content, links, tags = parse_markdown(rel_path, content)
 
-                # Delete any virtual entries from when this might have been a journal
-                # This handles the case where a journal becomes a regular note
-                self.db.execute("DELETE FROM notes WHERE source_file = ?", (rel_path,))
-
-                # Update database
-                self._update_note(
-                    rel_path,
-                    title,
-                    content,
-                    created,
-                    modified,
-                    file_mtime,
-                    links,
-                    tags,
+                # Virtual entries from when this might have been a journal are
+                # deleted. This handles the case where a journal becomes a regular note
+                if db_mtime is not None:
+                    regular_files.append(rel_path)
+                    replaced_paths.append(rel_path)
+
+                note = Note(
+                    path=rel_path,
+                    title=title,
+                    content=content,
+                    links=links,
+                    tags=tags,
+                    created=created,
+                    modified=modified,
+                    is_virtual=False,
+                    source_file=None,
+                    entry_date=None,
                 )
+                pending[rel_path] = (note, file_mtime)
 
                 processed_count += 1
 
+        self._write_notes(
+            journal_files, regular_files, replaced_paths, stale_entries, list(pending.values())
+        )
+
         # Remove notes that no longer exist in filesystem
         # Build set of existing paths for efficient lookup
-        existing_paths = {str(f.relative_to(self.vault_path)) for f in md_files}
+        existing_paths = set(rel_paths)
 
         # Delete regular notes (not virtual entries) that no longer exist.
         # Virtual entries are managed by their source_file, not their path.
@@ -221,70 +260,108 @@ class Vault:
             raise
         return processed_count
 
-    def _update_note(
+    def _diff_journal_entries(
+        self, rel_path: str, virtual_notes: list[Note]
+    ) -> tuple[list[Note], list[str]]:
+        """Compare a journal's freshly split entries with the stored ones.
+
+        Entries are matched by virtual path (which encodes the entry date) and
+        compared by heading and stored section content hash.
+
+        Args:
+            rel_path: Journal file path (the entries' source_file)
+            virtual_notes: Entries produced by split_date_collection_note
+
+        Returns:
+            Tuple of (entries that are new or whose section changed, paths of
+            stored entries whose date no longer appears in the file)
+        """
+        stored = {
+            path: (title, stored_hash)
+            for path, title, stored_hash in self.db.execute(
+                "SELECT path, title, content_hash FROM notes WHERE source_file = ?", (rel_path,)
+            )
+        }
+        changed = [
+            note
+            for note in virtual_notes
+            if stored.get(note.path) != (note.title, content_hash(note.content))
+        ]
+        current = {note.path for note in virtual_notes}
+        removed = [path for path in stored if path not in current]
+        return changed, removed
+
+    def _write_notes(
         self,
-        path: str,
-        title: str,
-        content: str,
-        created: datetime,
-        modified: datetime,
-        file_mtime: float,
-        links: list[Link],
-        tags: list[str],
+        journal_files: list[tuple[str, float]],
+        regular_files: list[str],
+        replaced_paths: list[str],
+        stale_entries: list[str],
+        notes: list[tuple[Note, float]],
     ) -> None:
-        """Update a note and its relationships in the database."""
-        # Construct a Note object for regular (non-virtual) entries
-        note = Note(
-            path=path,
-            title=title,
-            content=content,
-            links=links,
-            tags=tags,
-            created=created,
-            modified=modified,
-            is_virtual=False,
-            source_file=None,
-            entry_date=None,
-        )
-        # Delegate to the full update method
-        self._update_note_from_object(note, file_mtime)
+        """Write changed notes and their relationships in bulk.
 
-    def _update_note_from_object(self, note: Note, file_mtime: float) -> None:
-        """Update a note from a Note object (including virtual entries).
+        Rows are flushed statement by statement through executemany, in an
+        order equivalent to updating each note in turn: stale rows for the
+        changed files are removed first, then notes, links and tags are
+        inserted. The caller commits.
 
         Args:
-            note: Note object to insert/update
-            file_mtime: File modification time
+            journal_files: (path, file_mtime) of date-collection files already
+                stored; any regular note at their path is removed and their
+                unchanged entries get the new file mtime
+            regular_files: Regular files whose stale virtual entries are removed
+            replaced_paths: Notes already stored whose links and tags are
+                replaced
+            stale_entries: Virtual entries whose date was removed from their
+                journal
+            notes: (note, file_mtime) pairs to insert or replace
         """
-        # Insert or replace note with virtual entry fields
-        self.db.execute(
+        writer = BulkWriter(self.db)
+        writer.add_many(
+            "DELETE FROM notes WHERE path = ? AND is_virtual = 0",
+            ((path,) for path, _ in journal_files),
+        )
+        writer.add_many("DELETE FROM notes WHERE path = ?", ((path,) for path in stale_entries))
+        writer.add_many(
+            "DELETE FROM notes WHERE source_file = ?", ((path,) for path in regular_files)
+        )
+        writer.add_many(
+            "DELETE FROM links WHERE source_path = ?", ((path,) for path in replaced_paths)
+        )
+        writer.add_many(
+            "DELETE FROM tags WHERE note_path = ?", ((path,) for path in replaced_paths)
+        )
+        writer.add_many(
             """
             INSERT OR REPLACE INTO notes (
                 path, title, content, created, modified, file_mtime,
-                is_virtual, source_file, entry_date
+                is_virtual, source_file, entry_date, content_hash
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
-                note.path,
-                note.title,
-                note.content,
-                note.created.isoformat(),
-                note.modified.isoformat(),
-                file_mtime,
-                1 if note.is_virtual else 0,
-                note.source_file,
-                note.entry_date.isoformat() if note.entry_date else None,
+                (
+                    note.path,
+                    note.title,
+                    note.content,
+                    note.created.isoformat(),
+                    note.modified.isoformat(),
+                    file_mtime,
+                    1 if note.is_virtual else 0,
+                    note.source_file,
+                    note.entry_date.isoformat() if note.entry_date else None,
+                    content_hash(note.content),
+                )
+                for note, file_mtime in notes
             ),
         )
-
-        # Delete old links and tags
-        self.db.execute("DELETE FROM links WHERE source_path = ?", (note.path,))
-        self.db.execute("DELETE FROM tags WHERE note_path = ?", (note.path,))
-
-        # Insert new links using batch executemany
-        if note.links:
-            link_rows = [
+        writer.add_many(
+            """
+            INSERT INTO links (source_path, target, display_text, is_embed, block_ref)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
                 (
                     note.path,
                     link.target,
@@ -292,23 +369,19 @@ class Vault:
                     1 if link.is_embed else 0,
                     link.block_ref,
                 )
+                for note, _ in notes
                 for link in note.links
-            ]
-            self.db.executemany(
-                """
-                INSERT INTO links (source_path, target, display_text, is_embed, block_ref)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                link_rows,
-            )
-
-        # Insert new tags using batch executemany
-        if note.tags:
-            tag_rows = [(note.path, tag) for tag in note.tags]
-            self.db.executemany(
-                "INSERT INTO tags (note_path, tag) VALUES (?, ?)",
-                tag_rows,
-            )
+            ),
+        )
+        writer.add_many(
+            "INSERT INTO tags (note_path, tag) VALUES (?, ?)",
+            ((note.path, tag) for note, _ in notes for tag in note.tags),
+        )
+        writer.add_many(
+            "UPDATE notes SET file_mtime = ? WHERE source_file = ?",
+            ((file_mtime, path) for path, file_mtime in journal_files),
+        )
+        writer.flush()
 
     def _build_note_from_row(
         self,
@@ -3,7 +3,7 @@
 import logging
 import random
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import (
@@ -17,8 +17,12 @@ import numpy as np
 
 from .clustering_analysis import Cluster, format_cluster_label
 from .config import TOTAL_DIM
-from .embeddings import Session, cosine_similarity
+from .embeddings import Session, configure_sklearn, cosine_similarity
+from .knn_graph import KnnGraph, normalise_rows, session_knn_graph
+from .memory_budget import BoundedCache, MemoryBudget
 from .models import Link, Note, link_target_forms
+from .quantization import StoredEmbeddings, decode_embedding
+from .temporal_analysis import TemporalIndex
 from .vault import Vault
 from .voice_analysis import VoiceMetadata, compute_voice, compute_voice_metadata
 
@@ -63,19 +67,20 @@ class ChurnResult:
     arrived: list[str]
 
 
-def _normalise_rows(matrix: np.ndarray) -> np.ndarray:
-    """Row-normalise a matrix to unit vectors, leaving zero rows as zeros.
-
-    Args:
-        matrix: (N, d) array
+@dataclass
+class EmbeddingMatrix:
+    """Session embeddings stacked into one row-normalised matrix.
 
-    Returns:
-        (N, d) array with each non-zero row scaled to unit norm
+    Attributes:
+        notes: Notes that have an embedding, in notes() order
+        rows: Note path -> row index
+        unit: Row-normalised embeddings, shape (len(notes), dim); float32,
+            or float16 when the session is stored at reduced precision
     """
-    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
-    norms = np.where(norms == 0, 1.0, norms)
-    result: np.ndarray = matrix / norms
-    return result
+
+    notes: list[Note]
+    rows: dict[str, int]
+    unit: np.ndarray
 
 
 def _jaccard_churn(old: set[str], new: set[str]) -> float:
@@ -102,10 +107,11 @@ def _topk_neighbour_sets(
 ) -> dict[str, set[str]]:
     """Compute top-k cosine neighbour path sets for every row of a matrix.
 
-    Uses blocked matrix multiplication (block_size rows at a time) so peak
-    memory stays bounded at roughly block_size × N floats, followed by
+    Uses blocked float32 matrix multiplication (block_size rows at a time) so
+    peak memory stays bounded at roughly block_size × N floats, followed by
     np.argpartition for O(N) top-k selection per row. Self-similarity is
-    masked out, and k is capped at N - 1.
+    masked out, and k is capped at N - 1. Session graphs (KnnGraph) answer
+    the common case; this serves k above what they store.
 
     Args:
         matrix: (N, d) embedding matrix; row i corresponds to paths[i]
@@ -124,7 +130,7 @@ def _topk_neighbour_sets(
     if k_eff <= 0:
         return {path: set() for path in paths}
 
-    normalised = _normalise_rows(matrix.astype(np.float64))
+    normalised = normalise_rows(matrix.astype(np.float32))
 
     result: dict[str, set[str]] = {}
     for start in range(0, n, block_size):
@@ -140,7 +146,7 @@ def _topk_neighbour_sets(
 
 
 def _surprisal_blocked(
-    embeddings: dict[str, np.ndarray], k_neighbours: int, block_size: int = 1024
+    embeddings: Mapping[str, np.ndarray], k_neighbours: int, block_size: int = 1024
 ) -> dict[str, float]:
     """Compute surprisal for all notes using blocked matrix operations.
 
@@ -169,7 +175,7 @@ def _surprisal_blocked(
         return {}
 
     matrix = np.stack([np.asarray(embeddings[p], dtype=np.float64) for p in paths])
-    normalised = _normalise_rows(matrix)
+    normalised = normalise_rows(matrix)
 
     scores: dict[str, float] = {}
     for start in range(0, n, block_size):
@@ -195,6 +201,49 @@ def _surprisal_blocked(
     return scores
 
 
+def _surprisal_from_graph(
+    graph: KnnGraph, embeddings: Mapping[str, np.ndarray], k_neighbours: int, block_size: int = 1024
+) -> dict[str, float]:
+    """Compute surprisal for all notes from a session's kNN graph.
+
+    Same result as _surprisal_blocked, but the top-k neighbours come from the
+    graph, so only the centroid step (O(N·k·d)) remains.
+
+    Args:
+        graph: Session graph with graph.covers(k_neighbours)
+        embeddings: Mapping of note path to embedding vector
+        k_neighbours: Number of nearest neighbours forming the centroid
+        block_size: Rows per block (bounds the (block, k, d) centroid gather)
+
+    Returns:
+        Mapping of note path to surprisal in [0.0, 2.0]; empty dict if
+        fewer than k_neighbours + 1 notes are available
+    """
+    paths = graph.paths
+    n = len(paths)
+    if k_neighbours < 1 or n < k_neighbours + 1:
+        return {}
+
+    normalised = normalise_rows(
+        np.stack([np.asarray(embeddings[p], dtype=np.float64) for p in paths])
+    )
+
+    scores: dict[str, float] = {}
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        block = normalised[start:end]
+        centroids = normalised[graph.neighbours[start:end, :k_neighbours]].mean(axis=1)
+        centroid_norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroid_norms = np.where(centroid_norms == 0, 1.0, centroid_norms)
+        centroids = centroids / centroid_norms
+
+        surprisal = np.clip(1.0 - np.einsum("ij,ij->i", block, centroids), 0.0, 2.0)
+        for offset in range(end - start):
+            scores[paths[start + offset]] = float(surprisal[offset])
+
+    return scores
+
+
 def _surprisal_naive(embeddings: dict[str, np.ndarray], k_neighbours: int) -> dict[str, float]:
     """Readable reference implementation of surprisal (plain Python loops).
 
@@ -260,6 +309,7 @@ class VaultContext:
         seed: int | None = None,
         metadata_loader: "MetadataLoader | None" = None,
         function_registry: "FunctionRegistry | None" = None,
+        memory_budget: MemoryBudget | None = None,
     ):
         """Initialise vault context.
 
@@ -269,15 +319,20 @@ class VaultContext:
             seed: Random seed for deterministic operations. If None, use date-based seed.
             metadata_loader: Optional metadata inference loader
             function_registry: Optional function registry for vault functions
+            memory_budget: Sizes similarity blocks, samples and cache caps;
+                built-in limits when None
         """
         self.vault = vault
         self.session = session
         self.db = vault.db
+        self.memory_budget = memory_budget or MemoryBudget()
+        budget = self.memory_budget
 
         # Deterministic randomness
         if seed is None:
             # Use session date as seed for determinism
             seed = int(session.date.strftime("%Y%m%d"))
+        self.seed = seed
         self.rng = random.Random(seed)
 
         # Function registry (for extensibility)
@@ -287,31 +342,46 @@ class VaultContext:
         # Cache for notes (performance optimisation)
         self._notes_cache: list[Note] | None = None
 
+        # Temporal indexes (keyed by exclude_journal)
+        self._temporal_index_cache: dict[bool, TemporalIndex] = {}
+
         # Cache for metadata
         self._metadata_cache: dict[str, dict[str, Any]] = {}
 
+        # Built-in metadata of notes being prefetched, served by metadata()
+        # while inference modules run (see prefetch_metadata)
+        self._metadata_pending: dict[str, dict[str, Any]] | None = None
+
         # Cache for clusters (performance optimisation - keyed by min_size)
         self._clusters_cache: dict[int, dict[int, Cluster]] = {}
 
         # Cache for similarity scores (performance optimisation - keyed by note path pair)
-        self._similarity_cache: dict[tuple[str, str], float] = {}
+        self._similarity_cache: dict[tuple[str, str], float] = BoundedCache(
+            budget.cache_entries("_similarity_cache")
+        )
 
         # Cache for neighbours (keyed by (note_path, count, return_scores))
         self._neighbours_cache: dict[
             tuple[str, int, bool], list[Note] | list[tuple[Note, float]]
-        ] = {}
+        ] = BoundedCache(budget.cache_entries("_neighbours_cache"))
 
         # Cache for backlinks (performance optimisation - keyed by note_path)
-        self._backlinks_cache: dict[str, list[Note]] = {}
+        self._backlinks_cache: dict[str, list[Note]] = BoundedCache(
+            budget.cache_entries("_backlinks_cache")
+        )
 
         # Cache for outgoing_links (performance optimisation - keyed by note_path)
-        self._outgoing_links_cache: dict[str, list[Note]] = {}
+        self._outgoing_links_cache: dict[str, list[Note]] = BoundedCache(
+            budget.cache_entries("_outgoing_links_cache")
+        )
 
         # Cache for graph_neighbours (performance optimisation - keyed by note_path)
-        self._graph_neighbours_cache: dict[str, list[Note]] = {}
+        self._graph_neighbours_cache: dict[str, list[Note]] = BoundedCache(
+            budget.cache_entries("_graph_neighbours_cache")
+        )
 
         # Cache for read() content (OPTIMISATION #2 - session-scoped)
-        self._read_cache: dict[str, str] = {}
+        self._read_cache: dict[str, str] = BoundedCache(budget.cache_entries("_read_cache"))
 
         # Cache for surprisal scores (session-scoped - keyed by k_neighbours)
         self._surprisal_cache: dict[int, dict[str, float]] = {}
@@ -319,9 +389,18 @@ class VaultContext:
         # Cache for neighbour churn (session-scoped - keyed by (since_days, k))
         self._churn_cache: dict[tuple[int, int], dict[str, ChurnResult]] = {}
 
+        # Session kNN graph, loaded or built on first neighbour query
+        self._knn: KnnGraph | None = None
+
         # Cache for typed voice metadata (session-scoped - keyed by note path)
         self._voice_cache: dict[str, VoiceMetadata] = {}
 
+        # Voice metadata fields as arrays over notes() (keyed by field name)
+        self._voice_columns: dict[str, np.ndarray] = {}
+
+        # Session embeddings as one normalised matrix, built on first use
+        self._embedding_matrix: EmbeddingMatrix | None = None
+
         # Metadata loader for extensible metadata inference
         self._metadata_loader = metadata_loader
 
@@ -331,18 +410,28 @@ class VaultContext:
         # Vector search backend (delegated from session)
         self._backend = session.get_backend()
 
-        # Session embeddings loaded once and cached for the session
-        cursor = vault.db.execute(
-            """
-            SELECT note_path, embedding FROM session_embeddings
-            WHERE session_id = ?
-            """,
-            (session.session_id,),
+        # Session embeddings loaded once and cached for the session. float32
+        # rows decode to views over their blobs; float16/int8 rows stay as
+        # blobs and are decoded on access, so they are held at stored size.
+        blobs: dict[str, bytes] = dict(
+            vault.db.execute(
+                """
+                SELECT note_path, embedding FROM session_embeddings
+                WHERE session_id = ?
+                """,
+                (session.session_id,),
+            ).fetchall()
         )
-        self._embeddings: dict[str, np.ndarray] = {}
-        for row in cursor.fetchall():
-            note_path, embedding_bytes = row
-            self._embeddings[note_path] = np.frombuffer(embedding_bytes, dtype=np.float32)
+        self._embeddings: Mapping[str, np.ndarray]
+        if all(len(blob) == 4 * TOTAL_DIM for blob in blobs.values()):
+            self._embeddings = {
+                path: decode_embedding(blob, TOTAL_DIM) for path, blob in blobs.items()
+            }
+        else:
+            self._embeddings = StoredEmbeddings(blobs, TOTAL_DIM)
+        self._backend.share_rows(self._embeddings)
+        if budget.limited:
+            logger.debug("Memory budget limits: %s", budget.describe(len(self._embeddings)))
 
     # Direct vault access (delegated)
 
@@ -385,6 +474,27 @@ class VaultContext:
         """
         return [n for n in self.notes() if not n.path.startswith("geist journal/")]
 
+    def temporal_index(self, exclude_journal: bool = False) -> TemporalIndex:
+        """Get the session's date index over notes (cached).
+
+        Date-driven geists should query this instead of scanning notes() and
+        comparing datetimes: range queries are a binary search, and calendar
+        day and month lookups are precomputed buckets. Results keep notes()
+        order, so sampling from them is unchanged.
+
+        Args:
+            exclude_journal: Index notes_excluding_journal() instead of notes()
+
+        Returns:
+            TemporalIndex over the chosen notes
+        """
+        index = self._temporal_index_cache.get(exclude_journal)
+        if index is None:
+            notes = self.notes_excluding_journal() if exclude_journal else self.notes()
+            index = TemporalIndex(notes)
+            self._temporal_index_cache[exclude_journal] = index
+        return index
+
     def get_note(self, path: str) -> Note | None:
         """Get specific note by path.
 
@@ -403,23 +513,51 @@ class VaultContext:
             path: Note path
 
         Returns:
-            Embedding array or None if not found. The array is a READ-ONLY
-            view over the cached buffer (np.frombuffer) shared with every
-            other caller this session - in-place mutation raises ValueError
-            by design. Call .copy() if you need a writable array.
+            Embedding array or None if not found. The array is READ-ONLY -
+            a view over the cached buffer (np.frombuffer) shared with every
+            other caller this session, or a frozen decode of a float16/int8
+            row - so in-place mutation raises ValueError by design. Call
+            .copy() if you need a writable array.
         """
         return self._embeddings.get(path)
 
-    def get_all_embeddings(self) -> dict[str, np.ndarray]:
-        """Get all session embeddings as a path-to-embedding dictionary.
+    def get_all_embeddings(self) -> Mapping[str, np.ndarray]:
+        """Get all session embeddings as a path-to-embedding mapping.
 
         Returns:
-            Dictionary mapping note paths to embedding arrays. The arrays are
-            READ-ONLY views shared with every other caller this session (see
-            get_embedding); call .copy() before mutating.
+            Read-only mapping of note paths to embedding arrays. The arrays
+            are READ-ONLY and may be shared with every other caller this
+            session (see get_embedding); call .copy() before mutating.
         """
         return self._embeddings
 
+    def embedding_matrix(self) -> EmbeddingMatrix:
+        """Get the session embeddings as one row-normalised matrix (cached).
+
+        Functions that score many notes against many others (contrarian_to,
+        for one) share this matrix instead of stacking embeddings per call.
+        Notes without an embedding are left out. Rows stored as float16 or
+        int8 are held as float16 here, so the matrix does not undo the saving.
+
+        Returns:
+            EmbeddingMatrix whose rows follow notes() order
+        """
+        if self._embedding_matrix is None:
+            dtype = np.float16 if isinstance(self._embeddings, StoredEmbeddings) else np.float32
+            notes = [note for note in self.notes() if note.path in self._embeddings]
+            if notes:
+                unit = normalise_rows(
+                    np.stack([self._embeddings[note.path] for note in notes]).astype(np.float32)
+                ).astype(dtype, copy=False)
+            else:
+                unit = np.empty((0, TOTAL_DIM), dtype=dtype)
+            self._embedding_matrix = EmbeddingMatrix(
+                notes=notes,
+                rows={note.path: i for i, note in enumerate(notes)},
+                unit=unit,
+            )
+        return self._embedding_matrix
+
     def resolve_link_target(self, target: str) -> Note | None:
         """Resolve a wiki-link target to a Note.
 
@@ -494,14 +632,18 @@ class VaultContext:
         if cache_key in self._neighbours_cache:
             return self._neighbours_cache[cache_key]
 
-        # Get embedding for query note
-        try:
-            query_embedding = self._backend.get_embedding(note.path)
-        except KeyError:
-            return [] if not return_scores else []
+        graph = self.knn_graph()
+        if graph.covers(count):
+            similar = self._graph_neighbours(graph, note.path)
+        else:
+            # Get embedding for query note
+            try:
+                query_embedding = self._backend.get_embedding(note.path)
+            except KeyError:
+                return []
 
-        # Find similar notes (request k+1 to exclude self)
-        similar = self._backend.find_similar(query_embedding, count=count + 1)
+            # Find similar notes (request k+1 to exclude self)
+            similar = self._backend.find_similar(query_embedding, count=count + 1)
 
         # Convert paths to notes using batch loading (OP-6)
         # Collect paths first (excluding self)
@@ -535,6 +677,53 @@ class VaultContext:
             self._neighbours_cache[cache_key] = result
             return result
 
+    def knn_graph(self) -> KnnGraph:
+        """The session's kNN graph (top DEFAULT_KNN_K neighbours per note).
+
+        Loaded from session_knn when the stored graph matches the session,
+        otherwise built once from the session embeddings and stored.
+
+        Returns:
+            KnnGraph shared by neighbours(), surprisal_scores() and
+            neighbour_churn()
+        """
+        if self._knn is None:
+            self._knn = session_knn_graph(
+                self.db,
+                self.session.session_id,
+                self._embeddings,
+                block_size=self._block_rows(),
+            )
+        return self._knn
+
+    def _block_rows(self) -> int:
+        """Rows per block for blocked similarity products over this session."""
+        return self.memory_budget.block_rows(len(self._embeddings))
+
+    def _graph_neighbours(self, graph: KnnGraph, path: str) -> list[tuple[str, float]]:
+        """A note's graph neighbours with exact similarities, best first.
+
+        The graph fixes which notes are neighbours; their scores are
+        recomputed in float64 from the embeddings (the stored float16 scores
+        are too coarse to return) and the row re-sorted by them.
+
+        Args:
+            graph: Session kNN graph
+            path: Query note path
+
+        Returns:
+            (note_path, similarity) for every stored neighbour of the note
+        """
+        neighbour_paths = graph.neighbour_paths(path, graph.k)
+        if not neighbour_paths:
+            return []
+        vectors = normalise_rows(
+            np.stack([self._embeddings[p] for p in [path, *neighbour_paths]]).astype(np.float64)
+        )
+        scores = vectors[1:] @ vectors[0]
+        order = np.argsort(-scores, kind="stable")
+        return [(neighbour_paths[i], float(scores[i])) for i in order]
+
     def similarity(self, a: Note, b: Note) -> float:
         """Calculate semantic similarity between two notes.
 
@@ -837,7 +1026,7 @@ class VaultContext:
     ) -> dict[str, list[Note]]:
         """Group notes by creation date.
 
-        Provides temporal aggregation without exposing SQL implementation.
+        Provides temporal aggregation over the session's temporal index.
         Use this instead of direct database queries for grouping notes by date.
 
         Args:
@@ -846,40 +1035,13 @@ class VaultContext:
 
         Returns:
             Dictionary mapping date strings (YYYY-MM-DD) to lists of notes
-            created on that date, sorted by note count descending
+            created on that date, sorted by note count descending (ties by date)
         """
-        journal_filter = "WHERE NOT path LIKE 'geist journal/%'" if exclude_journal else ""
-
-        cursor = self.db.execute(
-            f"""
-            SELECT DATE(created) as creation_date,
-                   GROUP_CONCAT(path, char(31)) as note_paths
-            FROM notes
-            {journal_filter}
-            GROUP BY DATE(created)
-            HAVING COUNT(*) >= ?
-            ORDER BY COUNT(*) DESC
-            """,
-            (min_per_day,),
-        )
-
-        result: dict[str, list[Note]] = {}
-        for row in cursor.fetchall():
-            date_str, paths_str = row
-            if paths_str:
-                paths = paths_str.split("\x1f")
-                # Batch load notes for efficiency
-                notes_map = self.vault.get_notes_batch(paths)
-                # Preserve order and filter out None
-                notes: list[Note] = []
-                for p in paths:
-                    note = notes_map.get(p)
-                    if note is not None:
-                        notes.append(note)
-                if notes:
-                    result[date_str] = notes
-
-        return result
+        by_date = self.temporal_index(exclude_journal).by_created_date()
+        busy_days = [(day, notes) for day, notes in by_date.items() if len(notes) >= min_per_day]
+        # Stable sort: days with equal counts stay in date order
+        busy_days.sort(key=lambda item: len(item[1]), reverse=True)
+        return dict(busy_days)
 
     def session_count(self) -> int:
         """Get the number of sessions recorded for this vault.
@@ -946,7 +1108,7 @@ class VaultContext:
                 """,
                 (session_id,),
             )
-            embeddings = [np.frombuffer(row[0], dtype=np.float32) for row in emb_cursor.fetchall()]
+            embeddings = [decode_embedding(row[0], TOTAL_DIM) for row in emb_cursor.fetchall()]
             if hasattr(session_date, "strftime"):
                 date_str = session_date.strftime("%Y-%m")
             else:
@@ -1054,6 +1216,7 @@ class VaultContext:
             empty_result: dict[int, Cluster] = {}
             self._clusters_cache[min_size] = empty_result
             return empty_result
+        configure_sklearn()
 
         from . import cluster_labeling
 
@@ -1191,7 +1354,7 @@ class VaultContext:
         return [note for note, _ in similarities[:count]]
 
     def unlinked_pairs(
-        self, count: int = 10, candidate_limit: int = 200
+        self, count: int = 10, candidate_limit: int | None = None
     ) -> list[tuple[Note, Note]]:
         """Find semantically similar note pairs with no links between them.
 
@@ -1201,12 +1364,15 @@ class VaultContext:
 
         Args:
             k: Number of pairs to return
-            candidate_limit: Maximum number of notes to consider (to avoid O(n²) on large vaults)
+            candidate_limit: Maximum number of notes to consider (to avoid O(n²) on
+                large vaults); sized by the memory budget when None
 
         Returns:
             List of (note_a, note_b) tuples sorted by similarity
         """
         all_notes = self.notes()
+        if candidate_limit is None:
+            candidate_limit = self.memory_budget.pair_candidates()
 
         # Optimise for large vaults by limiting candidate set
         if len(all_notes) > candidate_limit:
@@ -1243,25 +1409,19 @@ class VaultContext:
         norms = np.linalg.norm(embeddings_matrix, axis=1)
         similarity_matrix = similarity_matrix / np.outer(norms, norms)
 
-        # Extract high-similarity pairs (upper triangle only, threshold > 0.5)
+        # Extract high-similarity pairs (upper triangle only, threshold > 0.5),
+        # in row-major order
         pairs = []
-        n = len(valid_notes)
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                sim = similarity_matrix[i, j]
+        rows, cols = np.nonzero(np.triu(similarity_matrix > 0.5, 1))
 
-                # Early threshold filter
-                if sim <= 0.5:
-                    continue
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            note_a, note_b = valid_notes[i], valid_notes[j]
 
-                note_a, note_b = valid_notes[i], valid_notes[j]
-
-                # Check if linked (this is now the main bottleneck)
-                if self.links_between(note_a, note_b):
-                    continue
+            # Check if linked (this is now the main bottleneck)
+            if self.links_between(note_a, note_b):
+                continue
 
-                pairs.append((note_a, note_b, sim))
+            pairs.append((note_a, note_b, similarity_matrix[i, j]))
 
         # Sort by similarity descending, return top k
         pairs.sort(key=lambda x: x[2], reverse=True)
@@ -1392,13 +1552,12 @@ class VaultContext:
         Computed for ALL notes in one vectorised pass and session-cached,
         so every geist and vault function shares the result.
 
-        Algorithm (O(N²·d) flops, but as blocked BLAS matmuls, NOT a
-        Python loop):
+        Algorithm:
 
-        1. E = row-normalised embedding matrix (paths in sorted order)
-        2. For each 1024-row block B: S_B = E[B] @ E.T
-        3. Top-k neighbour indices per row via np.argpartition
-        4. centroid_i = normalise(mean(E[topk_i]));
+        1. Top-k neighbour indices per note from the session kNN graph
+           (for k above the graph's K: blocked BLAS matmuls E[B] @ E.T and
+           np.argpartition, O(N²·d) flops)
+        2. centroid_i = normalise(mean(E[topk_i]));
            surprisal_i = 1 - E[i] · centroid_i, clipped to [0.0, 2.0]
 
         Args:
@@ -1412,7 +1571,15 @@ class VaultContext:
         if k_neighbours in self._surprisal_cache:
             return self._surprisal_cache[k_neighbours]
 
-        scores = _surprisal_blocked(self._embeddings, k_neighbours)
+        graph = self.knn_graph()
+        if graph.covers(k_neighbours):
+            scores = _surprisal_from_graph(
+                graph, self._embeddings, k_neighbours, block_size=self._block_rows()
+            )
+        else:
+            scores = _surprisal_blocked(
+                self._embeddings, k_neighbours, block_size=self._block_rows()
+            )
         self._surprisal_cache[k_neighbours] = scores
         return scores
 
@@ -1431,11 +1598,10 @@ class VaultContext:
 
         Implementation:
 
-        1. ONE bulk SELECT loads the historical session's embeddings —
-           never per-note queries
-        2. Two blocked top-k passes (shared helper with surprisal_scores),
-           one per epoch
-        3. Set-based Jaccard per note (O(k) each):
+        1. Each epoch's neighbours come from its session kNN graph; the
+           historical graph is loaded from session_knn, or built from ONE
+           bulk SELECT of that session's embeddings and stored for next time
+        2. Set-based Jaccard per note (O(k) each):
            churn = 1 - |old ∩ new| / |old ∪ new| (0.0 if both empty)
 
         Session-cached per (since_days, k).
@@ -1496,29 +1662,22 @@ class VaultContext:
         if historical_session_id == self.session.session_id:
             return {}
 
-        # ONE bulk SELECT of the historical session's embeddings
-        cursor = self.db.execute(
-            """
-            SELECT note_path, embedding FROM session_embeddings
-            WHERE session_id = ?
-            """,
-            (historical_session_id,),
+        # The historical session's stored graph, or ONE bulk SELECT of its
+        # embeddings to build (and store) it
+        old_graph = session_knn_graph(
+            self.db, historical_session_id, k=k, block_size=self._block_rows()
         )
-        historical: dict[str, np.ndarray] = {}
-        for note_path, embedding_bytes in cursor.fetchall():
-            historical[note_path] = np.frombuffer(embedding_bytes, dtype=np.float32)
-
-        if not historical or not self._embeddings:
+        if not old_graph.paths or not self._embeddings:
             return {}
+        old_sets = old_graph.neighbour_sets(k)
 
-        # Top-k neighbour path sets per epoch (same blocked helper)
-        old_paths = sorted(historical)
-        old_matrix = np.stack([historical[p] for p in old_paths])
-        old_sets = _topk_neighbour_sets(old_matrix, old_paths, k)
-
-        new_paths = sorted(self._embeddings)
-        new_matrix = np.stack([self._embeddings[p] for p in new_paths])
-        new_sets = _topk_neighbour_sets(new_matrix, new_paths, k)
+        new_graph = self.knn_graph()
+        if new_graph.covers(k):
+            new_sets = new_graph.neighbour_sets(k)
+        else:
+            new_paths = sorted(self._embeddings)
+            new_matrix = np.stack([self._embeddings[p] for p in new_paths])
+            new_sets = _topk_neighbour_sets(new_matrix, new_paths, k, block_size=self._block_rows())
 
         # Jaccard churn for notes present in BOTH epochs
         result: dict[str, ChurnResult] = {}
@@ -1546,7 +1705,88 @@ class VaultContext:
         """
         if note.path in self._metadata_cache:
             return self._metadata_cache[note.path]
+        if self._metadata_pending is not None and note.path in self._metadata_pending:
+            return self._metadata_pending[note.path]
+
+        # Batch modules infer every note in one pass rather than one note
+        # per call
+        if self._metadata_loader is not None and getattr(
+            self._metadata_loader, "wants_prefetch", False
+        ):
+            self.prefetch_metadata()
+            if note.path in self._metadata_cache:
+                return self._metadata_cache[note.path]
+
+        metadata = self._builtin_metadata(note)
 
+        # Run metadata inference modules if available
+        if self._metadata_loader is not None:
+            try:
+                inferred, failed_modules = self._metadata_loader.infer_all(note, self)
+                metadata.update(inferred)
+
+                # Track failed modules for this note
+                if failed_modules:
+                    self.metadata_errors[note.path] = failed_modules
+            except Exception as e:
+                # Log error but don't fail - metadata inference is optional
+                logger.error(
+                    f"Error inferring metadata for {note.path}: {e}",
+                    exc_info=True,
+                    extra={"note_path": note.path},
+                )
+
+        self._metadata_cache[note.path] = metadata
+        return metadata
+
+    def prefetch_metadata(self, notes: list[Note] | None = None) -> None:
+        """Infer metadata for many notes in one pass and cache it.
+
+        Runs each inference module once over all uncached notes (see
+        MetadataLoader.infer_many), so `infer_batch` modules amortise their
+        vault-wide work. metadata() calls this itself when the loader has
+        batch modules. While modules run, metadata() on a note
+        being prefetched returns its built-in keys only.
+
+        Args:
+            notes: Notes to prefetch (default: all notes)
+        """
+        if self._metadata_pending is not None:
+            return  # Called from an inference module during a prefetch
+
+        pending = [
+            note
+            for note in (self.notes() if notes is None else notes)
+            if note.path not in self._metadata_cache
+        ]
+        if not pending:
+            return
+
+        builtins = {note.path: self._builtin_metadata(note) for note in pending}
+        inferred: dict[str, tuple[dict[str, Any], list[str]]] = {}
+        if self._metadata_loader is not None:
+            self._metadata_pending = builtins
+            try:
+                inferred = self._metadata_loader.infer_many(pending, self)
+            except Exception as e:
+                # Log error but don't fail - metadata inference is optional
+                logger.error(
+                    f"Error inferring metadata for {len(pending)} notes: {e}", exc_info=True
+                )
+            finally:
+                self._metadata_pending = None
+
+        for note in pending:
+            metadata = dict(builtins[note.path])
+            if note.path in inferred:
+                values, failed_modules = inferred[note.path]
+                metadata.update(values)
+                if failed_modules:
+                    self.metadata_errors[note.path] = failed_modules
+            self._metadata_cache[note.path] = metadata
+
+    def _builtin_metadata(self, note: Note) -> dict[str, Any]:
+        """Compute the built-in metadata keys for a note."""
         # Built-in metadata. "Now" is the session date, not wall-clock, so
         # --date replays stay deterministic (same date + vault = same output).
         session_now = self.session.date
@@ -1581,24 +1821,6 @@ class VaultContext:
         for key, value in compute_voice_metadata(note.content).items():
             metadata.setdefault(key, value)
 
-        # Run metadata inference modules if available
-        if self._metadata_loader is not None:
-            try:
-                inferred, failed_modules = self._metadata_loader.infer_all(note, self)
-                metadata.update(inferred)
-
-                # Track failed modules for this note
-                if failed_modules:
-                    self.metadata_errors[note.path] = failed_modules
-            except Exception as e:
-                # Log error but don't fail - metadata inference is optional
-                logger.error(
-                    f"Error inferring metadata for {note.path}: {e}",
-                    exc_info=True,
-                    extra={"note_path": note.path},
-                )
-
-        self._metadata_cache[note.path] = metadata
         return metadata
 
     def voice(self, note: Note) -> VoiceMetadata:
@@ -1624,8 +1846,47 @@ class VaultContext:
         self._voice_cache[note.path] = voice
         return voice
 
+    def voice_column(self, field: str) -> np.ndarray:
+        """Get one voice metadata field for every note as an array (cached).
+
+        Lets vault functions select notes with one vectorised comparison,
+        e.g. ``vault.voice_column("hedging_ratio") > 0.5``, instead of a
+        Python pass over voice() per call.
+
+        Args:
+            field: VoiceMetadata field name
+
+        Returns:
+            Array of the field's values, aligned with notes()
+
+        Raises:
+            ValueError: If field is not a VoiceMetadata field
+        """
+        column = self._voice_columns.get(field)
+        if column is None:
+            if field not in VoiceMetadata.__dataclass_fields__:
+                raise ValueError(
+                    f"Unknown voice field: {field!r}. "
+                    f"Valid fields: {', '.join(VoiceMetadata.__dataclass_fields__)}"
+                )
+            column = np.array([getattr(self.voice(note), field) for note in self.notes()])
+            self._voice_columns[field] = column
+        return column
+
     # Deterministic sampling
 
+    def reseed(self, key: str) -> None:
+        """Restart the RNG from the session seed and a key.
+
+        The executor reseeds with each geist's id before running it, so a
+        geist's samples do not depend on which geists ran before it (or were
+        skipped by the planner or the output cache).
+
+        Args:
+            key: Stream identifier, e.g. a geist id
+        """
+        self.rng.seed(f"{self.seed}:{key}")
+
     def sample(self, items: list[Any], count: int) -> list[Any]:
         """Deterministically sample k items.
 
@@ -1667,6 +1928,37 @@ class VaultContext:
         else:
             self._functions[name] = func
 
+    def call_function_many(
+        self, name: str, values: list[Any], *args: Any, **kwargs: Any
+    ) -> list[Any]:
+        """Call a registered vault function once per value.
+
+        Equivalent to ``[call_function(name, v, *args, **kwargs) for v in
+        values]``, but a batched function (``@vault_function(...,
+        batched=True)``) computes every value in one call.
+
+        Args:
+            name: Function name
+            values: Values for the function's first argument
+            *args: Remaining positional arguments, shared by every call
+            **kwargs: Keyword arguments, shared by every call
+
+        Returns:
+            One result per value
+
+        Raises:
+            KeyError: If function not found
+        """
+        if self._function_registry is not None:
+            if self._function_registry.has_function(name):
+                return self._function_registry.call_many(name, self, values, *args, **kwargs)
+
+        if name not in self._functions:
+            raise KeyError(f"Function '{name}' not registered")
+
+        func = self._functions[name]
+        return [func(self, value, *args, **kwargs) for value in values]
+
     def call_function(self, name: str, *args: Any, **kwargs: Any) -> Any:
         """Call registered vault function.
 
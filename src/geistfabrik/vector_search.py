@@ -6,13 +6,45 @@ allowing users to choose between in-memory and sqlite-vec implementations.
 
 import sqlite3
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 import numpy as np
-from sklearn.metrics.pairwise import (  # type: ignore[import-untyped]
-    cosine_similarity as sklearn_cosine,
+
+from .config import DEFAULT_RESCORE_FACTOR, TOTAL_DIM
+from .embeddings import pairwise_cosine
+from .quantization import (
+    CompactMatrix,
+    decode_embedding,
+    decode_embeddings,
+    rescore_count,
+    validate_precision,
 )
 
-from .config import TOTAL_DIM
+
+def _select_session_rows(
+    db: sqlite3.Connection, session_id: int, paths: list[str]
+) -> list[tuple[str, bytes]]:
+    """Fetch (note_path, embedding) rows of one session for the given paths.
+
+    Paths are staged in a temp table rather than bound as one variable each,
+    which would hit SQLite's variable limit on large change sets.
+    """
+    if not paths:
+        return []
+    db.execute("CREATE TEMP TABLE IF NOT EXISTS _refresh_paths (path TEXT PRIMARY KEY)")
+    db.execute("DELETE FROM _refresh_paths")
+    db.executemany("INSERT OR IGNORE INTO _refresh_paths (path) VALUES (?)", ((p,) for p in paths))
+    rows = db.execute(
+        """
+        SELECT se.note_path, se.embedding
+        FROM session_embeddings se
+        JOIN _refresh_paths rp ON rp.path = se.note_path
+        WHERE se.session_id = ?
+        """,
+        (session_id,),
+    ).fetchall()
+    db.execute("DELETE FROM _refresh_paths")
+    return rows
 
 
 class VectorSearchBackend(ABC):
@@ -27,6 +59,32 @@ class VectorSearchBackend(ABC):
         """
         pass
 
+    def refresh_embeddings(
+        self, session_date: str, changed_paths: list[str], removed_paths: list[str]
+    ) -> None:
+        """Apply incremental changes to the loaded session embeddings.
+
+        Called after a session re-run rewrote some rows. The default reloads
+        the whole session; backends override it to refresh in place.
+
+        Args:
+            session_date: ISO date string (YYYY-MM-DD)
+            changed_paths: Notes whose rows were inserted or rewritten
+            removed_paths: Notes whose rows were deleted
+        """
+        self.load_embeddings(session_date)
+
+    def share_rows(self, rows: Mapping[str, np.ndarray]) -> None:
+        """Offer the loaded session's embeddings, already decoded by the caller.
+
+        VaultContext holds the session's rows anyway; a backend that would
+        otherwise read them again may use these until its next load or
+        refresh. The default ignores them.
+
+        Args:
+            rows: Note path -> float32 embedding for the loaded session
+        """
+
     @abstractmethod
     def find_similar(self, query_embedding: np.ndarray, count: int = 10) -> list[tuple[str, float]]:
         """Find k most similar notes to query embedding.
@@ -71,6 +129,25 @@ class VectorSearchBackend(ABC):
         """
         pass
 
+    def get_embeddings(self, paths: list[str]) -> np.ndarray:
+        """Get embedding vectors for several notes at once.
+
+        The default stacks get_embedding() calls; backends override it when
+        a batched read is cheaper.
+
+        Args:
+            paths: Note paths
+
+        Returns:
+            Matrix of shape (len(paths), dim), rows in the order of paths
+
+        Raises:
+            KeyError: If any note path not found
+        """
+        if not paths:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack([self.get_embedding(path) for path in paths])
+
 
 class InMemoryVectorBackend(VectorSearchBackend):
     """In-memory vector search using Python cosine similarity.
@@ -83,21 +160,46 @@ class InMemoryVectorBackend(VectorSearchBackend):
     - Loads all embeddings into memory
     - Pure Python, no external dependencies
     - Memory usage: ~50 bytes per dimension per note
+
+    At reduced precision only the compact matrix stays resident. The float32
+    rows needed to rescore candidates, get_embedding() and get_similarity()
+    come from rows shared by the caller (see share_rows), or are read from
+    the database on demand.
     """
 
-    def __init__(self, db: sqlite3.Connection):
+    def __init__(
+        self,
+        db: sqlite3.Connection,
+        precision: str = "float32",
+        rescore_factor: int = DEFAULT_RESCORE_FACTOR,
+    ):
         """Initialise in-memory backend.
 
         Args:
             db: SQLite database connection
+            precision: Precision of the search matrix ("float32", "float16"
+                or "int8"). Reduced precisions scan a compact copy and
+                rescore the best candidates in float32.
+            rescore_factor: Candidates rescored per result wanted, at
+                reduced precision
+
+        Raises:
+            ValueError: If the precision is unknown
         """
         self.db = db
+        self.precision = validate_precision(precision)
+        self.rescore_factor = rescore_factor
         self.embeddings: dict[str, np.ndarray] = {}
         self.session_id: int = 0
         # Cached stacked matrix + parallel path index for vectorised search.
         # Rebuilt whenever embeddings change (see _rebuild_matrix).
         self._paths: list[str] = []
         self._matrix: np.ndarray | None = None
+        # Reduced precision: the compact matrix, the paths it covers and
+        # float32 rows shared by the caller (self.embeddings stays empty)
+        self._compact: CompactMatrix | None = None
+        self._compact_paths: set[str] = set()
+        self._shared_rows: Mapping[str, np.ndarray] | None = None
 
     def _rebuild_matrix(self) -> None:
         """Rebuild the cached embedding matrix and path index from self.embeddings.
@@ -107,10 +209,49 @@ class InMemoryVectorBackend(VectorSearchBackend):
         operation instead of an O(N) Python loop of per-pair calls.
         """
         self._paths = list(self.embeddings.keys())
-        if self._paths:
-            self._matrix = np.vstack([self.embeddings[p] for p in self._paths])
-        else:
-            self._matrix = None
+        self._matrix = np.vstack([self.embeddings[p] for p in self._paths]) if self._paths else None
+
+    def _load_compact(self, rows: list[tuple[str, bytes]]) -> None:
+        """Build the compact matrix from a session's rows.
+
+        The decoded float32 matrix exists only while it is quantised.
+        """
+        self._paths = [path for path, _ in rows]
+        self._compact_paths = set(self._paths)
+        self._compact = None
+        self._shared_rows = None
+        if rows:
+            matrix = decode_embeddings([blob for _, blob in rows], TOTAL_DIM)
+            self._compact = CompactMatrix(matrix, self.precision)
+
+    def share_rows(self, rows: Mapping[str, np.ndarray]) -> None:
+        """Rescore from the caller's decoded rows instead of the database.
+
+        Only used at reduced precision, where this backend keeps no float32
+        rows of its own. Dropped on the next load or refresh.
+
+        Args:
+            rows: Note path -> float32 embedding for the loaded session
+        """
+        if self.precision != "float32":
+            self._shared_rows = rows
+
+    def _exact_rows(self, paths: list[str]) -> np.ndarray:
+        """float32 rows for paths loaded at reduced precision, in order.
+
+        Raises:
+            KeyError: If a path is not in the loaded session
+        """
+        for path in paths:
+            if path not in self._compact_paths:
+                raise KeyError(f"Note not found: {path}")
+        shared = self._shared_rows
+        if shared is not None and all(path in shared for path in paths):
+            matrix = np.vstack([shared[path] for path in paths])
+            matrix.flags.writeable = False
+            return matrix
+        found = dict(_select_session_rows(self.db, self.session_id, paths))
+        return decode_embeddings([found[path] for path in paths], TOTAL_DIM)
 
     def load_embeddings(self, session_date: str) -> None:
         """Load all embeddings for session into memory.
@@ -125,7 +266,10 @@ class InMemoryVectorBackend(VectorSearchBackend):
             # No session found, embeddings will be empty
             self.embeddings = {}
             self.session_id = 0
-            self._rebuild_matrix()
+            if self.precision == "float32":
+                self._rebuild_matrix()
+            else:
+                self._load_compact([])
             return
 
         self.session_id = int(row[0])
@@ -141,10 +285,36 @@ class InMemoryVectorBackend(VectorSearchBackend):
         )
 
         self.embeddings = {}
+        if self.precision != "float32":
+            self._load_compact(cursor.fetchall())
+            return
         for row in cursor:
             path, blob = row
-            embedding = np.frombuffer(blob, dtype=np.float32)
-            self.embeddings[path] = embedding
+            self.embeddings[path] = decode_embedding(blob, TOTAL_DIM)
+
+        self._rebuild_matrix()
+
+    def refresh_embeddings(
+        self, session_date: str, changed_paths: list[str], removed_paths: list[str]
+    ) -> None:
+        """Patch changed and removed rows instead of reloading the session.
+
+        The compact matrix of a reduced-precision backend is rebuilt from a
+        reload instead, as it keeps no float32 rows to patch.
+
+        Args:
+            session_date: ISO date string (YYYY-MM-DD)
+            changed_paths: Notes whose rows were inserted or rewritten
+            removed_paths: Notes whose rows were deleted
+        """
+        if self.session_id == 0 or self.precision != "float32":
+            self.load_embeddings(session_date)
+            return
+
+        for path in removed_paths:
+            self.embeddings.pop(path, None)
+        for path, blob in _select_session_rows(self.db, self.session_id, changed_paths):
+            self.embeddings[path] = decode_embedding(blob, TOTAL_DIM)
 
         self._rebuild_matrix()
 
@@ -164,12 +334,18 @@ class InMemoryVectorBackend(VectorSearchBackend):
             List of (note_path, similarity_score) tuples, sorted descending
         """
         # Defensive: rebuild if embeddings were mutated since the last load.
-        if self._matrix is None or len(self._paths) != len(self.embeddings):
+        if self.precision == "float32" and (
+            len(self._paths) != len(self.embeddings) or self._matrix is None
+        ):
             self._rebuild_matrix()
-        if self._matrix is None or count <= 0:
+        if count <= 0:
+            return []
+        if self._compact is not None:
+            return self._find_similar_compact(self._compact, query_embedding, count)
+        if self._matrix is None:
             return []
 
-        scores = sklearn_cosine(query_embedding.reshape(1, -1), self._matrix)[0]
+        scores = pairwise_cosine(query_embedding.reshape(1, -1), self._matrix)[0]
         n = scores.shape[0]
         if count >= n:
             # Full stable sort: descending by score, ties keep insertion order.
@@ -186,6 +362,24 @@ class InMemoryVectorBackend(VectorSearchBackend):
             order = cand[np.argsort(-scores[cand], kind="stable")][:count]
         return [(self._paths[int(i)], float(scores[int(i)])) for i in order]
 
+    def _find_similar_compact(
+        self, compact: CompactMatrix, query_embedding: np.ndarray, count: int
+    ) -> list[tuple[str, float]]:
+        """Scan the compact matrix, then rescore the best candidates in float32.
+
+        Scores of returned notes are exact; a note can be missed only when
+        the reduced-precision scan ranks it below rescore_factor * count
+        others (see quantization.neighbour_recall).
+        """
+        # Ascending indices, so the stable sort keeps insertion order on ties
+        candidates = np.sort(
+            compact.candidates(query_embedding, rescore_count(count, self.rescore_factor))
+        )
+        matrix = self._exact_rows([self._paths[int(i)] for i in candidates])
+        scores = pairwise_cosine(query_embedding.reshape(1, -1), matrix)[0]
+        order = np.argsort(-scores, kind="stable")[:count]
+        return [(self._paths[int(candidates[i])], float(scores[i])) for i in order]
+
     def get_similarity(self, path_a: str, path_b: str) -> float:
         """Compute similarity between two notes.
 
@@ -201,6 +395,9 @@ class InMemoryVectorBackend(VectorSearchBackend):
         """
         from .embeddings import cosine_similarity
 
+        if self.precision != "float32":
+            emb_a, emb_b = self._exact_rows([path_a, path_b])
+            return cosine_similarity(emb_a, emb_b)
         if path_a not in self.embeddings:
             raise KeyError(f"Note not found: {path_a}")
         if path_b not in self.embeddings:
@@ -223,6 +420,9 @@ class InMemoryVectorBackend(VectorSearchBackend):
         Raises:
             KeyError: If note path not found
         """
+        if self.precision != "float32":
+            row: np.ndarray = self._exact_rows([path])[0]
+            return row
         if path not in self.embeddings:
             raise KeyError(f"Note not found: {path}")
         return self.embeddings[path]
@@ -240,6 +440,9 @@ class SqliteVecBackend(VectorSearchBackend):
     - Uses vec0 virtual table with path mapping
     """
 
+    # Batches of at least this many paths are read with one vec_search scan
+    SCAN_THRESHOLD = 256
+
     def __init__(self, db: sqlite3.Connection, dim: int = TOTAL_DIM):
         """Initialise sqlite-vec backend.
 
@@ -256,6 +459,8 @@ class SqliteVecBackend(VectorSearchBackend):
         self.session_id: int = 0
         self._path_to_id: dict[str, int] = {}  # Cache for path -> vec_id mapping
         self._id_to_path: dict[int, str] = {}  # Cache for vec_id -> path mapping
+        # vec_search rows inserted, updated or deleted by the last load/refresh
+        self.rows_written = 0
         self._setup_vec_tables()
 
     def _setup_vec_tables(self) -> None:
@@ -288,8 +493,53 @@ class SqliteVecBackend(VectorSearchBackend):
             )
         """)
 
+        # Which session vec_search mirrors. Rows of session_embeddings can
+        # vanish through note cascades without the vault hash changing, so
+        # the row count is recorded alongside it.
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS vec_search_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                session_id INTEGER NOT NULL,
+                vault_state_hash TEXT NOT NULL,
+                row_count INTEGER NOT NULL
+            )
+        """)
+
         self.db.commit()
 
+    def _vec0_blob(self, blob: bytes) -> bytes:
+        """Convert a stored embedding to the float32 bytes vec0 expects.
+
+        Rows stored at reduced precision (database.embedding_precision) are
+        decoded; float32 rows pass through unchanged.
+        """
+        if len(blob) == 4 * self.dim:
+            return blob
+        return decode_embedding(blob, self.dim).tobytes()
+
+    def _load_path_mapping(self) -> None:
+        """Fill both mapping caches from vec_path_mapping in a single scan."""
+        self._path_to_id = {}
+        self._id_to_path = {}
+        for vec_id, path in self.db.execute("SELECT vec_id, note_path FROM vec_path_mapping"):
+            self._path_to_id[path] = vec_id
+            self._id_to_path[vec_id] = path
+
+    def _ensure_vec_ids(self, paths: list[str]) -> None:
+        """Make sure every path has a vec_id, creating the missing ones in bulk.
+
+        Args:
+            paths: Note paths that are about to be written to vec_search
+        """
+        missing = [path for path in paths if path not in self._path_to_id]
+        if not missing:
+            return
+        self.db.executemany(
+            "INSERT OR IGNORE INTO vec_path_mapping (note_path) VALUES (?)",
+            ((path,) for path in missing),
+        )
+        self._load_path_mapping()
+
     def _get_or_create_vec_id(self, path: str) -> int:
         """Get or create a vec_id for a note path.
 
@@ -299,30 +549,8 @@ class SqliteVecBackend(VectorSearchBackend):
         Returns:
             Integer ID for use as vec_search rowid
         """
-        # Check cache first
-        if path in self._path_to_id:
-            return self._path_to_id[path]
-
-        # Check database
-        cursor = self.db.execute("SELECT vec_id FROM vec_path_mapping WHERE note_path = ?", (path,))
-        row = cursor.fetchone()
-
-        if row is not None:
-            vec_id = int(row[0])
-            self._path_to_id[path] = vec_id
-            self._id_to_path[vec_id] = path
-            return vec_id
-
-        # Create new mapping
-        cursor = self.db.execute("INSERT INTO vec_path_mapping (note_path) VALUES (?)", (path,))
-        lastrowid = cursor.lastrowid
-        if lastrowid is None:
-            raise RuntimeError(f"Failed to create vec_id for path: {path}")
-
-        vec_id = lastrowid
-        self._path_to_id[path] = vec_id
-        self._id_to_path[vec_id] = path
-        return vec_id
+        self._ensure_vec_ids([path])
+        return self._path_to_id[path]
 
     def _get_path_from_vec_id(self, vec_id: int) -> str:
         """Get note path from vec_id.
@@ -336,70 +564,190 @@ class SqliteVecBackend(VectorSearchBackend):
         Raises:
             KeyError: If vec_id not found
         """
-        # Check cache first
-        if vec_id in self._id_to_path:
-            return self._id_to_path[vec_id]
-
-        # Check database
-        cursor = self.db.execute(
-            "SELECT note_path FROM vec_path_mapping WHERE vec_id = ?", (vec_id,)
-        )
-        row = cursor.fetchone()
-
-        if row is None:
+        if vec_id not in self._id_to_path:
+            # Another connection may have added mappings since the last scan
+            self._load_path_mapping()
+        if vec_id not in self._id_to_path:
             raise KeyError(f"vec_id not found: {vec_id}")
-
-        path = str(row[0])
-        self._path_to_id[path] = vec_id
-        self._id_to_path[vec_id] = path
-        return path
+        return self._id_to_path[vec_id]
 
     def load_embeddings(self, session_date: str) -> None:
-        """Load embeddings into vec0 virtual table.
+        """Bring vec_search in line with a session's embeddings.
+
+        vec_search lives in the database file and usually still holds the
+        previous session's vectors, which mostly match the new ones. Instead
+        of clearing and re-inserting every row, only inserted, changed and
+        stale rows are written, each group with a single executemany. The
+        diff runs against the session vec_search is known to mirror when
+        there is one, otherwise against the stored vectors themselves.
 
         Args:
             session_date: ISO date string (YYYY-MM-DD)
         """
         self.session_date = session_date
+        self.rows_written = 0
+        self._load_path_mapping()
 
         # Get session_id from date
         cursor = self.db.execute("SELECT session_id FROM sessions WHERE date = ?", (session_date,))
         row = cursor.fetchone()
         if row is None:
-            # No session found, clear caches
+            # No session found, nothing to search
             self.session_id = 0
-            self._path_to_id = {}
-            self._id_to_path = {}
             return
 
         self.session_id = int(row[0])
 
-        # Clear existing vec_search data and caches
-        self.db.execute("DELETE FROM vec_search")
-        self._path_to_id = {}
-        self._id_to_path = {}
+        mirrored = self._mirrored_session()
+        if mirrored is not None:
+            inserts, updates, deletes = self._diff_against_session(mirrored)
+        else:
+            inserts, updates, deletes = self._diff_against_vec_search()
 
-        # Load from session_embeddings into vec_search
-        cursor = self.db.execute(
+        self.db.executemany("DELETE FROM vec_search WHERE rowid = ?", deletes)
+        self.db.executemany("UPDATE vec_search SET embedding = ? WHERE rowid = ?", updates)
+        self.db.executemany("INSERT INTO vec_search(rowid, embedding) VALUES (?, ?)", inserts)
+        self._record_state()
+        self.db.commit()
+        self.rows_written = len(inserts) + len(updates) + len(deletes)
+
+    def _mirrored_session(self) -> int | None:
+        """Return the session vec_search provably still mirrors, if any.
+
+        That is the session recorded by the last load or refresh, provided
+        its vault hash and row count are unchanged since.
+        """
+        row = self.db.execute(
+            """
+            SELECT st.session_id
+            FROM vec_search_state st
+            JOIN sessions s ON s.session_id = st.session_id
+            WHERE s.vault_state_hash = st.vault_state_hash
+              AND st.row_count = (
+                  SELECT COUNT(*) FROM session_embeddings WHERE session_id = st.session_id
+              )
+            """
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def _record_state(self) -> None:
+        """Record that vec_search now mirrors the current session."""
+        self.db.execute("DELETE FROM vec_search_state")
+        self.db.execute(
+            """
+            INSERT INTO vec_search_state (id, session_id, vault_state_hash, row_count)
+            SELECT 1, session_id, vault_state_hash,
+                   (SELECT COUNT(*) FROM session_embeddings WHERE session_id = ?)
+            FROM sessions
+            WHERE session_id = ? AND vault_state_hash IS NOT NULL
+            """,
+            (self.session_id, self.session_id),
+        )
+
+    def _diff_against_session(
+        self, mirrored: int
+    ) -> tuple[list[tuple[int, bytes]], list[tuple[bytes, int]], list[tuple[int]]]:
+        """Diff the current session against the session vec_search mirrors.
+
+        Both sides are ordinary table rows, so this never reads vec0; reopening
+        the mirrored session returns three empty lists.
+
+        Returns:
+            (inserts, updates, deletes) parameter lists for executemany
+        """
+        changed = self.db.execute(
+            """
+            SELECT se.note_path, se.embedding, old.note_path IS NOT NULL
+            FROM session_embeddings se
+            LEFT JOIN session_embeddings old
+                ON old.session_id = ? AND old.note_path = se.note_path
+            WHERE se.session_id = ?
+              AND (old.embedding IS NULL OR old.embedding != se.embedding)
+            """,
+            (mirrored, self.session_id),
+        ).fetchall()
+        removed = [
+            path
+            for (path,) in self.db.execute(
+                """
+                SELECT old.note_path
+                FROM session_embeddings old
+                WHERE old.session_id = ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM session_embeddings se
+                      WHERE se.session_id = ? AND se.note_path = old.note_path
+                  )
+                """,
+                (mirrored, self.session_id),
+            )
+        ]
+        self._ensure_vec_ids([path for path, _, _ in changed])
+        changed = [(path, self._vec0_blob(blob), existed) for path, blob, existed in changed]
+        inserts = [(self._path_to_id[path], blob) for path, blob, existed in changed if not existed]
+        updates = [(blob, self._path_to_id[path]) for path, blob, existed in changed if existed]
+        deletes = [(self._path_to_id[path],) for path in removed if path in self._path_to_id]
+        return inserts, updates, deletes
+
+    def _diff_against_vec_search(
+        self,
+    ) -> tuple[list[tuple[int, bytes]], list[tuple[bytes, int]], list[tuple[int]]]:
+        """Diff the current session against the vectors stored in vec_search.
+
+        Used when it is unknown what vec_search holds. Reads every stored
+        vector once, which is still far cheaper than rewriting them.
+
+        Returns:
+            (inserts, updates, deletes) parameter lists for executemany
+        """
+        rows = self.db.execute(
             """
             SELECT note_path, embedding
             FROM session_embeddings
             WHERE session_id = ?
             """,
             (self.session_id,),
-        )
+        ).fetchall()
+        self._ensure_vec_ids([path for path, _ in rows])
+        wanted = {self._path_to_id[path]: self._vec0_blob(blob) for path, blob in rows}
+
+        current = dict(self.db.execute("SELECT rowid, embedding FROM vec_search"))
+        inserts = [(vec_id, blob) for vec_id, blob in wanted.items() if vec_id not in current]
+        updates = [
+            (blob, vec_id)
+            for vec_id, blob in wanted.items()
+            if vec_id in current and current[vec_id] != blob
+        ]
+        deletes = [(vec_id,) for vec_id in current if vec_id not in wanted]
+        return inserts, updates, deletes
+
+    def refresh_embeddings(
+        self, session_date: str, changed_paths: list[str], removed_paths: list[str]
+    ) -> None:
+        """Rewrite only the changed and removed rows of vec_search.
 
-        for path, blob in cursor:
-            embedding = np.frombuffer(blob, dtype=np.float32)
-            vec_id = self._get_or_create_vec_id(path)
-
-            # Insert into vec_search using vec_id as rowid
-            self.db.execute(
-                "INSERT INTO vec_search(rowid, embedding) VALUES (?, ?)",
-                (vec_id, embedding.tobytes()),
-            )
+        Args:
+            session_date: ISO date string (YYYY-MM-DD)
+            changed_paths: Notes whose rows were inserted or rewritten
+            removed_paths: Notes whose rows were deleted
+        """
+        if self.session_id == 0 or session_date != self.session_date:
+            self.load_embeddings(session_date)
+            return
 
+        rows = _select_session_rows(self.db, self.session_id, changed_paths)
+        self._ensure_vec_ids([*removed_paths, *changed_paths])
+        # vec0 has no upsert, so rewritten rows are deleted and re-inserted
+        self.db.executemany(
+            "DELETE FROM vec_search WHERE rowid = ?",
+            [(self._path_to_id[path],) for path in [*removed_paths, *changed_paths]],
+        )
+        self.db.executemany(
+            "INSERT INTO vec_search(rowid, embedding) VALUES (?, ?)",
+            [(self._path_to_id[path], self._vec0_blob(blob)) for path, blob in rows],
+        )
+        self._record_state()
         self.db.commit()
+        self.rows_written = len(removed_paths) + len(changed_paths)
 
     def find_similar(self, query_embedding: np.ndarray, count: int = 10) -> list[tuple[str, float]]:
         """Find similar notes via sqlite-vec.
@@ -411,14 +759,17 @@ class SqliteVecBackend(VectorSearchBackend):
         Returns:
             List of (note_path, similarity_score) tuples, sorted descending
         """
-        # Query vec_search for similar vectors
+        if count <= 0:
+            return []
+
+        # Query vec_search for similar vectors. "k = ?" rather than LIMIT:
+        # SQLite before 3.41 does not pass LIMIT down to virtual tables.
         cursor = self.db.execute(
             """
             SELECT rowid, distance
             FROM vec_search
-            WHERE embedding MATCH ?
+            WHERE embedding MATCH ? AND k = ?
             ORDER BY distance
-            LIMIT ?
             """,
             (query_embedding.astype(np.float32).tobytes(), count),
         )
@@ -464,6 +815,18 @@ class SqliteVecBackend(VectorSearchBackend):
 
         return cosine_similarity(emb_a, emb_b)
 
+    def _vec_id(self, path: str) -> int:
+        """Look up the vec_id of a note path.
+
+        Raises:
+            KeyError: If note path not found
+        """
+        if path not in self._path_to_id:
+            self._load_path_mapping()
+        if path not in self._path_to_id:
+            raise KeyError(f"Note not found: {path}")
+        return self._path_to_id[path]
+
     def get_embedding(self, path: str) -> np.ndarray:
         """Get embedding for a note.
 
@@ -476,22 +839,7 @@ class SqliteVecBackend(VectorSearchBackend):
         Raises:
             KeyError: If note path not found
         """
-        # Get vec_id for path
-        if path not in self._path_to_id:
-            # Try to load from database
-            cursor = self.db.execute(
-                "SELECT vec_id FROM vec_path_mapping WHERE note_path = ?", (path,)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                raise KeyError(f"Note not found: {path}")
-            vec_id = int(row[0])
-            self._path_to_id[path] = vec_id
-            self._id_to_path[vec_id] = path
-        else:
-            vec_id = self._path_to_id[path]
-
-        # Get embedding from vec_search
+        vec_id = self._vec_id(path)
         cursor = self.db.execute("SELECT embedding FROM vec_search WHERE rowid = ?", (vec_id,))
         row = cursor.fetchone()
 
@@ -499,3 +847,43 @@ class SqliteVecBackend(VectorSearchBackend):
             raise KeyError(f"Note not found in vec_search: {path}")
 
         return np.frombuffer(row[0], dtype=np.float32)
+
+    def get_embeddings(self, paths: list[str]) -> np.ndarray:
+        """Get embeddings for several notes at once.
+
+        vec0 answers rowid equality with an index lookup but serves
+        ``rowid IN (...)`` and joins with a full scan. Small batches therefore
+        use point lookups; larger ones read vec_search once and pick rows out.
+
+        Args:
+            paths: Note paths
+
+        Returns:
+            Matrix of shape (len(paths), dim), rows in the order of paths
+
+        Raises:
+            KeyError: If any note path not found
+        """
+        vec_ids = [self._vec_id(path) for path in paths]
+        if len(vec_ids) < self.SCAN_THRESHOLD:
+            blobs: dict[int, bytes] = {}
+            for vec_id in set(vec_ids):
+                row = self.db.execute(
+                    "SELECT embedding FROM vec_search WHERE rowid = ?", (vec_id,)
+                ).fetchone()
+                if row is not None:
+                    blobs[vec_id] = row[0]
+        else:
+            wanted = set(vec_ids)
+            blobs = {
+                vec_id: blob
+                for vec_id, blob in self.db.execute("SELECT rowid, embedding FROM vec_search")
+                if vec_id in wanted
+            }
+
+        matrix = np.empty((len(paths), self.dim), dtype=np.float32)
+        for i, (path, vec_id) in enumerate(zip(paths, vec_ids)):
+            if vec_id not in blobs:
+                raise KeyError(f"Note not found in vec_search: {path}")
+            matrix[i] = np.frombuffer(blobs[vec_id], dtype=np.float32)
+        return matrix
@@ -555,7 +555,7 @@ Entry A2.
 
     # Re-sync
     count = vault.sync()
-    assert count == 2  # Only Journal A reprocessed (2 entries)
+    assert count == 1  # Only the edited entry of Journal A is rewritten
 
     entry_a = vault.get_note("Journal A.md/2025-01-15")
     assert "Modified entry A" in entry_a.content
@@ -563,6 +563,54 @@ Entry A2.
     vault.close()
 
 
+def test_sync_journal_edit_keeps_untouched_entries(tmp_path: Path) -> None:
+    """Editing one entry leaves the other entries' rows (and caches) alone."""
+    import os
+
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    journal = vault_path / "Journal.md"
+    journal.write_text("""
+## 2025-01-15
+Entry one.
+
+## 2025-01-16
+Entry two.
+
+## 2025-01-17
+Entry three.
+""")
+
+    vault = Vault(vault_path)
+    assert vault.sync() == 3
+    vault.db.executemany(
+        "INSERT INTO embeddings (note_path, embedding, model_version, computed_at) "
+        "VALUES (?, x'00', 'm', '')",
+        [(f"Journal.md/2025-01-{day}",) for day in (15, 16, 17)],
+    )
+    vault.db.commit()
+
+    journal.write_text("""
+## 2025-01-15
+Entry one.
+
+## 2025-01-16
+Entry two, edited.
+""")
+    stat = journal.stat()
+    os.utime(journal, (stat.st_atime, stat.st_mtime + 10))
+
+    assert vault.sync() == 1  # Only the edited entry is rewritten
+    cached = {row[0] for row in vault.db.execute("SELECT note_path FROM embeddings")}
+    assert cached == {"Journal.md/2025-01-15"}
+    assert vault.get_note("Journal.md/2025-01-17") is None
+    assert "edited" in vault.get_note("Journal.md/2025-01-16").content
+
+    # Unchanged entries picked up the new mtime, so nothing is re-split
+    assert vault.sync() == 0
+    vault.close()
+
+
 def test_journal_becomes_regular(tmp_path: Path) -> None:
     """Test file changes to no longer match pattern."""
     vault_path = tmp_path / "vault"
@@ -16,9 +16,10 @@ from geistfabrik.embeddings import (
     EmbeddingComputer,
     Session,
     cosine_similarity,
+    load_cached_semantic_embeddings,
 )
 from geistfabrik.models import Note
-from geistfabrik.schema import init_db
+from geistfabrik.schema import content_hash, init_db
 
 # Mark all tests as slow and integration
 pytestmark = [
@@ -171,6 +172,12 @@ def test_real_session_embeddings(db_with_notes, sample_notes):
 
 def test_real_semantic_cache(db_with_notes, sample_notes):
     """Test that semantic embeddings are cached correctly with real model."""
+    # The cache probe matches rows against the hashes stored at sync time
+    db_with_notes.executemany(
+        "UPDATE notes SET content_hash = ? WHERE path = ?",
+        [(content_hash(note.content), note.path) for note in sample_notes],
+    )
+
     # First session computes embeddings
     session1 = Session(datetime(2023, 6, 15), db_with_notes)
     session1.compute_embeddings(sample_notes)
@@ -182,8 +189,8 @@ def test_real_semantic_cache(db_with_notes, sample_notes):
     session2 = Session(datetime(2023, 6, 16), db_with_notes)
 
     # Check cache before computing
-    cached_semantic = session2._get_cached_semantic_embedding(sample_notes[0])
-    assert cached_semantic is not None, "Semantic embedding should be cached"
+    cached, _, _ = load_cached_semantic_embeddings(db_with_notes, sample_notes[:1])
+    assert cached == sample_notes[:1], "Semantic embedding should be cached"
 
     # Compute embeddings for session 2
     session2.compute_embeddings(sample_notes)
@@ -1,13 +1,67 @@
 """Shared test fixtures for unit tests."""
 
+from collections.abc import Callable, Generator
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
+from geistfabrik import Vault, VaultContext
+from geistfabrik.embeddings import Session
 from geistfabrik.models import Note
 
+# Notes of the `vault` fixture unless a test or module marks it with
+# @pytest.mark.vault_notes({filename: content}, db=...)
+DEFAULT_VAULT_NOTES = {
+    "a.md": "# A\n\nLinks to [[b]].",
+    "b.md": "# B\n\nBody.",
+}
+
+# Session date of contexts built by `make_context` unless given another
+SESSION_DATE = datetime(2023, 6, 15)
+
+
+@pytest.fixture
+def vault(request: pytest.FixtureRequest, tmp_path: Path) -> Generator[Vault, None, None]:
+    """A synced vault in tmp_path/vault, in-memory database by default.
+
+    Holds DEFAULT_VAULT_NOTES; mark a test or module with
+    ``@pytest.mark.vault_notes({filename: content})`` to write other notes,
+    adding ``db="relative/path.db"`` for an on-disk database in the vault.
+    """
+    marker = request.node.get_closest_marker("vault_notes")
+    notes = marker.args[0] if marker is not None else DEFAULT_VAULT_NOTES
+    db = marker.kwargs.get("db") if marker is not None else None
+    root = tmp_path / "vault"
+    root.mkdir()
+    for filename, content in notes.items():
+        (root / filename).write_text(content)
+    db_path: Path | str = ":memory:"
+    if db is not None:
+        db_path = root / db
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+    vault = Vault(root, db_path)
+    vault.sync()
+    yield vault
+    vault.close()
+
+
+@pytest.fixture
+def make_context(vault: Vault) -> Callable[..., VaultContext]:
+    """Build VaultContexts over the `vault` fixture.
+
+    Call with an optional session date (default SESSION_DATE); other keyword
+    arguments go to VaultContext.
+    """
+
+    def make(date: datetime = SESSION_DATE, **kwargs: Any) -> VaultContext:
+        return VaultContext(vault, Session(date, vault.db), **kwargs)
+
+    return make
+
 
 @pytest.fixture
 def sample_notes():
@@ -0,0 +1,113 @@
+"""Tests for bulk historical session backfill (geistfabrik backfill)."""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from geistfabrik.backfill import backfill_sessions, session_dates
+from geistfabrik.embeddings import EmbeddingComputer, Session, temporal_feature_matrix
+from geistfabrik.vault import Vault
+
+# The backfill command opens the vault's own database
+pytestmark = pytest.mark.vault_notes(
+    {f"note {i}.md": f"# Note {i}\n\nAbout topic {i}." for i in range(5)},
+    db="_geistfabrik/vault.db",
+)
+
+
+def _rows(vault: Vault, date: str) -> dict[str, bytes]:
+    return dict(
+        vault.db.execute(
+            """
+            SELECT note_path, embedding FROM session_embeddings
+            JOIN sessions USING (session_id) WHERE date = ?
+            """,
+            (date,),
+        ).fetchall()
+    )
+
+
+def test_session_dates() -> None:
+    dates = session_dates(datetime(2025, 1, 1, 9, 30), datetime(2025, 1, 15), every=7)
+    assert dates == [datetime(2025, 1, 1), datetime(2025, 1, 8), datetime(2025, 1, 15)]
+    assert session_dates(datetime(2025, 1, 1), datetime(2025, 1, 1)) == [datetime(2025, 1, 1)]
+    with pytest.raises(ValueError, match="before start"):
+        session_dates(datetime(2025, 1, 2), datetime(2025, 1, 1))
+    with pytest.raises(ValueError, match="at least 1"):
+        session_dates(datetime(2025, 1, 1), datetime(2025, 1, 2), every=0)
+
+
+def test_temporal_feature_matrix_matches_per_note_features(vault: Vault) -> None:
+    notes = vault.all_notes()
+    dates = [datetime(2024, 2, 29), datetime(2025, 12, 31)]
+    matrix = temporal_feature_matrix(notes, dates)
+    assert matrix.shape == (2, len(notes), 3)
+    computer = EmbeddingComputer()
+    for d, date in enumerate(dates):
+        for n, note in enumerate(notes):
+            assert np.array_equal(matrix[d, n], computer.compute_temporal_features(note, date))
+
+
+def test_backfill_matches_per_session_embeddings(vault: Vault, tmp_path: Path) -> None:
+    notes = vault.all_notes()
+    dates = session_dates(datetime(2025, 1, 1), datetime(2025, 1, 10), every=3)
+    report = backfill_sessions(vault.db, notes, dates)
+    assert report.written == ["2025-01-01", "2025-01-04", "2025-01-07", "2025-01-10"]
+    assert report.skipped == []
+
+    # The same dates computed one session at a time, as invoke --date would
+    other = Vault(vault.vault_path, tmp_path / "other.db")
+    other.sync()
+    for date in dates:
+        Session(date, other.db).compute_embeddings(other.all_notes())
+        key = date.strftime("%Y-%m-%d")
+        assert _rows(vault, key) == _rows(other, key)
+    other.close()
+
+    again = backfill_sessions(vault.db, notes, dates)
+    assert again.written == []
+    assert len(again.skipped) == 4
+
+
+def test_backfill_rewrites_sessions_after_an_edit(vault: Vault) -> None:
+    dates = [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+    backfill_sessions(vault.db, vault.all_notes(), dates)
+    (vault.vault_path / "note 5.md").write_text("# Note 5\n\nA new note.")
+    vault.sync()
+
+    report = backfill_sessions(vault.db, vault.all_notes(), dates)
+    assert report.written == ["2025-01-01", "2025-01-02"]
+    assert "note 5.md" in _rows(vault, "2025-01-01")
+
+
+def test_backfill_rewrites_sessions_pruned_by_retention(vault: Vault) -> None:
+    notes = vault.all_notes()
+    dates = [datetime(2025, 1, day) for day in range(1, 6)]
+    backfill_sessions(vault.db, notes, dates)
+    Session(datetime(2025, 1, 6), vault.db, embedding_retention=2).compute_embeddings(notes)
+    assert _rows(vault, "2025-01-01") == {}
+
+    report = backfill_sessions(vault.db, notes, dates)
+    assert report.written == ["2025-01-01", "2025-01-02", "2025-01-03"]
+    assert report.skipped == ["2025-01-04", "2025-01-05"]
+    assert all(len(_rows(vault, f"2025-01-0{day}")) == len(notes) for day in range(1, 6))
+
+
+def test_backfill_command(vault: Vault) -> None:
+    from geistfabrik.cli import COMMANDS, create_parser
+
+    args = create_parser().parse_args(
+        ["backfill", str(vault.vault_path), "--from", "2025-02-01", "--to", "2025-02-05"]
+    )
+    assert COMMANDS["backfill"](args).run() == 0
+    count = vault.db.execute(
+        "SELECT COUNT(*) FROM sessions WHERE date BETWEEN '2025-02-01' AND '2025-02-05'"
+    ).fetchone()[0]
+    assert count == 5
+
+    args = create_parser().parse_args(
+        ["backfill", str(vault.vault_path), "--from", "2025-02-05", "--to", "2025-02-01"]
+    )
+    assert COMMANDS["backfill"](args).run() == 1
@@ -0,0 +1,72 @@
+"""Tests for running invoke over many vaults (geistfabrik invoke-many)."""
+
+import json
+from pathlib import Path
+
+from geistfabrik.batch_invoke import invoke_many, read_vault_list
+from geistfabrik.benchmark import HashEmbeddingModel
+
+
+def _make_vault(root: Path, topic: str) -> Path:
+    (root / "_geistfabrik").mkdir(parents=True)
+    for i in range(6):
+        link = f"[[{topic} {(i + 1) % 6}]]"
+        (root / f"{topic} {i}.md").write_text(f"# {topic} {i}\n\nNotes on {topic}. See {link}.")
+    return root
+
+
+def test_read_vault_list(tmp_path: Path) -> None:
+    vault_list = tmp_path / "vaults.txt"
+    vault_list.write_text("# my vaults\n\nrelative\n/abs/vault\n  # indented comment\n")
+    assert read_vault_list(vault_list) == [str(tmp_path / "relative"), "/abs/vault"]
+
+
+def test_invoke_many_isolates_failing_vaults(tmp_path: Path) -> None:
+    vaults = [
+        _make_vault(tmp_path / "garden", "compost"),
+        tmp_path / "missing",
+        _make_vault(tmp_path / "queues", "latency"),
+    ]
+    output = tmp_path / "out"
+    seen = []
+
+    report = invoke_many(
+        vaults,
+        ["--geists", "hidden_hub", "--date", "2025-03-01"],
+        workers=1,  # one worker runs all three, one after another
+        output_dir=output,
+        model=HashEmbeddingModel(),
+        progress=seen.append,
+    )
+
+    assert [r.status for r in report.results] == ["ok", "failed", "ok"]
+    assert len(seen) == 3
+    assert report.results[0].notes == 6
+    assert report.results[0].texts_encoded > 0
+    assert "does not exist" in (report.results[1].error or "")
+    assert report.texts_encoded == sum(r.texts_encoded for r in report.results)
+
+    document = json.loads((output / "report.json").read_text())
+    assert (document["vaults"], document["succeeded"]) == (3, 2)
+    assert json.loads((output / "0001-missing.json").read_text())["status"] == "failed"
+    assert (output / "0002-queues.log").exists()
+
+
+def test_invoke_many_command_passes_options_through(tmp_path: Path) -> None:
+    from geistfabrik.cli import COMMANDS, create_parser
+
+    args = create_parser().parse_args(
+        [
+            "invoke-many",
+            str(tmp_path / "vaults.txt"),
+            "--workers",
+            "3",
+            "--write",
+            "--date",
+            "2025-03-01",
+        ]
+    )
+    command = COMMANDS["invoke-many"](args)
+    assert args.workers == 3
+    assert command._invoke_args() == ["--write", "--date", "2025-03-01"]
+    assert command.run() == 1  # list file does not exist
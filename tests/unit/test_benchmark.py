@@ -0,0 +1,158 @@
+"""Tests for the scale benchmark suite (geistfabrik bench)."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from geistfabrik import Vault
+from geistfabrik.benchmark import (
+    RESULT_FORMAT,
+    HashEmbeddingModel,
+    SyntheticVaultSpec,
+    apply_creation_dates,
+    compare_results,
+    generate_vault,
+    parse_scale,
+    run_benchmark,
+)
+
+
+def test_parse_scale() -> None:
+    assert parse_scale("1k") == 1_000
+    assert parse_scale("100K") == 100_000
+    assert parse_scale("2.5k") == 2_500
+    assert parse_scale("300") == 300
+    for bad in ("", "lots", "0", "-1k"):
+        with pytest.raises(ValueError):
+            parse_scale(bad)
+
+
+def test_generate_vault_is_deterministic(tmp_path: Path) -> None:
+    spec = SyntheticVaultSpec(notes=200, seed=3)
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    created = generate_vault(first, spec)
+    generate_vault(second, spec)
+
+    files = sorted(p.name for p in first.glob("*.md"))
+    assert files == sorted(p.name for p in second.glob("*.md"))
+    assert all((first / f).read_text() == (second / f).read_text() for f in files)
+
+    vault = Vault(first, ":memory:")
+    vault.sync()
+    apply_creation_dates(vault, created)
+    notes = vault.all_notes()
+    assert len(notes) == spec.notes
+    assert sum(1 for n in notes if "/" in n.path) == 20  # journal entries
+    assert sum(len(n.links) for n in notes) > spec.notes
+    dated = {n.path: n.created for n in notes if n.path in created}
+    assert dated == created
+    vault.close()
+
+
+def test_hash_embedding_model_groups_shared_words() -> None:
+    model = HashEmbeddingModel()
+    vectors = model.encode(["compost and soil", "soil and compost mulch", "latency of a queue"])
+    assert vectors.shape == (3, 384)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+    assert np.array_equal(model.encode("compost and soil"), vectors[0])
+
+
+def test_run_benchmark_records_phases_and_geists() -> None:
+    result = run_benchmark(
+        SyntheticVaultSpec(notes=150), geist_ids=["hidden_hub", "random_prompts"]
+    )
+
+    assert result["notes"] == 150
+    assert list(result["phases"]) == ["sync", "embed", "context", "execute", "filter", "write"]
+    assert set(result["geists"]) == {"hidden_hub", "random_prompts"}
+    assert result["sql"]["sync"] > 0
+    assert result["suggestions"]["raw"] >= result["suggestions"]["final"]
+    json.dumps(result)
+
+
+# Runs labelling geists in a fresh interpreter (the unit-test conftest stubs
+# sentence_transformers in this one) and reports the model modules it loaded
+_OFFLINE_PROBE = """
+import json, sys
+from geistfabrik.benchmark import SyntheticVaultSpec, run_benchmark
+from geistfabrik.embeddings import _loaded_models
+run_benchmark(SyntheticVaultSpec(notes=200), geist_ids=["cluster_mirror", "anachronism_detector"])
+loaded = [m for m in ("sentence_transformers", "torch") if m in sys.modules]
+print(json.dumps({"loaded": loaded, "installed": sorted(_loaded_models)}))
+"""
+
+
+def test_run_benchmark_never_loads_the_sentence_transformer() -> None:
+    """KeyBERT cluster labelling uses the hash model, which is uninstalled afterwards."""
+    result = subprocess.run(
+        [sys.executable, "-c", _OFFLINE_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "HF_HUB_OFFLINE": "1"},
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report == {"loaded": [], "installed": []}
+
+
+def _document(**metrics: float) -> dict:
+    return {
+        "format": RESULT_FORMAT,
+        "scales": {
+            "1k": {
+                "total": metrics.get("total", 1.0),
+                "phases": {"sync": metrics.get("sync", 0.5)},
+                "geists": {"hidden_hub": {"seconds": metrics.get("hidden_hub", 0.2)}},
+                "peak_rss_mb": metrics.get("memory", 200.0),
+            }
+        },
+    }
+
+
+def test_compare_results_gates_on_threshold_and_floor() -> None:
+    baseline = _document()
+    assert compare_results(_document(sync=0.6), baseline, threshold=0.25) == []
+
+    regressions = compare_results(
+        _document(sync=1.0, total=1.6, memory=400.0), baseline, threshold=0.25
+    )
+    assert [r.metric for r in regressions] == ["phase.sync", "peak_rss_mb", "total"]
+    assert regressions[0].change == pytest.approx(1.0)
+
+    # Large relative change, but below the absolute floor: noise, not a regression
+    tiny = _document(hidden_hub=0.001)
+    assert compare_results(_document(hidden_hub=0.01), tiny, threshold=0.25) == []
+
+    with pytest.raises(ValueError):
+        compare_results(_document(), {**baseline, "format": RESULT_FORMAT + 1})
+
+
+def test_bench_command_fails_on_regression(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from geistfabrik.cli import COMMANDS, create_parser
+
+    monkeypatch.setenv("GEISTFABRIK_OFFLINE", "1")  # bench sets it for the process otherwise
+
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "out.json"
+    argv = ["bench", "--scales", "100", "--geists", "hidden_hub", "--output", str(output)]
+
+    args = create_parser().parse_args(argv)
+    assert COMMANDS["bench"](args).run() == 0
+    document = json.loads(output.read_text())
+    assert document["scales"]["100"]["notes"] == 100
+
+    # A baseline far faster than any real run makes every phase regress
+    document["scales"]["100"]["total"] = 0.0
+    for phase in document["scales"]["100"]["phases"]:
+        document["scales"]["100"]["phases"][phase] = 0.0
+    baseline.write_text(json.dumps(document))
+    args = create_parser().parse_args(argv + ["--baseline", str(baseline)])
+    assert COMMANDS["bench"](args).run() == 1
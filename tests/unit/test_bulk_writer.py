@@ -0,0 +1,88 @@
+"""Tests for batched SQLite writes."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from geistfabrik.bulk_writer import BulkWriter
+from geistfabrik.schema import init_db
+from geistfabrik.vault import Vault
+
+INSERT_NOTE = (
+    "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+    "VALUES (?, ?, '', '', '', 0)"
+)
+
+
+def test_flush_runs_statements_in_first_added_order_and_chunks() -> None:
+    """Statements flush in first-added order; rows are split into chunks."""
+    db = init_db()
+    writer = BulkWriter(db, chunk_size=2)
+
+    writer.add_many(INSERT_NOTE, [(f"n{i}.md", f"N{i}") for i in range(5)])
+    writer.add("DELETE FROM notes WHERE path = ?", ("n0.md",))
+    writer.add(INSERT_NOTE, ("n5.md", "N5"))
+    assert writer.pending_rows == 7
+
+    assert writer.flush() == 7
+    # 6 inserts in 3 chunks, then the delete
+    assert writer.statements_executed == 4
+    assert writer.pending_rows == 0
+
+    paths = [row[0] for row in db.execute("SELECT path FROM notes ORDER BY path")]
+    assert paths == ["n1.md", "n2.md", "n3.md", "n4.md", "n5.md"]
+    db.close()
+
+
+def test_context_manager_commits_or_rolls_back(tmp_path: Path) -> None:
+    """The writer commits on success and discards everything on error."""
+    db = init_db(tmp_path / "bulk.db")
+
+    with BulkWriter(db) as writer:
+        writer.add(INSERT_NOTE, ("kept.md", "Kept"))
+
+    with pytest.raises(RuntimeError):
+        with BulkWriter(db) as writer:
+            writer.add(INSERT_NOTE, ("dropped.md", "Dropped"))
+            raise RuntimeError("boom")
+
+    paths = [row[0] for row in db.execute("SELECT path FROM notes")]
+    assert paths == ["kept.md"]
+    db.close()
+
+
+def test_invalid_chunk_size_rejected() -> None:
+    """chunk_size must be positive."""
+    with pytest.raises(ValueError):
+        BulkWriter(init_db(), chunk_size=0)
+
+
+def test_file_database_uses_wal(tmp_path: Path) -> None:
+    """File-backed databases are opened with the bulk-write pragmas."""
+    db = init_db(tmp_path / "wal.db")
+
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    db.close()
+
+
+def test_resync_replaces_links_and_tags(tmp_path: Path) -> None:
+    """Bulk sync replaces a changed note's links and tags without duplicates."""
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    note = vault_path / "a.md"
+    note.write_text("# A\n[[B]] #one")
+
+    vault = Vault(vault_path, tmp_path / "vault.db")
+    vault.sync()
+
+    note.write_text("# A\n[[C]] [[D]] #two")
+    os.utime(note, (note.stat().st_atime, note.stat().st_mtime + 10))
+    assert vault.sync() == 1
+
+    links = sorted(r[0] for r in vault.db.execute("SELECT target FROM links"))
+    tags = [r[0] for r in vault.db.execute("SELECT tag FROM tags")]
+    assert links == ["C", "D"]
+    assert tags == ["two"]
+    vault.close()
@@ -0,0 +1,58 @@
+"""Tests that CLI startup does not import heavy dependencies."""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ["torch", "sentence_transformers", "sklearn", "scipy", "vendi_score", "skdim"]
+
+# Runs the CLI in a fresh interpreter and reports which heavy modules it loaded
+PROBE = """
+import json, sys
+from geistfabrik.cli import main
+sys.argv = ["geistfabrik", *json.loads(sys.argv[1])]
+try:
+    code = main()
+except SystemExit as e:  # argparse exits after --help
+    code = e.code
+print(json.dumps({"code": code, "loaded": [m for m in HEAVY if m in sys.modules]}))
+"""
+
+
+def _run_cli(args: list[str]) -> tuple[dict, float]:
+    """Run the CLI in a subprocess; return its report and wall time."""
+    script = f"HEAVY = {HEAVY_MODULES!r}\n{PROBE}"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script, json.dumps(args)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return json.loads(result.stdout.strip().splitlines()[-1]), elapsed
+
+
+@pytest.fixture
+def initialised_vault(tmp_path: Path) -> Path:
+    vault = tmp_path / "vault"
+    (vault / ".obsidian").mkdir(parents=True)
+    (vault / "_geistfabrik").mkdir()
+    (vault / "note.md").write_text("# Note\n\nBody.")
+    return vault
+
+
+@pytest.mark.parametrize("command", ["help", "validate"])
+def test_startup_is_fast_and_skips_heavy_imports(command: str, initialised_vault: Path) -> None:
+    args = ["--help"] if command == "help" else ["validate", str(initialised_vault)]
+
+    # Best of three, so a busy machine does not fail the timing
+    runs = [_run_cli(args) for _ in range(3)]
+    report = runs[0][0]
+    assert report["code"] == 0
+    assert report["loaded"] == []
+    assert min(elapsed for _, elapsed in runs) < 1.0
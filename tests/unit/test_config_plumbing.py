@@ -49,6 +49,7 @@ class TestConfigSectionsRoundTrip:
                 "quality": {"min_length": 20, "max_length": 500},
             },
             "session": {"default_suggestions": 9},
+            "database": {"profile": "safe"},
         }
         cfg = GeistFabrikConfig.from_dict(data)
         assert cfg.geist_execution.timeout == 12
@@ -56,6 +57,7 @@ class TestConfigSectionsRoundTrip:
         assert cfg.filtering.exclude_paths == ["Private/", "People/"]
         assert cfg.filtering.novelty_window_days == 90
         assert cfg.session.default_suggestions == 9
+        assert cfg.database.profile == "safe"
         # from_dict(to_dict(x)) == x
         assert GeistFabrikConfig.from_dict(cfg.to_dict()) == cfg
 
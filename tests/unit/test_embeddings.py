@@ -1,6 +1,8 @@
 """Unit tests for embeddings module (mocked models)."""
 
+from dataclasses import replace
 from datetime import datetime
+from unittest.mock import Mock
 
 import numpy as np
 import pytest
@@ -10,9 +12,10 @@ from geistfabrik.embeddings import (
     Session,
     cosine_similarity,
     find_similar_notes,
+    load_cached_semantic_embeddings,
 )
 from geistfabrik.models import Note
-from geistfabrik.schema import init_db
+from geistfabrik.schema import content_hash, init_db
 
 # Add 5 second timeout to ALL tests to prevent hangs
 pytestmark = pytest.mark.timeout(5)
@@ -347,8 +350,8 @@ def test_semantic_cache_hit(db_with_notes, mock_embedding_computer):
     # Insert note
     db_with_notes.execute(
         """
-        INSERT INTO notes (path, title, content, created, modified, file_mtime)
-        VALUES (?, ?, ?, ?, ?, ?)
+        INSERT INTO notes (path, title, content, created, modified, file_mtime, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
         (
             note.path,
@@ -357,6 +360,7 @@ def test_semantic_cache_hit(db_with_notes, mock_embedding_computer):
             note.created.isoformat(),
             note.modified.isoformat(),
             note.modified.timestamp(),
+            content_hash(note.content),
         ),
     )
     db_with_notes.commit()
@@ -372,11 +376,11 @@ def test_semantic_cache_hit(db_with_notes, mock_embedding_computer):
     count = cursor.fetchone()[0]
     assert count == 1
 
-    # Second computation with same note - should use cache
-    session2 = Session(datetime(2023, 6, 16), db_with_notes, computer=mock_embedding_computer)
-    cached_embedding = session2._get_cached_semantic_embedding(note)
-    assert cached_embedding is not None
-    assert cached_embedding.shape == (384,)
+    # A later session finds it in the cache
+    cached, matrix, stale = load_cached_semantic_embeddings(db_with_notes, [note])
+    assert cached == [note]
+    assert stale == []
+    assert matrix.shape == (1, 384)
 
 
 def test_session_embedding_retention_prunes_old_sessions(
@@ -435,6 +439,103 @@ def test_session_embedding_retention_zero_keeps_all(
     assert distinct == 4
 
 
+def test_session_rerun_skips_unchanged_vault(mocked_session, sample_notes):
+    """A second run with the same notes recomputes nothing."""
+    mocked_session.compute_embeddings(sample_notes)
+    assert len(mocked_session.changed_paths) == len(sample_notes)
+
+    model = mocked_session.computer.model
+    model.encode = Mock(wraps=model.encode)
+    mocked_session.compute_embeddings(sample_notes)
+
+    assert mocked_session.changed_paths == []
+    assert mocked_session.removed_paths == []
+    model.encode.assert_not_called()
+
+
+def test_session_rerun_recomputes_pruned_session(
+    db_with_notes, mock_embedding_computer, sample_notes
+):
+    """A replayed session whose rows were pruned is recomputed, not skipped."""
+    for day in (1, 2, 3):
+        Session(
+            datetime(2023, 1, day),
+            db_with_notes,
+            computer=mock_embedding_computer,
+            embedding_retention=1,
+        ).compute_embeddings(sample_notes)
+
+    replay = Session(
+        datetime(2023, 1, 1), db_with_notes, computer=mock_embedding_computer, embedding_retention=1
+    )
+    replay.compute_embeddings(sample_notes)
+
+    rows = db_with_notes.execute(
+        "SELECT COUNT(*) FROM session_embeddings WHERE session_id = ?", (replay.session_id,)
+    ).fetchone()[0]
+    assert rows == len(sample_notes)
+    assert len(replay.changed_paths) == len(sample_notes)
+
+
+def test_session_rerun_upserts_only_changed_rows(mocked_session, sample_notes):
+    """Only changed notes are rewritten; removed notes lose their rows."""
+    mocked_session.compute_embeddings(sample_notes)
+    backend = mocked_session.get_backend()
+    kept, changed, removed = sample_notes[0], sample_notes[1], sample_notes[2]
+    kept_before = backend.get_embedding(kept.path).copy()
+
+    changed = replace(changed, modified=datetime(2023, 6, 14))
+    notes = [kept, changed, *sample_notes[3:]]
+    mocked_session.compute_embeddings(notes)
+
+    assert mocked_session.changed_paths == [changed.path]
+    assert mocked_session.removed_paths == [removed.path]
+    stored = {
+        row[0]
+        for row in mocked_session.db.execute(
+            "SELECT note_path FROM session_embeddings WHERE session_id = ?",
+            (mocked_session.session_id,),
+        )
+    }
+    assert stored == {note.path for note in notes}
+
+    # The loaded backend was refreshed in place
+    assert removed.path not in backend.embeddings
+    np.testing.assert_array_equal(backend.get_embedding(kept.path), kept_before)
+    np.testing.assert_array_equal(
+        backend.get_embedding(changed.path), mocked_session.get_embedding(changed.path)
+    )
+
+
+def test_bulk_cache_probe_uses_stored_hashes(db_with_notes, mock_embedding_computer, sample_notes):
+    """One joined probe returns cached vectors as a matrix plus the stale notes."""
+    db_with_notes.executemany(
+        "UPDATE notes SET content_hash = ? WHERE path = ?",
+        [(content_hash(note.content), note.path) for note in sample_notes],
+    )
+    session1 = Session(datetime(2023, 6, 15), db_with_notes, computer=mock_embedding_computer)
+    session1.compute_embeddings(sample_notes)
+
+    session2 = Session(datetime(2023, 6, 16), db_with_notes, computer=mock_embedding_computer)
+    cached, matrix, stale = session2._load_cached_semantic_embeddings(sample_notes)
+    assert {note.path for note in cached} == {note.path for note in sample_notes}
+    assert matrix.shape == (len(sample_notes), 384)
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert stale == []
+    row = db_with_notes.execute(
+        "SELECT embedding FROM embeddings WHERE note_path = ?", (cached[0].path,)
+    ).fetchone()
+    np.testing.assert_array_equal(matrix[0], np.frombuffer(row[0], dtype=np.float32))
+
+    # A note whose stored hash no longer matches its cache row is stale
+    db_with_notes.execute(
+        "UPDATE notes SET content_hash = 'edited' WHERE path = ?", (sample_notes[0].path,)
+    )
+    cached, matrix, stale = session2._load_cached_semantic_embeddings(sample_notes)
+    assert stale == [sample_notes[0]]
+    assert matrix.shape == (len(sample_notes) - 1, 384)
+
+
 def test_is_offline_mode_respects_env_flags(monkeypatch):
     """is_offline_mode honours GeistFabrik and HuggingFace offline flags."""
     from geistfabrik.embeddings import is_offline_mode
@@ -0,0 +1,108 @@
+"""Tests for the warm in-process engine (GeistFabrikEngine)."""
+
+import os
+from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from geistfabrik.engine import GeistFabrikEngine
+
+DATE = datetime(2025, 3, 1)
+
+ECHO_GEIST = """
+from geistfabrik import Suggestion
+
+def suggest(vault):
+    return [Suggestion(text="{text} " + n.title, notes=[n.title], geist_id="echo")
+            for n in vault.notes()]
+"""
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[GeistFabrikEngine, None, None]:
+    vault = tmp_path / "vault"
+    (vault / "_geistfabrik" / "geists" / "code").mkdir(parents=True)
+    for i in range(4):
+        (vault / f"note {i}.md").write_text(f"# Note {i}\n\nAbout topic {i}. See [[note {i + 1}]].")
+    (vault / "_geistfabrik" / "geists" / "code" / "echo.py").write_text(
+        ECHO_GEIST.format(text="Look at")
+    )
+    with GeistFabrikEngine(vault, use_cache=False) as engine:
+        yield engine
+
+
+def _touch(path: Path, text: str) -> None:
+    """Rewrite a file and move its mtime forward, so the edit is seen."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_run_reuses_context_until_the_vault_changes(engine: GeistFabrikEngine) -> None:
+    first = engine.run(DATE, mode="raw", geists=["echo"])
+    assert first.executed == ["echo"]
+    assert len(first.suggestions) == 4
+    context = engine.context(DATE)
+
+    engine.run(DATE, mode="raw", geists=["echo"])
+    assert engine.context(DATE) is context
+    assert engine.refresh() == 0
+
+    _touch(engine.vault_path / "note 2.md", "# Note 2\n\nRewritten.")
+    assert engine.refresh() == 1
+    assert engine._session is not None
+    assert engine._session.changed_paths == ["note 2.md"]  # only the edited note
+
+    (engine.vault_path / "note 3.md").unlink()
+    third = engine.run(DATE, mode="raw", geists=["echo"])
+    assert len(third.suggestions) == 3
+    context = engine.context(DATE)
+    assert "note 3.md" not in context.get_all_embeddings()
+    backend = context.session.get_backend()
+    similar = backend.find_similar(context.get_embedding("note 0.md"), 10)
+    assert {path for path, _ in similar} == {"note 0.md", "note 1.md", "note 2.md"}
+
+
+def test_new_date_gets_new_session(engine: GeistFabrikEngine) -> None:
+    engine.run(DATE, mode="raw", geists=["echo"])
+    session = engine._session
+    engine.run(datetime(2025, 3, 2), mode="raw", geists=["echo"])
+    assert engine._session is not session
+    assert engine.context(datetime(2025, 3, 2)).session.date == datetime(2025, 3, 2)
+
+
+def test_runs_on_one_day_share_session_context_and_seed(engine: GeistFabrikEngine) -> None:
+    first = engine.run(mode="raw", geists=["echo"])
+    context = engine.context(datetime.now())
+    second = engine.run(mode="raw", geists=["echo"])
+
+    assert engine.context(datetime.now()) is context
+    assert first.date == second.date
+    assert first.date == first.date.replace(hour=0, minute=0, second=0, microsecond=0)
+    assert engine.context(DATE.replace(hour=15)) is engine.context(DATE)
+
+
+def test_edited_geist_is_reloaded(engine: GeistFabrikEngine) -> None:
+    assert engine.run(DATE, mode="raw", geists=["echo"]).suggestions[0].text.startswith("Look at")
+
+    geist = engine.geistfabrik_dir / "geists" / "code" / "echo.py"
+    _touch(geist, ECHO_GEIST.format(text="Reconsider"))
+    result = engine.run(DATE, mode="raw", geists=["echo"])
+    assert result.suggestions[0].text.startswith("Reconsider")
+
+
+def test_run_validates_mode_and_geists(engine: GeistFabrikEngine) -> None:
+    with pytest.raises(ValueError, match="Unknown mode"):
+        engine.run(DATE, mode="everything")
+    with pytest.raises(ValueError, match="no_such_geist"):
+        engine.run(DATE, geists=["no_such_geist"])
+
+
+def test_write_refuses_to_overwrite(engine: GeistFabrikEngine) -> None:
+    result = engine.run(DATE, mode="full", geists=["echo"])
+    path = engine.write(result)
+    assert "Look at Note 0" in path.read_text()
+    with pytest.raises(FileExistsError):
+        engine.write(result)
@@ -0,0 +1,146 @@
+"""Tests for planned (selection-aware) geist execution."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from geistfabrik.config import get_default_filter_config
+from geistfabrik.config_loader import GeistFabrikConfig
+from geistfabrik.execution_planner import ExecutionPlanner, resolve_execution_mode
+from geistfabrik.filtering import SuggestionFilter
+from geistfabrik.models import Suggestion
+from geistfabrik.schema import init_db
+
+GEISTS = [f"geist_{i:02d}" for i in range(20)]
+
+
+def _one_each(geist_id: str) -> list[Suggestion]:
+    return [Suggestion(text=f"From {geist_id}", notes=["Note"], geist_id=geist_id)]
+
+
+def test_order_depends_only_on_seed_and_geist_set() -> None:
+    """The planned order is a seeded shuffle, independent of input order."""
+    order = ExecutionPlanner(GEISTS, seed=42, target=5).order
+
+    assert order == ExecutionPlanner(list(reversed(GEISTS)), seed=42, target=5).order
+    assert sorted(order) == GEISTS
+    assert order != ExecutionPlanner(GEISTS, seed=43, target=5).order
+
+
+def test_stops_once_enough_suggestions_survive() -> None:
+    """Waves stop as soon as the target is met; the rest is reported skipped."""
+    planner = ExecutionPlanner(GEISTS, seed=1, target=5, wave_size=2)
+    planned = planner.run(_one_each, lambda batch: batch)
+
+    assert planned.executed == planner.order[:6]
+    assert planned.skipped == planner.order[6:]
+    assert planned.waves == 3
+    assert planned.raw_count == 6
+    assert [s.geist_id for s in planned.survivors] == planner.order[:6]
+
+
+def test_runs_every_geist_when_filtering_keeps_too_few() -> None:
+    """If survivors never reach the target, every geist runs (exhaustive)."""
+    planned = ExecutionPlanner(GEISTS, seed=1, target=5, wave_size=3).run(
+        _one_each, lambda batch: batch[:0]
+    )
+
+    assert sorted(planned.executed) == GEISTS
+    assert planned.skipped == []
+    assert planned.waves == 7
+    assert planned.survivors == []
+
+
+def test_execution_mode_and_wave_size_validation() -> None:
+    assert resolve_execution_mode("planned") == "planned"
+    assert resolve_execution_mode("exhaustive") == "exhaustive"
+    assert resolve_execution_mode("serial") == "exhaustive"
+    with pytest.raises(ValueError):
+        resolve_execution_mode("parallel")
+    with pytest.raises(ValueError):
+        ExecutionPlanner(GEISTS, seed=1, target=5, wave_size=0)
+
+
+@pytest.mark.parametrize("diversity", [True, False])
+def test_filter_incremental_matches_filter_all(diversity: bool) -> None:
+    """Filtering batch by batch keeps exactly what one filter_all() pass keeps."""
+    # Without diversity, repeated texts reach the quality stage's repetition check
+    config = get_default_filter_config()
+    config["diversity"]["enabled"] = diversity
+    db = init_db()
+    db.execute(
+        "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES ('note.md', 'Note', '', '', '', 0)"
+    )
+    db.execute(
+        "INSERT INTO session_suggestions "
+        "(session_date, geist_id, suggestion_text, block_id, created_at) "
+        "VALUES ('2025-01-10', 'g', 'topic 0 again', 'b', '2025-01-10')"
+    )
+    db.commit()
+
+    # Texts about the same topic embed identically, so they collide in the
+    # novelty (history) and diversity (batch) stages
+    rng = np.random.default_rng(0)
+    topics = rng.standard_normal((8, 384)).astype(np.float32)
+    computer = MagicMock()
+    computer.compute_batch_semantic.side_effect = lambda texts: [
+        topics[int(text.split()[1])] for text in texts
+    ]
+
+    suggestions = [
+        Suggestion(
+            text=f"topic {i % 8} variant {i}" if i % 5 else "topic 3 short",
+            notes=["Note"] if i % 7 else ["Missing"],
+            geist_id="g",
+        )
+        for i in range(40)
+    ]
+    session_date = datetime(2025, 1, 20)
+    expected = SuggestionFilter(db, computer, config=config).filter_all(suggestions, session_date)
+
+    for batch_size in (1, 3, 40):
+        incremental = SuggestionFilter(db, computer, config=config)
+        survivors = []
+        for start in range(0, len(suggestions), batch_size):
+            batch = suggestions[start : start + batch_size]
+            survivors.extend(incremental.filter_incremental(batch, session_date))
+        assert survivors == expected
+        assert [t.stage for t in incremental.timings] == [
+            "boundary",
+            "novelty",
+            "diversity",
+            "quality",
+        ]
+        assert incremental.timings[0].input_count == len(suggestions)
+    db.close()
+
+
+class _FakeArgs:
+    def __init__(self, **kw):
+        self.full = False
+        self.no_filter = False
+        self.geist = None
+        self.geists = None
+        self.__dict__.update(kw)
+
+
+@pytest.mark.parametrize(
+    ("args", "execution", "planned"),
+    [
+        ({}, {}, True),
+        ({}, {"execution_mode": "exhaustive"}, False),
+        ({"full": True}, {}, False),
+        ({"no_filter": True}, {}, False),
+        ({"geists": "a,b"}, {}, False),
+    ],
+)
+def test_invoke_plans_only_default_mode(args: dict, execution: dict, planned: bool) -> None:
+    """Only default-mode invocations go through the planner."""
+    from geistfabrik.commands.invoke import InvokeCommand
+
+    command = InvokeCommand(_FakeArgs(**args))
+    command._config = GeistFabrikConfig.from_dict({"geist_execution": execution})
+    assert command._use_planner() is planned
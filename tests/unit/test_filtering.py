@@ -2,12 +2,14 @@
 
 import sqlite3
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from geistfabrik.embeddings import MODEL_NAME, EmbeddingComputer
 from geistfabrik.filtering import SuggestionFilter
 from geistfabrik.models import Suggestion
+from geistfabrik.schema import content_hash, init_db
 
 
 @pytest.fixture
@@ -229,3 +231,102 @@ class TestBoundaryFilterVirtualNotes:
 
         assert kept in result, "virtual-note deeplink reference should be kept"
         assert dropped not in result, "reference to a missing note should be dropped"
+
+
+class TestSharedSuggestionEmbeddings:
+    """Novelty and diversity share one embedding per distinct suggestion text."""
+
+    @pytest.fixture
+    def full_db(self):
+        conn = init_db()
+        conn.executemany(
+            "INSERT INTO session_suggestions "
+            "(session_date, geist_id, suggestion_text, block_id, created_at) "
+            "VALUES ('2025-01-10', 'g', ?, ?, '')",
+            [("An old suggestion about gardens.", "b1"), ("Another old one on tides.", "b2")],
+        )
+        conn.commit()
+        yield conn
+        conn.close()
+
+    @pytest.fixture
+    def computer(self, mock_sentence_transformer):
+        computer = EmbeddingComputer()
+        computer._model = mock_sentence_transformer
+        computer._model.encode = Mock(wraps=computer._model.encode)
+        return computer
+
+    def _suggestions(self):
+        texts = ["Link the bee note to pollination.", "Revisit the tide tables.", "Dup text."]
+        return [Suggestion(text=t, notes=[], geist_id="g") for t in texts + ["Dup text."]]
+
+    def test_each_text_encoded_once_per_run(self, full_db, computer):
+        config = {
+            "strategies": ["novelty", "diversity"],
+            "novelty": {"enabled": True, "window_days": 60, "threshold": 0.99},
+            "diversity": {"enabled": True, "threshold": 0.99},
+        }
+        filter_obj = SuggestionFilter(full_db, computer, config=config)
+        filtered = filter_obj.filter_all(self._suggestions(), datetime(2025, 1, 20))
+
+        encoded = [t for call in computer._model.encode.call_args_list for t in call.args[0]]
+        assert sorted(encoded) == sorted(set(encoded))  # no text encoded twice
+        assert filter_obj.texts_encoded == 5  # 2 history + 3 distinct suggestions
+        assert [t.stage for t in filter_obj.timings] == ["novelty", "diversity"]
+        assert filter_obj.timings[-1].output_count == len(filtered) == 3
+
+    def test_later_run_reads_stored_embeddings(self, full_db, computer):
+        config = {"strategies": ["novelty", "diversity"]}
+        SuggestionFilter(full_db, computer, config=config).filter_all(
+            self._suggestions(), datetime(2025, 1, 20)
+        )
+        computer._model.encode.reset_mock()
+
+        second = SuggestionFilter(full_db, computer, config=config)
+        second.filter_all(self._suggestions(), datetime(2025, 1, 20))
+
+        computer._model.encode.assert_not_called()
+        assert second.texts_encoded == 0
+        assert second.texts_loaded == 5
+
+    def _stamps(self, db):
+        return {row[0] for row in db.execute("SELECT computed_at FROM suggestion_embeddings")}
+
+    def test_stored_embeddings_age_by_session_date(self, full_db, computer):
+        config = {"strategies": ["novelty"], "novelty": {"enabled": True, "window_days": 60}}
+        SuggestionFilter(full_db, computer, config=config).filter_all(
+            self._suggestions(), datetime(2025, 1, 20)
+        )
+        assert self._stamps(full_db) == {"2025-01-20T00:00:00"}
+
+        # Rows a later session reads are stamped with its date, not left to age
+        computer._model.encode.reset_mock()
+        SuggestionFilter(full_db, computer, config=config).filter_all(
+            self._suggestions()[:1], datetime(2025, 3, 1)
+        )
+        assert "2025-03-01T00:00:00" in self._stamps(full_db)
+        computer._model.encode.assert_not_called()
+
+        # The window ends at the session date: only rows unused since
+        # 2025-01-02 (60 days before 2025-03-03) are pruned
+        SuggestionFilter(full_db, computer, config=config).filter_all([], datetime(2025, 3, 3))
+        assert self._stamps(full_db) == {"2025-01-20T00:00:00", "2025-03-01T00:00:00"}
+        SuggestionFilter(full_db, computer, config=config).filter_all([], datetime(2025, 5, 1))
+        assert self._stamps(full_db) == set()
+
+    def test_stored_embeddings_are_kept_per_model(self, full_db, computer):
+        config = {"strategies": ["diversity"], "diversity": {"enabled": True}}
+        text = "Revisit the tide tables."
+        full_db.execute(
+            "INSERT INTO suggestion_embeddings VALUES (?, 'other-model', x'00', '2025-01-20')",
+            (content_hash(text),),
+        )
+        SuggestionFilter(full_db, computer, config=config).filter_all(
+            [Suggestion(text=text, notes=[], geist_id="g")], datetime(2025, 1, 20)
+        )
+
+        models = full_db.execute(
+            "SELECT model_version FROM suggestion_embeddings WHERE text_hash = ?",
+            (content_hash(text),),
+        ).fetchall()
+        assert sorted(models) == sorted([("other-model",), (MODEL_NAME,)])
@@ -1,6 +1,9 @@
 """Tests for function registry system (Phase 9)."""
 
+import copy
+import pickle
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +15,8 @@ from geistfabrik import (
     FunctionRegistryError,
     vault_function,
 )
+from geistfabrik.function_registry import NoteLink
+from geistfabrik.models import Note
 
 
 def test_function_registry_initialization() -> None:
@@ -209,6 +214,61 @@ def loaded_function(vault, k=5):
         assert "test_loaded" in registry.functions
 
 
+def test_registries_in_one_process_are_independent() -> None:
+    """A second registry neither collides with nor inherits the first one's functions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_dir = Path(tmpdir)
+        (module_dir / "extra.py").write_text("""
+from geistfabrik import vault_function
+
+@vault_function("vault_a_only")
+def vault_a_only(vault):
+    return []
+""")
+        first = FunctionRegistry(module_dir)
+        first.load_modules()
+
+        second = FunctionRegistry()
+        second.load_modules()
+
+        assert "vault_a_only" in first.functions
+        assert "vault_a_only" not in second.functions
+        assert second.has_function("sample_notes")
+
+
+def test_decorated_functions_survive_new_registries() -> None:
+    """Building registries keeps functions decorated beforehand (e.g. in user code)."""
+
+    @vault_function("user_code_func")
+    def user_code_func(vault: Any) -> list[str]:
+        return []
+
+    first = FunctionRegistry()
+    second = FunctionRegistry()
+
+    assert first.functions["user_code_func"] is user_code_func
+    assert second.functions["user_code_func"] is user_code_func
+    assert second.has_function("sample_notes")
+
+
+def test_duplicate_names_across_vault_modules_are_rejected() -> None:
+    """A second module defining an already-loaded name fails to load."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_dir = Path(tmpdir)
+        for module in ("a_funcs", "b_funcs"):
+            (module_dir / f"{module}.py").write_text(f"""
+from geistfabrik import vault_function
+
+@vault_function("shared_name")
+def {module}(vault):
+    return ["{module}"]
+""")
+        registry = FunctionRegistry(module_dir)
+        registry.load_modules()
+
+        assert registry.functions["shared_name"].__name__ == "a_funcs"
+
+
 def test_load_module_with_syntax_error() -> None:
     """Test loading module with syntax errors."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -363,3 +423,108 @@ def test_function_returns_none() -> None:
 
     result = registry.call("return_none", MockVault())
     assert result is None
+
+
+def test_pure_function_memoised_per_session() -> None:
+    """Pure functions run once per (args, session); impure ones every call."""
+    registry = FunctionRegistry()
+    calls: list[int] = []
+
+    def pure_func(vault: Any, count: int = 1) -> list[int]:
+        calls.append(count)
+        return list(range(count))
+
+    def impure_func(vault: Any) -> int:
+        calls.append(-1)
+        return len(calls)
+
+    registry.register("pure_func", pure_func, pure=True)
+    registry.register("impure_func", impure_func)
+
+    class MockVault:
+        pass
+
+    session_a = MockVault()
+    first = registry.call("pure_func", session_a, 3)
+    first.append(99)  # Mutating a result must not leak into the memo
+    assert registry.call("pure_func", session_a, 3) == [0, 1, 2]
+    registry.call("pure_func", session_a, 2)
+    registry.call("impure_func", session_a)
+    registry.call("impure_func", session_a)
+
+    assert calls == [3, 2, -1, -1]
+    stats = registry.get_memo_stats()
+    assert (stats["pure_func"].hits, stats["pure_func"].misses) == (1, 2)
+    assert "impure_func" not in stats
+
+    # A new VaultContext starts a fresh memo
+    registry.call("pure_func", MockVault(), 3)
+    assert calls[-1] == 3
+    assert registry.get_memo_stats()["pure_func"].misses == 1
+
+
+def test_builtin_purity_declarations() -> None:
+    """Deterministic builtins are pure; RNG-sampling builtins are not."""
+    from geistfabrik.function_registry import is_pure_function
+
+    registry = FunctionRegistry()
+
+    assert is_pure_function(registry.functions["hubs"])
+    assert is_pure_function(registry.functions["semantic_clusters"])
+    assert not is_pure_function(registry.functions["sample_notes"])
+    assert not is_pure_function(registry.functions["random_note_title"])
+
+
+def test_call_many_batches_misses_and_shares_the_memo() -> None:
+    """A batched function gets every unmemoised value in one call."""
+    registry = FunctionRegistry()
+    calls: list[list[int]] = []
+
+    def squares(vault: Any, values: list[int], offset: int = 0) -> list[int]:
+        calls.append(list(values))
+        return [v * v + offset for v in values]
+
+    registry.register("squares", squares, pure=True, batched=True)
+
+    class MockVault:
+        pass
+
+    session = MockVault()
+    assert registry.call("squares", session, 3) == 9  # a batch of one
+    assert registry.call_many("squares", session, [1, 2, 3], 1) == [2, 5, 10]
+    assert registry.call_many("squares", session, [3, 4, 3]) == [9, 16, 9]
+    assert calls == [[3], [1, 2, 3], [4]]
+    assert registry.call("squares", session, 4) == 16
+    stats = registry.get_memo_stats()["squares"]
+    assert (stats.hits, stats.misses) == (3, 5)
+
+    # Unbatched functions are called once per value, keyword arguments shared
+    def plus(vault: Any, value: int, amount: int = 1) -> int:
+        return value + amount
+
+    registry.register("plus", plus)
+    assert registry.call_many("plus", session, [1, 2], amount=10) == [11, 12]
+
+    registry.register("short", lambda vault, values: values[:1], batched=True)
+    with pytest.raises(FunctionRegistryError, match="returned 1 results for 2 values"):
+        registry.call_many("short", session, [1, 2])
+
+
+def test_note_link_survives_copy_and_pickle() -> None:
+    """NoteLinks are rebuilt from their text, path and link text."""
+    when = datetime(2025, 3, 1)
+    note = Note(
+        path="ideas/Deep Work.md",
+        title="Deep Work",
+        content="",
+        links=[],
+        tags=[],
+        created=when,
+        modified=when,
+    )
+    link = NoteLink(note)
+
+    for clone in (copy.copy(link), copy.deepcopy(link), pickle.loads(pickle.dumps(link))):
+        assert isinstance(clone, NoteLink)
+        assert clone == link == f"[[{note.link_text}]]"
+        assert (clone.path, clone.link_text) == (note.path, note.link_text)
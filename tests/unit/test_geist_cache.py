@@ -0,0 +1,147 @@
+"""Tests for the cross-run geist output cache."""
+
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from geistfabrik import GeistExecutor, Suggestion, Vault, VaultContext
+from geistfabrik.config_loader import GeistFabrikConfig
+from geistfabrik.geist_cache import GeistOutputCache, session_fingerprint, source_digest
+from geistfabrik.tracery import TraceryGeist
+
+pytestmark = pytest.mark.vault_notes({"test.md": "# Test Note\n\nSome content"})
+
+# Appends a line to runs.log each time it actually executes
+COUNTING_GEIST = """
+from pathlib import Path
+from geistfabrik import Suggestion
+
+def suggest(vault):
+    log = Path({log!r})
+    log.write_text(log.read_text() + "run\\n" if log.exists() else "run\\n")
+    pick = vault.sample(["a", "b", "c", "d", "e", "f"], 2)
+    return [Suggestion(text=f"Picked {{pick}}", notes=["Test Note"], geist_id="counting")]
+"""
+
+FAILING_GEIST = """
+def suggest(vault):
+    raise RuntimeError("boom")
+"""
+
+
+def test_get_put_round_trip(vault: Vault) -> None:
+    cache = GeistOutputCache(vault.db, "fingerprint")
+    suggestions = [
+        Suggestion(text="One", notes=["A"], geist_id="g"),
+        Suggestion(text="Two", notes=[], geist_id="g", title="Titled"),
+    ]
+
+    assert cache.get("g", "digest") is None
+    cache.put("g", "digest", suggestions)
+    assert cache.get("g", "digest") == suggestions
+    assert cache.get("g", "edited") is None
+    assert GeistOutputCache(vault.db, "other day").get("g", "digest") is None
+    assert (cache.hits, cache.misses, cache.hit_ids) == (1, 2, ["g"])
+
+    # One row per geist: a new key replaces the old entry
+    cache.put("g", "edited", suggestions[:1])
+    assert cache.get("g", "digest") is None
+    assert vault.db.execute("SELECT COUNT(*) FROM geist_output_cache").fetchone()[0] == 1
+
+
+def test_fetch_does_not_cache_failures(vault: Vault) -> None:
+    cache = GeistOutputCache(vault.db, "fingerprint")
+
+    def fail() -> list[Suggestion]:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.fetch("g", "digest", fail)
+    assert cache.fetch("g", "digest", lambda: []) == []
+    assert cache.fetch("g", "digest", fail) == []
+
+
+def test_fingerprint_covers_date_and_config(
+    vault: Vault, make_context: Callable[..., VaultContext], tmp_path: Path
+) -> None:
+    gf_dir = tmp_path / "vault" / "_geistfabrik"
+    context = make_context()
+    config = GeistFabrikConfig()
+    fingerprint = session_fingerprint(context, config, gf_dir)
+
+    assert session_fingerprint(context, config, gf_dir) == fingerprint
+    assert session_fingerprint(make_context(datetime(2023, 6, 16)), config, gf_dir) != fingerprint
+    config.session.default_suggestions += 1
+    assert session_fingerprint(context, config, gf_dir) != fingerprint
+
+    # Vault functions are part of every geist's inputs
+    (gf_dir / "vault_functions").mkdir(parents=True)
+    before = session_fingerprint(context, config, gf_dir)
+    (gf_dir / "vault_functions" / "extra.py").write_text("# helpers\n")
+    changed = session_fingerprint(context, config, gf_dir)
+    assert changed != before
+    (gf_dir / "vault_functions" / "extra.py").write_text("# edited helpers\n")
+    assert session_fingerprint(context, config, gf_dir) != changed
+
+
+def test_executor_skips_cached_geists(
+    vault: Vault, make_context: Callable[..., VaultContext], tmp_path: Path
+) -> None:
+    """A second executor with the same inputs serves output without running."""
+    geists_dir = tmp_path / "geists"
+    geists_dir.mkdir()
+    log = tmp_path / "runs.log"
+    (geists_dir / "counting.py").write_text(COUNTING_GEIST.format(log=str(log)))
+    (geists_dir / "failing.py").write_text(FAILING_GEIST)
+
+    def run() -> tuple[GeistExecutor, dict[str, list[Suggestion]]]:
+        executor = GeistExecutor(geists_dir, output_cache=GeistOutputCache(vault.db, "fingerprint"))
+        executor.load_geists()
+        return executor, executor.execute_all(make_context())
+
+    _, first = run()
+    second_executor, second = run()
+
+    assert second == first
+    assert log.read_text() == "run\n"
+    assert second_executor.output_cache is not None
+    assert second_executor.output_cache.hit_ids == ["counting"]
+    profiles = {p.geist_id: p for p in second_executor.get_execution_profiles()}
+    assert profiles["counting"].cached
+    assert profiles["failing"].status == "error"
+
+    # Editing the geist invalidates its entry
+    (geists_dir / "counting.py").write_text(COUNTING_GEIST.format(log=str(log)) + "\n# v2\n")
+    run()
+    assert log.read_text() == "run\nrun\n"
+
+
+def test_reseed_isolates_geists_from_earlier_sampling(
+    vault: Vault, make_context: Callable[..., VaultContext]
+) -> None:
+    """A geist's samples do not depend on what ran (or was skipped) before it."""
+    items = list(range(100))
+    context = make_context()
+    context.reseed("geist_b")
+    alone = context.sample(items, 5)
+
+    context = make_context()
+    context.reseed("geist_a")
+    context.sample(items, 50)
+    context.reseed("geist_b")
+    assert context.sample(items, 5) == alone
+
+    context.reseed("geist_c")
+    assert context.sample(items, 5) != alone
+
+
+def test_tracery_geists_record_source_digest(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "hello.yaml"
+    yaml_path.write_text(
+        "type: geist-tracery\nid: hello\ntracery:\n  origin:\n    - Hello [[Test Note]]\n"
+    )
+
+    assert TraceryGeist.from_yaml(yaml_path, seed=1).source_digest == source_digest(yaml_path)
+    assert TraceryGeist("inline", {"origin": ["Hi"]}).source_digest is None
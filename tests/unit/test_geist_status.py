@@ -102,6 +102,9 @@ def _write_geist(directory: Path, name: str, body: str) -> None:
 class _StubContext:
     """Minimal stand-in for VaultContext (failing geist never uses it)."""
 
+    def reseed(self, key: str) -> None:
+        pass
+
 
 class TestExecutorPersistence:
     def test_disabled_state_persists_into_a_new_executor(self, tmp_path):
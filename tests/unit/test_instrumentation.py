@@ -0,0 +1,119 @@
+"""Tests for opt-in run instrumentation (--timings)."""
+
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from geistfabrik import GeistExecutor, Vault, VaultContext
+from geistfabrik.instrumentation import SESSION_SCOPE, Instrumentation
+
+LINKING_GEIST = """
+def suggest(vault):
+    for note in vault.notes():
+        vault.backlinks(note)
+        vault.backlinks(note)
+    return []
+"""
+
+
+def test_methods_attributed_per_geist_with_cache_hits(
+    vault: Vault, make_context: Callable[..., VaultContext], tmp_path: Path
+) -> None:
+    geists_dir = tmp_path / "geists"
+    geists_dir.mkdir()
+    (geists_dir / "linker.py").write_text(LINKING_GEIST)
+    timings = Instrumentation()
+    context = make_context()
+    timings.instrument(context)
+    timings.attach(vault.db)
+
+    executor = GeistExecutor(geists_dir)
+    executor.load_geists()
+    executor.timings = timings
+    executor.execute_geist("linker", context)
+    context.notes()
+    timings.detach()
+
+    backlinks = timings.methods[("linker", "backlinks")]
+    assert (backlinks.calls, backlinks.hits, backlinks.misses) == (4, 2, 2)
+    assert timings.methods[(SESSION_SCOPE, "notes")].calls == 1
+    assert timings.geists["linker"].sql_count > 0
+    assert timings.method_totals()["backlinks"].calls == 4
+
+    # Only the instrumented instance is wrapped
+    other = make_context()
+    other.backlinks(vault.all_notes()[0])
+    assert timings.method_totals()["backlinks"].calls == 4
+
+
+def test_nested_phases_report_their_own_time_and_sql(vault: Vault) -> None:
+    timings = Instrumentation()
+    timings.attach(vault.db)
+    with timings.phase("execute"):
+        vault.db.execute("SELECT 1").fetchall()
+        with timings.phase("filter"):
+            time.sleep(0.02)
+            vault.db.execute("SELECT 1").fetchall()
+            vault.db.execute("SELECT 2").fetchall()
+    with timings.phase("filter"):
+        vault.db.execute("SELECT 3").fetchall()
+    timings.detach()
+    vault.db.execute("SELECT 4").fetchall()
+
+    assert list(timings.phases) == ["execute", "filter"]
+    assert timings.phases["execute"].sql_count == 1
+    assert timings.phases["filter"].sql_count == 3
+    assert timings.phases["filter"].duration >= 0.02
+    assert timings.phases["execute"].duration < 0.02
+    assert "filter" in timings.format_table()
+
+
+def test_phases_record_their_own_memory_growth() -> None:
+    timings = Instrumentation()
+    if not timings.per_phase_memory:
+        pytest.skip("per-phase peaks need /proc/self/clear_refs")
+
+    with timings.phase("execute"):
+        with timings.phase("load"):
+            block = b"x" * (64 << 20)
+            del block
+        with timings.phase("filter"):
+            pass
+    with timings.phase("write"):
+        pass
+
+    growth = {name: span.peak_growth_mb for name, span in timings.phases.items()}
+    assert growth["load"] is not None and growth["load"] >= 60
+    # The parent includes its child's peak; later phases start afresh
+    assert growth["execute"] is not None and growth["execute"] >= 60
+    assert growth["filter"] is not None and growth["filter"] < 30
+    assert growth["write"] is not None and growth["write"] < 30
+    assert "Peak +MB" in timings.format_table()
+
+
+def test_write_produces_chrome_trace(vault: Vault, tmp_path: Path) -> None:
+    timings = Instrumentation()
+    with timings.phase("sync"):
+        pass
+    with timings.geist("g"):
+        pass
+    path = tmp_path / "trace.json"
+    timings.write(path)
+
+    trace = json.loads(path.read_text())
+    assert [(e["name"], e["cat"], e["ph"]) for e in trace["traceEvents"]] == [
+        ("sync", "phase", "X"),
+        ("g", "geist", "X"),
+    ]
+    assert set(trace["geistfabrik"]) == {"phases", "geists", "methods"}
+
+
+def test_invoke_accepts_timings_flags() -> None:
+    from geistfabrik.cli import create_parser
+
+    args = create_parser().parse_args(["invoke", "--timings", "--timings-file", "out.json"])
+    assert args.timings is True
+    assert args.timings_file == "out.json"
@@ -0,0 +1,156 @@
+"""Tests for the per-session kNN graph."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from geistfabrik import Vault, VaultContext
+from geistfabrik.embeddings import Session
+from geistfabrik.function_registry import FunctionRegistry
+from geistfabrik.knn_graph import KnnGraph, load_knn_graph, save_knn_graph, session_knn_graph
+from geistfabrik.schema import init_db
+from geistfabrik.vault_context import _surprisal_from_graph, _surprisal_naive
+
+
+def _random_embeddings(n: int, d: int, seed: int) -> dict[str, np.ndarray]:
+    """Build a dict of n random d-dimensional embeddings (Gaussian, no ties)."""
+    rng = np.random.default_rng(seed)
+    return {f"note{i:04d}.md": rng.standard_normal(d).astype(np.float32) for i in range(n)}
+
+
+def _brute_force_order(embeddings: dict[str, np.ndarray], path: str) -> list[str]:
+    """All other paths ranked by float64 cosine similarity to path."""
+    query = embeddings[path].astype(np.float64)
+    query /= np.linalg.norm(query)
+    ranked = []
+    for other, vector in embeddings.items():
+        if other != path:
+            vector = vector.astype(np.float64)
+            ranked.append((-float(query @ (vector / np.linalg.norm(vector))), other))
+    return [other for _, other in sorted(ranked)]
+
+
+def _session_with_embeddings(db, date: str, embeddings: dict[str, np.ndarray]) -> int:
+    """Store a session and its embedding rows; return the session id."""
+    db.executemany(
+        "INSERT OR IGNORE INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES (?, ?, '', '', '', 0)",
+        [(path, path) for path in embeddings],
+    )
+    db.execute(
+        "INSERT INTO sessions (date, created_at, vault_state_hash) VALUES (?, ?, ?)",
+        (date, date, f"hash-{date}"),
+    )
+    session_id = db.execute("SELECT session_id FROM sessions WHERE date = ?", (date,)).fetchone()[0]
+    db.executemany(
+        "INSERT INTO session_embeddings (session_id, note_path, embedding) VALUES (?, ?, ?)",
+        [(session_id, path, vector.tobytes()) for path, vector in embeddings.items()],
+    )
+    db.commit()
+    return int(session_id)
+
+
+@pytest.mark.parametrize("block_size", [7, 1024])
+def test_build_matches_brute_force_ranking(block_size: int) -> None:
+    """Rows hold each note's exact top-k, most similar first, self excluded."""
+    embeddings = _random_embeddings(60, d=16, seed=3)
+    graph = KnnGraph.build(embeddings, k=8, block_size=block_size)
+
+    assert graph.k == 8
+    assert graph.neighbours.dtype == np.int32
+    assert graph.scores.dtype == np.float16
+    for path in graph.paths:
+        assert graph.neighbour_paths(path, 8) == _brute_force_order(embeddings, path)[:8]
+        row = graph.scores[graph.row(path)].astype(np.float32)
+        assert np.all(np.diff(row) <= 1e-3)
+
+
+def test_small_vault_lists_every_other_note() -> None:
+    """k is capped at N - 1, and such a graph covers any count."""
+    embeddings = _random_embeddings(5, d=8, seed=1)
+    graph = KnnGraph.build(embeddings, k=50)
+
+    assert graph.k == 4
+    assert graph.covers(100)
+    assert graph.neighbour_sets(100) == {path: set(embeddings) - {path} for path in embeddings}
+    assert KnnGraph.build({}, k=50).paths == []
+    assert KnnGraph.build(_random_embeddings(40, d=8, seed=1), k=10).covers(11) is False
+
+
+def test_surprisal_from_graph_matches_naive() -> None:
+    """Surprisal from stored neighbours agrees with the naive reference."""
+    embeddings = _random_embeddings(80, d=16, seed=5)
+    graph = KnnGraph.build(embeddings, k=20, block_size=16)
+
+    fast = _surprisal_from_graph(graph, embeddings, k_neighbours=5, block_size=9)
+    slow = _surprisal_naive(embeddings, k_neighbours=5)
+
+    assert fast.keys() == slow.keys()
+    for path in slow:
+        assert abs(fast[path] - slow[path]) < 1e-5
+
+
+def test_stored_graph_round_trips_until_session_changes() -> None:
+    """A stored graph loads back while its session is unchanged."""
+    db = init_db()
+    embeddings = _random_embeddings(30, d=8, seed=2)
+    session_id = _session_with_embeddings(db, "2025-01-15", embeddings)
+
+    graph = KnnGraph.build(embeddings, k=10)
+    save_knn_graph(db, session_id, graph)
+
+    loaded = load_knn_graph(db, session_id, k=10)
+    assert loaded is not None
+    assert loaded.paths == graph.paths
+    np.testing.assert_array_equal(loaded.neighbours, graph.neighbours)
+    np.testing.assert_array_equal(loaded.scores, graph.scores)
+
+    # Asking for more neighbours than stored
+    assert load_knn_graph(db, session_id, k=11) is None
+
+    # A note cascade drops a row without touching the vault hash
+    db.execute("DELETE FROM notes WHERE path = 'note0000.md'")
+    assert load_knn_graph(db, session_id, k=10) is None
+
+    # Rebuilt and stored again on demand
+    rebuilt = session_knn_graph(db, session_id, k=10)
+    assert "note0000.md" not in rebuilt.paths
+    assert load_knn_graph(db, session_id, k=10) is not None
+    db.close()
+
+
+def test_vault_context_answers_neighbour_queries_from_graph(tmp_path: Path) -> None:
+    """neighbours(), surprisal and churn share the stored session graphs."""
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    for i in range(12):
+        (vault_path / f"note{i:02d}.md").write_text(f"# Note {i}\n\nTopic number {i}.")
+    vault = Vault(str(vault_path), ":memory:")
+    vault.sync()
+    notes = vault.all_notes()
+
+    old_session = Session(datetime(2024, 6, 1), vault.db)
+    old_session.compute_embeddings(notes)
+    session = Session(datetime(2025, 1, 15), vault.db)
+    session.compute_embeddings(notes)
+    context = VaultContext(vault, session, function_registry=FunctionRegistry())
+
+    with patch.object(context._backend, "find_similar") as find_similar:
+        neighbours = context.neighbours(notes[0], count=5, return_scores=True)
+        find_similar.assert_not_called()
+
+    assert len(neighbours) == 5
+    assert notes[0] not in [note for note, _ in neighbours]
+    for note, score in neighbours:
+        assert abs(score - context.similarity(notes[0], note)) < 1e-6
+
+    assert context.surprisal_scores(k_neighbours=3)
+    assert context.neighbour_churn(since_days=90, k=3)
+
+    # Both sessions' graphs are stored for the next run
+    stored = {row[0] for row in vault.db.execute("SELECT session_id FROM session_knn")}
+    assert stored == {old_session.session_id, session.session_id}
+    vault.close()
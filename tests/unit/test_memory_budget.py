@@ -0,0 +1,115 @@
+"""Tests for the memory budget governor (performance.memory_budget_mb)."""
+
+from datetime import datetime
+
+import pytest
+import yaml
+
+from geistfabrik import Vault, VaultContext
+from geistfabrik.config_loader import GeistFabrikConfig, generate_default_config
+from geistfabrik.embeddings import Session
+from geistfabrik.instrumentation import Instrumentation
+from geistfabrik.memory_budget import (
+    DEFAULT_BLOCK_ROWS,
+    DEFAULT_PAIR_CANDIDATES,
+    DEFAULT_SIMILARITY_SAMPLE,
+    BoundedCache,
+    MemoryBudget,
+)
+
+# Thirty notes; every third links to the next
+pytestmark = pytest.mark.vault_notes(
+    {
+        f"note {i}.md": f"# Note {i}\n\nAbout topic {i % 4}, item {i}."
+        + (f" See [[note {i + 1}]]." if i % 3 == 0 else "")
+        for i in range(30)
+    }
+)
+
+
+def test_unlimited_budget_keeps_builtin_limits() -> None:
+    budget = MemoryBudget()
+    assert not budget.limited
+    assert budget.block_rows(50_000) == DEFAULT_BLOCK_ROWS
+    assert budget.similarity_sample() == DEFAULT_SIMILARITY_SAMPLE
+    assert budget.pair_candidates() == DEFAULT_PAIR_CANDIDATES
+    assert budget.cache_entries("_similarity_cache") is None
+
+
+def test_limits_scale_with_budget_and_vault_size() -> None:
+    small, large = MemoryBudget(64), MemoryBudget(4096)
+
+    # Blocks shrink as the vault grows and grow with the budget
+    assert small.block_rows(50_000) < small.block_rows(5_000)
+    assert small.block_rows(50_000) < DEFAULT_BLOCK_ROWS < large.block_rows(50_000)
+    # A (rows x N) block of float32 scores and int64 indices fits the budget
+    assert small.block_rows(50_000) * 50_000 * 12 <= 64 * 1024 * 1024
+    assert small.block_rows(10_000_000) == 16  # floor
+
+    assert small.similarity_sample() < large.similarity_sample()
+    assert small.similarity_sample() ** 2 * 24 <= 64 * 1024 * 1024
+    assert large.pair_candidates() == DEFAULT_PAIR_CANDIDATES
+    assert MemoryBudget(1).pair_candidates() < DEFAULT_PAIR_CANDIDATES
+
+    entries = small.cache_entries("_similarity_cache")
+    assert entries is not None
+    assert entries < (large.cache_entries("_similarity_cache") or 0)
+    assert small.cache_entries("_clusters_cache") is None  # not capped
+
+    described = small.describe(100)
+    assert described["budget_mb"] == 64
+    assert described["block_rows"] == 100
+
+
+def test_bounded_cache_evicts_oldest() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(2)
+    cache["a"], cache["b"], cache["c"] = 1, 2, 3
+    assert list(cache) == ["b", "c"]
+    assert cache.evictions == 1
+    cache["b"] = 4  # updates do not evict
+    assert (len(cache), cache.evictions) == (2, 1)
+
+    unbounded: BoundedCache[int, int] = BoundedCache()
+    for i in range(1000):
+        unbounded[i] = i
+    assert (len(unbounded), unbounded.evictions) == (1000, 0)
+
+
+def test_config_round_trip() -> None:
+    config = GeistFabrikConfig.from_dict({"performance": {"memory_budget_mb": 512}})
+    assert config.performance.memory_budget_mb == 512
+    assert config.to_dict()["performance"] == {"memory_budget_mb": 512}
+    default = GeistFabrikConfig.from_dict(yaml.safe_load(generate_default_config()))
+    assert default.performance.memory_budget_mb == 0
+
+
+def test_budgeted_context_matches_unlimited(vault: Vault) -> None:
+    session = Session(datetime(2025, 3, 1), vault.db)
+    session.compute_embeddings(vault.all_notes())
+    unlimited = VaultContext(vault, session, seed=1)
+    budgeted = VaultContext(vault, session, seed=1, memory_budget=MemoryBudget(1))
+
+    assert isinstance(budgeted._similarity_cache, BoundedCache)
+    assert budgeted._similarity_cache.max_entries == 256
+    assert budgeted.surprisal_scores(5) == pytest.approx(unlimited.surprisal_scores(5))
+    assert budgeted.unlinked_pairs(count=10) == unlimited.unlinked_pairs(count=10)
+    note = vault.all_notes()[0]
+    assert budgeted.neighbours(note, 5) == unlimited.neighbours(note, 5)
+
+
+def test_evicting_caches_count_misses(vault: Vault) -> None:
+    session = Session(datetime(2025, 3, 1), vault.db)
+    session.compute_embeddings(vault.all_notes())
+    context = VaultContext(vault, session, memory_budget=MemoryBudget(1))
+    context._backlinks_cache.max_entries = 1  # type: ignore[attr-defined]
+    timings = Instrumentation()
+    timings.instrument(context)
+
+    a, b = vault.all_notes()[:2]
+    with timings.phase("execute"):
+        for note in (a, b, a, a):
+            context.backlinks(note)
+
+    stats = timings.method_totals()["backlinks"]
+    assert (stats.calls, stats.hits, stats.misses) == (4, 1, 3)
+    assert len(context._backlinks_cache) == 1
@@ -368,3 +368,169 @@ def infer(note, vault):
 
         assert "enabled" in loader.modules
         assert "disabled" not in loader.modules
+
+
+def _notes(count: int) -> list[Note]:
+    from datetime import datetime
+
+    return [
+        Note(
+            path=f"note{i}.md",
+            title=f"Note {i}",
+            content=" ".join(["word"] * (i + 1)),
+            links=[],
+            tags=[],
+            created=datetime.now(),
+            modified=datetime.now(),
+        )
+        for i in range(count)
+    ]
+
+
+def test_infer_batch_runs_once_for_many_notes() -> None:
+    """A batch module is called once per infer_many, and still works per note."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_dir = Path(tmpdir)
+
+        (module_dir / "ranked.py").write_text("""
+CALLS = []
+
+def infer_batch(notes, vault):
+    CALLS.append(len(notes))
+    order = sorted(notes, key=lambda n: len(n.content))
+    return {n.path: {"length_rank": rank} for rank, n in enumerate(order)}
+""")
+        (module_dir / "simple.py").write_text("""
+def infer(note, vault):
+    return {"title_length": len(note.title)}
+""")
+
+        loader = MetadataLoader(module_dir)
+        loader.load_modules()
+        assert set(loader.modules) == {"ranked", "simple"}
+        assert set(loader.batch_modules) == {"ranked"}
+        assert loader.wants_prefetch
+
+        class MockVault:
+            pass
+
+        notes = _notes(5)
+        inferred = loader.infer_many(notes, MockVault())  # type: ignore[arg-type]
+        import sys
+
+        assert sys.modules["_metadata_ranked"].CALLS == [5]
+        assert inferred["note3.md"] == ({"length_rank": 3, "title_length": 6}, [])
+
+        # infer_all still works, calling infer_batch with one note
+        metadata, failed = loader.infer_all(notes[4], MockVault())  # type: ignore[arg-type]
+        assert metadata == {"length_rank": 0, "title_length": 6}
+        assert failed == []
+
+
+def test_infer_many_validates_like_infer_all() -> None:
+    """Invalid values are dropped and failures reported per note."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_dir = Path(tmpdir)
+
+        (module_dir / "a_batch.py").write_text("""
+def infer_batch(notes, vault):
+    return {
+        notes[0].path: {"shared": 1, "bad": object()},
+        notes[1].path: "not a dict",
+    }
+""")
+        (module_dir / "b_broken.py").write_text("""
+def infer_batch(notes, vault):
+    raise RuntimeError("boom")
+""")
+        (module_dir / "c_note.py").write_text("""
+def infer(note, vault):
+    if note.path == "note2.md":
+        raise ValueError("bad note")
+    return {"own": True}
+""")
+
+        loader = MetadataLoader(module_dir)
+        loader.load_modules()
+
+        class MockVault:
+            pass
+
+        inferred = loader.infer_many(_notes(3), MockVault())  # type: ignore[arg-type]
+        assert inferred["note0.md"] == ({"shared": 1, "own": True}, ["b_broken"])
+        assert inferred["note1.md"] == ({"own": True}, ["a_batch", "b_broken"])
+        assert inferred["note2.md"] == ({}, ["b_broken", "c_note"])
+
+
+def test_infer_many_conflict_costs_only_the_conflicting_note() -> None:
+    """A key conflict on one note is recorded as a failed module for that note."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_dir = Path(tmpdir)
+
+        (module_dir / "a_batch.py").write_text("""
+def infer_batch(notes, vault):
+    return {notes[0].path: {"shared": 1}}
+""")
+        (module_dir / "b_note.py").write_text("""
+def infer(note, vault):
+    result = {"own": note.path}
+    if note.path == "note0.md":
+        result["shared"] = 2
+    return result
+""")
+
+        loader = MetadataLoader(module_dir)
+        loader.load_modules()
+
+        class MockVault:
+            pass
+
+        inferred = loader.infer_many(_notes(3), MockVault())  # type: ignore[arg-type]
+        assert inferred["note0.md"] == ({"shared": 1}, ["b_note"])
+        assert inferred["note1.md"] == ({"own": "note1.md"}, [])
+        assert inferred["note2.md"] == ({"own": "note2.md"}, [])
+
+        # infer_all still raises for the conflicting note
+        with pytest.raises(MetadataConflictError):
+            loader.infer_all(_notes(1)[0], MockVault())  # type: ignore[arg-type]
+
+
+def test_vault_context_prefetches_batch_metadata(tmp_path: Path) -> None:
+    """VaultContext.metadata() infers every note in one infer_batch call."""
+    import sys
+    from datetime import datetime
+
+    from geistfabrik import Session, Vault, VaultContext
+    from geistfabrik.function_registry import FunctionRegistry
+
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    for i in range(6):
+        (vault_path / f"note{i}.md").write_text(f"# Note {i}\n\n" + "word " * (i + 1))
+    module_dir = tmp_path / "metadata_inference"
+    module_dir.mkdir()
+    (module_dir / "relative.py").write_text("""
+CALLS = []
+
+def infer_batch(notes, vault):
+    CALLS.append(len(notes))
+    # Built-in keys of other notes are available while modules run
+    counts = {n.path: vault.metadata(n)["word_count"] for n in notes}
+    longest = max(counts.values())
+    return {path: {"relative_length": count / longest} for path, count in counts.items()}
+""")
+
+    vault = Vault(vault_path, ":memory:")
+    vault.sync()
+    session = Session(datetime(2025, 1, 1), vault.db)
+    session.compute_embeddings(vault.all_notes())
+    loader = MetadataLoader(module_dir)
+    loader.load_modules()
+    ctx = VaultContext(vault, session, metadata_loader=loader, function_registry=FunctionRegistry())
+
+    by_path = {note.path: ctx.metadata(note) for note in ctx.notes()}
+    assert sys.modules["_metadata_relative"].CALLS == [6]
+    assert by_path["note5.md"]["relative_length"] == 1.0
+    assert by_path["note0.md"]["relative_length"] < by_path["note1.md"]["relative_length"]
+    assert by_path["note0.md"]["word_count"] > 0
+    vault.close()
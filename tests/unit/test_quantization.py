@@ -0,0 +1,158 @@
+"""Tests for reduced-precision embedding storage and search."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from geistfabrik.config import SEMANTIC_DIM, TOTAL_DIM
+from geistfabrik.embeddings import Session
+from geistfabrik.quantization import (
+    EMBEDDING_PRECISIONS,
+    CompactMatrix,
+    StoredEmbeddings,
+    decode_embedding,
+    decode_embeddings,
+    encode_embeddings,
+    encoded_size,
+    neighbour_recall,
+)
+from geistfabrik.vault import Vault
+from geistfabrik.vault_context import VaultContext
+from geistfabrik.vector_search import InMemoryVectorBackend
+
+pytestmark = pytest.mark.vault_notes(
+    {f"note {i}.md": f"# Note {i}\n\nAbout topic {i % 3}, item {i}." for i in range(12)},
+    db="vault.db",
+)
+
+
+def _session_like(n: int, seed: int = 0) -> np.ndarray:
+    """Clustered unit semantic vectors (x0.9) plus temporal features (x0.1)."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(20, SEMANTIC_DIM))
+    semantic = centres[rng.integers(0, 20, n)] + rng.normal(size=(n, SEMANTIC_DIM))
+    semantic /= np.linalg.norm(semantic, axis=1, keepdims=True)
+    temporal = np.column_stack([rng.uniform(0, 8, n), rng.uniform(-1, 1, n), np.full(n, 0.5)])
+    return np.hstack([semantic * 0.9, temporal * 0.1]).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    ("precision", "size", "tolerance"),
+    [("float32", 1548, 0.0), ("float16", 774, 1e-3), ("int8", 400, 5e-3)],
+)
+def test_round_trip(precision: str, size: int, tolerance: float) -> None:
+    matrix = _session_like(50)
+    blobs = encode_embeddings(matrix, precision)
+    assert {len(blob) for blob in blobs} == {size} == {encoded_size(TOTAL_DIM, precision)}
+    decoded = decode_embeddings(blobs, TOTAL_DIM)
+    assert decoded.dtype == np.float32
+    assert np.abs(decoded - matrix).max() <= tolerance
+    if precision == "int8":
+        # Temporal features are kept exactly, however large the note age
+        assert np.array_equal(decoded[:, SEMANTIC_DIM:], matrix[:, SEMANTIC_DIM:])
+
+
+def test_decoding_mixed_and_legacy_blobs() -> None:
+    matrix = _session_like(3)
+    blobs = [
+        encode_embeddings(matrix[i : i + 1], precision)[0]
+        for i, precision in enumerate(EMBEDDING_PRECISIONS)
+    ]
+    decoded = decode_embeddings(blobs, TOTAL_DIM)
+    assert np.allclose(decoded, matrix, atol=5e-3)
+    assert np.array_equal(decode_embedding(blobs[0], TOTAL_DIM), matrix[0])
+
+    # Decoded vectors are shared by callers, so none of them is writable
+    assert not decoded.flags.writeable
+    for blob in blobs:
+        vector = decode_embedding(blob, TOTAL_DIM)
+        with pytest.raises(ValueError, match="read-only"):
+            vector[0] = 1.0
+
+    # float32 vectors of another dimension decode as before
+    other = np.arange(8, dtype=np.float32)
+    assert np.array_equal(decode_embedding(other.tobytes(), TOTAL_DIM), other)
+    with pytest.raises(ValueError, match="Unknown embedding precision"):
+        encode_embeddings(matrix, "int4")
+
+
+def test_neighbour_recall() -> None:
+    matrix = _session_like(1000)
+    assert neighbour_recall(matrix, "float32", k=10, queries=50) == 1.0
+    assert neighbour_recall(matrix, "float16", k=10, queries=50) >= 0.99
+    assert neighbour_recall(matrix, "int8", k=10, queries=50) >= 0.95
+    # Rescoring float32-stored vectors recovers what the int8 scan misses
+    scan = neighbour_recall(matrix, "int8", k=10, queries=50, rescore_factor=1, storage=False)
+    rescored = neighbour_recall(matrix, "int8", k=10, queries=50, storage=False)
+    assert rescored >= scan
+    assert rescored >= 0.99
+
+    compact = CompactMatrix(matrix, "int8")
+    assert compact.nbytes < CompactMatrix(matrix, "float32").nbytes / 3.5
+
+
+def test_session_stores_and_searches_at_reduced_precision(vault: Vault) -> None:
+    date = datetime(2025, 3, 1)
+    exact = Session(date, vault.db)
+    exact.compute_embeddings(vault.all_notes())
+    exact_backend = exact.get_backend()
+    query = exact.get_embedding("note 0.md")
+    assert query is not None
+
+    # A second vault database holding the same session at int8
+    other = Vault(vault.vault_path, vault.db_path.with_name("int8.db"))
+    other.sync()
+    compact = Session(date, other.db, embedding_precision="int8", search_precision="int8")
+    compact.compute_embeddings(other.all_notes())
+    sizes = {len(blob) for (blob,) in other.db.execute("SELECT embedding FROM session_embeddings")}
+    assert sizes == {encoded_size(TOTAL_DIM, "int8")}
+
+    stored = compact.get_embedding("note 0.md")
+    assert stored is not None
+    assert np.allclose(stored, query, atol=5e-3)
+    backend = compact.get_backend()
+    assert isinstance(backend, InMemoryVectorBackend)
+    assert backend._matrix is None and backend._compact is not None
+    expected = [path for path, _ in exact_backend.find_similar(query, 5)]
+    assert [path for path, _ in backend.find_similar(query, 5)] == expected
+
+    with pytest.raises(ValueError, match="Unknown embedding precision"):
+        Session(date, other.db, search_precision="bfloat16")
+    other.close()
+    vault.close()
+
+
+def test_reduced_precision_keeps_only_compact_rows_resident(vault: Vault) -> None:
+    date = datetime(2025, 3, 1)
+    session = Session(date, vault.db, embedding_precision="int8", search_precision="int8")
+    session.compute_embeddings(vault.all_notes())
+    exact = {path: session.get_embedding(path) for path in ("note 0.md", "note 1.md")}
+
+    # The backend holds no float32 rows; it rescores from the database...
+    backend = session.get_backend()
+    assert isinstance(backend, InMemoryVectorBackend)
+    assert backend.embeddings == {} and backend._matrix is None
+    query = exact["note 0.md"]
+    assert query is not None
+    from_db = backend.find_similar(query, 5)
+    assert np.array_equal(backend.get_embedding("note 0.md"), query)
+    assert backend.get_similarity("note 0.md", "note 1.md") == pytest.approx(
+        float(np.dot(query, exact["note 1.md"]))
+        / float(np.linalg.norm(query) * np.linalg.norm(exact["note 1.md"])),
+        rel=1e-5,
+    )
+    with pytest.raises(KeyError):
+        backend.get_embedding("missing.md")
+
+    # ...or from the rows VaultContext keeps as stored blobs
+    context = VaultContext(vault, session)
+    rows = context.get_all_embeddings()
+    assert isinstance(rows, StoredEmbeddings)
+    assert backend._shared_rows is rows
+    assert rows.nbytes == len(rows) * encoded_size(TOTAL_DIM, "int8")
+    assert backend.find_similar(query, 5) == from_db
+    embedding = context.get_embedding("note 0.md")
+    assert embedding is not None and not embedding.flags.writeable
+    assert context.embedding_matrix().unit.dtype == np.float16
+    assert context.neighbours(context.notes()[0], 3)
@@ -255,3 +255,46 @@ def test_candidates_match_expected_voices(voice_vault) -> None:
 
     we = registry.call("we_notes", context, 12)
     assert any("We" in entry for entry in we)
+
+
+def test_voice_columns_match_voice(voice_vault) -> None:
+    """voice_column() is voice() for every note, in notes() order."""
+    vault, session = voice_vault
+    context = _context(vault, session, FunctionRegistry())
+
+    hedging = context.voice_column("hedging_ratio")
+    assert hedging.tolist() == [context.voice(n).hedging_ratio for n in context.notes()]
+    assert context.voice_column("hedging_ratio") is hedging
+    with pytest.raises(ValueError, match="Unknown voice field"):
+        context.voice_column("mood")
+
+
+def test_contrarian_to_batches_over_the_embedding_matrix(voice_vault) -> None:
+    """Batched contrarian_to matches per-note cosine ranking and returns NoteLinks."""
+    import numpy as np
+
+    from geistfabrik.function_registry import NoteLink
+
+    vault, session = voice_vault
+    registry = FunctionRegistry()
+    context = _context(vault, session, registry)
+    notes = context.notes()
+
+    titles = [n.title for n in notes[:4]] + ["No Such Note"]
+    batched = context.call_function_many("contrarian_to", titles, 3)
+    assert batched[-1] == []
+    assert context.embedding_matrix() is context.embedding_matrix()
+
+    for note, links in zip(notes[:4], batched):
+        query = context.get_embedding(note.path)
+        others = [n for n in notes if n.path != note.path]
+        scores = [
+            float(np.dot(query, e) / (np.linalg.norm(query) * np.linalg.norm(e)))
+            for e in (context.get_embedding(n.path) for n in others)
+        ]
+        expected = [others[i].path for i in np.argsort(scores, kind="stable")[:3]]
+        assert [link.path for link in links] == expected
+        assert all(isinstance(link, NoteLink) for link in links)
+        assert all(BRACKETED_LINK_RE.match(link) for link in links)
+        # A single call returns the same links, from the memo
+        assert registry.call("contrarian_to", context, note.title, 3) == links
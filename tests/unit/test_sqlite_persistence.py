@@ -1,8 +1,23 @@
 """Unit tests for SQLite persistence."""
 
+import os
 import sqlite3
+import stat
+import sys
+from pathlib import Path
 
-from geistfabrik.schema import SCHEMA_VERSION, get_schema_version, init_db, migrate_schema
+import pytest
+
+from geistfabrik.config_loader import DatabaseConfig, GeistFabrikConfig
+from geistfabrik.schema import (
+    SCHEMA_VERSION,
+    connect_readonly,
+    content_hash,
+    get_schema_version,
+    init_db,
+    migrate_schema,
+)
+from geistfabrik.vault import Vault
 
 
 def test_init_db_memory() -> None:
@@ -308,3 +323,169 @@ def test_composite_index_improves_orphan_query() -> None:
     assert "note3.md" in orphans
 
     conn.close()
+
+
+def test_fast_profile_pragmas(tmp_path: Path) -> None:
+    """The default "fast" profile enables WAL, mmap and a busy timeout."""
+    conn = init_db(tmp_path / "fast.db")
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    conn.close()
+
+
+def test_safe_profile_pragmas(tmp_path: Path) -> None:
+    """The "safe" profile keeps the rollback journal and full fsync."""
+    conn = init_db(tmp_path / "safe.db", profile="safe")
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 0
+    conn.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_database_and_wal_files_are_owner_only(tmp_path: Path) -> None:
+    """vault.db, vault.db-wal and vault.db-shm are 0600 whatever the umask."""
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    (vault_path / "note.md").write_text("# Private\n\nSecret content.")
+    db_path = tmp_path / "vault.db"
+    side_files = [db_path.with_name(f"vault.db{suffix}") for suffix in ("", "-wal", "-shm")]
+
+    old_umask = os.umask(0o022)
+    try:
+        vault = Vault(vault_path, db_path)
+        vault.sync()
+        modes = {path.name: stat.S_IMODE(path.stat().st_mode) for path in side_files}
+        vault.close()
+
+        # Files left world-readable by an older version are tightened on open
+        for path in side_files:
+            if path.exists():
+                path.chmod(0o644)
+        db_path.chmod(0o644)
+        init_db(db_path).close()
+        reopened = stat.S_IMODE(db_path.stat().st_mode)
+    finally:
+        os.umask(old_umask)
+
+    assert modes == {"vault.db": 0o600, "vault.db-wal": 0o600, "vault.db-shm": 0o600}
+    assert reopened == 0o600
+
+
+def test_unknown_profile_rejected(tmp_path: Path) -> None:
+    """An unknown profile raises before the database file is created."""
+    with pytest.raises(ValueError, match="Unknown database profile"):
+        init_db(tmp_path / "bad.db", profile="turbo")
+    assert not (tmp_path / "bad.db").exists()
+
+
+def test_readonly_connection_reads_during_write(tmp_path: Path) -> None:
+    """A reader sees committed rows while the writer holds an open transaction."""
+    db_path = tmp_path / "vault.db"
+    writer = init_db(db_path)
+    writer.execute(
+        "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES ('a.md', 'A', '', '', '', 0)"
+    )
+    writer.commit()
+
+    reader = connect_readonly(db_path)
+    writer.execute("UPDATE notes SET title = 'A2' WHERE path = 'a.md'")  # uncommitted
+
+    assert reader.execute("SELECT title FROM notes").fetchone()[0] == "A"
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("DELETE FROM notes")
+
+    writer.commit()
+    reader.close()
+    writer.close()
+
+
+def test_readonly_connection_requires_existing_db(tmp_path: Path) -> None:
+    """Opening a reader on a missing database fails instead of creating it."""
+    with pytest.raises(FileNotFoundError):
+        connect_readonly(tmp_path / "missing.db")
+
+
+def test_vault_uses_configured_profile(tmp_path: Path) -> None:
+    """Vault opens its writer and readers with config.database.profile."""
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    config = GeistFabrikConfig(database=DatabaseConfig(profile="safe"))
+
+    vault = Vault(vault_path, tmp_path / "vault.db", config=config)
+    assert vault.db.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    reader = vault.open_reader()
+    assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+    reader.close()
+    vault.close()
+
+    with pytest.raises(ValueError):
+        Vault(vault_path).open_reader()
+
+
+def test_init_db_migrates_existing_database(tmp_path: Path) -> None:
+    """Reopening a v8 database adds session_embeddings.note_state."""
+    db_path = tmp_path / "v8.db"
+    conn = init_db(db_path)
+    conn.execute("ALTER TABLE session_embeddings DROP COLUMN note_state")
+    conn.execute("PRAGMA user_version = 8")
+    conn.commit()
+    conn.close()
+
+    conn = init_db(db_path)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(session_embeddings)")}
+    assert "note_state" in columns
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    conn.close()
+
+
+def test_migration_backfills_content_hash(tmp_path: Path) -> None:
+    """Upgrading to v10 fills notes.content_hash for existing notes."""
+    db_path = tmp_path / "v9.db"
+    conn = init_db(db_path)
+    conn.execute(
+        "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES ('a.md', 'A', 'Body', '', '', 0)"
+    )
+    conn.execute("ALTER TABLE notes DROP COLUMN content_hash")
+    conn.execute("PRAGMA user_version = 9")
+    conn.commit()
+    conn.close()
+
+    conn = init_db(db_path)
+    assert conn.execute("SELECT content_hash FROM notes").fetchone()[0] == content_hash("Body")
+    conn.close()
+
+
+def test_migration_keys_suggestion_embeddings_by_model(tmp_path: Path) -> None:
+    """Upgrading to v14 keeps stored rows and allows one row per model."""
+    db_path = tmp_path / "v13.db"
+    conn = init_db(db_path)
+    conn.execute("DROP TABLE suggestion_embeddings")
+    conn.execute("""
+        CREATE TABLE suggestion_embeddings (
+            text_hash TEXT PRIMARY KEY,
+            model_version TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            computed_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("INSERT INTO suggestion_embeddings VALUES ('h', 'model-a', x'00', '2025-01-01')")
+    conn.execute("PRAGMA user_version = 13")
+    conn.commit()
+    conn.close()
+
+    conn = init_db(db_path)
+    conn.execute("INSERT INTO suggestion_embeddings VALUES ('h', 'model-b', x'01', '2025-01-02')")
+    rows = conn.execute(
+        "SELECT model_version FROM suggestion_embeddings WHERE text_hash = 'h' ORDER BY 1"
+    ).fetchall()
+    assert rows == [("model-a",), ("model-b",)]
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    conn.close()
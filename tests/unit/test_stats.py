@@ -137,6 +137,22 @@ def test_stats_collector_get_latest_embeddings(vault_with_embeddings):
     assert embeddings.shape[0] == 3
 
 
+def test_stats_collector_reads_on_reader_connection(vault_with_embeddings):
+    """Stats read through a read-only connection while the writer is mid-write."""
+    vault = vault_with_embeddings
+    vault.db.execute("UPDATE notes SET title = 'Renamed'")  # open write transaction
+    reader = vault.open_reader()
+    try:
+        collector = StatsCollector(vault, GeistFabrikConfig(), db=reader)
+        assert collector.db is reader
+        assert collector.stats["notes"]["total"] == 3
+        latest = collector.get_latest_embeddings()
+        assert latest is not None and latest[0] == "2025-01-15"
+    finally:
+        reader.close()
+        vault.db.rollback()
+
+
 # ========== EmbeddingMetricsComputer Tests ==========
 
 
@@ -777,3 +793,140 @@ def test_procrustes_alignment():
 
     # After alignment should be better (closer to 1)
     assert sim_after >= sim_before - 0.1  # Allow small numerical error
+
+
+# ========== Drift Engine Tests ==========
+
+
+def _insert_session(db, date, paths, embeddings, labels=None):
+    """Insert a session with explicit embeddings directly into the database."""
+    db.executemany(
+        """INSERT OR IGNORE INTO notes (path, title, content, created, modified, file_mtime)
+        VALUES (?, ?, '', ?, ?, 0)""",
+        [(path, path, date, date) for path in paths],
+    )
+    cursor = db.execute(
+        "INSERT INTO sessions (date, vault_state_hash, created_at) VALUES (?, ?, ?)",
+        (date, "test", date),
+    )
+    session_id = cursor.lastrowid
+    labels = labels or [None] * len(paths)
+    db.executemany(
+        """INSERT INTO session_embeddings (session_id, note_path, embedding, cluster_label)
+        VALUES (?, ?, ?, ?)""",
+        [
+            (session_id, path, emb.astype(np.float32).tobytes(), label)
+            for path, emb, label in zip(paths, embeddings, labels)
+        ],
+    )
+    db.commit()
+
+
+class _DbVault:
+    """Minimal vault stand-in exposing only the database."""
+
+    def __init__(self, db):
+        self.db = db
+        self.vault_path = "/tmp/drift-vault"
+
+
+def _drift_collector(db):
+    collector = StatsCollector.__new__(StatsCollector)
+    collector.vault = _DbVault(db)
+    collector.config = GeistFabrikConfig()
+    collector.history_days = 30
+    collector.db = db
+    collector.stats = {}
+    collector._latest_snapshot = None
+    return collector
+
+
+def test_procrustes_rotation_matches_scipy_with_blocks():
+    """Blocked cross-covariance gives the same rotation as scipy."""
+    from scipy.linalg import orthogonal_procrustes  # type: ignore[import-untyped]
+
+    from geistfabrik.stats import _procrustes_rotation
+
+    rng = np.random.default_rng(0)
+    source = rng.standard_normal((50, 12))
+    target = rng.standard_normal((50, 12))
+
+    expected, _ = orthogonal_procrustes(source, target)
+    actual = _procrustes_rotation(source, target, block_size=7)
+
+    np.testing.assert_allclose(actual, expected, atol=1e-10)
+
+
+def test_temporal_drift_ignores_global_rotation():
+    """A rotated copy of the same session aligns back to near-zero drift."""
+    db = init_db()
+    rng = np.random.default_rng(1)
+    paths = [f"note{i:02d}.md" for i in range(30)]
+    past = rng.standard_normal((30, 16))
+    rotation, _ = np.linalg.qr(rng.standard_normal((16, 16)))
+    current = past @ rotation
+    # Make one note genuinely move
+    current[3] = rng.standard_normal(16)
+
+    _insert_session(db, "2024-12-01", paths, past)
+    # Current session holds an extra note and lacks one, exercising the join
+    _insert_session(
+        db,
+        "2025-01-15",
+        paths[1:] + ["new.md"],
+        np.vstack([current[1:], rng.standard_normal((1, 16))]),
+        labels=["a"] * 15 + ["b"] * 15,
+    )
+
+    drift = _drift_collector(db).get_temporal_drift("2025-01-15", days_back=30)
+
+    assert drift is not None
+    assert drift["notes_compared"] == 29
+    assert drift["high_drift_notes"][0]["title"] == "note03"
+    assert drift["drift_distribution"]["median"] < 0.05
+    assert drift["drift_distribution"]["max"] >= drift["drift_distribution"]["p90"]
+    assert {c["cluster"] for c in drift["cluster_drift"]} == {"a", "b"}
+    assert drift["cluster_drift"][0]["cluster"] == "a"  # note03 is in cluster "a"
+    db.close()
+
+
+def test_stats_decode_each_session_once(monkeypatch):
+    """Latest embeddings and drift share one decode of the latest session."""
+    db = init_db()
+    rng = np.random.default_rng(3)
+    paths = [f"note{i:02d}.md" for i in range(20)]
+    _insert_session(db, "2024-12-01", paths, rng.standard_normal((20, 16)))
+    _insert_session(db, "2025-01-15", paths, rng.standard_normal((20, 16)))
+    collector = _drift_collector(db)
+    decoded: list[str] = []
+    load = collector._load_session_snapshot
+    monkeypatch.setattr(
+        collector, "_load_session_snapshot", lambda date: decoded.append(date) or load(date)
+    )
+
+    latest = collector.get_latest_embeddings()
+    assert latest is not None
+    drift = collector.get_temporal_drift(latest[0], days_back=30)
+
+    assert drift is not None
+    assert sorted(decoded) == ["2024-12-01", "2025-01-15"]
+    db.close()
+
+
+def test_drift_timeline_covers_consecutive_sessions():
+    """Timeline reports one entry per consecutive session pair in the window."""
+    db = init_db()
+    rng = np.random.default_rng(2)
+    paths = [f"note{i:02d}.md" for i in range(10)]
+    base = rng.standard_normal((10, 8))
+    for i, date in enumerate(["2024-11-01", "2025-01-01", "2025-01-08", "2025-01-15"]):
+        _insert_session(db, date, paths, base + 0.1 * i * rng.standard_normal((10, 8)))
+
+    timeline = _drift_collector(db).get_drift_timeline(days_back=30)
+
+    assert [(s["from_date"], s["to_date"]) for s in timeline] == [
+        ("2025-01-01", "2025-01-08"),
+        ("2025-01-08", "2025-01-15"),
+    ]
+    assert all(s["notes_compared"] == 10 for s in timeline)
+    db.close()
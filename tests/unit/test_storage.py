@@ -0,0 +1,121 @@
+"""Tests for database footprint and compaction (geistfabrik db)."""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from geistfabrik.embeddings import Session
+from geistfabrik.schema import init_db
+from geistfabrik.storage import compact_database, database_stats, incremental_vacuum
+from geistfabrik.vault import Vault
+
+
+def _fill(conn: sqlite3.Connection, sessions: int) -> None:
+    """Store embedding rows for 50 notes in several sessions."""
+    conn.executemany(
+        "INSERT INTO notes (path, title, content, created, modified, file_mtime) "
+        "VALUES (?, '', '', '', '', 0)",
+        [(f"note {i}.md",) for i in range(50)],
+    )
+    for day in range(sessions):
+        date = (datetime(2025, 1, 1) + timedelta(days=day)).strftime("%Y-%m-%d")
+        conn.execute("INSERT INTO sessions (date, created_at) VALUES (?, ?)", (date, date))
+        session_id = conn.execute(
+            "SELECT session_id FROM sessions WHERE date = ?", (date,)
+        ).fetchone()[0]
+        conn.executemany(
+            "INSERT INTO session_embeddings (session_id, note_path, embedding) VALUES (?, ?, ?)",
+            [(session_id, f"note {i}.md", bytes(1548)) for i in range(50)],
+        )
+    conn.commit()
+
+
+def test_new_databases_use_incremental_auto_vacuum(tmp_path: Path) -> None:
+    conn = init_db(tmp_path / "vault.db")
+    assert database_stats(conn).auto_vacuum == "incremental"
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_database_stats_reports_tables(tmp_path: Path) -> None:
+    conn = init_db(tmp_path / "vault.db")
+    _fill(conn, 3)
+    stats = database_stats(conn)
+    by_name = {table.name: table for table in stats.tables}
+    assert stats.tables[0].name == "session_embeddings"  # largest first
+    assert by_name["session_embeddings"].rows == 150
+    assert (by_name["session_embeddings"].payload_bytes or 0) >= 150 * 1548
+    assert by_name["sessions"].rows == 3
+    assert by_name["notes"].rows == 50
+    assert 0.0 <= (by_name["session_embeddings"].fragmentation or 0.0) <= 1.0
+    assert json.loads(json.dumps(stats.to_dict()))["tables"][0]["name"] == "session_embeddings"
+    conn.close()
+
+
+def test_compact_converts_and_shrinks_old_databases(tmp_path: Path) -> None:
+    path = tmp_path / "vault.db"
+    conn = sqlite3.connect(str(path))  # created before incremental auto-vacuum
+    conn.execute("CREATE TABLE legacy (x)")
+    conn.close()
+    conn = init_db(path)
+    assert database_stats(conn).auto_vacuum == "none"
+    _fill(conn, 6)
+    conn.execute("DELETE FROM session_embeddings WHERE session_id <= 4")
+    conn.commit()
+    assert incremental_vacuum(conn) == 0  # not possible in this mode
+
+    report = compact_database(conn)
+    assert report.full_vacuum
+    assert report.bytes_after < report.bytes_before
+    stats = database_stats(conn)
+    assert (stats.auto_vacuum, stats.freelist_count) == ("incremental", 0)
+
+    # Later compactions are incremental
+    conn.execute("DELETE FROM session_embeddings")
+    conn.commit()
+    report = compact_database(conn)
+    assert not report.full_vacuum
+    assert report.bytes_after < report.bytes_before
+    conn.close()
+
+
+@pytest.mark.parametrize("vacuum_after_prune", [False, True])
+def test_pruning_can_release_pages(tmp_path: Path, vacuum_after_prune: bool) -> None:
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    for i in range(20):
+        (vault_path / f"note {i}.md").write_text(f"# Note {i}\n\n" + "words " * 200)
+    vault = Vault(vault_path, tmp_path / "vault.db")
+    vault.sync()
+    notes = vault.all_notes()
+    for day in range(4):
+        Session(
+            datetime(2025, 1, 1) + timedelta(days=day),
+            vault.db,
+            embedding_retention=1,
+            vacuum_after_prune=vacuum_after_prune,
+        ).compute_embeddings(notes)
+
+    freelist = vault.db.execute("PRAGMA freelist_count").fetchone()[0]
+    assert (freelist == 0) is vacuum_after_prune
+    vault.close()
+
+
+def test_db_command(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    from geistfabrik.cli import COMMANDS, create_parser
+
+    vault_path = tmp_path / "vault"
+    (vault_path / "_geistfabrik").mkdir(parents=True)
+    (vault_path / "note.md").write_text("# Note")
+    Vault(vault_path, vault_path / "_geistfabrik" / "vault.db").close()
+
+    args = create_parser().parse_args(["db", "stats", str(vault_path), "--json"])
+    assert COMMANDS["db"](args).run() == 0
+    assert json.loads(capsys.readouterr().out)["auto_vacuum"] == "incremental"
+
+    args = create_parser().parse_args(["db", "compact", str(vault_path)])
+    assert COMMANDS["db"](args).run() == 0
+    assert "incremental vacuum and reindex" in capsys.readouterr().out
@@ -0,0 +1,164 @@
+"""Tests for TemporalIndex date queries."""
+
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from geistfabrik import Vault, VaultContext
+from geistfabrik.embeddings import Session
+from geistfabrik.function_registry import FunctionRegistry
+from geistfabrik.models import Note
+from geistfabrik.temporal_analysis import TemporalIndex, get_season
+
+
+def _note(path: str, created: datetime, modified: datetime | None = None, **kwargs) -> Note:
+    return Note(
+        path=path,
+        title=path,
+        content="",
+        links=[],
+        tags=[],
+        created=created,
+        modified=modified or created,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def notes() -> list[Note]:
+    """Notes with random creation times over four years, some sharing instants."""
+    rng = random.Random(7)
+    base = datetime(2021, 1, 1)
+    result = []
+    for i in range(300):
+        created = base + timedelta(minutes=rng.randrange(4 * 365 * 24 * 60))
+        if i % 10 == 0 and result:
+            created = result[-1].created  # exact ties
+        modified = created + timedelta(days=rng.randrange(200))
+        result.append(_note(f"note{i:03d}.md", created, modified))
+    return result
+
+
+def test_range_queries_match_scans(notes: list[Note]) -> None:
+    """Range queries return exactly what a scan would, in the same order."""
+    index = TemporalIndex(notes)
+    # Bounds exactly on note timestamps exercise inclusive/strict edges
+    for start, end in [
+        (datetime(2022, 3, 1), datetime(2022, 6, 1)),
+        (notes[5].created, notes[5].created),
+        (notes[20].created, notes[40].created),
+        (datetime(2030, 1, 1), datetime(2031, 1, 1)),
+    ]:
+        assert index.created_between(start, end) == [n for n in notes if start <= n.created <= end]
+        assert index.modified_between(start, end) == [
+            n for n in notes if start <= n.modified <= end
+        ]
+        assert index.created_before(start) == [n for n in notes if n.created < start]
+        assert index.created_after(end) == [n for n in notes if n.created > end]
+
+
+def test_calendar_buckets_match_scans(notes: list[Note]) -> None:
+    """Day, season and month lookups agree with grouping by scan."""
+    index = TemporalIndex(notes)
+
+    day = notes[0].created
+    assert index.created_on_day(day.month, day.day) == [
+        n for n in notes if (n.created.month, n.created.day) == (day.month, day.day)
+    ]
+    assert index.created_on_day(day.month, day.day, before_year=2023) == [
+        n
+        for n in notes
+        if (n.created.month, n.created.day) == (day.month, day.day) and n.created.year < 2023
+    ]
+    assert index.created_on_day(2, 30) == []
+
+    by_month: defaultdict[int, list[Note]] = defaultdict(list)
+    by_season: defaultdict[str, list[Note]] = defaultdict(list)
+    for note in notes:
+        by_month[note.created.month].append(note)
+        by_season[get_season(note.created)].append(note)
+
+    # Same keys in the same (first-appearance) order as a defaultdict scan
+    assert list(index.by_created_month().items()) == list(by_month.items())
+    assert list(index.by_created_season().items()) == list(by_season.items())
+    assert index.created_in_season("Winter") == by_season["Winter"]
+    with pytest.raises(ValueError):
+        index.created_in_season("Monsoon")
+
+
+def test_by_created_date_and_journal_entries() -> None:
+    """Notes group by calendar date; virtual entries index by entry date."""
+    notes = [
+        _note("b.md", datetime(2024, 5, 2, 9, 0)),
+        _note("a.md", datetime(2024, 5, 1, 23, 59)),
+        _note("c.md", datetime(2024, 5, 2, 8, 0)),
+        _note(
+            "Journal.md/2024-04-30",
+            datetime(2024, 4, 30),
+            is_virtual=True,
+            source_file="Journal.md",
+            entry_date=date(2024, 4, 30),
+        ),
+        _note(
+            "Journal.md/2024-05-02",
+            datetime(2024, 5, 2),
+            is_virtual=True,
+            source_file="Journal.md",
+            entry_date=date(2024, 5, 2),
+        ),
+    ]
+    index = TemporalIndex(notes)
+
+    assert {day: [n.path for n in group] for day, group in index.by_created_date().items()} == {
+        "2024-04-30": ["Journal.md/2024-04-30"],
+        "2024-05-01": ["a.md"],
+        "2024-05-02": ["b.md", "c.md", "Journal.md/2024-05-02"],
+    }
+    assert [n.path for n in index.entries_between(date(2024, 5, 1), date(2024, 5, 31))] == [
+        "Journal.md/2024-05-02"
+    ]
+    assert TemporalIndex([]).created_between(datetime.min, datetime.max) == []
+
+
+def test_vault_context_caches_index_and_groups_by_date(tmp_path) -> None:
+    """VaultContext shares one index per journal filter and groups busy days."""
+    vault_path = tmp_path / "vault"
+    (vault_path / "geist journal").mkdir(parents=True)
+    created = {
+        "a.md": datetime(2024, 1, 2, 9, 0),
+        "b.md": datetime(2024, 1, 2, 17, 0),
+        "c.md": datetime(2024, 1, 1, 10, 0),
+        "d.md": datetime(2024, 1, 1, 11, 0),
+        "e.md": datetime(2024, 1, 3, 12, 0),
+        "geist journal/2024-01-03.md": datetime(2024, 1, 3, 8, 0),
+    }
+    for path in created:
+        (vault_path / path).write_text(f"# {path}\n\nBody.")
+    vault = Vault(str(vault_path), ":memory:")
+    vault.sync()
+    for path, when in created.items():
+        vault.db.execute("UPDATE notes SET created = ? WHERE path = ?", (when.isoformat(), path))
+    vault.db.commit()
+
+    session = Session(datetime(2024, 2, 1), vault.db)
+    session.compute_embeddings(vault.all_notes())
+    context = VaultContext(vault, session, function_registry=FunctionRegistry())
+
+    assert context.temporal_index() is context.temporal_index()
+    assert len(context.temporal_index().notes) == 6
+    assert len(context.temporal_index(exclude_journal=True).notes) == 5
+
+    # Count descending, equal counts in date order
+    grouped = context.notes_grouped_by_creation_date(min_per_day=2)
+    assert {day: [n.path for n in group] for day, group in grouped.items()} == {
+        "2024-01-01": ["c.md", "d.md"],
+        "2024-01-02": ["a.md", "b.md"],
+    }
+    assert list(context.notes_grouped_by_creation_date(exclude_journal=False)) == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+    ]
+    vault.close()
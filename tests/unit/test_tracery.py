@@ -10,7 +10,15 @@ import pytest
 
 from geistfabrik.embeddings import EmbeddingComputer, Session
 from geistfabrik.function_registry import FunctionRegistry
-from geistfabrik.tracery import TraceryEngine, TraceryGeist, TraceryGeistLoader
+from geistfabrik.tracery import (
+    SymbolRef,
+    TraceryEngine,
+    TraceryGeist,
+    TraceryGeistLoader,
+    VaultCall,
+    compile_grammar,
+    compile_rule,
+)
 from geistfabrik.vault import Vault
 from geistfabrik.vault_context import VaultContext
 
@@ -1214,3 +1222,51 @@ tracery:
     # Should not raise any error (no vault function with symbol args)
     geist = TraceryGeist.from_yaml(yaml_file, seed=42)
     assert geist.geist_id == "semantic_neighbours"
+
+
+# ========== Compiled grammar tests ==========
+
+
+def test_compile_rule_tokenises_literals_symbols_and_modifiers() -> None:
+    """Rules compile into literal segments and parsed symbol references."""
+    tokens = compile_rule("See #note.s.capitalize#, not #other#!")
+
+    assert tokens == (
+        "See ",
+        SymbolRef("note", ("s", "capitalize"), "note.s.capitalize"),
+        ", not ",
+        SymbolRef("other", (), "other"),
+        "!",
+    )
+
+
+def test_compile_grammar_parses_vault_calls_once() -> None:
+    """$vault.* rules are recognised at compile time with converted arguments."""
+    compiled = compile_grammar({"origin": ["#note#"], "note": ["static", " $vault.hubs(3, 'x') "]})
+
+    assert compiled.vault_calls == {"note": {1: VaultCall("hubs", (3, "x"))}}
+    assert "origin" not in compiled.vault_calls
+
+
+def test_compiled_expansion_keeps_undefined_symbols_and_modifiers() -> None:
+    """Undefined symbols are echoed back; modifiers apply in order."""
+    engine = TraceryEngine({"origin": ["#animal.s.capitalize# and #missing.s#"], "animal": ["fox"]})
+
+    assert engine.expand("#origin#") == "Foxes and #missing.s#"
+
+
+def test_from_yaml_reuses_compiled_grammar_until_file_changes(tmp_path: Path) -> None:
+    """Unchanged YAML files reuse the compiled grammar; edits recompile it."""
+    yaml_file = tmp_path / "cached.yaml"
+    yaml_file.write_text('type: geist-tracery\nid: cached\ntracery:\n  origin: ["one"]\n')
+
+    first = TraceryGeist.from_yaml(yaml_file, seed=1)
+    second = TraceryGeist.from_yaml(yaml_file, seed=2)
+    assert first.engine._compiled is second.engine._compiled
+    # Geists must not share mutable grammar lists
+    assert first.engine.grammar["origin"] is not second.engine.grammar["origin"]
+
+    yaml_file.write_text('type: geist-tracery\nid: cached\ntracery:\n  origin: ["two", "2"]\n')
+    third = TraceryGeist.from_yaml(yaml_file, seed=1)
+    assert third.engine._compiled is not first.engine._compiled
+    assert third.engine.expand("#origin#") in ("two", "2")
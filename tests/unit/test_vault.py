@@ -365,3 +365,16 @@ def test_large_note(tmp_path: Path) -> None:
     assert len(note.content) > 1024 * 1024
 
     vault.close()
+
+
+def test_sync_stores_content_hash(tmp_path: Path) -> None:
+    """Sync records each note's content hash for the embedding cache probe."""
+    from geistfabrik.schema import content_hash
+
+    (tmp_path / "a.md").write_text("# A\nBody")
+    vault = Vault(tmp_path)
+    vault.sync()
+
+    row = vault.db.execute("SELECT content, content_hash FROM notes").fetchone()
+    assert row[1] == content_hash(row[0])
+    vault.close()
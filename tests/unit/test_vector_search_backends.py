@@ -701,6 +701,89 @@ class TestSqliteVecBackend:
         vec_id2 = backend._get_or_create_vec_id("note1.md")
         assert vec_id1 == vec_id2
 
+    @pytest.mark.parametrize("vault_hashes", [(None, None), ("h1", "h2")])
+    def test_reload_writes_only_changed_rows(self, db, sample_embeddings, vault_hashes):
+        """Opening a new session rewrites only rows whose vectors differ.
+
+        Without vault hashes the diff reads vec_search; with them it runs
+        against the session vec_search was loaded from.
+        """
+        if not SQLITE_VEC_LOADABLE:
+            pytest.skip("sqlite-vec not loadable")
+
+        db.execute(
+            "UPDATE sessions SET vault_state_hash = ? WHERE session_id = ?",
+            (vault_hashes[0], sample_embeddings["session_id"]),
+        )
+        backend = SqliteVecBackend(db, dim=3)
+        backend.load_embeddings(sample_embeddings["session_date"])
+        assert backend.rows_written == 4
+
+        # Same session again: nothing to write
+        backend.load_embeddings(sample_embeddings["session_date"])
+        assert backend.rows_written == 0
+
+        # Next session: note2 changed, note4 gone, note1/note3 identical
+        next_date = "2025-01-16"
+        db.execute(
+            "INSERT INTO sessions (date, created_at, vault_state_hash) VALUES (?, ?, ?)",
+            (next_date, datetime.now().isoformat(), vault_hashes[1]),
+        )
+        session_id = db.execute(
+            "SELECT session_id FROM sessions WHERE date = ?", (next_date,)
+        ).fetchone()[0]
+        vectors = dict(sample_embeddings["embeddings"])
+        vectors["note2.md"] = np.array([0.0, 0.6, 0.8], dtype=np.float32)
+        del vectors["note4.md"]
+        db.executemany(
+            "INSERT INTO session_embeddings (session_id, note_path, embedding) VALUES (?, ?, ?)",
+            [(session_id, path, vec.tobytes()) for path, vec in vectors.items()],
+        )
+        db.commit()
+
+        backend.load_embeddings(next_date)
+
+        assert backend.rows_written == 2
+        assert db.execute("SELECT COUNT(*) FROM vec_search").fetchone()[0] == 3
+        np.testing.assert_array_equal(backend.get_embedding("note2.md"), vectors["note2.md"])
+        with pytest.raises(KeyError):
+            backend.get_embedding("note4.md")
+
+    def test_reload_detects_rows_dropped_behind_its_back(self, db, sample_embeddings):
+        """Rows deleted by a note cascade invalidate the recorded mirror."""
+        if not SQLITE_VEC_LOADABLE:
+            pytest.skip("sqlite-vec not loadable")
+
+        db.execute("UPDATE sessions SET vault_state_hash = 'h1'")
+        backend = SqliteVecBackend(db, dim=3)
+        backend.load_embeddings(sample_embeddings["session_date"])
+
+        # Deleting the note cascades to session_embeddings; the hash is untouched
+        db.execute("DELETE FROM notes WHERE path = 'note4.md'")
+        db.commit()
+        backend.load_embeddings(sample_embeddings["session_date"])
+
+        assert backend.rows_written == 1
+        assert db.execute("SELECT COUNT(*) FROM vec_search").fetchone()[0] == 3
+
+    @pytest.mark.parametrize("scan_threshold", [256, 1])
+    def test_get_embeddings_batched(self, db, sample_embeddings, scan_threshold):
+        """Batched lookups return rows in request order via either read path."""
+        if not SQLITE_VEC_LOADABLE:
+            pytest.skip("sqlite-vec not loadable")
+
+        backend = SqliteVecBackend(db, dim=3)
+        backend.SCAN_THRESHOLD = scan_threshold
+        backend.load_embeddings(sample_embeddings["session_date"])
+
+        paths = ["note3.md", "note1.md", "note3.md"]
+        matrix = backend.get_embeddings(paths)
+
+        expected = np.vstack([sample_embeddings["embeddings"][p] for p in paths])
+        np.testing.assert_array_equal(matrix, expected)
+        with pytest.raises(KeyError, match="Note not found"):
+            backend.get_embeddings(["note1.md", "missing.md"])
+
     def test_empty_vault(self, db):
         """Test backend behaviour with empty vault."""
         if not SQLITE_VEC_LOADABLE: